@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date, datetime
@@ -11,6 +12,9 @@ from app.schemas.earnings_calendar_schema import (
 from app.services.earnings_calendar_service import EarningsCalendarService
 from app.dependencies import get_db
 
+# 목록 변환용 검증기 (스키마 컴파일은 한 번만, 목록 전체를 한 번에 검증)
+_EARNINGS_CALENDAR_LIST = TypeAdapter(List[EarningsCalendarResponse])
+
 # 실적 캘린더 라우터 생성
 router = APIRouter(
     tags=["Earnings Calendar"],
@@ -86,10 +90,7 @@ async def get_earnings_calendar(
         earnings_list, total_count = service.get_earnings_calendar(params)
         
         # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        items = [
-            EarningsCalendarResponse.model_validate(earnings) 
-            for earnings in earnings_list
-        ]
+        items = _EARNINGS_CALENDAR_LIST.validate_python(earnings_list, from_attributes=True)
         
         # 최종 응답 구성
         return EarningsCalendarListResponse(
@@ -133,10 +134,7 @@ async def get_today_earnings(db: Session = Depends(get_db)):
         service = EarningsCalendarService(db)
         earnings_list = service.get_today_earnings()
         
-        return [
-            EarningsCalendarResponse.model_validate(earnings) 
-            for earnings in earnings_list
-        ]
+        return _EARNINGS_CALENDAR_LIST.validate_python(earnings_list, from_attributes=True)
         
     except Exception as e:
         raise HTTPException(
@@ -172,10 +170,7 @@ async def get_upcoming_earnings(
         service = EarningsCalendarService(db)
         earnings_list = service.get_upcoming_earnings(days)
         
-        return [
-            EarningsCalendarResponse.model_validate(earnings) 
-            for earnings in earnings_list
-        ]
+        return _EARNINGS_CALENDAR_LIST.validate_python(earnings_list, from_attributes=True)
         
     except Exception as e:
         raise HTTPException(
@@ -219,10 +214,7 @@ async def get_earnings_by_symbol(
                 detail=f"심볼 '{symbol.upper()}'에 대한 실적 발표 일정을 찾을 수 없습니다."
             )
         
-        return [
-            EarningsCalendarResponse.model_validate(earnings) 
-            for earnings in earnings_list
-        ]
+        return _EARNINGS_CALENDAR_LIST.validate_python(earnings_list, from_attributes=True)
         
     except HTTPException:
         # HTTPException은 그대로 재발생
@@ -273,10 +265,7 @@ async def get_earnings_by_date_range(
         service = EarningsCalendarService(db)
         earnings_list = service.get_earnings_by_date_range(start_date, end_date)
         
-        return [
-            EarningsCalendarResponse.model_validate(earnings) 
-            for earnings in earnings_list
-        ]
+        return _EARNINGS_CALENDAR_LIST.validate_python(earnings_list, from_attributes=True)
         
     except HTTPException:
         raise
@@ -1,5 +1,7 @@
 # app/api/endpoints/email_subscription_endpoint.py
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+import html
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -27,6 +29,108 @@ router = APIRouter(
     }
 )
 
+# =========================
+# 인증/구독취소 결과 페이지 HTML
+# =========================
+# 네 가지 결과 페이지가 공유하는 <head>/<style> 블록은 모듈 로드 시 한 번만
+# bytes로 만들어 두고, 요청마다 바뀌는 본문(middle)만 이어 붙입니다.
+
+_HOME_URL = "https://investment-assistant.site"
+
+_HTML_PREFIX = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>""".encode("utf-8")
+
+_HTML_HEAD_REST = """</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            min-height: 100vh;
+            margin: 0;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }
+        .container {
+            background: white;
+            padding: 40px;
+            border-radius: 16px;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
+            text-align: center;
+            max-width: 400px;
+        }
+        .icon { font-size: 64px; margin-bottom: 20px; }
+        h1 { color: #333; font-size: 24px; margin-bottom: 16px; }
+        p { color: #666; line-height: 1.6; }
+        .email { color: #667eea; font-weight: 600; }
+        .btn {
+            display: inline-block;
+            margin-top: 20px;
+            padding: 12px 24px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            text-decoration: none;
+            border-radius: 8px;
+            font-weight: 500;
+        }
+        .btn:hover { opacity: 0.9; }
+    </style>
+</head>
+<body>
+    <div class="container">
+""".encode("utf-8")
+
+_HTML_SUFFIX = b"""
+    </div>
+</body>
+</html>
+"""
+
+_HOME_BUTTON = f'<a href="{_HOME_URL}" class="btn">홈으로 돌아가기</a>'
+
+_VERIFY_OK_TITLE = "이메일 인증 완료".encode("utf-8")
+_VERIFY_OK_MID_TPL = """        <div class="icon">🎉</div>
+        <h1>이메일 인증 완료!</h1>
+        <p>
+            <span class="email">{email}</span> 주소로<br>
+            매주 일요일에 S&P 500 실적 발표 일정을<br>
+            받아보실 수 있습니다.
+        </p>""".encode("utf-8")
+
+_VERIFY_FAIL_TITLE = "인증 실패".encode("utf-8")
+_VERIFY_FAIL_MID_TPL = f"""        <div class="icon">⚠️</div>
+        <h1>인증 실패</h1>
+        <p>{{message}}</p>
+        {_HOME_BUTTON}""".encode("utf-8")
+
+_UNSUBSCRIBE_OK_TITLE = "구독 취소 완료".encode("utf-8")
+_UNSUBSCRIBE_OK_MID = f"""        <div class="icon">✅</div>
+        <h1>구독이 취소되었습니다</h1>
+        <p>더 이상 주간 실적 발표 알림을 받지 않습니다.<br>
+        언제든지 다시 구독하실 수 있습니다.</p>
+        {_HOME_BUTTON}""".encode("utf-8")
+
+_UNSUBSCRIBE_FAIL_TITLE = "구독 취소 오류".encode("utf-8")
+_UNSUBSCRIBE_FAIL_MID_TPL = f"""        <div class="icon">⚠️</div>
+        <h1>구독 취소 실패</h1>
+        <p>{{message}}</p>
+        {_HOME_BUTTON}""".encode("utf-8")
+
+
+def _escape(value: str) -> bytes:
+    """템플릿에 삽입할 동적 값을 HTML 이스케이프 후 bytes로 변환"""
+    return html.escape(str(value)).encode("utf-8")
+
+
+def _html_page(title: bytes, middle: bytes) -> HTMLResponse:
+    """공유 prefix/suffix와 결과별 본문을 이어 붙여 HTML 응답 생성"""
+    body = _HTML_PREFIX + title + _HTML_HEAD_REST + middle + _HTML_SUFFIX
+    return HTMLResponse(content=body)
+
 @router.post(
     "/subscribe",
     response_model=EmailSubscriptionResponse,
@@ -35,6 +139,7 @@ router = APIRouter(
 )
 async def subscribe_email(
     request: EmailSubscriptionRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -51,10 +156,17 @@ async def subscribe_email(
     - success: 구독 요청 성공 여부
     - message: 결과 메시지
     - requires_verification: 이메일 인증 필요 여부 (true면 인증 메일 확인 필요)
+    
+    인증 메일은 응답 반환 후 백그라운드에서 발송됩니다.
     """
     try:
         service = EmailSubscriptionService(db)
-        result = service.subscribe(request.email, request.scope.value, request.agreed)
+        result = service.subscribe(
+            request.email,
+            request.scope.value,
+            request.agreed,
+            background_tasks=background_tasks
+        )
         
         return EmailSubscriptionResponse(**result)
         
@@ -71,6 +183,7 @@ async def subscribe_email(
     description="이메일에 포함된 인증 링크를 통해 구독을 확정합니다."
 )
 async def verify_email(
+    background_tasks: BackgroundTasks,
     token: str = Query(..., description="이메일 인증 토큰"),
     db: Session = Depends(get_db)
 ):
@@ -82,120 +195,19 @@ async def verify_email(
     
     **쿼리 파라미터:**
     - token: 이메일 인증 토큰 (필수)
+    
+    인증 완료 시 발송되는 실적 발표 알림 메일은 응답 반환 후 백그라운드에서 발송됩니다.
     """
     try:
         service = EmailSubscriptionService(db)
-        result = service.verify_email(token)
+        result = service.verify_email(token, background_tasks=background_tasks)
         
         if result['success']:
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="ko">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>이메일 인증 완료</title>
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        min-height: 100vh;
-                        margin: 0;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    }}
-                    .container {{
-                        background: white;
-                        padding: 40px;
-                        border-radius: 16px;
-                        box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                        text-align: center;
-                        max-width: 400px;
-                    }}
-                    .icon {{ font-size: 64px; margin-bottom: 20px; }}
-                    h1 {{ color: #333; font-size: 24px; margin-bottom: 16px; }}
-                    p {{ color: #666; line-height: 1.6; }}
-                    .email {{ color: #667eea; font-weight: 600; }}
-                    .btn {{
-                        display: inline-block;
-                        margin-top: 20px;
-                        padding: 12px 24px;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        text-decoration: none;
-                        border-radius: 8px;
-                        font-weight: 500;
-                    }}
-                    .btn:hover {{ opacity: 0.9; }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="icon">🎉</div>
-                    <h1>이메일 인증 완료!</h1>
-                    <p>
-                        <span class="email">{result.get('email', '')}</span> 주소로<br>
-                        매주 일요일에 S&P 500 실적 발표 일정을<br>
-                        받아보실 수 있습니다.
-                    </p>
-                </div>
-            </body>
-            </html>
-            """
-        else:
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="ko">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>인증 실패</title>
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        min-height: 100vh;
-                        margin: 0;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    }}
-                    .container {{
-                        background: white;
-                        padding: 40px;
-                        border-radius: 16px;
-                        box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                        text-align: center;
-                        max-width: 400px;
-                    }}
-                    .icon {{ font-size: 64px; margin-bottom: 20px; }}
-                    h1 {{ color: #333; font-size: 24px; margin-bottom: 16px; }}
-                    p {{ color: #666; line-height: 1.6; }}
-                    .btn {{
-                        display: inline-block;
-                        margin-top: 20px;
-                        padding: 12px 24px;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        text-decoration: none;
-                        border-radius: 8px;
-                        font-weight: 500;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="icon">⚠️</div>
-                    <h1>인증 실패</h1>
-                    <p>{result['message']}</p>
-                    <a href="https://investment-assistant.site" class="btn">홈으로 돌아가기</a>
-                </div>
-            </body>
-            </html>
-            """
+            middle = _VERIFY_OK_MID_TPL.replace(b"{email}", _escape(result.get('email', '')))
+            return _html_page(_VERIFY_OK_TITLE, middle)
         
-        return HTMLResponse(content=html_content)
+        middle = _VERIFY_FAIL_MID_TPL.replace(b"{message}", _escape(result['message']))
+        return _html_page(_VERIFY_FAIL_TITLE, middle)
         
     except Exception as e:
         error_html = f"""
@@ -254,111 +266,10 @@ async def unsubscribe_by_token(
         result = service.unsubscribe_by_token(token)
         
         if result['success']:
-            html_content = """
-            <!DOCTYPE html>
-            <html lang="ko">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>구독 취소 완료</title>
-                <style>
-                    body {
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        min-height: 100vh;
-                        margin: 0;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    }
-                    .container {
-                        background: white;
-                        padding: 40px;
-                        border-radius: 16px;
-                        box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                        text-align: center;
-                        max-width: 400px;
-                    }
-                    .icon { font-size: 64px; margin-bottom: 20px; }
-                    h1 { color: #333; font-size: 24px; margin-bottom: 16px; }
-                    p { color: #666; line-height: 1.6; }
-                    .btn {
-                        display: inline-block;
-                        margin-top: 20px;
-                        padding: 12px 24px;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        text-decoration: none;
-                        border-radius: 8px;
-                        font-weight: 500;
-                    }
-                    .btn:hover { opacity: 0.9; }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="icon">✅</div>
-                    <h1>구독이 취소되었습니다</h1>
-                    <p>더 이상 주간 실적 발표 알림을 받지 않습니다.<br>
-                    언제든지 다시 구독하실 수 있습니다.</p>
-                    <a href="https://investment-assistant.site" class="btn">홈으로 돌아가기</a>
-                </div>
-            </body>
-            </html>
-            """
-        else:
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="ko">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>구독 취소 오류</title>
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        min-height: 100vh;
-                        margin: 0;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    }}
-                    .container {{
-                        background: white;
-                        padding: 40px;
-                        border-radius: 16px;
-                        box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                        text-align: center;
-                        max-width: 400px;
-                    }}
-                    .icon {{ font-size: 64px; margin-bottom: 20px; }}
-                    h1 {{ color: #333; font-size: 24px; margin-bottom: 16px; }}
-                    p {{ color: #666; line-height: 1.6; }}
-                    .btn {{
-                        display: inline-block;
-                        margin-top: 20px;
-                        padding: 12px 24px;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        text-decoration: none;
-                        border-radius: 8px;
-                        font-weight: 500;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="icon">⚠️</div>
-                    <h1>구독 취소 실패</h1>
-                    <p>{result['message']}</p>
-                    <a href="https://investment-assistant.site" class="btn">홈으로 돌아가기</a>
-                </div>
-            </body>
-            </html>
-            """
+            return _html_page(_UNSUBSCRIBE_OK_TITLE, _UNSUBSCRIBE_OK_MID)
         
-        return HTMLResponse(content=html_content)
+        middle = _UNSUBSCRIBE_FAIL_MID_TPL.replace(b"{message}", _escape(result['message']))
+        return _html_page(_UNSUBSCRIBE_FAIL_TITLE, middle)
         
     except Exception as e:
         error_html = f"""
@@ -1,10 +1,11 @@
 # app/api/endpoints/etf_polling_endpoint.py
-from fastapi import APIRouter, HTTPException, Depends, Query, Path
-from fastapi.responses import JSONResponse
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, HTTPException, Depends, Query, Path, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BeforeValidator
+from typing import Annotated, List, Optional, Dict, Any
 import logging
-from datetime import datetime
-import pytz
+import re
+from datetime import datetime, timezone
 from app.database import get_db
 from app.services.etf_service import ETFService
 from app.schemas.etf_schema import (
@@ -13,18 +14,44 @@ from app.schemas.etf_schema import (
     ErrorResponse, TimeframeEnum, SortOrderEnum, create_error_response
 )
 from app.schemas import etf_schema
+from app.utils.cache_utils import cached_response, conditional_etag, single_flight
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
-# 라우터 생성
-router = APIRouter()
+# 라우터 생성 (차트/목록 등 큰 페이로드 직렬화는 orjson 사용)
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# ETF 심볼 경로 파라미터 (패턴은 모듈 로드 시 한 번만 컴파일/선언)
+# 대문자 변환은 요청 파싱 단계에서 처리하므로 핸들러에서는 정규화된 값만 받음
+SYMBOL_RE = re.compile(r"^[A-Z]{2,5}$")
+ETFSymbol = Annotated[
+    str,
+    BeforeValidator(str.upper),
+    Path(description="ETF 심볼 (예: SPY, 소문자 입력 허용)", pattern=SYMBOL_RE.pattern)
+]
+
+# 404 에러 응답 템플릿 (존재하지 않는 심볼 요청이 많으므로 pydantic 모델 생성 없이 dict로 구성)
+NOT_FOUND_TEMPLATE = {"error_type": "ETF_NOT_FOUND", "message": None, "timestamp": None, "path": None}
+
+def _not_found_detail(message: str, path: str) -> Dict[str, Any]:
+    """ETF_NOT_FOUND 에러 detail 생성 (create_error_response와 동일한 구조)"""
+    return NOT_FOUND_TEMPLATE | {"message": message, "timestamp": datetime.utcnow().isoformat(), "path": path}
 
 # 서비스 인스턴스 생성 (의존성)
 def get_etf_service() -> ETFService:
     """ETFService 의존성 제공"""
     return ETFService()
 
+# ETag 버전 조회 (conditional_etag용)
+async def _chart_data_version(symbol: str, **_) -> Optional[str]:
+    """차트 ETag 버전: 최신 가격 시각 (차트 범위가 이 시각 기준으로 정해짐)"""
+    return await ETFService().get_data_version(symbol)
+
+async def _detail_data_version(symbol: str, **_) -> Optional[str]:
+    """상세 ETag 버전: 최신 가격 시각 + 프로필 갱신 시각"""
+    return await ETFService().get_data_version(symbol, include_profile=True)
+
 # =========================
 # ETF 리스트 및 폴링 엔드포인트
 # =========================
@@ -94,27 +121,39 @@ async def get_all_etfs(
 # =========================
 
 @router.get("/symbol/{symbol}", response_model=etf_schema.ETFDetailResponse, summary="개별 ETF 상세 정보 조회")
-async def get_etf_symbol_details(symbol: str):
+@conditional_etag(_detail_data_version, max_age=15)
+@cached_response("etf", expire=60, not_found_expire=30)
+@single_flight("etf")
+async def get_etf_symbol_details(symbol: ETFSymbol, request: Request, response: Response):
     """
     특정 ETF 심볼에 대한 모든 상세 정보를 반환합니다.
     기본 정보, 프로필, 보유 종목 데이터를 모두 포함합니다.
+    
+    응답에 ETag가 포함되며, If-None-Match가 일치하면 304를 반환합니다.
+    같은 심볼에 대한 동시 요청은 한 번의 조회 결과를 공유합니다.
     """
     try:
         service = ETFService()
-        details = service.get_etf_details_by_symbol(symbol)
+        details = await service.get_etf_details_by_symbol(symbol)
         
         if not details:
             raise HTTPException(status_code=404, detail=f"ETF not found: {symbol}")
         
         return details
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"ETF 상세 정보 API 오류 ({symbol}): {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/symbol/{symbol}/chart", summary="ETF 차트 데이터만 조회")
+@conditional_etag(_chart_data_version, max_age=15)
+@cached_response("etf", expire=30, not_found_expire=30)
 async def get_etf_chart_data(
-    symbol: str = Path(..., description="ETF 심볼 (예: SPY)", regex=r"^[A-Z]{2,5}$"),
+    symbol: ETFSymbol,
+    request: Request,
+    response: Response,
     timeframe: TimeframeEnum = Query(default=TimeframeEnum.ONE_DAY, description="차트 시간대"),
     etf_service: ETFService = Depends(get_etf_service)
 ):
@@ -144,19 +183,26 @@ async def get_etf_chart_data(
     - `data_points`: 데이터 포인트 개수
     - `market_status`: 시장 상태
     - `last_updated`: 최종 업데이트 시간
+    
+    **조건부 요청:**
+    - 응답의 `ETag`를 `If-None-Match`로 보내면 데이터 변경이 없을 때 304 반환
     """
     try:
-        symbol = symbol.upper()
         logger.info(f"ETF 차트 데이터 조회: {symbol} (timeframe: {timeframe.value})")
         
         result = etf_service.get_chart_data_only(symbol, timeframe.value)
         
         if result.get('error'):
             logger.error(f"ETF {symbol} 차트 데이터 조회 실패: {result['error']}")
+            if "not found" in result['error'].lower():
+                raise HTTPException(
+                    status_code=404,
+                    detail=_not_found_detail(result['error'], f"/etf/symbol/{symbol}/chart")
+                )
             raise HTTPException(
-                status_code=404 if "not found" in result['error'].lower() else 500,
+                status_code=500,
                 detail=create_error_response(
-                    error_type="ETF_NOT_FOUND" if "not found" in result['error'].lower() else "CHART_ERROR",
+                    error_type="CHART_ERROR",
                     message=result['error'],
                     path=f"/etf/symbol/{symbol}/chart"
                 ).model_dump()
@@ -179,8 +225,9 @@ async def get_etf_chart_data(
         )
 
 @router.get("/symbol/{symbol}/basic", summary="ETF 기본 정보만 조회")
+@cached_response("etf", expire=30, not_found_expire=30)
 async def get_etf_basic_info(
-    symbol: str = Path(..., description="ETF 심볼 (예: SPY)", regex=r"^[A-Z]{2,5}$"),
+    symbol: ETFSymbol,
     etf_service: ETFService = Depends(get_etf_service)
 ):
     """
@@ -197,17 +244,21 @@ async def get_etf_basic_info(
     ```
     """
     try:
-        symbol = symbol.upper()
         logger.info(f"ETF 기본 정보 조회: {symbol}")
         
         result = etf_service.get_etf_basic_info(symbol)
         
         if result.get('error'):
             logger.error(f"ETF {symbol} 기본 정보 조회 실패: {result['error']}")
+            if "not found" in result['error'].lower():
+                raise HTTPException(
+                    status_code=404,
+                    detail=_not_found_detail(result['error'], f"/etf/symbol/{symbol}/basic")
+                )
             raise HTTPException(
-                status_code=404 if "not found" in result['error'].lower() else 500,
+                status_code=500,
                 detail=create_error_response(
-                    error_type="ETF_NOT_FOUND" if "not found" in result['error'].lower() else "BASIC_INFO_ERROR",
+                    error_type="BASIC_INFO_ERROR",
                     message=result['error'],
                     path=f"/etf/symbol/{symbol}/basic"
                 ).model_dump()
@@ -293,6 +344,7 @@ async def search_etfs(
 # =========================
 
 @router.get("/market-overview", response_model=ETFMarketOverviewResponse, summary="ETF 시장 개요")
+@cached_response("etf", expire=300)
 async def get_etf_market_overview(
     etf_service: ETFService = Depends(get_etf_service)
 ):
@@ -356,6 +408,9 @@ async def get_etf_service_stats(
     - API 요청 수, DB 쿼리 수
     - 에러 수, 마지막 요청 시간
     - 서비스 가동 시간
+    
+    통계는 워커 프로세스별 메모리 카운터이므로 공유 Redis 캐시에 저장하지 않습니다.
+    (캐시하면 다른 워커/5분 전 값이 응답됨, DB 조회가 없어 캐시 이득도 없음)
     """
     try:
         logger.info("ETF 서비스 통계 조회")
@@ -394,19 +449,19 @@ async def get_etf_health_check(
         # 헬스 상태에 따라 적절한 HTTP 상태 코드 반환
         status_code = 200 if health.get('status') == 'healthy' else 503
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content=health
         )
         
     except Exception as e:
         logger.error(f"ETF 헬스 체크 실패: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 'status': 'unhealthy',
                 'database': 'error',
                 'error': str(e),
-                'last_check': datetime.now(pytz.UTC).isoformat()
+                'last_check': datetime.now(timezone.utc)
             }
         )
\ No newline at end of file
@@ -1,10 +1,14 @@
-from datetime import datetime, timezone
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
-from sqlalchemy.orm import Session
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BeforeValidator
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_db
-from app.services.financial_news_service import FinancialNewsService
+from app.dependencies import get_async_db
+from app.services.financial_news_service import FinancialNewsService, get_categories_statistics_snapshot
+from app.utils.cache_utils import cached_response
 from app.schemas.financial_news_schema import (
     FinancialNewsResponse,
     FinancialNewsListResponse,
@@ -13,9 +17,12 @@ from app.schemas.financial_news_schema import (
     CategoryType
 )
 
-# 라우터 생성 (태그로 API 문서 그룹화)
+logger = logging.getLogger(__name__)
+
+# 라우터 생성 (태그로 API 문서 그룹화, 뉴스 목록 직렬화는 orjson 사용)
 router = APIRouter(
     tags=["Financial News"],
+    default_response_class=ORJSONResponse,
     responses={
         404: {"description": "뉴스를 찾을 수 없습니다"},
         422: {"description": "잘못된 요청 파라미터"},
@@ -23,6 +30,31 @@ router = APIRouter(
     }
 )
 
+# 헬스 체크: 백그라운드 통계 갱신이 이 시간 이상 멈추면 unhealthy
+HEALTH_STALE_AFTER = timedelta(minutes=2)
+
+# 종목 코드 경로 파라미터 (요청 파싱 단계에서 대문자로 정규화)
+NewsSymbol = Annotated[str, BeforeValidator(str.upper), Path(description="종목 코드 (예: BTCUSD, AAPL)")]
+
+
+def deprecated_page(
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1, deprecated=True, description="페이지 번호 (1부터 시작, deprecated: cursor 사용 권장)")
+) -> int:
+    """
+    deprecated된 page 파라미터 의존성 (하위 호환용으로 유지)
+    
+    cursor 없이 2페이지 이후를 page로 요청하면 OFFSET 페이징이 실행되므로
+    Deprecation/Warning 헤더를 붙이고 로그를 남깁니다.
+    의존성에서 처리하므로 응답 캐시 적중 시에도 헤더가 붙습니다.
+    """
+    if page > 1 and not request.query_params.get("cursor"):
+        response.headers["Deprecation"] = "true"
+        response.headers["Warning"] = '299 - "page is deprecated; pass next_cursor as cursor instead"'
+        logger.warning("⚠️ deprecated page 파라미터 사용: %s (page=%s)", request.url.path, page)
+    return page
+
 
 @router.get(
     "/",
@@ -30,14 +62,15 @@ router = APIRouter(
     summary="카테고리 금융 뉴스 목록 (Finnhub 수집 데이터)"
 )
 async def get_financial_news_list(
-    page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
+    page: int = Depends(deprecated_page),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (최대 100)"),
     categories: Optional[List[CategoryType]] = Query(None, description="카테고리 필터 (crypto, forex, merger, general)"),
     start_date: Optional[datetime] = Query(None, description="시작 날짜 (YYYY-MM-DD 또는 ISO 형식)"),
     end_date: Optional[datetime] = Query(None, description="종료 날짜 (YYYY-MM-DD 또는 ISO 형식)"),
     symbols: Optional[List[str]] = Query(None, description="관련 종목 필터 (BTCUSD, AAPL 등)"),
     sources: Optional[List[str]] = Query(None, description="뉴스 소스 필터"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Finnhub 카테고리별로 수집해 DB(`market_news_finnhub`)에 저장된 뉴스를 조회합니다.
@@ -49,29 +82,33 @@ async def get_financial_news_list(
     
     - 주요 기능:
       - 카테고리/기간/소스/종목(related) 필터
-      - 페이징: page, limit
+      - 페이징: 응답의 next_cursor를 cursor로 전달하는 keyset 페이징 (page는 deprecated)
     
     - 예시:
       - GET /api/v1/financial-news/?categories=crypto&limit=10
+      - GET /api/v1/financial-news/?limit=10&cursor=WyIyMDI1LTA3LTIwVDE0OjMwOjE1IiwxMjM0NTY3ODkwMSwiY3J5cHRvIl0
       - GET /api/v1/financial-news/?symbols=BTCUSD,ETHUSD&start_date=2025-07-01
       - GET /api/v1/financial-news/?categories=merger&sources=Reuters
     """
     try:
-        skip = (page - 1) * limit
+        skip = 0 if cursor else (page - 1) * limit
         service = FinancialNewsService(db)
         
-        result = service.get_financial_news_list(
+        result = await service.get_financial_news_list(
             skip=skip,
             limit=limit,
             categories=categories,
             start_date=start_date,
             end_date=end_date,
             symbols=symbols,
-            sources=sources
+            sources=sources,
+            cursor=cursor
         )
         
         return result
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -84,13 +121,15 @@ async def get_financial_news_list(
     response_model=FinancialNewsListResponse,
     summary="카테고리별 금융 뉴스 (Finnhub)"
 )
+@cached_response("financial_news", expire=60)
 async def get_category_financial_news(
     category: CategoryType = Path(..., description="뉴스 카테고리"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Depends(deprecated_page),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
     start_date: Optional[datetime] = Query(None, description="시작 날짜"),
     end_date: Optional[datetime] = Query(None, description="종료 날짜"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Finnhub의 단일 카테고리 뉴스만 최신순으로 조회합니다.
@@ -99,21 +138,25 @@ async def get_category_financial_news(
     - 예시:
       - GET /api/v1/financial-news/category/crypto?limit=15
       - GET /api/v1/financial-news/category/forex?start_date=2025-07-01
+      - GET /api/v1/financial-news/category/crypto?cursor=WyIyMDI1LTA3LTIwVDE0OjMwOjE1IiwxMjM0NTY3ODkwMSwiY3J5cHRvIl0
     """
     try:
-        skip = (page - 1) * limit
+        skip = 0 if cursor else (page - 1) * limit
         service = FinancialNewsService(db)
         
-        result = service.get_category_news(
+        result = await service.get_category_news(
             category=category,
             skip=skip,
             limit=limit,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cursor=cursor
         )
         
         return result
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -130,7 +173,7 @@ async def get_recent_financial_news(
     hours: int = Query(24, ge=1, le=168, description="몇 시간 이내 뉴스 (최대 7일)"),
     limit: int = Query(10, ge=1, le=50, description="최대 개수 (최대 50)"),
     categories: Optional[List[CategoryType]] = Query(None, description="대상 카테고리"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     최근 N시간 내 수집된 Finnhub 카테고리 뉴스를 최신순으로 반환합니다.
@@ -142,7 +185,7 @@ async def get_recent_financial_news(
     """
     try:
         service = FinancialNewsService(db)
-        result = service.get_recent_financial_news(
+        result = await service.get_recent_financial_news(
             hours=hours,
             limit=limit,
             categories=categories
@@ -164,12 +207,13 @@ async def get_recent_financial_news(
 )
 async def search_financial_news(
     q: str = Query(..., min_length=2, description="검색어 (최소 2글자)"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Depends(deprecated_page),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
     categories: Optional[List[CategoryType]] = Query(None, description="검색 대상 카테고리"),
     start_date: Optional[datetime] = Query(None, description="검색 시작 날짜"),
     end_date: Optional[datetime] = Query(None, description="검색 종료 날짜"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Finnhub 수집 데이터에서 헤드라인/요약/소스명을 검색합니다.
@@ -180,22 +224,26 @@ async def search_financial_news(
       - GET /api/v1/financial-news/search?q=Bitcoin
       - GET /api/v1/financial-news/search?q=merger&categories=merger
       - GET /api/v1/financial-news/search?q=Federal&start_date=2025-07-01
+      - 다음 페이지는 응답의 next_cursor를 cursor로 전달
     """
     try:
-        skip = (page - 1) * limit
+        skip = 0 if cursor else (page - 1) * limit
         service = FinancialNewsService(db)
         
-        result = service.search_financial_news(
+        result = await service.search_financial_news(
             query_text=q,
             skip=skip,
             limit=limit,
             categories=categories,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cursor=cursor
         )
         
         return result
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -211,7 +259,7 @@ async def search_financial_news(
 async def get_financial_news_detail(
     category: CategoryType = Path(..., description="뉴스 카테고리"),
     news_id: int = Path(..., description="Finnhub 뉴스 ID", ge=1),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Finnhub 원본의 `category + news_id`를 키로 상세 정보를 반환합니다.
@@ -221,7 +269,7 @@ async def get_financial_news_detail(
     """
     try:
         service = FinancialNewsService(db)
-        result = service.get_news_by_id(category=category, news_id=news_id)
+        result = await service.get_news_by_id(category=category, news_id=news_id)
         
         if not result:
             raise HTTPException(
@@ -246,11 +294,12 @@ async def get_financial_news_detail(
     summary="종목(related) 기반 뉴스"
 )
 async def get_news_by_symbol(
-    symbol: str = Path(..., description="종목 코드 (예: BTCUSD, AAPL)"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    symbol: NewsSymbol,
+    page: int = Depends(deprecated_page),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
     categories: Optional[List[CategoryType]] = Query(None, description="검색 대상 카테고리"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     `related` 필드에 특정 심볼이 언급된 뉴스를 최신순으로 조회합니다.
@@ -258,20 +307,24 @@ async def get_news_by_symbol(
     - 예시:
       - GET /api/v1/financial-news/symbol/BTCUSD?categories=crypto
       - GET /api/v1/financial-news/symbol/AAPL?limit=15
+      - 다음 페이지는 응답의 next_cursor를 cursor로 전달
     """
     try:
-        skip = (page - 1) * limit
+        skip = 0 if cursor else (page - 1) * limit
         service = FinancialNewsService(db)
         
-        result = service.get_news_by_symbol(
-            symbol=symbol.upper(),
+        result = await service.get_news_by_symbol(
+            symbol=symbol,
             skip=skip,
             limit=limit,
-            categories=categories
+            categories=categories,
+            cursor=cursor
         )
         
         return result
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -280,7 +333,8 @@ async def get_news_by_symbol(
 
 
 @router.get("/stats", summary="Financial News 통계")
-async def get_financial_news_stats(db: Session = Depends(get_db)):
+@cached_response("financial_news", expire=300)
+async def get_financial_news_stats(db: AsyncSession = Depends(get_async_db)):
     """
     Financial News 통계 정보를 반환합니다.
     
@@ -288,7 +342,7 @@ async def get_financial_news_stats(db: Session = Depends(get_db)):
     """
     try:
         service = FinancialNewsService(db)
-        stats_result = service.get_categories_statistics()
+        stats_result = await service.get_categories_statistics()
         
         return {
             "total_count": stats_result.total_news
@@ -306,8 +360,9 @@ async def get_financial_news_stats(db: Session = Depends(get_db)):
     response_model=CategoriesStatsResponse,
     summary="카테고리별 통계 (개수/최신일시/전체)"
 )
+@cached_response("financial_news", expire=3600)
 async def get_categories_statistics(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Finnhub 카테고리별 개수/최신일시/총계를 반환합니다.
@@ -316,7 +371,7 @@ async def get_categories_statistics(
     """
     try:
         service = FinancialNewsService(db)
-        result = service.get_categories_statistics()
+        result = await service.get_categories_statistics()
         
         return result
         
@@ -328,10 +383,11 @@ async def get_categories_statistics(
 
 
 @router.get("/trending-symbols", summary="트렌딩 종목 (언급 빈도 기준)")
+@cached_response("financial_news", expire=3600)
 async def get_trending_symbols(
     days: int = Query(7, ge=1, le=30, description="조회할 일수 (최대 30일)"),
     limit: int = Query(10, ge=1, le=50, description="반환할 종목 수"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     최근 N일 동안 가장 많이 언급된 종목을 반환합니다.
@@ -341,7 +397,7 @@ async def get_trending_symbols(
     """
     try:
         service = FinancialNewsService(db)
-        trending_data = service.get_trending_symbols(days=days, limit=limit)
+        trending_data = await service.get_trending_symbols(days=days, limit=limit)
         
         return {
             "trending_symbols": [
@@ -360,17 +416,26 @@ async def get_trending_symbols(
 
 
 @router.get("/health", summary="Financial News API 상태")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_async_db)):
     """
     Finnhub 기반 수집 데이터의 기본 상태 정보를 반환합니다.
     
     - 항목: DB 연결, 카테고리별 개수, 최신 수집 시각 등
+    - 통계는 lifespan 백그라운드 태스크가 주기적으로 갱신한 값을 메모리에서 읽습니다.
+      (프로브가 자주 호출해도 집계 쿼리를 실행하지 않음)
+    - 마지막 갱신이 2분 이상 지났으면 503 unhealthy
     """
     try:
-        service = FinancialNewsService(db)
+        stats, refreshed_at = get_categories_statistics_snapshot()
         
-        # 카테고리별 통계로 DB 연결 및 데이터 상태 확인
-        stats = service.get_categories_statistics()
+        # 백그라운드 갱신이 아직 한 번도 끝나지 않은 경우에만 직접 조회
+        if stats is None:
+            service = FinancialNewsService(db)
+            stats = await service.get_categories_statistics()
+            _, refreshed_at = get_categories_statistics_snapshot()
+        
+        now = datetime.now(timezone.utc)
+        is_stale = refreshed_at is None or now - refreshed_at > HEALTH_STALE_AFTER
         
         # 카테고리별 개수 딕셔너리 생성
         categories_count = {
@@ -384,19 +449,24 @@ async def health_check(db: Session = Depends(get_db)):
             if latest_dates:
                 latest_date = max(latest_dates)
         
-        return {
-            "status": "healthy",
-            "database": "connected",
+        content = {
+            "status": "unhealthy" if is_stale else "healthy",
+            "database": "stale" if is_stale else "connected",
             "categories_count": categories_count,
             "total_news": stats.total_news,
             "latest_news_date": latest_date,
             "available_categories": stats.available_categories,
+            "stats_refreshed_at": refreshed_at,
             "api_version": "1.0.0",
-            "timestamp": datetime.now(timezone.utc)
+            "timestamp": now
         }
         
+        if is_stale:
+            return ORJSONResponse(status_code=503, content=content)
+        return content
+        
     except Exception as e:
         raise HTTPException(
             status_code=503,
             detail=f"서비스 상태 확인 실패: {str(e)}"
-        )
\ No newline at end of file
+        )
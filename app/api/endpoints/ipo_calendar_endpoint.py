@@ -1,6 +1,6 @@
 # app/api/endpoints/ipo_calendar_endpoint.py
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import date, datetime
 import logging
@@ -12,7 +12,8 @@ from app.schemas.ipo_calendar_schema import (
     IPOCalendarStatistics
 )
 from app.services.ipo_calendar_service import IPOCalendarService
-from app.dependencies import get_db
+from app.dependencies import get_async_db
+from app.utils.cache_utils import cached_response
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +32,13 @@ router = APIRouter(
     summary="IPO 캘린더 전체 조회",
     description="프론트엔드 캘린더에 표시할 IPO 일정을 조회합니다. 날짜 범위와 거래소 필터링이 가능합니다."
 )
+@cached_response("ipo_calendar", expire=60)
 async def get_ipo_calendar(
     start_date: Optional[date] = Query(None, description="조회 시작일", example="2025-10-01"),
     end_date: Optional[date] = Query(None, description="조회 종료일", example="2025-12-31"),
     exchange: Optional[str] = Query(None, description="거래소 필터 (NYSE, NASDAQ 등)", example="NYSE"),
     limit: int = Query(100, ge=1, le=1000, description="최대 조회 개수"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **IPO 캘린더 전체 조회**
@@ -60,7 +62,7 @@ async def get_ipo_calendar(
     """
     try:
         service = IPOCalendarService(db)
-        items, total_count = service.get_all_ipos(
+        items, total_count = await service.get_all_ipos(
             start_date=start_date,
             end_date=end_date,
             exchange=exchange,
@@ -68,7 +70,7 @@ async def get_ipo_calendar(
         )
         
         return IPOCalendarListResponse(
-            items=[IPOCalendarResponse.model_validate(item) for item in items],
+            items=[IPOCalendarResponse.from_orm_fast(item) for item in items],
             total_count=total_count,
             start_date=start_date,
             end_date=end_date
@@ -96,7 +98,7 @@ async def get_ipo_calendar(
 async def get_monthly_ipos(
     year: Optional[int] = Query(None, description="연도 (미지정 시 현재)", example=2025),
     month: Optional[int] = Query(None, ge=1, le=12, description="월 (미지정 시 현재)", example=10),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **이번 달 IPO 일정 조회**
@@ -118,7 +120,7 @@ async def get_monthly_ipos(
     """
     try:
         service = IPOCalendarService(db)
-        items = service.get_monthly_ipos(year=year, month=month)
+        items = await service.get_monthly_ipos(year=year, month=month)
         
         # 조회 월 결정
         if year and month:
@@ -129,7 +131,7 @@ async def get_monthly_ipos(
         
         return IPOCalendarMonthlyResponse(
             month=month_str,
-            items=[IPOCalendarResponse.model_validate(item) for item in items],
+            items=[IPOCalendarResponse.from_orm_fast(item) for item in items],
             total_count=len(items)
         )
         
@@ -152,7 +154,8 @@ async def get_monthly_ipos(
     summary="IPO 통계 정보",
     description="IPO 캘린더의 다양한 통계 정보를 제공합니다."
 )
-async def get_ipo_statistics(db: Session = Depends(get_db)):
+@cached_response("ipo_calendar", expire=300)
+async def get_ipo_statistics(db: AsyncSession = Depends(get_async_db)):
     """
     **IPO 통계 정보**
     
@@ -186,7 +189,7 @@ async def get_ipo_statistics(db: Session = Depends(get_db)):
     """
     try:
         service = IPOCalendarService(db)
-        stats = service.get_statistics()
+        stats = await service.get_statistics()
         
         return IPOCalendarStatistics(**stats)
     
@@ -1,27 +1,50 @@
-from datetime import datetime
-import pytz
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_db
+from app.dependencies import get_async_db
 from app.services.market_news_service import MarketNewsService
-from app.models.market_news_model import MarketNews
+from app.utils.cache_utils import cached_response, conditional_etag
+from app.utils.url_utils import canonicalize_url
 from app.schemas.market_news_schema import (
     MarketNewsResponse,
     MarketNewsListResponse,
     MarketNewsSearchResponse
 )
 
-# 라우터 생성 (태그로 API 문서 그룹화)
+# 라우터 생성 (태그로 API 문서 그룹화, 뉴스 목록 직렬화는 orjson 사용)
 router = APIRouter(
     tags=["Market News"],
+    default_response_class=ORJSONResponse,
     responses={
         404: {"description": "뉴스를 찾을 수 없습니다"},
         500: {"description": "서버 내부 오류 발생"}
     }
 )
 
+# 서비스 인스턴스 생성 (의존성)
+def get_market_news_service(db: AsyncSession = Depends(get_async_db)) -> MarketNewsService:
+    """MarketNewsService 의존성 제공 (요청 단위 AsyncSession 바인딩)"""
+    return MarketNewsService(db)
+
+# 기사 상세 캐시 TTL (초) - 수집된 기사는 바뀌지 않으므로 7일
+NEWS_DETAIL_CACHE_TTL = 7 * 24 * 3600
+
+# 공개 통계 엔드포인트용 Cache-Control (CDN/브라우저 공유 캐시 허용)
+PUBLIC_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=600"
+
+# ETag 버전 조회 (conditional_etag용)
+async def _news_data_version(service: MarketNewsService, **_) -> Optional[str]:
+    """통계 ETag 버전: 최신 뉴스 발행 시간"""
+    return await service.get_data_version()
+
+async def _windowed_news_data_version(service: MarketNewsService, **_) -> Optional[str]:
+    """최근 N일 집계 ETag 버전: 최신 발행 시간 + 현재 날짜 (새 데이터가 없어도 날짜가 바뀌면 범위가 이동)"""
+    version = await service.get_data_version()
+    return f"{version}:{datetime.now(timezone.utc).date().isoformat()}" if version else None
+
 
 @router.get(
     "/",
@@ -29,13 +52,15 @@ router = APIRouter(
     summary="시장 뉴스 목록 (NewsAPI 수집 데이터)"
 )
 async def get_market_news_list(
-    page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
+    page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작, deprecated: cursor 사용 권장)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수 (최대 100)"),
     start_date: Optional[datetime] = Query(None, description="시작 날짜 (YYYY-MM-DD 또는 ISO 형식)"),
     end_date: Optional[datetime] = Query(None, description="종료 날짜 (YYYY-MM-DD 또는 ISO 형식)"),
     sources: Optional[List[str]] = Query(None, description="포함할 소스 목록"),
     exclude_sources: Optional[List[str]] = Query(None, description="제외할 소스 목록"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    exact_count: bool = Query(False, description="정확한 전체 개수 계산 여부 (false면 실행 계획 기반 추정치)"),
+    service: MarketNewsService = Depends(get_market_news_service)
 ):
     """
     NewsAPI에서 수집해 DB(`market_news`)에 저장된 시장 뉴스를 페이징하여 조회합니다.
@@ -47,7 +72,7 @@ async def get_market_news_list(
       - 스케줄: 매일 04:00 (UTC 기준 시스템 설정에 따름)
     
     - 주요 기능:
-      - 페이징: page, limit
+      - 페이징: 응답의 next_cursor를 cursor로 전달하는 keyset 페이징 (page, limit은 하위 호환용)
       - 날짜 필터링: start_date, end_date (ISO)
       - 소스 필터링: 포함(sources)/제외(exclude_sources)
       - 최신순 정렬: published_at desc
@@ -56,33 +81,31 @@ async def get_market_news_list(
       - GET /api/v1/market-news/?page=1&limit=10
       - GET /api/v1/market-news/?start_date=2025-07-01&end_date=2025-07-31
       - GET /api/v1/market-news/?sources=Reuters,CNBC
+      - GET /api/v1/market-news/?limit=10&cursor={next_cursor}
     
-    - 응답: total, items(요약), page, limit, has_next
+    - 응답: total, items(요약), page, limit, has_next, next_cursor
+      - total은 기본적으로 추정치이며, exact_count=true일 때만 COUNT(*)로 정확히 계산
     """
     try:
-        # 페이지 번호를 offset으로 변환 (page 1 = skip 0)
-        skip = (page - 1) * limit
-        
-        # 서비스 인스턴스 생성
-        service = MarketNewsService(db)
+        # 페이지 번호를 offset으로 변환 (page 1 = skip 0, cursor 사용 시 무시)
+        skip = 0 if cursor else (page - 1) * limit
         
         # 뉴스 목록 조회
-        result = service.get_news_list(
+        result = await service.get_news_list(
             skip=skip,
             limit=limit,
             start_date=start_date,
             end_date=end_date,
             sources=sources,
-            exclude_sources=exclude_sources
+            exclude_sources=exclude_sources,
+            cursor=cursor,
+            exact_count=exact_count
         )
         
         return result
         
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"뉴스 목록 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get(
@@ -93,7 +116,7 @@ async def get_market_news_list(
 async def get_recent_market_news(
     hours: int = Query(24, ge=1, le=168, description="몇 시간 이내 뉴스 (최대 7일)"),
     limit: int = Query(10, ge=1, le=50, description="최대 개수 (최대 50)"),
-    db: Session = Depends(get_db)
+    service: MarketNewsService = Depends(get_market_news_service)
 ):
     """
     최근 N시간 내 수집된 시장 뉴스를 최신순으로 반환합니다.
@@ -104,17 +127,9 @@ async def get_recent_market_news(
       - GET /api/v1/market-news/recent?hours=6&limit=5
       - GET /api/v1/market-news/recent
     """
-    try:
-        service = MarketNewsService(db)
-        result = service.get_recent_news(hours=hours, limit=limit)
-        
-        return result
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"최근 뉴스 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+    result = await service.get_recent_news(hours=hours, limit=limit)
+    
+    return result
 
 
 @router.get(
@@ -128,7 +143,8 @@ async def search_market_news(
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
     start_date: Optional[datetime] = Query(None, description="검색 시작 날짜"),
     end_date: Optional[datetime] = Query(None, description="검색 종료 날짜"),
-    db: Session = Depends(get_db)
+    exact_count: bool = Query(False, description="정확한 전체 개수 계산 여부 (false면 실행 계획 기반 추정치)"),
+    service: MarketNewsService = Depends(get_market_news_service)
 ):
     """
     PostgreSQL Full-Text Search로 NewsAPI 수집 기사(제목/설명/본문)를 검색합니다.
@@ -140,25 +156,41 @@ async def search_market_news(
       - GET /api/v1/market-news/search?q=economy&start_date=2025-07-01
       - GET /api/v1/market-news/search?q="stock market"
     """
-    try:
-        skip = (page - 1) * limit
-        service = MarketNewsService(db)
-        
-        result = service.search_news(
-            query_text=q,
-            skip=skip,
-            limit=limit,
-            start_date=start_date,
-            end_date=end_date
-        )
-        
-        return result
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"뉴스 검색 중 오류가 발생했습니다: {str(e)}"
-        )
+    skip = (page - 1) * limit
+    
+    result = await service.search_news(
+        query_text=q,
+        skip=skip,
+        limit=limit,
+        start_date=start_date,
+        end_date=end_date,
+        exact_count=exact_count
+    )
+    
+    return result
+
+
+def news_article_key(
+    source: str = Query(..., min_length=1, max_length=200, description="뉴스 소스"),
+    url: str = Query(..., min_length=1, max_length=2048, description="뉴스 URL")
+) -> Tuple[str, str]:
+    """
+    (source, url) 기사 캐시 키를 검증/정규화하는 의존성 함수
+    
+    같은 기사를 가리키는 요청이 표기 차이로 다른 캐시 키를 만들지 않도록
+    source는 앞뒤 공백을, url은 canonicalize_url 규칙으로 정리합니다.
+    수집 시 URL을 정규화하지 않으므로 정규화된 url은 캐시 키에만 사용하고,
+    DB 조회는 요청된 원본 URL로 합니다.
+    """
+    source = source.strip()
+    url = canonicalize_url(url)
+    
+    if not source:
+        raise HTTPException(status_code=400, detail="source가 비어 있습니다")
+    if not url.startswith(("http://", "https://")):
+        raise HTTPException(status_code=400, detail=f"잘못된 URL 형식입니다: {url}")
+    
+    return source, url
 
 
 @router.get(
@@ -166,10 +198,11 @@ async def search_market_news(
     response_model=MarketNewsResponse,
     summary="시장 뉴스 상세 조회 (source+url)"
 )
+@cached_response("market_news", expire=NEWS_DETAIL_CACHE_TTL)
 async def get_market_news_detail(
-    source: str = Query(..., description="뉴스 소스"),
-    url: str = Query(..., description="뉴스 URL"),
-    db: Session = Depends(get_db)
+    request: Request,
+    article_key: Tuple[str, str] = Depends(news_article_key),
+    service: MarketNewsService = Depends(get_market_news_service)
 ):
     """
     수집된 기사 중 한 건의 상세 정보를 반환합니다.
@@ -177,31 +210,30 @@ async def get_market_news_detail(
     - 식별키: source + url
     - 포함: 전체 본문(content), 요약, 미리보기 등
     - 예시: GET /api/v1/market-news/detail?source=Reuters&url=https://www.reuters.com/...
+    - 수집된 기사는 바뀌지 않으므로 정규화된 (source, url) 키로 7일 동안 캐시합니다
     """
-    try:
-        service = MarketNewsService(db)
-        result = service.get_news_by_url(source=source, url=url)
-        
-        if not result:
-            raise HTTPException(
-                status_code=404,
-                detail=f"뉴스를 찾을 수 없습니다. source: {source}, url: {url}"
-            )
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    source, _ = article_key
+    # 저장된 URL은 정규화되어 있지 않으므로 기본키 조회는 요청된 원본 URL로 수행
+    # (404는 표기에 따라 달라지므로 정규화 키로 캐시하지 않음)
+    url = request.query_params["url"].strip()
+    result = await service.get_news_by_url(source=source, url=url)
+    
+    if not result:
         raise HTTPException(
-            status_code=500,
-            detail=f"뉴스 상세 조회 중 오류가 발생했습니다: {str(e)}"
+            status_code=404,
+            detail=f"뉴스를 찾을 수 없습니다. source: {source}, url: {url}"
         )
+    
+    return result
 
 
 @router.get("/sources", summary="뉴스 소스별 집계 (개수 기준)")
+@conditional_etag(_news_data_version, cache_control=PUBLIC_CACHE_CONTROL)
+@cached_response("market_news", expire=3600)
 async def get_news_sources_stats(
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    service: MarketNewsService = Depends(get_market_news_service)
 ):
     """
     수집된 기사에서 소스별 건수를 집계합니다.
@@ -209,108 +241,78 @@ async def get_news_sources_stats(
     - 용도: 소스 필터 UI, 수집 품질 모니터링
     - 정렬: 개수 내림차순
     """
-    try:
-        service = MarketNewsService(db)
-        sources_data = service.get_news_sources()
-        
-        return {
-            "sources": [
-                {"source": source, "count": count}
-                for source, count in sources_data
-            ]
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"소스 통계 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+    sources_data = await service.get_news_sources()
+    
+    return {
+        "sources": [
+            {"source": source, "count": count}
+            for source, count in sources_data
+        ]
+    }
 
 
 @router.get("/daily-stats", summary="일별 뉴스 발행량 (최근 N일)")
+@conditional_etag(_windowed_news_data_version, cache_control=PUBLIC_CACHE_CONTROL)
+@cached_response("market_news", expire=3600)
 async def get_daily_news_stats(
+    request: Request,
+    response: Response,
     days: int = Query(30, ge=1, le=365, description="조회할 일수 (최대 1년)"),
-    db: Session = Depends(get_db)
+    service: MarketNewsService = Depends(get_market_news_service)
 ):
     """
     최근 N일 동안의 일별 기사 건수를 반환합니다.
     
     - 용도: 발행 트렌드 차트, 수집 상태 모니터링
     """
-    try:
-        service = MarketNewsService(db)
-        daily_data = service.get_daily_news_count(days=days)
-        
-        # 전체 뉴스 개수 계산
-        total_news = sum(count for _, count in daily_data)
-        
-        return {
-            "daily_stats": [
-                {"date": date, "count": count}
-                for date, count in daily_data
-            ],
-            "period_days": days,
-            "total_news": total_news
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"일별 통계 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+    # 일별 개수 + 기간 내 전체 개수 (DB에서 함께 집계)
+    daily_data, total_news = await service.get_daily_news_count(days=days)
+    
+    return {
+        "daily_stats": [
+            {"date": date, "count": count}
+            for date, count in daily_data
+        ],
+        "period_days": days,
+        "total_news": total_news
+    }
 
 
 @router.get("/stats", summary="Market News 통계")
-async def get_market_news_stats(db: Session = Depends(get_db)):
+@conditional_etag(_news_data_version, cache_control=PUBLIC_CACHE_CONTROL)
+@cached_response("market_news", expire=300)
+async def get_market_news_stats(
+    request: Request,
+    response: Response,
+    service: MarketNewsService = Depends(get_market_news_service)
+):
     """
     Market News 통계 정보를 반환합니다.
     
     - Hero 섹션 등에서 사용할 간단한 통계 정보
     """
-    try:
-        service = MarketNewsService(db)
-        
-        # 전체 뉴스 개수
-        total_count = service.db.query(MarketNews).count()
-        
-        # 최신 뉴스 날짜
-        latest_news = service.db.query(MarketNews.published_at).order_by(
-            MarketNews.published_at.desc()
-        ).first()
-        
-        latest_date = latest_news[0] if latest_news else None
-        
-        return {
-            "total_count": total_count,
-            "latest_news_date": latest_date
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"통계 조회 중 오류가 발생했습니다: {str(e)}"
-        )
+    # 전체 뉴스 개수 + 최신 뉴스 날짜
+    total_count, latest_date = await service.get_news_overview()
+    
+    return {
+        "total_count": total_count,
+        "latest_news_date": latest_date
+    }
 
 
 @router.get("/health", summary="Market News API 상태")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(response: Response, service: MarketNewsService = Depends(get_market_news_service)):
     """
     NewsAPI 기반 수집 데이터의 기본 상태 정보를 반환합니다.
     
     - 항목: DB 연결, 전체 개수, 최신 수집 시각 등
+    - 전체 개수/최신 날짜는 30초간 메모리에 캐시 (프로브가 자주 호출해도 집계 쿼리를 반복하지 않음)
+    - 상태 응답은 CDN/브라우저에 캐시되지 않도록 no-store
     """
+    response.headers["Cache-Control"] = "no-store"
     try:
-        service = MarketNewsService(db)
-        
-        # 기본 통계 조회로 DB 연결 테스트
-        total_count = service.db.query(MarketNews).count()
-        
-        # 최신 뉴스 날짜 조회
-        latest_news = service.db.query(MarketNews.published_at).order_by(
-            MarketNews.published_at.desc()
-        ).first()
-        
-        latest_date = latest_news[0] if latest_news else None
+        # 기본 통계 조회로 DB 연결 테스트 (전체 개수 + 최신 뉴스 날짜)
+        total_count, latest_date = await service.get_cached_news_overview()
         
         return {
             "status": "healthy",
@@ -318,7 +320,7 @@ async def health_check(db: Session = Depends(get_db)):
             "total_news": total_count,
             "latest_news_date": latest_date,
             "api_version": "1.0.0",
-            "timestamp": datetime.now(pytz.UTC)
+            "timestamp": datetime.now(timezone.utc)
         }
         
     except Exception as e:
@@ -1,10 +1,14 @@
 # app/api/endpoints/market_news_sentiment_endpoint.py
 
-from fastapi import APIRouter, Depends, Query, Path, HTTPException
-from sqlalchemy.orm import Session
-from typing import List, Optional
-
-from app.dependencies import get_db
+import asyncio
+import orjson
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, Query, Path, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+
+from app.dependencies import get_async_db, csv_query
 from app.schemas.market_news_sentiment_schema import (
     MarketSentimentListResponse,
     TopicListResponse,
@@ -17,13 +21,18 @@ from app.schemas.market_news_sentiment_schema import (
     BatchInfo,
     SentimentQueryParams,
     RankingQueryParams,
-    SentimentTrendsResponse
+    SentimentTrendsResponse,
+    SentimentSortType,
+    SortOrderType,
+    TrendIntervalType
 )
 from app.services.market_news_sentiment_service import MarketNewsSentimentService
+from app.utils.cache_utils import cached_response, conditional_etag
 
-# Market News Sentiment 라우터 생성
+# Market News Sentiment 라우터 생성 (뉴스 목록 직렬화는 orjson 사용)
 router = APIRouter(
     tags=["Market News Sentiment"],
+    default_response_class=ORJSONResponse,
     responses={
         404: {"description": "요청한 뉴스 감성 분석 데이터를 찾을 수 없습니다"},
         422: {"description": "잘못된 요청 파라미터"},
@@ -31,6 +40,24 @@ router = APIRouter(
     }
 )
 
+# 서비스 인스턴스 생성 (의존성)
+def get_market_news_sentiment_service(db: AsyncSession = Depends(get_async_db)) -> MarketNewsSentimentService:
+    """MarketNewsSentimentService 의존성 제공 (요청 단위 AsyncSession 바인딩)"""
+    return MarketNewsSentimentService(db)
+
+# 공개 통계 엔드포인트용 Cache-Control (CDN/브라우저 공유 캐시 허용)
+PUBLIC_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=600"
+
+# ETag 버전 조회 (conditional_etag용)
+async def _sentiment_data_version(service: MarketNewsSentimentService, **_) -> Optional[str]:
+    """데이터셋 ETag 버전: 최신 배치 ID + 최신 발행 시각"""
+    return await service.get_data_version()
+
+async def _windowed_sentiment_data_version(service: MarketNewsSentimentService, **_) -> Optional[str]:
+    """최근 N일 집계 ETag 버전: 데이터 버전 + 현재 시각(시 단위) (새 배치가 없어도 시간이 지나면 범위가 이동)"""
+    version = await service.get_data_version()
+    return f"{version}:{datetime.now(timezone.utc).strftime('%Y-%m-%dT%H')}" if version else None
+
 # =============================================================================
 # 기본 뉴스 조회 API
 # =============================================================================
@@ -41,15 +68,17 @@ router = APIRouter(
     summary="뉴스 감성 리스트 (Alpha Vantage 25/일 수집)"
 )
 async def get_market_sentiment_news(
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="최근 N일 데이터 (1-30일)"),
     limit: int = Query(20, ge=1, le=100, description="결과 개수 제한"),
-    offset: int = Query(0, ge=0, description="페이징 오프셋"),
+    offset: int = Query(0, ge=0, description="페이징 오프셋 (deprecated: cursor 사용 권장)"),
     min_sentiment: Optional[float] = Query(None, ge=-1.0, le=1.0, description="최소 감성 점수"),
     max_sentiment: Optional[float] = Query(None, ge=-1.0, le=1.0, description="최대 감성 점수"),
-    sentiment_labels: Optional[str] = Query(None, description="감성 라벨 필터 (쉼표 구분)"),
-    sort_by: str = Query("time_published", description="정렬 기준"),
-    order: str = Query("desc", pattern="^(asc|desc)$", description="정렬 순서")
+    sentiment_labels: Tuple[str, ...] = Depends(csv_query("sentiment_labels", "감성 라벨 필터 (쉼표 구분)")),
+    sort_by: SentimentSortType = Query("time_published", description="정렬 기준"),
+    order: SortOrderType = Query("desc", description="정렬 순서"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 offset 무시)"),
+    exact_count: bool = Query(False, description="정확한 전체 개수 계산 여부 (false면 실행 계획 기반 추정치)")
 ):
     """
     Alpha Vantage NEWS_SENTIMENT에서 수집해 DB(`market_news_sentiment`)에 저장된 감성 뉴스를 조회합니다.
@@ -58,28 +87,28 @@ async def get_market_sentiment_news(
       - 일일 호출 제한: 25회 (요일별 전문화 쿼리 세트)
       - 저장 필드: overall_sentiment_score/label, ticker_sentiment, topics, batch_id, query_type, query_params, time_published 등
     - 필터: 기간(days), 감성 점수/라벨, 정렬/페이지네이션
-    """
-    service = MarketNewsSentimentService(db)
-    
-    # 감성 라벨 파싱
-    labels_list = None
-    if sentiment_labels:
-        labels_list = [label.strip() for label in sentiment_labels.split(",")]
-    
-    # 뉴스 목록 조회
-    news_list, total_count = service.get_news_list(
-        days=days, limit=limit, offset=offset,
-        min_sentiment=min_sentiment, max_sentiment=max_sentiment,
-        sentiment_labels=labels_list, sort_by=sort_by, order=order
-    )
-    
-    # 배치 정보 조회
-    batch_info = service.get_batch_info()
+    - 페이징: 응답의 next_cursor를 cursor로 전달 (sort_by=time_published에서만 지원, offset은 하위 호환용)
+    - total_count는 기본적으로 추정치이며, exact_count=true일 때만 정확히 계산
+    """
+    # 뉴스 목록과 배치 정보는 서로 독립적이므로 동시에 조회
+    try:
+        (news_list, total_count, next_cursor), batch_info = await asyncio.gather(
+            service.get_news_list(
+                days=days, limit=limit, offset=offset,
+                min_sentiment=min_sentiment, max_sentiment=max_sentiment,
+                sentiment_labels=sentiment_labels, sort_by=sort_by, order=order,
+                cursor=cursor, exact_count=exact_count
+            ),
+            service.run_in_new_session(lambda s: s.get_batch_info())
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return MarketSentimentListResponse(
         total_count=total_count,
         batch_info=BatchInfo(**batch_info),
-        news=news_list
+        news=news_list,
+        next_cursor=next_cursor
     )
 
 # =============================================================================
@@ -87,24 +116,16 @@ async def get_market_sentiment_news(
 # =============================================================================
 
 @router.get("/tickers", response_model=TickerListResponse, summary="언급된 티커 목록")
-async def get_all_tickers(db: Session = Depends(get_db)):
+@conditional_etag(_windowed_sentiment_data_version, cache_control=PUBLIC_CACHE_CONTROL)
+@cached_response("market_sentiment", expire=300)
+async def get_all_tickers(request: Request, response: Response, service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service)):
     """
     수집 데이터에서 언급된 모든 티커와 간단 통계를 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    tickers = service.get_all_tickers()
+    tickers = await service.get_all_tickers()
     
-    # 티커별 간단한 통계 정보
-    ticker_details = []
-    for ticker in tickers[:10]:  # 상위 10개만 상세 정보 제공
-        summary = service.calculate_ticker_sentiment_summary(ticker, days=7)
-        ticker_details.append({
-            "ticker": ticker,
-            "mention_count": summary.get("mention_count", 0),
-            "avg_sentiment": summary.get("avg_sentiment_score", 0.0),
-            "sentiment_label": summary.get("sentiment_label", "알 수 없음")
-        })
+    # 최근 7일 언급 상위 10개 티커의 간단한 통계 정보
+    ticker_details = await service.get_tickers_with_summary(limit=10, days=7)
     
     return TickerListResponse(
         total_tickers=len(tickers),
@@ -116,7 +137,7 @@ async def get_all_tickers(db: Session = Depends(get_db)):
 @router.get("/ticker/{symbol}", response_model=TickerNewsResponse, summary="티커별 감성 뉴스")
 async def get_ticker_news(
     symbol: str = Path(..., description="주식 심볼", example="AAPL"),
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="최근 N일 데이터"),
     limit: int = Query(20, ge=1, le=100, description="결과 개수 제한"),
     offset: int = Query(0, ge=0, description="페이징 오프셋")
@@ -124,12 +145,10 @@ async def get_ticker_news(
     """
     특정 티커의 뉴스와 감성 요약을 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
     # 심볼 대문자 변환
     symbol = symbol.upper()
     
-    news_list, ticker_summary = service.get_news_by_ticker(symbol, days, limit, offset)
+    news_list, ticker_summary = await service.get_news_by_ticker(symbol, days, limit, offset)
     
     if not news_list:
         raise HTTPException(
@@ -145,8 +164,9 @@ async def get_ticker_news(
 
 
 @router.get("/tickers/ranking", response_model=TickerRankingResponse, summary="티커 감성 랭킹")
+@cached_response("market_sentiment", expire=300)
 async def get_ticker_ranking(
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="랭킹 계산 기간"),
     top_count: int = Query(10, ge=1, le=50, description="상위 티커 개수"),
     bottom_count: int = Query(10, ge=1, le=50, description="하위 티커 개수"),
@@ -155,9 +175,7 @@ async def get_ticker_ranking(
     """
     최근 N일 기준 "긍정 상위/부정 하위" 티커 랭킹을 제공합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    hot_tickers, cold_tickers = service.calculate_ticker_sentiment_ranking(
+    hot_tickers, cold_tickers = await service.calculate_ticker_sentiment_ranking(
         days, top_count, bottom_count, min_mentions
     )
     
@@ -179,17 +197,17 @@ async def get_ticker_ranking(
 )
 async def get_topic_related_tickers(
     topic: str = Path(..., description="주제명", example="Technology"),
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="분석 기간"),
     limit: int = Query(10, ge=1, le=50, description="관련 티커 개수")
 ):
     """
     특정 주제와 함께 자주 언급된 티커와 감성 요약을 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    related_tickers = service.get_tickers_by_topic(topic, days, limit)
-    topic_summary = service.calculate_topic_sentiment_summary(topic, days)
+    related_tickers, topic_summary = await asyncio.gather(
+        service.get_tickers_by_topic(topic, days, limit),
+        service.run_in_new_session(lambda s: s.calculate_topic_sentiment_summary(topic, days))
+    )
     
     if not related_tickers:
         raise HTTPException(
@@ -212,20 +230,20 @@ async def get_topic_related_tickers(
 )
 async def get_ticker_related_topics(
     symbol: str = Path(..., description="주식 심볼", example="AAPL"),
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="분석 기간"),
     limit: int = Query(10, ge=1, le=50, description="관련 주제 개수")
 ):
     """
     특정 티커와 함께 언급된 주제와 감성 요약을 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
     # 심볼 대문자 변환
     symbol = symbol.upper()
     
-    related_topics = service.get_topics_by_ticker(symbol, days, limit)
-    ticker_summary = service.calculate_ticker_sentiment_summary(symbol, days)
+    related_topics, ticker_summary = await asyncio.gather(
+        service.get_topics_by_ticker(symbol, days, limit),
+        service.run_in_new_session(lambda s: s.calculate_ticker_sentiment_summary(symbol, days))
+    )
     
     if not related_topics:
         raise HTTPException(
@@ -245,19 +263,19 @@ async def get_ticker_related_topics(
 # =============================================================================
 
 @router.get("/info", response_model=dict, summary="API/데이터셋 정보")
-async def get_api_info(db: Session = Depends(get_db)):
+@conditional_etag(_sentiment_data_version, cache_control=PUBLIC_CACHE_CONTROL)
+@cached_response("market_sentiment", expire=300)
+async def get_api_info(request: Request, response: Response, service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service)):
     """
     수집 주기, 배치 정보, 사용 가능 리소스 등을 제공합니다.
     
     - 수집 소스: Alpha Vantage NEWS_SENTIMENT (25회/일)
     - 요일별 전문 쿼리 세트 사용, `batch_id`로 배치 구분
     """
-    service = MarketNewsSentimentService(db)
-    
     # 기본 통계 정보
-    batch_info = service.get_batch_info()
-    topics = service.get_all_topics()
-    tickers = service.get_all_tickers()
+    batch_info = await service.get_batch_info()
+    topics = await service.get_all_topics()
+    tickers = await service.get_all_tickers()
     
     return {
         "api_name": "Market Sentiment Analysis API",
@@ -306,44 +324,35 @@ async def get_api_info(db: Session = Depends(get_db)):
 
 
 @router.get("/stats", response_model=dict, summary="감성 통계 요약")
+@conditional_etag(_windowed_sentiment_data_version, cache_control=PUBLIC_CACHE_CONTROL)
+@cached_response("market_sentiment", expire=300)
 async def get_sentiment_stats(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="통계 계산 기간")
 ):
     """
     최근 N일 동안의 감성 분포, 평균 점수, 시장 무드 등을 요약합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    # 전체 뉴스 통계
-    all_news, total_count = service.get_news_list(days=days, limit=1000)
-    
-    # 감성별 분류
-    bullish_news = service.get_sentiment_filtered_news("bullish", days, 1000)
-    bearish_news = service.get_sentiment_filtered_news("bearish", days, 1000)
-    neutral_news = service.get_sentiment_filtered_news("neutral", days, 1000)
-    
-    # 평균 감성 점수 계산
-    sentiment_scores = [
-        news.get("overall_sentiment_score", 0) 
-        for news in all_news 
-        if news.get("overall_sentiment_score") is not None
-    ]
-    avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
+    # 전체 개수 / 감성별 분포 / 평균 점수 (단일 집계 쿼리)
+    summary = await service.get_sentiment_summary(days)
+    total_count = summary["total"]
+    avg_sentiment = summary["avg_sentiment"]
+    distribution = {
+        "bullish": summary["bullish"],
+        "bearish": summary["bearish"],
+        "neutral": summary["neutral"]
+    }
     
     return {
         "period": f"최근 {days}일",
         "total_count": total_count,
         "total_news": total_count,  # 호환성을 위해 둘 다 제공
-        "sentiment_distribution": {
-            "bullish": len(bullish_news),
-            "bearish": len(bearish_news),
-            "neutral": len(neutral_news)
-        },
+        "sentiment_distribution": distribution,
         "sentiment_percentages": {
-            "bullish": round(len(bullish_news) / total_count * 100, 1) if total_count > 0 else 0,
-            "bearish": round(len(bearish_news) / total_count * 100, 1) if total_count > 0 else 0,
-            "neutral": round(len(neutral_news) / total_count * 100, 1) if total_count > 0 else 0
+            label: round(count / total_count * 100, 1) if total_count > 0 else 0
+            for label, count in distribution.items()
         },
         "average_sentiment_score": round(avg_sentiment, 4),
         "market_mood": "긍정적" if avg_sentiment > 0.1 else "부정적" if avg_sentiment < -0.1 else "중립적",
@@ -356,26 +365,33 @@ async def get_sentiment_stats(
     response_model=MarketSentimentListResponse,
     summary="최근 24시간 감성 뉴스"
 )
+@cached_response("market_sentiment", expire=60)
 async def get_latest_news(
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     limit: int = Query(20, ge=1, le=100, description="결과 개수 제한"),
-    offset: int = Query(0, ge=0, description="페이징 오프셋")
+    offset: int = Query(0, ge=0, description="페이징 오프셋 (deprecated: cursor 사용 권장)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 offset 무시)"),
+    exact_count: bool = Query(False, description="정확한 전체 개수 계산 여부 (false면 실행 계획 기반 추정치)")
 ):
     """
     최근 24시간 내 수집된 감성 뉴스를 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    news_list, total_count = service.get_news_list(
-        days=1, limit=limit, offset=offset, sort_by="time_published", order="desc"
-    )
-    
-    batch_info = service.get_batch_info()
+    try:
+        (news_list, total_count, next_cursor), batch_info = await asyncio.gather(
+            service.get_news_list(
+                days=1, limit=limit, offset=offset, sort_by="time_published", order="desc",
+                cursor=cursor, exact_count=exact_count
+            ),
+            service.run_in_new_session(lambda s: s.get_batch_info())
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return MarketSentimentListResponse(
         total_count=total_count,
         batch_info=BatchInfo(**batch_info),
-        news=news_list
+        news=news_list,
+        next_cursor=next_cursor
     )
 
 
@@ -386,16 +402,21 @@ async def get_latest_news(
 )
 async def get_batch_news(
     batch_id: int = Path(..., description="배치 ID", example=2),
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     limit: int = Query(20, ge=1, le=100, description="결과 개수 제한"),
-    offset: int = Query(0, ge=0, description="페이징 오프셋")
+    offset: int = Query(0, ge=0, description="페이징 오프셋 (deprecated: cursor 사용 권장)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 offset 무시)")
 ):
     """
     특정 `batch_id`로 저장된 감성 뉴스 묶음을 조회합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    news_list = service.get_news_by_batch(batch_id, limit, offset)
+    try:
+        (news_list, next_cursor), batch_info = await asyncio.gather(
+            service.get_news_by_batch(batch_id, limit, offset, cursor),
+            service.run_in_new_session(lambda s: s.get_batch_info())
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     if not news_list:
         raise HTTPException(
@@ -403,12 +424,11 @@ async def get_batch_news(
             detail=f"배치 ID {batch_id}의 데이터를 찾을 수 없습니다."
         )
     
-    batch_info = service.get_batch_info()
-    
     return MarketSentimentListResponse(
         total_count=len(news_list),
         batch_info=BatchInfo(**batch_info),
-        news=news_list
+        news=news_list,
+        next_cursor=next_cursor
     )
 
 # =============================================================================
@@ -421,23 +441,28 @@ async def get_batch_news(
     summary="긍정(Bullish) 뉴스"
 )
 async def get_bullish_news(
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="최근 N일 데이터"),
     limit: int = Query(20, ge=1, le=100, description="결과 개수 제한"),
-    offset: int = Query(0, ge=0, description="페이징 오프셋")
+    offset: int = Query(0, ge=0, description="페이징 오프셋 (deprecated: cursor 사용 권장)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 offset 무시)")
 ):
     """
     감성 점수 기준으로 긍정적 뉴스만 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    news_list = service.get_sentiment_filtered_news("bullish", days, limit, offset)
-    batch_info = service.get_batch_info()
+    try:
+        (news_list, next_cursor), batch_info = await asyncio.gather(
+            service.get_sentiment_filtered_news("bullish", days, limit, offset, cursor),
+            service.run_in_new_session(lambda s: s.get_batch_info())
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return MarketSentimentListResponse(
         total_count=len(news_list),
         batch_info=BatchInfo(**batch_info),
-        news=news_list
+        news=news_list,
+        next_cursor=next_cursor
     )
 
 
@@ -447,23 +472,28 @@ async def get_bullish_news(
     summary="부정(Bearish) 뉴스"
 )
 async def get_bearish_news(
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="최근 N일 데이터"),
     limit: int = Query(20, ge=1, le=100, description="결과 개수 제한"),
-    offset: int = Query(0, ge=0, description="페이징 오프셋")
+    offset: int = Query(0, ge=0, description="페이징 오프셋 (deprecated: cursor 사용 권장)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 offset 무시)")
 ):
     """
     감성 점수 기준으로 부정적 뉴스만 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    news_list = service.get_sentiment_filtered_news("bearish", days, limit, offset)
-    batch_info = service.get_batch_info()
+    try:
+        (news_list, next_cursor), batch_info = await asyncio.gather(
+            service.get_sentiment_filtered_news("bearish", days, limit, offset, cursor),
+            service.run_in_new_session(lambda s: s.get_batch_info())
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return MarketSentimentListResponse(
         total_count=len(news_list),
         batch_info=BatchInfo(**batch_info),
-        news=news_list
+        news=news_list,
+        next_cursor=next_cursor
     )
 
 
@@ -473,23 +503,28 @@ async def get_bearish_news(
     summary="중립(Neutral) 뉴스"
 )
 async def get_neutral_news(
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="최근 N일 데이터"),
     limit: int = Query(20, ge=1, le=100, description="결과 개수 제한"),
-    offset: int = Query(0, ge=0, description="페이징 오프셋")
+    offset: int = Query(0, ge=0, description="페이징 오프셋 (deprecated: cursor 사용 권장)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 offset 무시)")
 ):
     """
     감성 점수 기준으로 중립적 뉴스만 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    news_list = service.get_sentiment_filtered_news("neutral", days, limit, offset)
-    batch_info = service.get_batch_info()
+    try:
+        (news_list, next_cursor), batch_info = await asyncio.gather(
+            service.get_sentiment_filtered_news("neutral", days, limit, offset, cursor),
+            service.run_in_new_session(lambda s: s.get_batch_info())
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return MarketSentimentListResponse(
         total_count=len(news_list),
         batch_info=BatchInfo(**batch_info),
-        news=news_list
+        news=news_list,
+        next_cursor=next_cursor
     )
 
 # =============================================================================
@@ -497,24 +532,16 @@ async def get_neutral_news(
 # =============================================================================
 
 @router.get("/topics", response_model=TopicListResponse, summary="주제 목록")
-async def get_all_topics(db: Session = Depends(get_db)):
+@conditional_etag(_windowed_sentiment_data_version, cache_control=PUBLIC_CACHE_CONTROL)
+@cached_response("market_sentiment", expire=300)
+async def get_all_topics(request: Request, response: Response, service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service)):
     """
     수집 데이터에서 발견된 주제 목록과 간단 통계를 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    topics = service.get_all_topics()
+    topics = await service.get_all_topics()
     
-    # 주제별 간단한 통계 정보
-    topic_details = []
-    for topic in topics[:10]:  # 상위 10개만 상세 정보 제공
-        summary = service.calculate_topic_sentiment_summary(topic, days=7)
-        topic_details.append({
-            "topic": topic,
-            "news_count": summary.get("total_news", 0),
-            "avg_sentiment": summary.get("avg_sentiment_score", 0.0),
-            "sentiment_label": summary.get("sentiment_label", "알 수 없음")
-        })
+    # 최근 7일 뉴스 상위 10개 주제의 간단한 통계 정보
+    topic_details = await service.get_topics_with_summary(limit=10, days=7)
     
     return TopicListResponse(
         total_topics=len(topics),
@@ -530,7 +557,7 @@ async def get_all_topics(db: Session = Depends(get_db)):
 )
 async def get_topic_news(
     topic: str = Path(..., description="주제명", example="Technology"),
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="최근 N일 데이터"),
     limit: int = Query(20, ge=1, le=100, description="결과 개수 제한"),
     offset: int = Query(0, ge=0, description="페이징 오프셋")
@@ -538,9 +565,7 @@ async def get_topic_news(
     """
     특정 주제의 뉴스와 감성 요약을 반환합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    news_list, topic_summary = service.get_news_by_topic(topic, days, limit, offset)
+    news_list, topic_summary = await service.get_news_by_topic(topic, days, limit, offset)
     
     if not news_list:
         raise HTTPException(
@@ -560,8 +585,9 @@ async def get_topic_news(
     response_model=TopicRankingResponse,
     summary="주제 감성 랭킹"
 )
+@cached_response("market_sentiment", expire=300)
 async def get_topic_ranking(
-    db: Session = Depends(get_db),
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
     days: int = Query(7, ge=1, le=30, description="랭킹 계산 기간"),
     top_count: int = Query(10, ge=1, le=50, description="상위 주제 개수"),
     bottom_count: int = Query(10, ge=1, le=50, description="하위 주제 개수"),
@@ -570,9 +596,7 @@ async def get_topic_ranking(
     """
     최근 N일 기준 "긍정 상위/부정 하위" 주제 랭킹을 제공합니다.
     """
-    service = MarketNewsSentimentService(db)
-    
-    hot_topics, cold_topics = service.calculate_topic_sentiment_ranking(
+    hot_topics, cold_topics = await service.calculate_topic_sentiment_ranking(
         days, top_count, bottom_count, min_mentions
     )
     
@@ -592,36 +616,54 @@ async def get_topic_ranking(
     response_model=SentimentTrendsResponse,
     summary="감성 점수 추이 (차트용)"
 )
+@conditional_etag(_windowed_sentiment_data_version, cache_control=PUBLIC_CACHE_CONTROL)
+@cached_response("market_sentiment", expire=300)
 async def get_sentiment_trends(
-    db: Session = Depends(get_db),
-    interval: str = Query("daily", pattern="^(hourly|daily)$", description="시간 간격 (hourly/daily)"),
+    request: Request,
+    response: Response,
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
+    interval: TrendIntervalType = Query("daily", description="시간 간격 (hourly/daily)"),
     days: int = Query(7, ge=1, le=30, description="분석 기간"),
-    tickers: Optional[str] = Query(None, description="분석할 티커들 (쉼표 구분, 예: AAPL,TSLA,NVDA)"),
-    topics: Optional[str] = Query(None, description="분석할 주제들 (쉼표 구분, 예: Technology,Energy)")
+    tickers: Tuple[str, ...] = Depends(csv_query("tickers", "분석할 티커들 (쉼표 구분, 예: AAPL,TSLA,NVDA)", upper=True)),
+    topics: Tuple[str, ...] = Depends(csv_query("topics", "분석할 주제들 (쉼표 구분, 예: Technology,Energy)"))
 ):
     """
     시간 간격(시간/일)별 원시 감성 점수 추이 데이터를 반환합니다.
     
     - 필터: tickers, topics (쉼표 구분)
     """
-    service = MarketNewsSentimentService(db)
-    
-    # 티커 목록 파싱
-    ticker_list = None
-    if tickers:
-        ticker_list = [ticker.strip().upper() for ticker in tickers.split(",")]
-    
-    # 주제 목록 파싱
-    topic_list = None
-    if topics:
-        topic_list = [topic.strip() for topic in topics.split(",")]
-    
     # 감정 점수 추이 계산
-    trends_data = service.get_sentiment_trends(
+    trends_data = await service.get_sentiment_trends(
         interval=interval,
         days=days,
-        tickers=ticker_list,
-        topics=topic_list
+        tickers=tickers,
+        topics=topics
+    )
+    
+    return SentimentTrendsResponse(**trends_data)
+
+
+@router.get("/sentiment-trends/stream", summary="감성 점수 추이 스트리밍 (NDJSON)")
+async def stream_sentiment_trends(
+    service: MarketNewsSentimentService = Depends(get_market_news_sentiment_service),
+    interval: TrendIntervalType = Query("daily", description="시간 간격 (hourly/daily)"),
+    days: int = Query(7, ge=1, le=30, description="분석 기간"),
+    tickers: Tuple[str, ...] = Depends(csv_query("tickers", "분석할 티커들 (쉼표 구분, 예: AAPL,TSLA,NVDA)", upper=True)),
+    topics: Tuple[str, ...] = Depends(csv_query("topics", "분석할 주제들 (쉼표 구분, 예: Technology,Energy)"))
+):
+    """
+    /sentiment-trends와 같은 추이 데이터를 한 줄에 한 포인트씩 NDJSON으로 스트리밍합니다.
+    
+    - 첫 줄: {"type": "meta", "period", "interval"}
+    - 이후: {"type": "overall" | "ticker" | "topic", (ticker/topic), timestamp, avg_sentiment_score, ...}
+    - 티커/주제가 많고 기간이 긴 요청에서 전체 응답을 메모리에 만들지 않고 바로 전송을 시작합니다.
+    """
+    points = service.iter_in_new_session(
+        lambda s: s.iter_sentiment_trends(interval=interval, days=days, tickers=tickers, topics=topics)
     )
     
-    return SentimentTrendsResponse(**trends_data)
\ No newline at end of file
+    async def ndjson_lines():
+        async for point in points:
+            yield orjson.dumps(point) + b"\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
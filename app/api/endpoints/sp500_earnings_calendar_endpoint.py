@@ -1,6 +1,9 @@
 # app/api/endpoints/sp500_earnings_calendar_endpoint.py
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
 from typing import List, Optional
 from datetime import date, datetime
 
@@ -13,7 +16,11 @@ from app.schemas.sp500_earnings_calendar_schema import (
     SP500EarningsCalendarStats
 )
 from app.services.sp500_earnings_calendar_service import SP500EarningsCalendarService
-from app.dependencies import get_db
+from app.dependencies import get_async_db
+from app.utils.cache_utils import cached_response, conditional_etag
+
+# 목록 변환용 검증기 (스키마 컴파일은 한 번만, 목록 전체를 한 번에 검증)
+_SP500_EARNINGS_CALENDAR_LIST = TypeAdapter(List[SP500EarningsCalendarResponse])
 
 # S&P 500 실적 캘린더 라우터 생성
 router = APIRouter(
@@ -25,19 +32,57 @@ router = APIRouter(
     }
 )
 
+
+def _current_iso_week() -> str:
+    """
+    이번 주 ISO 주차 문자열 (예: "2025-W31")
+    
+    /weekly 응답 캐시 키에 포함시켜 주가 바뀌면 자동으로 새 키를 사용하게 합니다.
+    """
+    year, week, _ = date.today().isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+# 검색어 허용 형식: 영문/숫자와 회사명에 쓰이는 . & ' - 문자, 단어 사이 공백 한 칸 (앞뒤 공백 불가)
+SEARCH_QUERY_PATTERN = r"^[A-Za-z0-9.&'\-]+( [A-Za-z0-9.&'\-]+)*$"
+
+# 공개 조회 엔드포인트용 Cache-Control (CDN/브라우저 공유 캐시 허용)
+PUBLIC_CACHE_CONTROL = "public, max-age=60"
+# 이번 주/통계/향후 일정처럼 변동이 적은 응답은 더 길게 캐시
+PUBLIC_LONG_CACHE_CONTROL = "public, max-age=300"
+
+# ETag 버전 조회 (conditional_etag용)
+async def _calendar_data_version(db: AsyncSession, **_) -> Optional[str]:
+    """캘린더 ETag 버전: 최신 수정 시간 + 전체 행 수"""
+    return await SP500EarningsCalendarService(db).get_data_version()
+
+async def _dated_calendar_data_version(db: AsyncSession, **_) -> Optional[str]:
+    """오늘 기준 범위 ETag 버전: 캘린더 버전 + 현재 날짜 (새 데이터가 없어도 날짜가 바뀌면 범위가 이동)"""
+    version = await SP500EarningsCalendarService(db).get_data_version()
+    return f"{version}:{date.today().isoformat()}" if version else None
+
+async def _upcoming_calendar_data_version(db: AsyncSession, **_) -> Optional[str]:
+    """이번 주/향후 일정 ETag 버전: 실제로 읽는 materialized view 버전 + 현재 날짜"""
+    version = await SP500EarningsCalendarService(db).get_upcoming_data_version()
+    return f"{version}:{date.today().isoformat()}" if version else None
+
 @router.get(
     "/",
     response_model=SP500EarningsCalendarListResponse,
     summary="S&P 500 실적 발표 캘린더 전체 조회",
     description="프론트엔드 캘린더 컴포넌트에 표시할 모든 S&P 500 실적 발표 일정을 조회합니다. 날짜 제한 없이 전체 데이터를 제공하되, 필터링 옵션을 제공합니다."
 )
+@conditional_etag(_calendar_data_version, cache_control=PUBLIC_CACHE_CONTROL)
 async def get_sp500_earnings_calendar(
+    request: Request,
+    response: Response,
     start_date: Optional[date] = Query(None, description="조회 시작일 (옵션)", example="2025-08-01"),
     end_date: Optional[date] = Query(None, description="조회 종료일 (옵션)", example="2025-12-31"),
     symbol: Optional[str] = Query(None, description="주식 심볼 필터 (옵션)", example="AAPL"),
     sector: Optional[str] = Query(None, description="GICS 섹터 필터 (옵션)", example="Information Technology"),
     limit: int = Query(100, ge=1, le=10000, description="최대 조회 개수", example=100),
-    db: Session = Depends(get_db)
+    exact_count: bool = Query(False, description="정확한 전체 개수 계산 여부 (false면 실행 계획 기반 추정치)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **S&P 500 실적 발표 캘린더 전체 조회**
@@ -58,8 +103,9 @@ async def get_sp500_earnings_calendar(
     ```
     
     **응답 데이터:**
-    - 실적 일정 목록과 총 개수
+    - 실적 일정 목록과 총 개수 (X-Total-Count 헤더로도 제공)
     - 각 이벤트의 상세 정보
+    - total_count는 기본적으로 추정치이며, exact_count=true일 때만 COUNT(*)로 정확히 계산
     """
     try:
         # 쿼리 파라미터 객체 생성 및 검증 (has_estimate=None, offset=0 기본값 사용)
@@ -75,20 +121,15 @@ async def get_sp500_earnings_calendar(
         
         # 서비스 클래스를 통해 비즈니스 로직 처리
         service = SP500EarningsCalendarService(db)
-        earnings_list, total_count = service.get_all_calendar_events(params)
-        
-        # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        items = [
-            SP500EarningsCalendarResponse.model_validate(earnings) 
-            for earnings in earnings_list
-        ]
+        earnings_list, total_count = await service.get_all_calendar_events(params, exact_count=exact_count)
+        response.headers["X-Total-Count"] = str(total_count)
         
-        # 최종 응답 구성
-        return SP500EarningsCalendarListResponse(
-            items=items,
-            total_count=total_count,
-            message=f"총 {total_count}개의 S&P 500 실적 일정을 조회했습니다."
-        )
+        # ORM 객체를 그대로 반환 (response_model이 from_attributes로 한 번만 검증/직렬화)
+        return {
+            "items": earnings_list,
+            "total_count": total_count,
+            "message": f"총 {total_count}개의 S&P 500 실적 일정을 조회했습니다."
+        }
         
     except Exception as e:
         raise HTTPException(
@@ -96,13 +137,59 @@ async def get_sp500_earnings_calendar(
             detail=f"S&P 500 실적 캘린더 조회 중 오류가 발생했습니다: {str(e)}"
         )
 
+@router.get(
+    "/stream",
+    summary="S&P 500 실적 발표 캘린더 전체 스트리밍 (NDJSON)",
+    description="전체 조회(/)와 같은 필터로 실적 일정을 한 줄에 한 건씩 NDJSON으로 스트리밍합니다."
+)
+async def stream_sp500_earnings_calendar(
+    start_date: Optional[date] = Query(None, description="조회 시작일 (옵션)", example="2025-08-01"),
+    end_date: Optional[date] = Query(None, description="조회 종료일 (옵션)", example="2025-12-31"),
+    symbol: Optional[str] = Query(None, description="주식 심볼 필터 (옵션)", example="AAPL"),
+    sector: Optional[str] = Query(None, description="GICS 섹터 필터 (옵션)", example="Information Technology"),
+    limit: int = Query(10000, ge=1, le=10000, description="최대 조회 개수", example=10000),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    **S&P 500 실적 발표 캘린더 전체 스트리밍**
+    
+    - 각 줄은 SP500EarningsCalendarResponse와 같은 형식의 JSON 객체입니다.
+    - 서버 측 커서로 500건씩 읽어 바로 전송하므로 limit이 커도 전체 목록을 메모리에 만들지 않습니다.
+    - 수천 건을 한 번에 받아야 하는 캘린더 초기 로딩에 사용합니다.
+    """
+    params = SP500EarningsCalendarQueryParams(
+        start_date=start_date,
+        end_date=end_date,
+        symbol=symbol,
+        sector=sector,
+        has_estimate=None,
+        limit=limit,
+        offset=0
+    )
+    
+    service = SP500EarningsCalendarService(db)
+    events = service.iter_in_new_session(lambda s: s.iter_calendar_events(params))
+    
+    async def ndjson_lines():
+        async for event in events:
+            yield orjson.dumps(SP500EarningsCalendarResponse.model_validate(event).model_dump(mode="json")) + b"\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
 @router.get(
     "/weekly",
     response_model=SP500EarningsCalendarWeeklyResponse,
     summary="이번 주 S&P 500 실적 발표 일정",
     description="캘린더 하단에 표시할 이번 주(월~일) S&P 500 실적 발표 일정을 조회합니다."
 )
-async def get_weekly_sp500_earnings(db: Session = Depends(get_db)):
+@conditional_etag(_upcoming_calendar_data_version, cache_control=PUBLIC_LONG_CACHE_CONTROL)
+@cached_response("sp500_earnings", expire=300)
+async def get_weekly_sp500_earnings(
+    request: Request,
+    response: Response,
+    iso_week: str = Depends(_current_iso_week),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     **이번 주 S&P 500 실적 발표 일정 조회**
     
@@ -127,13 +214,10 @@ async def get_weekly_sp500_earnings(db: Session = Depends(get_db)):
     try:
         # 서비스 클래스를 통해 이번 주 일정 조회
         service = SP500EarningsCalendarService(db)
-        weekly_events, week_start, week_end = service.get_weekly_events()
+        weekly_events, week_start, week_end = await service.get_weekly_events()
         
         # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        events = [
-            SP500EarningsCalendarResponse.model_validate(event) 
-            for event in weekly_events
-        ]
+        events = _SP500_EARNINGS_CALENDAR_LIST.validate_python(weekly_events, from_attributes=True)
         
         # 최종 응답 구성
         return SP500EarningsCalendarWeeklyResponse(
@@ -156,10 +240,13 @@ async def get_weekly_sp500_earnings(db: Session = Depends(get_db)):
     summary="특정 심볼의 S&P 500 실적 발표 일정",
     description="특정 주식 심볼의 모든 실적 발표 일정을 조회합니다. (옵션 기능)"
 )
+@conditional_etag(_calendar_data_version, cache_control=PUBLIC_CACHE_CONTROL)
 async def get_sp500_earnings_by_symbol(
+    request: Request,
+    response: Response,
     symbol: str = Path(..., description="주식 심볼", example="AAPL", regex=r"^[A-Z]{1,5}$"),
     limit: int = Query(10, ge=1, le=50, description="최대 조회 개수", example=10),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **특정 심볼의 S&P 500 실적 발표 일정 조회**
@@ -188,7 +275,7 @@ async def get_sp500_earnings_by_symbol(
         
         # 서비스 클래스를 통해 특정 심볼 일정 조회
         service = SP500EarningsCalendarService(db)
-        earnings_list = service.get_earnings_by_symbol(symbol, limit)
+        earnings_list, total_count = await service.get_earnings_by_symbol(symbol, limit)
         
         if not earnings_list:
             raise HTTPException(
@@ -196,27 +283,17 @@ async def get_sp500_earnings_by_symbol(
                 detail=f"심볼 '{symbol}'에 대한 S&P 500 실적 일정을 찾을 수 없습니다."
             )
         
-        # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        earnings = [
-            SP500EarningsCalendarResponse.model_validate(earning) 
-            for earning in earnings_list
-        ]
-        
         # 회사명 추출 (첫 번째 레코드에서)
         company_name = earnings_list[0].company_name if earnings_list else None
         
-        # 총 개수 조회 (제한 없이)
-        all_earnings = service.get_earnings_by_symbol(symbol, limit=None)
-        total_count = len(all_earnings)
-        
-        # 최종 응답 구성
-        return SP500EarningsCalendarBySymbolResponse(
-            symbol=symbol,
-            company_name=company_name,
-            earnings=earnings,
-            total_count=total_count,
-            message=f"{symbol}의 실적 일정 {len(earnings)}개를 조회했습니다. (전체 {total_count}개)"
-        )
+        # ORM 객체를 그대로 반환 (response_model이 from_attributes로 한 번만 검증/직렬화)
+        return {
+            "symbol": symbol,
+            "company_name": company_name,
+            "earnings": earnings_list,
+            "total_count": total_count,
+            "message": f"{symbol}의 실적 일정 {len(earnings_list)}개를 조회했습니다. (전체 {total_count}개)"
+        }
         
     except HTTPException:
         raise
@@ -232,7 +309,13 @@ async def get_sp500_earnings_by_symbol(
     summary="S&P 500 실적 캘린더 통계",
     description="S&P 500 실적 캘린더의 전체 통계 정보를 제공합니다."
 )
-async def get_sp500_earnings_statistics(db: Session = Depends(get_db)):
+@conditional_etag(_dated_calendar_data_version, cache_control=PUBLIC_LONG_CACHE_CONTROL)
+@cached_response("sp500_earnings", expire=300)
+async def get_sp500_earnings_statistics(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     **S&P 500 실적 캘린더 통계 정보**
     
@@ -254,7 +337,7 @@ async def get_sp500_earnings_statistics(db: Session = Depends(get_db)):
     try:
         # 서비스 클래스를 통해 통계 정보 조회
         service = SP500EarningsCalendarService(db)
-        stats = service.get_calendar_statistics()
+        stats = await service.get_calendar_statistics()
         
         # Pydantic 응답 모델로 변환
         return SP500EarningsCalendarStats(**stats)
@@ -271,9 +354,12 @@ async def get_sp500_earnings_statistics(db: Session = Depends(get_db)):
     summary="향후 S&P 500 실적 발표 일정",
     description="향후 N일 내의 S&P 500 실적 발표 일정을 조회합니다."
 )
+@conditional_etag(_upcoming_calendar_data_version, cache_control=PUBLIC_LONG_CACHE_CONTROL)
 async def get_upcoming_sp500_earnings(
+    request: Request,
+    response: Response,
     days: int = Query(30, ge=1, le=365, description="조회할 일수", example=30),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **향후 S&P 500 실적 발표 일정**
@@ -289,13 +375,10 @@ async def get_upcoming_sp500_earnings(
     try:
         # 서비스 클래스를 통해 향후 일정 조회
         service = SP500EarningsCalendarService(db)
-        upcoming_events = service.get_upcoming_events(days)
+        upcoming_events = await service.get_upcoming_events(days)
         
-        # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        return [
-            SP500EarningsCalendarResponse.model_validate(event) 
-            for event in upcoming_events
-        ]
+        # ORM 객체를 그대로 반환 (response_model이 from_attributes로 한 번만 검증/직렬화)
+        return upcoming_events
         
     except Exception as e:
         raise HTTPException(
@@ -309,15 +392,26 @@ async def get_upcoming_sp500_earnings(
     summary="S&P 500 실적 이벤트 검색",
     description="키워드로 S&P 500 실적 이벤트를 검색합니다."
 )
+@conditional_etag(_calendar_data_version, cache_control=PUBLIC_CACHE_CONTROL)
 async def search_sp500_earnings(
-    q: str = Query(..., description="검색어 (심볼, 회사명, 이벤트 제목)", example="Apple"),
+    request: Request,
+    response: Response,
+    q: str = Query(
+        ...,
+        min_length=2,
+        max_length=64,
+        pattern=SEARCH_QUERY_PATTERN,
+        description="검색어 (심볼, 회사명, 이벤트 제목 / 2~64자, 영문/숫자/공백/.&'-)",
+        example="Apple"
+    ),
     limit: int = Query(20, ge=1, le=100, description="최대 조회 개수", example=20),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **S&P 500 실적 이벤트 검색**
     
     심볼, 회사명, 이벤트 제목을 대상으로 검색합니다.
+    검색어 길이/문자 검증은 파라미터 선언에서 처리되어, 잘못된 검색어는 DB 조회 없이 422로 거절됩니다.
     
     **사용 예시:**
     ```
@@ -326,21 +420,12 @@ async def search_sp500_earnings(
     ```
     """
     try:
-        if len(q.strip()) < 2:
-            raise HTTPException(
-                status_code=422,
-                detail="검색어는 최소 2글자 이상이어야 합니다."
-            )
-        
         # 서비스 클래스를 통해 검색
         service = SP500EarningsCalendarService(db)
-        search_results = service.search_events(q.strip(), limit)
+        search_results = await service.search_events(q, limit)
         
-        # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        return [
-            SP500EarningsCalendarResponse.model_validate(result) 
-            for result in search_results
-        ]
+        # ORM 객체를 그대로 반환 (response_model이 from_attributes로 한 번만 검증/직렬화)
+        return search_results
         
     except HTTPException:
         raise
@@ -1,6 +1,6 @@
 # app/api/endpoints/sp500_earnings_news_endpoint.py
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 
@@ -12,7 +12,7 @@ from app.schemas.sp500_earnings_news_schema import (
     SP500EarningsNewsQueryParams,
 )
 from app.services.sp500_earnings_news_service import SP500EarningsNewsService
-from app.dependencies import get_db
+from app.dependencies import get_async_db
 
 # S&P 500 실적 뉴스 라우터 생성
 router = APIRouter(
@@ -32,7 +32,7 @@ router = APIRouter(
 )
 async def get_earnings_news_by_calendar_id(
     calendar_id: int = Path(..., description="실적 캘린더 ID", example=8, ge=1),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **특정 실적 이벤트의 관련 뉴스 조회 (메인 기능)**
@@ -65,7 +65,7 @@ async def get_earnings_news_by_calendar_id(
     try:
         # 서비스 클래스를 통해 캘린더 정보와 뉴스 조회
         service = SP500EarningsNewsService(db)
-        news_data = service.get_news_with_calendar_info(calendar_id)
+        news_data = await service.get_news_with_calendar_info(calendar_id)
         
         if not news_data:
             raise HTTPException(
@@ -73,41 +73,16 @@ async def get_earnings_news_by_calendar_id(
                 detail=f"캘린더 ID {calendar_id}에 해당하는 실적 이벤트를 찾을 수 없습니다."
             )
         
-        # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        forecast_news = []
-        for news in news_data["forecast_news"]:
-            # SQLAlchemy 객체를 딕셔너리로 변환 후 계산된 필드 추가
-            news_dict = news.to_dict()
-            news_dict.update({
-                'is_forecast_news': news.is_forecast_news,
-                'is_reaction_news': news.is_reaction_news,
-                'has_content': news.has_content,
-                'short_title': news.short_title
-            })
-            forecast_news.append(SP500EarningsNewsResponse.model_validate(news_dict))
-        
-        reaction_news = []
-        for news in news_data["reaction_news"]:
-            # SQLAlchemy 객체를 딕셔너리로 변환 후 계산된 필드 추가
-            news_dict = news.to_dict()
-            news_dict.update({
-                'is_forecast_news': news.is_forecast_news,
-                'is_reaction_news': news.is_reaction_news,
-                'has_content': news.has_content,
-                'short_title': news.short_title
-            })
-            reaction_news.append(SP500EarningsNewsResponse.model_validate(news_dict))
-        
-        # 최종 응답 구성
-        return SP500EarningsNewsWithCalendarResponse(
-            calendar_info=news_data["calendar_info"],
-            forecast_news=forecast_news,
-            reaction_news=reaction_news,
-            total_news_count=news_data["total_news_count"],
-            forecast_news_count=news_data["forecast_news_count"],
-            reaction_news_count=news_data["reaction_news_count"],
-            message=f"{news_data['calendar_info']['symbol']} 실적 관련 뉴스 {news_data['total_news_count']}개를 조회했습니다."
-        )
+        # ORM 객체를 그대로 반환 (response_model이 from_attributes로 한 번만 검증/직렬화)
+        return {
+            "calendar_info": news_data["calendar_info"],
+            "forecast_news": news_data["forecast_news"],
+            "reaction_news": news_data["reaction_news"],
+            "total_news_count": news_data["total_news_count"],
+            "forecast_news_count": news_data["forecast_news_count"],
+            "reaction_news_count": news_data["reaction_news_count"],
+            "message": f"{news_data['calendar_info']['symbol']} 실적 관련 뉴스 {news_data['total_news_count']}개를 조회했습니다."
+        }
         
     except HTTPException:
         raise
@@ -123,7 +98,7 @@ async def get_earnings_news_by_calendar_id(
     summary="이번 주 실적 관련 뉴스 전체 조회",
     description="이번 주 실적 발표 일정과 관련된 모든 뉴스를 한 번에 조회합니다. earnings_calendar의 weekly API와 연계된 통합 API입니다."
 )
-async def get_weekly_earnings_news(db: Session = Depends(get_db)):
+async def get_weekly_earnings_news(db: AsyncSession = Depends(get_async_db)):
     """
     **이번 주 실적 관련 뉴스 전체 조회 (통합 API)**
     
@@ -153,7 +128,7 @@ async def get_weekly_earnings_news(db: Session = Depends(get_db)):
     try:
         # 서비스 클래스를 통해 이번 주 뉴스 조회
         service = SP500EarningsNewsService(db)
-        weekly_data = service.get_weekly_news()
+        weekly_data = await service.get_weekly_news()
         
         # 최종 응답 구성
         return SP500EarningsNewsWeeklyResponse(
@@ -182,7 +157,7 @@ async def get_weekly_earnings_news(db: Session = Depends(get_db)):
 async def get_forecast_news_by_calendar_id(
     calendar_id: int = Path(..., description="실적 캘린더 ID", example=8, ge=1),
     limit: int = Query(20, ge=1, le=100, description="최대 조회 개수", example=20),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **특정 실적 이벤트의 예측 뉴스만 조회**
@@ -198,7 +173,7 @@ async def get_forecast_news_by_calendar_id(
     try:
         # 서비스 클래스를 통해 예측 뉴스 조회
         service = SP500EarningsNewsService(db)
-        forecast_news = service.get_forecast_news(calendar_id, limit)
+        forecast_news = await service.get_forecast_news(calendar_id, limit)
         
         if not forecast_news:
             raise HTTPException(
@@ -206,20 +181,8 @@ async def get_forecast_news_by_calendar_id(
                 detail=f"캘린더 ID {calendar_id}에 해당하는 예측 뉴스를 찾을 수 없습니다."
             )
         
-        # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        news_responses = []
-        for news in forecast_news:
-            # SQLAlchemy 객체를 딕셔너리로 변환 후 계산된 필드 추가
-            news_dict = news.to_dict()
-            news_dict.update({
-                'is_forecast_news': news.is_forecast_news,
-                'is_reaction_news': news.is_reaction_news,
-                'has_content': news.has_content,
-                'short_title': news.short_title
-            })
-            news_responses.append(SP500EarningsNewsResponse.model_validate(news_dict))
-        
-        return news_responses
+        # ORM 객체를 그대로 반환 (response_model이 from_attributes로 한 번만 검증/직렬화)
+        return forecast_news
         
     except HTTPException:
         raise
@@ -238,7 +201,7 @@ async def get_forecast_news_by_calendar_id(
 async def get_reaction_news_by_calendar_id(
     calendar_id: int = Path(..., description="실적 캘린더 ID", example=8, ge=1),
     limit: int = Query(20, ge=1, le=100, description="최대 조회 개수", example=20),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **특정 실적 이벤트의 반응 뉴스만 조회**
@@ -254,7 +217,7 @@ async def get_reaction_news_by_calendar_id(
     try:
         # 서비스 클래스를 통해 반응 뉴스 조회
         service = SP500EarningsNewsService(db)
-        reaction_news = service.get_reaction_news(calendar_id, limit)
+        reaction_news = await service.get_reaction_news(calendar_id, limit)
         
         if not reaction_news:
             raise HTTPException(
@@ -262,20 +225,8 @@ async def get_reaction_news_by_calendar_id(
                 detail=f"캘린더 ID {calendar_id}에 해당하는 반응 뉴스를 찾을 수 없습니다."
             )
         
-        # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        news_responses = []
-        for news in reaction_news:
-            # SQLAlchemy 객체를 딕셔너리로 변환 후 계산된 필드 추가
-            news_dict = news.to_dict()
-            news_dict.update({
-                'is_forecast_news': news.is_forecast_news,
-                'is_reaction_news': news.is_reaction_news,
-                'has_content': news.has_content,
-                'short_title': news.short_title
-            })
-            news_responses.append(SP500EarningsNewsResponse.model_validate(news_dict))
-        
-        return news_responses
+        # ORM 객체를 그대로 반환 (response_model이 from_attributes로 한 번만 검증/직렬화)
+        return reaction_news
         
     except HTTPException:
         raise
@@ -298,7 +249,7 @@ async def get_all_news_by_calendar_id(
     has_content: Optional[bool] = Query(None, description="본문 내용이 있는 뉴스만", example=True),
     limit: int = Query(50, ge=1, le=200, description="최대 조회 개수", example=50),
     offset: int = Query(0, ge=0, description="건너뛸 개수 (페이징)", example=0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     **특정 실적 이벤트의 모든 뉴스 조회 (고급 필터링)**
@@ -324,7 +275,7 @@ async def get_all_news_by_calendar_id(
         
         # 서비스 클래스를 통해 뉴스 조회
         service = SP500EarningsNewsService(db)
-        news_list, total_count = service.get_news_by_calendar_id(calendar_id, params)
+        news_list, total_count, section_counts = await service.get_news_by_calendar_id(calendar_id, params)
         
         if not news_list:
             raise HTTPException(
@@ -332,32 +283,16 @@ async def get_all_news_by_calendar_id(
                 detail=f"캘린더 ID {calendar_id}에 해당하는 뉴스를 찾을 수 없습니다."
             )
         
-        # SQLAlchemy 객체를 Pydantic 응답 모델로 변환
-        items = []
-        for news in news_list:
-            # SQLAlchemy 객체를 딕셔너리로 변환 후 계산된 필드 추가
-            news_dict = news.to_dict()
-            news_dict.update({
-                'is_forecast_news': news.is_forecast_news,
-                'is_reaction_news': news.is_reaction_news,
-                'has_content': news.has_content,
-                'short_title': news.short_title
-            })
-            items.append(SP500EarningsNewsResponse.model_validate(news_dict))
-        
-        # 섹션별 개수 계산
-        forecast_count = len([item for item in items if item.news_section == "forecast"])
-        reaction_count = len([item for item in items if item.news_section == "reaction"])
-        
-        # 최종 응답 구성
-        return SP500EarningsNewsListResponse(
-            calendar_id=calendar_id,
-            items=items,
-            total_count=total_count,
-            forecast_count=forecast_count,
-            reaction_count=reaction_count,
-            message=f"캘린더 ID {calendar_id}의 뉴스 {len(items)}개를 조회했습니다. (전체 {total_count}개)"
-        )
+        # 최종 응답 구성 (섹션별 개수는 페이지가 아닌 필터 결과 전체 기준)
+        # ORM 객체를 그대로 반환 (response_model이 from_attributes로 한 번만 검증/직렬화)
+        return {
+            "calendar_id": calendar_id,
+            "items": news_list,
+            "total_count": total_count,
+            "forecast_count": section_counts["forecast"],
+            "reaction_count": section_counts["reaction"],
+            "message": f"캘린더 ID {calendar_id}의 뉴스 {len(news_list)}개를 조회했습니다. (전체 {total_count}개)"
+        }
         
     except HTTPException:
         raise
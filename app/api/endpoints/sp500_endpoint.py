@@ -1,45 +1,90 @@
 # app/api/endpoints/sp500_endpoint.py
-from fastapi import APIRouter, HTTPException, Depends, Query, Path
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, Query, Path, Request, Response
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
+import re
 from datetime import datetime
 import pytz
 from app.database import get_db
-from app.services.sp500_service import SP500Service
+from app.services.sp500_service import SP500Service, MarketTimeChecker
 from app.services.company_overview_service import CompanyOverviewService  # 🆕 추가
 from app.services.balance_sheet_service import BalanceSheetService  # 🆕 추가
 from app.schemas.sp500_schema import (
     StockListResponse, StockDetail, CategoryStockResponse,
     SearchResponse, MarketOverviewResponse,
     ServiceStats, HealthCheckResponse, ErrorResponse,
-    TimeframeEnum, create_error_response
+    TimeframeEnum, error_detail
 )
+from app.utils.cache_utils import cached_response, conditional_etag, single_flight
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
-# 라우터 생성
-router = APIRouter()
+# 라우터 생성 (목록/차트 등 큰 페이로드 직렬화는 orjson 사용)
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# 서비스 인스턴스 생성 (의존성)
-def get_sp500_service() -> SP500Service:
+# 서비스 인스턴스 (모듈 로드 시 1회 생성)
+# 서비스는 요청별 상태 없이 메서드마다 세션을 열기 때문에 공유해도 안전하며,
+# 의존성 함수를 async로 두어 요청마다 threadpool을 거치지 않고 이벤트 루프에서 바로 해석합니다.
+# /stats의 누적 통계도 인스턴스 공유로 실제 요청 수를 반영합니다.
+_sp500_service = SP500Service()
+_company_overview_service = CompanyOverviewService()
+_balance_sheet_service = BalanceSheetService()
+
+async def get_sp500_service() -> SP500Service:
     """SP500Service 의존성 제공"""
-    return SP500Service()
+    return _sp500_service
 
-def get_company_overview_service() -> CompanyOverviewService:
+async def get_company_overview_service() -> CompanyOverviewService:
     """CompanyOverviewService 의존성 제공"""
-    return CompanyOverviewService()
+    return _company_overview_service
 
-def get_balance_sheet_service() -> BalanceSheetService:
+async def get_balance_sheet_service() -> BalanceSheetService:
     """BalanceSheetService 의존성 제공"""
-    return BalanceSheetService()
+    return _balance_sheet_service
+
+# 목록/개요 응답 캐시 TTL (초): 장중에는 가격이 계속 바뀌므로 짧게, 장 마감 후에는 길게
+MARKET_OPEN_CACHE_TTL = 15
+MARKET_CLOSED_CACHE_TTL = 600
+
+_market_checker = MarketTimeChecker()
+
+# 일괄 조회(/symbol?symbols=...) 제한 및 심볼 형식 (모듈 로드 시 1회 컴파일)
+MAX_BATCH_SYMBOLS = 50
+_SYMBOL_PATTERN = re.compile(r"^[A-Z]{1,5}$")
+
+def _market_cache_ttl() -> int:
+    """현재 시장 상태에 맞는 응답 캐시 TTL"""
+    return MARKET_OPEN_CACHE_TTL if _market_checker.is_market_open() else MARKET_CLOSED_CACHE_TTL
+
+# 차트 응답 캐시: 심볼/시간대별 Redis 캐시 + 최신 거래 시각 기반 ETag
+CHART_CACHE_TTL = 30
+CHART_CACHE_CONTROL = "public, max-age=30"
+
+async def _chart_data_version(symbol: str, **_) -> Optional[str]:
+    """차트 ETag 버전: 최신 거래 시각 (차트 범위가 이 시각 기준으로 정해짐)"""
+    return await _sp500_service.get_data_version(symbol)
+
+# 개요/순위/검색 응답: 짧게 공유 캐시 + 최신 거래 시각 기반 ETag (CDN/브라우저 재검증)
+LIST_CACHE_CONTROL = "public, max-age=5, stale-while-revalidate=30"
+
+async def _list_data_version(**_) -> Optional[str]:
+    """목록 ETag 버전: 전체 최신 거래 시각 + 전일 종가 기준 시점"""
+    return await _sp500_service.get_data_version()
+
 # =========================
 # 🎯 주식 리스트 및 개요 엔드포인트
 # =========================
 
 @router.get("/market-overview", response_model=MarketOverviewResponse, summary="시장 개요 조회")
+@conditional_etag(_list_data_version, cache_control=LIST_CACHE_CONTROL)
+@cached_response("sp500", expire=_market_cache_ttl)
+@single_flight("sp500")
 async def get_market_overview(
+    request: Request,
+    response: Response,
     sp500_service: SP500Service = Depends(get_sp500_service)
 ):
     """
@@ -65,33 +110,34 @@ async def get_market_overview(
     try:
         logger.info("📊 시장 개요 조회 요청")
         
-        result = sp500_service.get_market_overview()
+        result = await sp500_service.get_market_overview()
         
         if result.get('error'):
-            logger.error(f"❌ 시장 개요 조회 실패: {result['error']}")
+            logger.error("❌ 시장 개요 조회 실패: %s", result['error'])
             raise HTTPException(
                 status_code=500,
-                detail=create_error_response(
+                detail=error_detail(
                     error_type="MARKET_DATA_ERROR",
                     message=f"Failed to fetch market overview: {result['error']}",
                     path="/stocks/sp500/market-overview"
-                ).model_dump()
+                )
             )
         
         logger.info("✅ 시장 개요 조회 성공")
-        return MarketOverviewResponse(**result)
+        # 서비스 결과 dict를 그대로 반환 (response_model이 한 번만 검증/직렬화)
+        return result
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 예상치 못한 오류: {e}")
+        logger.error("❌ 예상치 못한 오류: %s", e)
         raise HTTPException(
             status_code=500,
-            detail=create_error_response(
+            detail=error_detail(
                 error_type="INTERNAL_ERROR",
                 message="Internal server error occurred",
                 path="/stocks/sp500/market-overview"
-            ).model_dump()
+            )
         )
 
 # 🔥 /polling 엔드포인트 제거됨 - WebSocket으로 대체
@@ -101,9 +147,109 @@ async def get_market_overview(
 # 🎯 개별 주식 상세 조회 엔드포인트 (Company Overview 통합) 🆕
 # =========================
 
+@router.get("/symbol", summary="여러 주식 기본 정보 일괄 조회 (관심 종목용)")
+@cached_response("sp500", expire=_market_cache_ttl)
+@single_flight("sp500")
+async def get_stocks_batch(
+    symbols: str = Query(..., description=f"쉼표로 구분한 주식 심볼 목록 (최대 {MAX_BATCH_SYMBOLS}개, 예: AAPL,MSFT,TSLA)"),
+    sp500_service: SP500Service = Depends(get_sp500_service),
+    company_service: CompanyOverviewService = Depends(get_company_overview_service)
+):
+    """
+    여러 주식의 실시간 주가 + 기업 정보 일괄 조회
+    
+    **주요 기능:**
+    - 관심 종목 화면에서 /symbol/{symbol}을 N번 호출하는 대신 한 번에 조회
+    - 심볼 수와 관계없이 고정 개수의 배치 쿼리로 처리
+    - 심볼별 `current_price`, `company_info`는 /symbol/{symbol} 응답과 같은 구조
+    
+    **사용 예시:**
+    ```
+    GET /stocks/sp500/symbol?symbols=AAPL,MSFT,TSLA
+    ```
+    
+    **참고:** 재무상태표(Balance Sheet)와 통합 분석은 포함하지 않습니다. 필요하면 /symbol/{symbol}을 사용하세요.
+    """
+    symbol_list = list(dict.fromkeys(s.strip().upper() for s in symbols.split(",") if s.strip()))
+    invalid = [s for s in symbol_list if not _SYMBOL_PATTERN.fullmatch(s)]
+    
+    if not symbol_list or invalid or len(symbol_list) > MAX_BATCH_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=error_detail(
+                error_type="INVALID_SYMBOLS",
+                message=(
+                    f"Invalid symbols: {', '.join(invalid)}" if invalid
+                    else f"Provide between 1 and {MAX_BATCH_SYMBOLS} symbols"
+                ),
+                path="/stocks/sp500/symbol"
+            )
+        )
+    
+    try:
+        logger.info("주식 기본 정보 일괄 조회: %d개", len(symbol_list))
+        
+        # SP500 실시간 데이터 / Company Overview를 동시에 조회
+        stock_result, company_data = await asyncio.gather(
+            sp500_service.get_stocks_basic_info(symbol_list),
+            company_service.get_companies_basic_metrics(symbol_list)
+        )
+        
+        if stock_result.get('error'):
+            raise HTTPException(
+                status_code=500,
+                detail=error_detail(
+                    error_type="STOCK_DATA_ERROR",
+                    message=f"Failed to fetch stock data: {stock_result['error']}",
+                    path="/stocks/sp500/symbol"
+                )
+            )
+        
+        stocks = {}
+        for symbol, current_price in stock_result['stocks'].items():
+            company = company_data.get(symbol)
+            stocks[symbol] = {
+                'symbol': symbol,
+                'current_price': current_price,
+                'company_info': {
+                    'available': company is not None,
+                    'data': {
+                        'name': company.get('company_name'),
+                        'sector': company.get('sector'),
+                        'industry': company.get('industry'),
+                        'market_cap': company.get('market_cap'),
+                        'pe_ratio': company.get('pe_ratio'),
+                        'dividend_yield': company.get('dividend_yield'),
+                        'beta': company.get('beta')
+                    } if company else None
+                }
+            }
+        
+        return {
+            'stocks': stocks,
+            'not_found': [symbol for symbol in symbol_list if symbol not in stocks],
+            'total_count': len(stocks),
+            'timestamp': datetime.now(pytz.UTC).isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("주식 기본 정보 일괄 조회 실패: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=error_detail(
+                error_type="INTERNAL_ERROR",
+                message="Internal server error occurred",
+                path="/stocks/sp500/symbol"
+            )
+        )
+
 @router.get("/symbol/{symbol}", summary="개별 주식 통합 정보 조회 (Company Overview + Balance Sheet)")
+@cached_response("sp500", expire=_market_cache_ttl, not_found_expire=MARKET_OPEN_CACHE_TTL)
+@single_flight("sp500")
 async def get_stock_detail_with_integrated_data(
-    symbol: str = Path(..., description="주식 심볼 (예: AAPL)", regex=r"^[A-Z]{1,5}$"),
+    symbol: str = Path(..., description="주식 심볼 (예: AAPL)", pattern=r"^[A-Z]{1,5}$"),
     sp500_service: SP500Service = Depends(get_sp500_service),
     company_service: CompanyOverviewService = Depends(get_company_overview_service),
     balance_service: BalanceSheetService = Depends(get_balance_sheet_service)  # 추가
@@ -137,48 +283,58 @@ async def get_stock_detail_with_integrated_data(
     - `data_status`: 각 데이터 소스별 가용성
     """
     try:
-        symbol = symbol.upper()
-        logger.info(f"통합 주식 정보 조회: {symbol}")
+        logger.info("통합 주식 정보 조회: %s", symbol)
         
-        # 1. SP500 실시간 데이터 조회 (필수)
-        stock_result = sp500_service.get_stock_basic_info(symbol)
+        # 1~3. SP500 실시간 데이터(필수) / Company Overview(옵션) / Balance Sheet(옵션)
+        # 서로 독립적인 조회이므로 동시에 실행 (Balance Sheet는 동기 서비스라 스레드에서 실행)
+        stock_result, company_result, balance_result = await asyncio.gather(
+            sp500_service.get_stock_basic_info(symbol),
+            company_service.get_company_basic_metrics(symbol),
+            asyncio.to_thread(_get_balance_sheet_summary, balance_service, symbol),
+            return_exceptions=True
+        )
+        
+        if isinstance(stock_result, Exception):
+            stock_result = {'symbol': symbol, 'error': str(stock_result)}
+        if isinstance(company_result, Exception):
+            logger.error("❌ %s Company Overview 조회 실패: %s", symbol, company_result)
+            company_result = {'data_available': False, 'error': str(company_result)}
+        if isinstance(balance_result, Exception):
+            logger.error("❌ %s Balance Sheet 조회 실패: %s", symbol, balance_result)
+            balance_result = {'data_available': False, 'error': str(balance_result)}
         
         if stock_result.get('error'):
             if 'No data found' in stock_result['error']:
-                logger.warning(f"주식 데이터 없음: {symbol}")
+                logger.warning("주식 데이터 없음: %s", symbol)
                 raise HTTPException(
                     status_code=404,
-                    detail=create_error_response(
+                    detail=error_detail(
                         error_type="STOCK_NOT_FOUND",
                         message=f"No stock data found for symbol: {symbol}",
                         path=f"/stocks/sp500/symbol/{symbol}"
-                    ).model_dump()
+                    )
                 )
             else:
                 raise HTTPException(
                     status_code=500,
-                    detail=create_error_response(
+                    detail=error_detail(
                         error_type="STOCK_DATA_ERROR",
                         message=f"Failed to fetch stock data: {stock_result['error']}",
                         path=f"/stocks/sp500/symbol/{symbol}"
-                    ).model_dump()
+                    )
                 )
         
-        # 2. Company Overview 데이터 조회 (옵션)
-        logger.info(f"Company Overview 데이터 조회 시작: {symbol}")
-        company_result = company_service.get_company_basic_metrics(symbol)
         has_company_data = company_result.get('data_available', False)
-        logger.info(f"Company Overview 결과: data_available={has_company_data}, result_keys={list(company_result.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Company Overview 결과: data_available=%s, result_keys=%s", has_company_data, list(company_result.keys()))
         
         if not has_company_data:
-            logger.warning(f"⚠️ {symbol} Company Overview 데이터 없음: {company_result.get('message', 'Unknown reason')}")
+            logger.warning("⚠️ %s Company Overview 데이터 없음: %s", symbol, company_result.get('message', 'Unknown reason'))
             if 'debug_info' in company_result:
-                logger.info(f"디버그 정보: {company_result['debug_info']}")
+                logger.debug("디버그 정보: %s", company_result['debug_info'])
         else:
-            logger.info(f"✅ {symbol} Company Overview 데이터 있음: {company_result.get('company_name', 'Unknown')}")
+            logger.info("✅ %s Company Overview 데이터 있음: %s", symbol, company_result.get('company_name', 'Unknown'))
         
-        # 3. Balance Sheet 데이터 조회 (옵션) - 새로 추가
-        balance_result = _get_balance_sheet_summary(balance_service, symbol)
         has_balance_data = balance_result.get('data_available', False)
         
         # 4. 데이터 케이스 결정
@@ -193,33 +349,33 @@ async def get_stock_detail_with_integrated_data(
             balance_data=balance_result
         )
         
-        logger.info(f"통합 데이터 조회 성공: {symbol} (케이스: {data_case})")
-        return JSONResponse(content=integrated_response)
+        logger.info("통합 데이터 조회 성공: %s (케이스: %s)", symbol, data_case)
+        return integrated_response
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"통합 데이터 조회 실패: {symbol} - {e}")
+        logger.error("통합 데이터 조회 실패: %s - %s", symbol, e)
         raise HTTPException(
             status_code=500,
-            detail=create_error_response(
+            detail=error_detail(
                 error_type="INTERNAL_ERROR",
                 message="Internal server error occurred",
                 path=f"/stocks/sp500/symbol/{symbol}"
-            ).model_dump()
+            )
         )
 
 # 헬퍼 함수들
 def _get_balance_sheet_summary(balance_service: BalanceSheetService, symbol: str) -> Dict[str, Any]:
     """Balance Sheet 요약 데이터 조회"""
     try:
-        logger.info(f"Balance Sheet 데이터 조회 시작: {symbol}")
+        logger.info("Balance Sheet 데이터 조회 시작: %s", symbol)
         
         # 최신 재무상태표 조회
         latest_balance = balance_service.get_latest_by_symbol(symbol)
         
         if not latest_balance:
-            logger.warning(f"⚠️ {symbol} Balance Sheet 데이터 없음 - DB에서 조회 결과 없음")
+            logger.warning("⚠️ %s Balance Sheet 데이터 없음 - DB에서 조회 결과 없음", symbol)
             return {
                 'data_available': False,
                 'message': f'{symbol} 재무제표 데이터가 아직 수집되지 않았습니다',
@@ -256,7 +412,7 @@ def _get_balance_sheet_summary(balance_service: BalanceSheetService, symbol: str
                 'description': financial_ratios['debt_to_asset'].description
             }
         
-        logger.info(f"✅ {symbol} Balance Sheet 요약 데이터 생성 완료")
+        logger.info("✅ %s Balance Sheet 요약 데이터 생성 완료", symbol)
         return {
             'data_available': True,
             'key_metrics': key_metrics,
@@ -271,9 +427,7 @@ def _get_balance_sheet_summary(balance_service: BalanceSheetService, symbol: str
         }
         
     except Exception as e:
-        logger.error(f"❌ Balance Sheet 요약 조회 실패: {symbol} - {e}")
-        import traceback
-        logger.error(f"❌ 상세 에러 트레이스: {traceback.format_exc()}")
+        logger.error("❌ Balance Sheet 요약 조회 실패: %s - %s", symbol, e, exc_info=True)
         return {
             'data_available': False,
             'error': f'Balance Sheet 조회 중 오류 발생: {str(e)}',
@@ -485,8 +639,13 @@ def _generate_key_highlights(company_data: Dict[str, Any], balance_data: Dict[st
 # =========================
 
 @router.get("/chart/{symbol}", summary="주식 차트 데이터 조회")
+@conditional_etag(_chart_data_version, cache_control=CHART_CACHE_CONTROL)
+@cached_response("sp500", expire=CHART_CACHE_TTL, not_found_expire=CHART_CACHE_TTL)
+@single_flight("sp500")
 async def get_stock_chart_data(
-    symbol: str = Path(..., description="주식 심볼 (예: AAPL)", regex=r"^[A-Z]{1,5}$"),
+    request: Request,
+    response: Response,
+    symbol: str = Path(..., description="주식 심볼 (예: AAPL)", pattern=r"^[A-Z]{1,5}$"),
     timeframe: TimeframeEnum = Query(default=TimeframeEnum.ONE_DAY, description="차트 시간대"),
     sp500_service: SP500Service = Depends(get_sp500_service)
 ):
@@ -519,57 +678,66 @@ async def get_stock_chart_data(
     - 시간대별 최적화된 데이터 샘플링
     """
     try:
-        symbol = symbol.upper()
-        logger.info(f"📈 {symbol} 차트 데이터 조회 요청 (timeframe: {timeframe})")
+        logger.info("📈 %s 차트 데이터 조회 요청 (timeframe: %s)", symbol, timeframe)
         
         # 차트 데이터만 조회
-        chart_result = sp500_service.get_chart_data_only(symbol, timeframe.value)
+        chart_result = await sp500_service.get_chart_data_only(symbol, timeframe.value)
         
         if chart_result.get('error'):
             if 'No data found' in chart_result['error']:
-                logger.warning(f"⚠️ {symbol} 차트 데이터 없음")
+                logger.warning("⚠️ %s 차트 데이터 없음", symbol)
                 raise HTTPException(
                     status_code=404,
-                    detail=create_error_response(
+                    detail=error_detail(
                         error_type="CHART_DATA_NOT_FOUND",
                         message=f"No chart data found for symbol: {symbol}",
                         code="CHART_404",
                         path=f"/stocks/sp500/chart/{symbol}"
-                    ).model_dump()
+                    )
                 )
             else:
-                logger.error(f"❌ {symbol} 차트 데이터 조회 실패: {chart_result['error']}")
+                logger.error("❌ %s 차트 데이터 조회 실패: %s", symbol, chart_result['error'])
                 raise HTTPException(
                     status_code=500,
-                    detail=create_error_response(
+                    detail=error_detail(
                         error_type="CHART_DATA_ERROR",
                         message=f"Failed to fetch chart data: {chart_result['error']}",
                         path=f"/stocks/sp500/chart/{symbol}"
-                    ).model_dump()
+                    )
                 )
         
-        logger.info(f"✅ {symbol} 차트 데이터 조회 성공 (timeframe: {timeframe}, 데이터: {len(chart_result.get('chart_data', []))}개)")
-        return JSONResponse(content=chart_result)
+        logger.info("✅ %s 차트 데이터 조회 성공 (timeframe: %s, 데이터: %d개)", symbol, timeframe, len(chart_result.get('chart_data', [])))
+        return chart_result
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 예상치 못한 오류: {e}")
+        logger.error("❌ 예상치 못한 오류: %s", e)
         raise HTTPException(
             status_code=500,
-            detail=create_error_response(
+            detail=error_detail(
                 error_type="INTERNAL_ERROR",
                 message="Internal server error occurred",
                 path=f"/stocks/sp500/chart/{symbol}"
-            ).model_dump()
+            )
         )
 
 # =========================
 # 🎯 카테고리별 주식 조회 엔드포인트
 # =========================
 
-@router.get("/gainers", response_model=CategoryStockResponse, summary="상위 상승 종목 조회")
+@router.get(
+    "/gainers",
+    response_model=None,
+    responses={200: {"model": CategoryStockResponse}},
+    summary="상위 상승 종목 조회"
+)
+@conditional_etag(_list_data_version, cache_control=LIST_CACHE_CONTROL)
+@cached_response("sp500", expire=_market_cache_ttl)
+@single_flight("sp500")
 async def get_top_gainers(
+    request: Request,
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100, description="반환할 최대 종목 개수"),
     sp500_service: SP500Service = Depends(get_sp500_service)
 ):
@@ -587,39 +755,49 @@ async def get_top_gainers(
     ```
     """
     try:
-        logger.info(f"📈 상위 상승 종목 조회 요청 (limit: {limit})")
+        logger.info("📈 상위 상승 종목 조회 요청 (limit: %s)", limit)
         
-        result = sp500_service.get_top_gainers(limit)
+        result = await sp500_service.get_top_gainers(limit)
         
         if result.get('error'):
-            logger.error(f"❌ 상위 상승 종목 조회 실패: {result['error']}")
+            logger.error("❌ 상위 상승 종목 조회 실패: %s", result['error'])
             raise HTTPException(
                 status_code=500,
-                detail=create_error_response(
+                detail=error_detail(
                     error_type="DATA_FETCH_ERROR",
                     message=f"Failed to fetch top gainers: {result['error']}",
                     path="/stocks/sp500/gainers"
-                ).model_dump()
+                )
             )
         
-        logger.info(f"✅ 상위 상승 종목 조회 성공: {result['total_count']}개")
-        return CategoryStockResponse(**result)
+        logger.info("✅ 상위 상승 종목 조회 성공: %d개", result['total_count'])
+        return CategoryStockResponse.from_service_fast(result)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 예상치 못한 오류: {e}")
+        logger.error("❌ 예상치 못한 오류: %s", e)
         raise HTTPException(
             status_code=500,
-            detail=create_error_response(
+            detail=error_detail(
                 error_type="INTERNAL_ERROR",
                 message="Internal server error occurred",
                 path="/stocks/sp500/gainers"
-            ).model_dump()
+            )
         )
 
-@router.get("/losers", response_model=CategoryStockResponse, summary="상위 하락 종목 조회")
+@router.get(
+    "/losers",
+    response_model=None,
+    responses={200: {"model": CategoryStockResponse}},
+    summary="상위 하락 종목 조회"
+)
+@conditional_etag(_list_data_version, cache_control=LIST_CACHE_CONTROL)
+@cached_response("sp500", expire=_market_cache_ttl)
+@single_flight("sp500")
 async def get_top_losers(
+    request: Request,
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100, description="반환할 최대 종목 개수"),
     sp500_service: SP500Service = Depends(get_sp500_service)
 ):
@@ -637,39 +815,49 @@ async def get_top_losers(
     ```
     """
     try:
-        logger.info(f"📉 상위 하락 종목 조회 요청 (limit: {limit})")
+        logger.info("📉 상위 하락 종목 조회 요청 (limit: %s)", limit)
         
-        result = sp500_service.get_top_losers(limit)
+        result = await sp500_service.get_top_losers(limit)
         
         if result.get('error'):
-            logger.error(f"❌ 상위 하락 종목 조회 실패: {result['error']}")
+            logger.error("❌ 상위 하락 종목 조회 실패: %s", result['error'])
             raise HTTPException(
                 status_code=500,
-                detail=create_error_response(
+                detail=error_detail(
                     error_type="DATA_FETCH_ERROR",
                     message=f"Failed to fetch top losers: {result['error']}",
                     path="/stocks/sp500/losers"
-                ).model_dump()
+                )
             )
         
-        logger.info(f"✅ 상위 하락 종목 조회 성공: {result['total_count']}개")
-        return CategoryStockResponse(**result)
+        logger.info("✅ 상위 하락 종목 조회 성공: %d개", result['total_count'])
+        return CategoryStockResponse.from_service_fast(result)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 예상치 못한 오류: {e}")
+        logger.error("❌ 예상치 못한 오류: %s", e)
         raise HTTPException(
             status_code=500,
-            detail=create_error_response(
+            detail=error_detail(
                 error_type="INTERNAL_ERROR",
                 message="Internal server error occurred",
                 path="/stocks/sp500/losers"
-            ).model_dump()
+            )
         )
 
-@router.get("/most-active", response_model=CategoryStockResponse, summary="가장 활발한 거래 종목 조회")
+@router.get(
+    "/most-active",
+    response_model=None,
+    responses={200: {"model": CategoryStockResponse}},
+    summary="가장 활발한 거래 종목 조회"
+)
+@conditional_etag(_list_data_version, cache_control=LIST_CACHE_CONTROL)
+@cached_response("sp500", expire=_market_cache_ttl)
+@single_flight("sp500")
 async def get_most_active(
+    request: Request,
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100, description="반환할 최대 종목 개수"),
     sp500_service: SP500Service = Depends(get_sp500_service)
 ):
@@ -687,43 +875,53 @@ async def get_most_active(
     ```
     """
     try:
-        logger.info(f"📊 활발한 거래 종목 조회 요청 (limit: {limit})")
+        logger.info("📊 활발한 거래 종목 조회 요청 (limit: %s)", limit)
         
-        result = sp500_service.get_most_active(limit)
+        result = await sp500_service.get_most_active(limit)
         
         if result.get('error'):
-            logger.error(f"❌ 활발한 거래 종목 조회 실패: {result['error']}")
+            logger.error("❌ 활발한 거래 종목 조회 실패: %s", result['error'])
             raise HTTPException(
                 status_code=500,
-                detail=create_error_response(
+                detail=error_detail(
                     error_type="DATA_FETCH_ERROR",
                     message=f"Failed to fetch most active stocks: {result['error']}",
                     path="/stocks/sp500/most-active"
-                ).model_dump()
+                )
             )
         
-        logger.info(f"✅ 활발한 거래 종목 조회 성공: {result['total_count']}개")
-        return CategoryStockResponse(**result)
+        logger.info("✅ 활발한 거래 종목 조회 성공: %d개", result['total_count'])
+        return CategoryStockResponse.from_service_fast(result)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 예상치 못한 오류: {e}")
+        logger.error("❌ 예상치 못한 오류: %s", e)
         raise HTTPException(
             status_code=500,
-            detail=create_error_response(
+            detail=error_detail(
                 error_type="INTERNAL_ERROR",
                 message="Internal server error occurred",
                 path="/stocks/sp500/most-active"
-            ).model_dump()
+            )
         )
 
 # =========================
 # 🎯 검색 및 필터 엔드포인트
 # =========================
 
-@router.get("/search", response_model=SearchResponse, summary="주식 검색")
+@router.get(
+    "/search",
+    response_model=None,
+    responses={200: {"model": SearchResponse}},
+    summary="주식 검색"
+)
+@conditional_etag(_list_data_version, cache_control=LIST_CACHE_CONTROL)
+@cached_response("sp500", expire=_market_cache_ttl)
+@single_flight("sp500")
 async def search_stocks(
+    request: Request,
+    response: Response,
     q: str = Query(..., description="검색어 (심볼 또는 회사명)", min_length=1, max_length=50),
     limit: int = Query(default=20, ge=1, le=100, description="반환할 최대 결과 개수"),
     sp500_service: SP500Service = Depends(get_sp500_service)
@@ -748,35 +946,35 @@ async def search_stocks(
     - 회사명 (예: Apple, Microsoft)
     """
     try:
-        logger.info(f"🔍 주식 검색 요청: '{q}' (limit: {limit})")
+        logger.info("🔍 주식 검색 요청: '%s' (limit: %s)", q, limit)
         
-        result = sp500_service.search_stocks(q.strip(), limit)
+        result = await sp500_service.search_stocks(q.strip(), limit)
         
         if result.get('error'):
-            logger.error(f"❌ 주식 검색 실패: {result['error']}")
+            logger.error("❌ 주식 검색 실패: %s", result['error'])
             raise HTTPException(
                 status_code=500,
-                detail=create_error_response(
+                detail=error_detail(
                     error_type="SEARCH_ERROR",
                     message=f"Search failed: {result['error']}",
                     path="/stocks/sp500/search"
-                ).model_dump()
+                )
             )
         
-        logger.info(f"✅ 주식 검색 성공: '{q}' -> {result['total_count']}개 결과")
-        return SearchResponse(**result)
+        logger.info("✅ 주식 검색 성공: '%s' -> %d개 결과", q, result['total_count'])
+        return SearchResponse.from_service_fast(result)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ 예상치 못한 오류: {e}")
+        logger.error("❌ 예상치 못한 오류: %s", e)
         raise HTTPException(
             status_code=500,
-            detail=create_error_response(
+            detail=error_detail(
                 error_type="INTERNAL_ERROR",
                 message="Internal server error occurred",
                 path="/stocks/sp500/search"
-            ).model_dump()
+            )
         )
 
 # =========================
@@ -818,11 +1016,11 @@ async def health_check(
         
         result = sp500_service.health_check()
         
-        logger.info(f"✅ 헬스 체크 완료: {result['status']}")
+        logger.info("✅ 헬스 체크 완료: %s", result['status'])
         return HealthCheckResponse(**result)
         
     except Exception as e:
-        logger.error(f"❌ 헬스 체크 실패: {e}")
+        logger.error("❌ 헬스 체크 실패: %s", e)
         return HealthCheckResponse(
             status="unhealthy",
             database="error",
@@ -865,12 +1063,12 @@ async def get_service_stats(
         return ServiceStats(**result)
         
     except Exception as e:
-        logger.error(f"❌ 서비스 통계 조회 실패: {e}")
+        logger.error("❌ 서비스 통계 조회 실패: %s", e)
         raise HTTPException(
             status_code=500,
-            detail=create_error_response(
+            detail=error_detail(
                 error_type="STATS_ERROR",
                 message="Failed to fetch service statistics",
                 path="/stocks/sp500/stats"
-            ).model_dump()
+            )
         )
\ No newline at end of file
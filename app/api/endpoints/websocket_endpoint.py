@@ -143,10 +143,7 @@ async def websocket_sp500_endpoint(websocket: WebSocket):
                 # Redis에 데이터 없으면 DB fallback
                 logger.warning("⚠️ Redis에 SP500 데이터 없음, DB fallback")
                 if sp500_service:
-                    initial_result = await asyncio.to_thread(
-                        sp500_service.get_stock_list,
-                        500
-                    )
+                    initial_result = await sp500_service.get_stock_list(500)
                     initial_data_db = initial_result.get('stocks', [])
                     if initial_data_db:
                         response = {
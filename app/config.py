@@ -1,4 +1,7 @@
 import os
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -90,7 +93,7 @@ class Settings(BaseSettings):
         비동기 PostgreSQL 연결 URL을 생성합니다.
         
         asyncpg 드라이버를 사용하는 비동기 연결용입니다.
-        현재는 사용하지 않지만 향후 확장을 위해 준비해둡니다.
+        database.async_engine에서 사용합니다.
         
         Returns:
             str: 비동기 PostgreSQL 연결 URL
@@ -206,4 +209,29 @@ def get_log_config() -> dict:
             "level": settings.log_level,
             "handlers": ["default"],
         },
-    }
\ No newline at end of file
+    }
+
+
+def setup_queue_logging() -> QueueListener:
+    """
+    루트 로거 출력을 백그라운드 스레드로 옮깁니다.
+    
+    dictConfig로 구성한 루트 핸들러를 QueueHandler 하나로 교체하고,
+    기존 핸들러는 QueueListener 스레드에서 실행합니다.
+    요청 코루틴은 레코드를 큐에 넣기만 하므로 stdout I/O로 이벤트 루프가 막히지 않습니다.
+    
+    Returns:
+        QueueListener: 시작된 리스너 (종료 시 stop() 호출)
+    """
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    log_queue: Queue = Queue(-1)
+    
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import text
@@ -17,6 +18,27 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# 비동기 엔진 (asyncpg) - 이벤트 루프를 막지 않고 DB 왕복을 처리
+# 반복 실행되는 조회 쿼리는 커넥션별 prepared statement 캐시로 parse/plan 비용 생략
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_size=20,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=300,
+    echo=settings.debug,
+    connect_args={
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024
+    }
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 def get_db():
@@ -1,8 +1,10 @@
-from typing import Generator
+from functools import lru_cache
+from typing import AsyncGenerator, Callable, Generator, Optional, Tuple
 from sqlalchemy.orm import Session
-from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, Query, status
 
-from .database import SessionLocal, test_db_connection
+from .database import SessionLocal, AsyncSessionLocal, test_db_connection
 from .config import settings
 
 def get_db() -> Generator[Session, None, None]:
@@ -41,6 +43,30 @@ def get_db() -> Generator[Session, None, None]:
         # 항상 세션 종료
         db.close()
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    비동기 데이터베이스 세션을 생성하고 반환하는 의존성 함수
+    
+    asyncpg 드라이버 기반 AsyncSession을 제공합니다.
+    DB 왕복 동안 이벤트 루프를 점유하지 않으므로 async 엔드포인트에서 사용합니다.
+    
+    Yields:
+        AsyncSession: SQLAlchemy 비동기 데이터베이스 세션
+        
+    사용 예시:
+        @router.get("/news")
+        async def get_news(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(News))
+            return result.scalars().all()
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            # get_db와 동일하게 롤백 후 원래 예외를 그대로 전파
+            await db.rollback()
+            raise
+
 def get_settings():
     """
     애플리케이션 설정을 반환하는 의존성 함수
@@ -79,6 +105,55 @@ async def verify_db_connection():
             detail="데이터베이스에 연결할 수 없습니다."
         )
 
+@lru_cache(maxsize=1024)
+def parse_csv(raw: Optional[str] = None, upper: bool = False) -> Tuple[str, ...]:
+    """
+    쉼표로 구분된 쿼리 문자열을 튜플로 변환하는 유틸리티 함수
+    
+    앞뒤 공백은 제거하고 빈 항목은 버립니다.
+    튜플은 해시 가능하므로 캐시 키로 그대로 사용할 수 있습니다.
+    같은 조합("Bullish,Bearish", "AAPL,TSLA" 등)이 반복되므로 결과를 메모이즈합니다.
+    
+    Args:
+        raw: 쉼표 구분 문자열 (예: "AAPL, tsla")
+        upper: 대문자로 변환할지 여부 (티커 등)
+        
+    Returns:
+        Tuple[str, ...]: 파싱된 항목들 (raw가 비어 있으면 빈 튜플)
+        
+    사용 예시:
+        parse_csv("aapl, tsla", upper=True)
+        # 결과: ("AAPL", "TSLA")
+    """
+    if not raw:
+        return ()
+    items = (item.strip() for item in raw.split(","))
+    return tuple(item.upper() if upper else item for item in items if item)
+
+def csv_query(alias: str, description: str, upper: bool = False) -> Callable[..., Tuple[str, ...]]:
+    """
+    쉼표 구분 쿼리 파라미터를 파싱된 튜플로 주입하는 의존성 함수 생성기
+    
+    핸들러마다 split(",")을 반복하지 않도록 파싱을 의존성 단계로 옮깁니다.
+    API 문서에는 원래 이름(alias)의 문자열 쿼리 파라미터로 노출됩니다.
+    
+    Args:
+        alias: 쿼리 파라미터 이름 (예: "tickers")
+        description: API 문서용 설명
+        upper: 대문자로 변환할지 여부
+        
+    사용 예시:
+        @router.get("/trends")
+        async def get_trends(
+            tickers: Tuple[str, ...] = Depends(csv_query("tickers", "티커 목록 (쉼표 구분)", upper=True))
+        ):
+            ...
+    """
+    def dependency(raw: Optional[str] = Query(None, alias=alias, description=description)) -> Tuple[str, ...]:
+        return parse_csv(raw, upper=upper)
+    
+    return dependency
+
 def get_cache_key(prefix: str, *args) -> str:
     """
     캐시 키를 생성하는 유틸리티 함수
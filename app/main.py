@@ -1,15 +1,19 @@
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 import logging.config
 import time
 import json
 import redis
 import os
+import uuid
+import atexit
 
-from .config import settings, get_log_config
+from .config import settings, get_log_config, setup_queue_logging
 from .database import test_db_connection
 from .dependencies import verify_db_connection
 
@@ -17,12 +21,20 @@ from .dependencies import verify_db_connection
 from app.websocket.manager import WebSocketManager
 from app.websocket.redis_streamer import RedisStreamer
 from app.services.crypto_service import CryptoService
-from app.services.sp500_service import SP500Service
+from app.services.sp500_service import SP500Service, latest_snapshot_view
 from app.services.etf_service import ETFService
 from app.api.endpoints.websocket_endpoint import set_websocket_dependencies
+from app.utils.cache_utils import init_response_cache, close_response_cache
+from app.services.financial_news_service import run_categories_statistics_refresher
+from app.services.market_news_sentiment_service import sentiment_trend_views
+from app.services.sp500_earnings_calendar_service import upcoming_earnings_view, earnings_search_tsv_column
+from app.services.market_news_service import market_news_tsv_column
 
 # 로깅 설정
 logging.config.dictConfig(get_log_config())
+# 로그 출력은 백그라운드 스레드에서 처리 (프로세스 종료 시 남은 레코드 flush)
+log_listener = setup_queue_logging()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # =========================
@@ -55,6 +67,7 @@ async def lifespan(app: FastAPI):
             settings.redis_url,
             decode_responses=True
         )
+        await init_response_cache(settings.redis_url)  # REST 응답 캐시 (실패 시 캐시 없이 동작)
         logger.info("✅ [1/7] Redis 클라이언트 초기화")
         
         # 2. 서비스 레이어 초기화
@@ -63,6 +76,19 @@ async def lifespan(app: FastAPI):
         
         sp500_service = SP500Service(redis_client=sync_redis_client)
         etf_service = ETFService(redis_client=sync_redis_client)
+        
+        # 금융 뉴스 카테고리 통계 캐시 백그라운드 갱신
+        categories_stats_task = asyncio.create_task(run_categories_statistics_refresher())
+        # 감성 추이 사전 집계 뷰 생성 및 주기적 갱신
+        sentiment_trend_views_task = asyncio.create_task(sentiment_trend_views.run())
+        # 이번 주/향후 실적 일정 뷰 생성 및 주기적 갱신
+        upcoming_earnings_view_task = asyncio.create_task(upcoming_earnings_view.run())
+        # SP500 심볼별 최신 스냅샷 뷰 생성 및 주기적 갱신 (상승/하락/거래량 순위)
+        latest_snapshot_view_task = asyncio.create_task(latest_snapshot_view.run())
+        # 시장 뉴스 전문 검색 컬럼(tsv) 존재 확인 (컬럼 추가는 scripts/sql 마이그레이션)
+        market_news_search_column_task = asyncio.create_task(market_news_tsv_column.probe())
+        # 실적 캘린더 전문 검색 컬럼(search_tsv) 존재 확인 (컬럼 추가는 scripts/sql 마이그레이션)
+        earnings_search_column_task = asyncio.create_task(earnings_search_tsv_column.probe())
         logger.info("✅ [2/7] 서비스 레이어 초기화 (Crypto + SP500 + ETF)")
         
         # 3. WebSocket Manager 초기화
@@ -127,6 +153,18 @@ async def lifespan(app: FastAPI):
             await crypto_service.shutdown()
             logger.info("✅ Crypto Service 종료")
         
+        # 카테고리 통계 / 감성 추이 뷰 / 실적 일정 뷰 / SP500 스냅샷 뷰 갱신 및 전문 검색 컬럼 준비 태스크 종료
+        for task in (categories_stats_task, sentiment_trend_views_task, upcoming_earnings_view_task,
+                     latest_snapshot_view_task, market_news_search_column_task, earnings_search_column_task):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        
+        # 응답 캐시 Redis 종료
+        await close_response_cache()
+        
         # Redis 클라이언트 종료
         if sync_redis_client:
             sync_redis_client.close()
@@ -152,7 +190,9 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
-    redirect_slashes=False
+    redirect_slashes=False,
+    # 응답 직렬화는 orjson 사용 (datetime/Decimal이 많은 목록 응답의 인코딩 비용 절감)
+    default_response_class=ORJSONResponse
 )
 
 # =========================
@@ -192,6 +232,12 @@ app.add_middleware(
     expose_headers=["*"]  # 모든 응답 헤더 노출
 )
 
+# 응답 압축 (뉴스/IPO 목록처럼 텍스트가 긴 JSON 응답의 전송량 감소)
+# - Accept-Encoding에 gzip이 있는 요청만 압축, Vary: Accept-Encoding 자동 설정
+# - 1KB 미만 응답은 압축 이득보다 비용이 커서 제외
+# - compresslevel=5: CPU 비용 대비 압축률 균형
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # =========================
 # 미들웨어
 # =========================
@@ -332,15 +378,25 @@ logger.info(f"✅ WebSocket 라우터 등록: {settings.api_v1_prefix}/ws/{{cryp
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    """전역 예외 처리기"""
-    logger.error(f"예상하지 못한 에러: {str(exc)}", exc_info=True)
+    """
+    전역 예외 처리기
+    
+    엔드포인트는 예상하지 못한 예외를 직접 잡지 않고 여기로 전파합니다.
+    트레이스백은 error_id와 함께 로그에 남기고, 응답에는 error_id만 노출합니다.
+    """
+    error_id = uuid.uuid4().hex[:12]
+    logger.error(
+        f"예상하지 못한 에러 [{error_id}] {request.method} {request.url.path}: {str(exc)}",
+        exc_info=exc
+    )
     
     return JSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
             "detail": str(exc) if settings.debug else "서버 오류가 발생했습니다.",
-            "type": type(exc).__name__
+            "type": type(exc).__name__,
+            "error_id": error_id
         }
     )
 
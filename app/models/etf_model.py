@@ -3,7 +3,7 @@ import logging
 import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, BigInteger
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, BigInteger, Index, DDL, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
 from app.database import Base
@@ -17,6 +17,18 @@ class ETFBasicInfo(Base):
     symbol = Column(String(10), primary_key=True, index=True, nullable=False)
     name = Column(String(255), nullable=False)
 
+    # 검색 최적화: symbol LIKE '%검색어%'가 pg_trgm GIN 인덱스를 사용
+    __table_args__ = (
+        Index('idx_etf_basic_symbol_trgm', symbol, postgresql_using='gin', postgresql_ops={'symbol': 'gin_trgm_ops'}),
+    )
+
+# trigram 인덱스 생성 전에 pg_trgm 확장 활성화
+event.listen(
+    ETFBasicInfo.__table__,
+    'before_create',
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect='postgresql')
+)
+
 class ETFProfileHoldings(Base):
     """ETF 프로필 및 보유종목 정보 테이블"""
     __tablename__ = "etf_profile_holdings"
@@ -240,17 +252,22 @@ class ETFRealtimePrices(Base):
             return {}
 
     @classmethod
-    def get_chart_data_by_timeframe(cls, db: Session, symbol: str, timeframe: str = '1D', limit: int = 200) -> List['ETFRealtimePrices']:
-        """시간대별 차트 데이터 조회"""
+    def get_chart_data_by_timeframe(cls, db: Session, symbol: str, timeframe: str = '1D', limit: int = 200) -> List[Any]:
+        """
+        시간대별 차트 데이터 조회
+        
+        차트에 필요한 컬럼(created_at, price, volume, timestamp_ms)만 Row로 조회해
+        ORM 엔티티 생성/identity map 등록 비용 없이 반환합니다.
+        (Row도 trade.price처럼 속성 접근 가능)
+        """
         try:
             # 해당 심볼의 최신 데이터 시점을 기준으로 조회
-            latest_record = db.query(cls).filter(cls.symbol == symbol).order_by(cls.created_at.desc()).first()
+            latest_time = db.query(cls.created_at).filter(cls.symbol == symbol).order_by(cls.created_at.desc()).limit(1).scalar()
             
-            if not latest_record:
+            if not latest_time:
                 logger.warning(f"ETF {symbol}의 데이터가 없습니다")
                 return []
             
-            latest_time = latest_record.created_at
             logger.info(f"ETF {symbol} 최신 데이터 시점: {latest_time}")
             
             # 최신 데이터 시점을 기준으로 시간대별 필터링
@@ -269,7 +286,9 @@ class ETFRealtimePrices(Base):
             
             logger.info(f"ETF {symbol} 차트 조회 범위: {start_time} ~ {latest_time} ({timeframe})")
             
-            chart_data = db.query(cls).filter(
+            chart_data = db.query(
+                cls.created_at, cls.price, cls.volume, cls.timestamp_ms
+            ).filter(
                 cls.symbol == symbol,
                 cls.created_at >= start_time
             ).order_by(cls.created_at.asc()).limit(limit).all()
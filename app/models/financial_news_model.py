@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, BigInteger
+from sqlalchemy import Column, String, Text, DateTime, BigInteger, Index, DDL, event
 from sqlalchemy.sql import func
 from app.models.base import BaseModel
 
@@ -38,6 +38,15 @@ class FinancialNews(BaseModel):
         comment="데이터 수집 시간"
     )
 
+    # 성능 최적화 인덱스 (트렌딩 종목 집계: 최근 기간 + related 존재 행만 스캔)
+    # 검색 최적화: headline/summary/source ILIKE '%검색어%'가 pg_trgm GIN 인덱스를 사용
+    __table_args__ = (
+        Index('idx_news_related_recent', published_at.desc(), postgresql_where=related.isnot(None)),
+        Index('idx_news_headline_trgm', headline, postgresql_using='gin', postgresql_ops={'headline': 'gin_trgm_ops'}),
+        Index('idx_news_summary_trgm', summary, postgresql_using='gin', postgresql_ops={'summary': 'gin_trgm_ops'}),
+        Index('idx_news_source_trgm', source, postgresql_using='gin', postgresql_ops={'source': 'gin_trgm_ops'}),
+    )
+
     def __repr__(self):
         """객체 표현을 위한 메서드"""
         return f"<FinancialNews(category='{self.category}', news_id={self.news_id}, headline='{self.headline[:50] if self.headline else 'N/A'}...')>"
@@ -83,4 +92,12 @@ class FinancialNews(BaseModel):
     @classmethod
     def get_valid_categories(cls):
         """유효한 카테고리 목록 반환"""
-        return ['crypto', 'forex', 'merger', 'general']
\ No newline at end of file
+        return ['crypto', 'forex', 'merger', 'general']
+
+
+# trigram 인덱스 생성 전에 pg_trgm 확장 활성화
+event.listen(
+    FinancialNews.__table__,
+    'before_create',
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect='postgresql')
+)
@@ -1,7 +1,15 @@
-from sqlalchemy import Column, String, Text, DateTime, text
+from sqlalchemy import Column, String, Text, DateTime, Index, Computed, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from app.models.base import BaseModel   
 
+# 전문 검색용 tsvector 식 (생성 컬럼 정의, 컬럼이 없는 DB의 검색 fallback에서 공용)
+MARKET_NEWS_TSV_EXPRESSION = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || "
+    "coalesce(description, '') || ' ' || coalesce(content, ''))"
+)
+
 
 class MarketNews(BaseModel):
     """
@@ -12,6 +20,7 @@ class MarketNews(BaseModel):
     - published_at: 뉴스 발행 시간 (중요한 정렬 기준)
     - fetched_at: 데이터 수집 시간 (자동 생성)
     - content: 뉴스 본문 (긴 텍스트)
+    - tsv: 제목/설명/본문 전문 검색용 tsvector (DB 생성 컬럼)
     """
     __tablename__ = "market_news"
 
@@ -34,6 +43,23 @@ class MarketNews(BaseModel):
         comment="데이터 수집 시간"
     )
 
+    # 전문 검색용 생성 컬럼 (STORED) - 목록 조회 시 불필요하게 읽지 않도록 지연 로딩
+    # 기존 테이블에는 scripts/sql/market_news_tsv.sql로 컬럼/GIN 인덱스를 추가
+    tsv = deferred(Column(
+        TSVECTOR,
+        Computed(MARKET_NEWS_TSV_EXPRESSION, persisted=True),
+        comment="전문 검색용 tsvector (title + description + content)"
+    ))
+
+    # keyset 페이징 인덱스: (published_at, source, url) < 커서 조건을 인덱스 탐색으로 처리
+    # 전문 검색 인덱스: search_news의 tsv @@ plainto_tsquery 조건이 GIN 인덱스를 사용
+    __table_args__ = (
+        Index('idx_market_news_published_keyset', published_at.desc(), source.desc(), url.desc()),
+        # sources 필터 + 최신순 정렬용
+        Index('idx_market_news_source_published', source, published_at.desc()),
+        Index('idx_market_news_tsv_gin', tsv, postgresql_using='gin'),
+    )
+
     def __repr__(self):
         """객체 표현을 위한 메서드"""
         return f"<MarketNews(source='{self.source}', title='{self.title[:50]}...')>"
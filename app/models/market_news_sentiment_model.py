@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, Text, DateTime, Numeric, func
+from sqlalchemy import Column, BigInteger, Text, DateTime, Numeric, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from app.models.base import BaseModel
 
@@ -46,6 +46,19 @@ class MarketNewsSentiment(BaseModel):
     # 시간 정보
     created_at = Column(DateTime, default=func.now(), comment="데이터 생성 시간")
     
+    # keyset 페이징 인덱스: (time_published, batch_id, url) 커서 조건을 인덱스 탐색으로 처리
+    __table_args__ = (
+        Index('idx_market_news_sentiment_published_keyset',
+              time_published.desc(), batch_id.desc(), url.desc()),
+        # ticker_sentiment/topics @> 포함 검색용 (jsonb_path_ops: @> 전용, 크기가 작음)
+        Index('idx_market_news_sentiment_ticker_gin', ticker_sentiment,
+              postgresql_using='gin',
+              postgresql_ops={'ticker_sentiment': 'jsonb_path_ops'}),
+        Index('idx_market_news_sentiment_topics_gin', topics,
+              postgresql_using='gin',
+              postgresql_ops={'topics': 'jsonb_path_ops'}),
+    )
+    
     def __repr__(self):
         return f"<MarketNewsSentiment(batch_id={self.batch_id}, title='{self.title[:50]}...', sentiment={self.overall_sentiment_score})>"
     
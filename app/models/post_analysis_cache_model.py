@@ -1,6 +1,6 @@
 # app/models/post_analysis_cache_model.py
 
-from sqlalchemy import Column, Integer, String, DateTime, func
+from sqlalchemy import Column, Integer, String, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -33,5 +33,12 @@ class PostAnalysisCache(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
+    # Keyset pagination indexes for the analysis feed: (post_timestamp, id) < cursor,
+    # optionally narrowed by post_source.
+    __table_args__ = (
+        Index('idx_post_analysis_cache_timestamp_keyset', post_timestamp.desc(), id.desc()),
+        Index('idx_post_analysis_cache_source_timestamp_keyset', post_source, post_timestamp.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<PostAnalysisCache(id={self.id}, post_id='{self.post_id}', source='{self.post_source}')>"
\ No newline at end of file
@@ -1,8 +1,15 @@
 # app/models/sp500_earnings_calendar_model.py
-from sqlalchemy import Column, Integer, String, Date, Numeric, DateTime, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Date, Numeric, DateTime, Text, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from app.models.base import BaseModel
 
+# 전문 검색용 tsvector 식 (생성 컬럼 정의, 컬럼이 없는 DB의 검색 fallback에서 공용)
+SP500_EARNINGS_SEARCH_TSV_EXPRESSION = (
+    "to_tsvector('english', coalesce(symbol, '') || ' ' || "
+    "coalesce(company_name, '') || ' ' || coalesce(event_title, ''))"
+)
+
 class SP500EarningsCalendar(BaseModel):
     """
     S&P 500 실적 발표 캘린더 테이블 모델
@@ -47,12 +54,34 @@ class SP500EarningsCalendar(BaseModel):
     created_at = Column(DateTime, nullable=True, comment="생성 시간")
     updated_at = Column(DateTime, nullable=True, comment="수정 시간")
     
+    # 전문 검색용 생성 컬럼 (STORED) - 목록 조회 시 불필요하게 읽지 않도록 지연 로딩
+    # 기존 테이블에는 scripts/sql/sp500_earnings_calendar_search_tsv.sql로 컬럼/GIN 인덱스를 추가
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed(SP500_EARNINGS_SEARCH_TSV_EXPRESSION, persisted=True),
+        comment="전문 검색용 tsvector (symbol + company_name + event_title)"
+    ))
+    
+    # 전문 검색 인덱스: search_events의 search_tsv @@ plainto_tsquery 조건이 GIN 인덱스를 사용
+    # 심볼 접두어 인덱스: symbol LIKE 'AA%' 조건이 인덱스 범위 탐색을 사용
+    __table_args__ = (
+        Index('idx_sp500_earnings_calendar_tsv_gin', search_tsv, postgresql_using='gin'),
+        Index(
+            'idx_sp500_earnings_calendar_symbol_prefix', symbol,
+            postgresql_ops={'symbol': 'varchar_pattern_ops'}
+        ),
+    )
+    
     # 관계 설정: 1:N (하나의 캘린더 이벤트에 여러 뉴스)
+    # 목록 응답에서 행마다 추가 SELECT가 나가지 않도록 지연 로딩을 금지합니다.
+    # 뉴스가 필요하면 selectinload 또는 calendar_id IN 일괄 조회를 사용하세요.
+    # 삭제는 FK의 ON DELETE CASCADE에 맡겨 자식 로딩 없이 처리합니다.
     related_news = relationship(
         "SP500EarningsNews",
         back_populates="earnings_calendar",
-        lazy="select",
-        cascade="all, delete-orphan"
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     def __repr__(self):
@@ -1,5 +1,5 @@
 # app/models/sp500_earnings_news_model.py
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, and_, literal_column, text
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
@@ -43,11 +43,21 @@ class SP500EarningsNews(BaseModel):
     fetched_at = Column(DateTime, nullable=True, comment="뉴스 수집 시간")
     created_at = Column(DateTime, nullable=True, comment="생성 시간")
     
+    # 본문 있는 뉴스 부분 인덱스: has_content=true 조회(calendar_id + 최신순)를 본문 있는 행만 담은 인덱스로 처리
+    # 조건식은 content_present()와 같아야 플래너가 인덱스를 사용합니다.
+    __table_args__ = (
+        Index(
+            'idx_sp500_earnings_news_has_content', calendar_id, published_at.desc(),
+            postgresql_where=text("content IS NOT NULL AND content <> ''")
+        ),
+    )
+    
     # 관계 설정: N:1 (여러 뉴스가 하나의 캘린더 이벤트에 속함)
+    # 지연 로딩 금지 (필요하면 joinedload로 명시적으로 함께 조회)
     earnings_calendar = relationship(
         "SP500EarningsCalendar",
         back_populates="related_news",
-        lazy="select"
+        lazy="raise"
     )
     
     def __repr__(self):
@@ -87,6 +97,16 @@ class SP500EarningsNews(BaseModel):
         """본문 내용이 있는지 확인"""
         return self.content is not None and len(self.content.strip()) > 0
     
+    @classmethod
+    def content_present(cls):
+        """
+        본문 있는 뉴스 조건 (쿼리용)
+        
+        빈 문자열을 바인드 파라미터가 아닌 리터럴로 렌더링해야
+        idx_sp500_earnings_news_has_content 부분 인덱스 조건과 일치합니다.
+        """
+        return and_(cls.content.isnot(None), cls.content != literal_column("''"))
+    
     @property
     def short_title(self):
         """제목 축약 버전 (50자)"""
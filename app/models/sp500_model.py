@@ -1,7 +1,7 @@
 # app/models/sp500_model.py
-from sqlalchemy import Column, Integer, String, Numeric, BigInteger, DateTime, Text, ARRAY, Index, text
+from sqlalchemy import Column, Integer, String, Numeric, BigInteger, DateTime, Text, ARRAY, Index, literal_column, select, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from typing import List, Optional, Dict, Any, Tuple
 import logging
 from datetime import datetime, timedelta
@@ -11,6 +11,130 @@ from app.models.base import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# =========================
+# 공용 조회 SQL (동기 Session / AsyncSession 공용)
+# =========================
+
+# 심볼별 최신 거래 + 회사 정보
+LATEST_PRICES_WITH_COMPANY_QUERY = text("""
+    SELECT DISTINCT ON (trades.symbol) 
+        trades.symbol,
+        trades.price,
+        trades.volume,
+        trades.timestamp_ms,
+        trades.created_at,
+        companies.company_name,
+        companies.gics_sector,
+        companies.gics_sub_industry
+    FROM sp500_websocket_trades trades
+    LEFT JOIN sp500_companies companies ON trades.symbol = companies.symbol
+    ORDER BY trades.symbol, trades.created_at DESC
+    LIMIT :limit
+""")
+
+# 지정 심볼들의 최신 거래
+LATEST_PRICES_BY_SYMBOLS_QUERY = text("""
+    SELECT DISTINCT ON (symbol) 
+        symbol, price, volume, created_at
+    FROM sp500_websocket_trades 
+    WHERE symbol = ANY(:symbols)
+        AND price IS NOT NULL 
+        AND price > 0
+    ORDER BY symbol, created_at DESC
+""")
+
+# 지정 심볼들의 검색 구간 내 마지막 가격 (전일 종가)
+# DISTINCT ON: 구간 전체에 ROW_NUMBER를 매기지 않고 (symbol, created_at DESC) 인덱스에서 심볼별 첫 행만 읽음
+PREVIOUS_CLOSE_PRICES_QUERY = text("""
+    SELECT DISTINCT ON (symbol) symbol, price
+    FROM sp500_websocket_trades
+    WHERE symbol = ANY(:symbols)
+        AND price IS NOT NULL 
+        AND price > 0
+        AND created_at >= :search_start
+        AND created_at <= :search_end
+    ORDER BY symbol, created_at DESC
+""")
+
+# 지정 심볼들의 회사명
+COMPANY_NAMES_BY_SYMBOLS_QUERY = text("""
+    SELECT symbol, company_name FROM sp500_companies WHERE symbol = ANY(:symbols)
+""")
+
+# 거래 테이블의 심볼 개수 (COUNT(DISTINCT) 정렬 대신 symbol 인덱스를 심볼당 한 번씩 건너뛰며 읽는 loose index scan)
+DISTINCT_SYMBOL_COUNT_QUERY = text("""
+    WITH RECURSIVE symbols AS (
+        (SELECT symbol FROM sp500_websocket_trades ORDER BY symbol LIMIT 1)
+        UNION ALL
+        SELECT (
+            SELECT trades.symbol FROM sp500_websocket_trades trades
+            WHERE trades.symbol > symbols.symbol
+            ORDER BY trades.symbol LIMIT 1
+        )
+        FROM symbols
+        WHERE symbols.symbol IS NOT NULL
+    )
+    SELECT COUNT(symbol) FROM symbols
+""")
+
+# 차트 시간대별 고정 조회 범위 (최신 거래 시각 기준)와 샘플링 간격
+CHART_RANGE_CONFIG = {
+    '1H': {'range': timedelta(hours=1), 'interval_minutes': 1},      # 1시간, 1분 간격 → ~60개
+    '1D': {'range': timedelta(days=1), 'interval_minutes': 5},       # 1일, 5분 간격 → ~78개
+    '1W': {'range': timedelta(days=5), 'interval_minutes': 30},      # 5거래일, 30분 간격 → ~65개
+    '1MO': {'range': timedelta(days=22), 'interval_minutes': 120},   # 22거래일, 2시간 간격 → ~72개
+}
+
+# 차트 샘플링: 지정된 간격으로 버킷팅하고, 각 버킷의 마지막 가격만 선택
+CHART_SAMPLING_QUERY = text("""
+    WITH sampled AS (
+        SELECT 
+            id,
+            symbol,
+            price,
+            volume,
+            timestamp_ms,
+            created_at,
+            -- 지정된 분 단위로 버킷팅
+            date_trunc('hour', created_at) + 
+            INTERVAL '1 min' * (FLOOR(EXTRACT(MINUTE FROM created_at) / :interval) * :interval) AS time_bucket,
+            -- 각 버킷 내에서 마지막 데이터 선택 (시간순 DESC)
+            ROW_NUMBER() OVER (
+                PARTITION BY date_trunc('hour', created_at) + 
+                INTERVAL '1 min' * (FLOOR(EXTRACT(MINUTE FROM created_at) / :interval) * :interval)
+                ORDER BY created_at DESC
+            ) AS rn
+        FROM sp500_websocket_trades
+        WHERE symbol = :symbol
+          AND created_at >= :start_time
+    )
+    SELECT id, symbol, price, volume, timestamp_ms, created_at
+    FROM sampled
+    WHERE rn = 1
+    ORDER BY time_bucket ASC
+    LIMIT :limit
+""")
+
+# 최신 거래 시각 (ETag 버전용, created_at 인덱스 끝 한 건만 읽음)
+LATEST_TRADE_TIME_QUERY = text("""
+    SELECT MAX(created_at) FROM sp500_websocket_trades
+""")
+
+# 지정 심볼의 최신 거래 시각
+LATEST_TRADE_TIME_BY_SYMBOL_QUERY = text("""
+    SELECT MAX(created_at) FROM sp500_websocket_trades WHERE symbol = :symbol
+""")
+
+# 지정 심볼들의 기준 시각 이후 거래량 합계
+VOLUME_SINCE_BY_SYMBOLS_QUERY = text("""
+    SELECT symbol, SUM(volume) AS total_volume
+    FROM sp500_websocket_trades
+    WHERE symbol = ANY(:symbols)
+        AND created_at >= :since
+        AND volume IS NOT NULL
+    GROUP BY symbol
+""")
+
 class SP500WebsocketTrades(BaseModel):
     """
     SP500 WebSocket 거래 데이터 테이블 ORM 모델
@@ -55,6 +179,13 @@ class SP500WebsocketTrades(BaseModel):
         Index('idx_sp500_symbol_created_desc', 'symbol', 'created_at'),
         Index('idx_sp500_symbol_timestamp_desc', 'symbol', 'timestamp_ms'),
         Index('idx_sp500_created_at_desc', 'created_at'),
+        # 심볼별 최신 1건 조회(DISTINCT ON (symbol) ... ORDER BY symbol, created_at DESC)를
+        # 정렬 없이 인덱스 순서대로 읽기 위한 인덱스 (운영 반영 시 CREATE INDEX CONCURRENTLY로 생성)
+        Index('idx_sp500_symbol_created_at_latest', symbol, created_at.desc(),
+              postgresql_include=['price', 'volume']),
+        # 시간 구간 스캔(24시간 거래량, 전일 종가 구간)용 BRIN 인덱스
+        # 거래는 created_at 순으로 추가되므로 블록 범위 요약만으로 오래된 구간을 건너뛸 수 있음 (파티션 프루닝과 유사)
+        Index('idx_sp500_created_at_brin', 'created_at', postgresql_using='brin'),
     )
     
     def __repr__(self):
@@ -102,7 +233,9 @@ class SP500WebsocketTrades(BaseModel):
             Optional[SP500WebsocketTrades]: 최신 거래 데이터 또는 None
         """
         try:
-            return db_session.query(cls).filter(
+            return db_session.query(cls).options(
+                load_only(cls.symbol, cls.price, cls.volume, cls.timestamp_ms, cls.created_at)
+            ).filter(
                 cls.symbol == symbol.upper()
             ).order_by(cls.created_at.desc()).first()
         except Exception as e:
@@ -149,7 +282,8 @@ class SP500WebsocketTrades(BaseModel):
             next_day_korea = last_close_korea + timedelta(days=1)
             search_end = next_day_korea.replace(hour=6, minute=0, second=0, microsecond=0)  # 다음날 오전 6시까지
             
-            prev_trade = db_session.query(cls).filter(
+            # 가격/시각만 필요하므로 ORM 객체 대신 두 컬럼만 조회
+            prev_trade = db_session.query(cls.price, cls.created_at).filter(
                 cls.symbol == symbol.upper(),
                 cls.created_at >= last_close_korea.replace(tzinfo=None),
                 cls.created_at <= search_end.replace(tzinfo=None)
@@ -163,7 +297,7 @@ class SP500WebsocketTrades(BaseModel):
                 logger.debug(f"⚠️ {symbol} SP500 폐장 시간 기준 데이터 없음, 확장 검색...")
                 
                 extended_search_start = last_close_korea - timedelta(hours=12)  # 폐장 12시간 전부터
-                extended_prev_trade = db_session.query(cls).filter(
+                extended_prev_trade = db_session.query(cls.price, cls.created_at).filter(
                     cls.symbol == symbol.upper(),
                     cls.created_at >= extended_search_start.replace(tzinfo=None),
                     cls.created_at <= search_end.replace(tzinfo=None)
@@ -204,7 +338,7 @@ class SP500WebsocketTrades(BaseModel):
         return candidate
     
     @classmethod
-    def get_all_current_prices(cls, db_session: Session, limit: int = 500) -> List['SP500WebsocketTrades']:
+    def get_all_current_prices(cls, db_session: Session, limit: int = 500) -> List[Dict[str, Any]]:
         """
         모든 심볼의 현재가 조회 (주식 리스트 페이지용)
         각 심볼당 최신 1개씩 조회
@@ -214,28 +348,20 @@ class SP500WebsocketTrades(BaseModel):
             limit: 반환할 최대 심볼 개수
             
         Returns:
-            List[SP500WebsocketTrades]: 각 심볼의 최신 거래 데이터
+            List[Dict[str, Any]]: 각 심볼의 최신 거래 데이터 (symbol, price, volume, timestamp_ms, created_at)
         """
         try:
-            from sqlalchemy import func, and_
-            
-            # 서브쿼리: 각 심볼별 최신 created_at 조회
-            subquery = db_session.query(
+            # DISTINCT ON (symbol): GROUP BY + self-join 없이 심볼별 최신 1건만 조회
+            # (symbol, created_at DESC) 인덱스를 따라 한 번만 스캔하며, 결과는 심볼 알파벳 순
+            # 읽기 전용 목록이므로 ORM 객체 대신 컬럼 select + mappings()로 딕셔너리 행만 생성
+            query = select(
+                cls.symbol, cls.price, cls.volume, cls.timestamp_ms, cls.created_at
+            ).distinct(cls.symbol).order_by(
                 cls.symbol,
-                func.max(cls.created_at).label('max_created_at')
-            ).group_by(cls.symbol).subquery()
-            
-            # 메인 쿼리: 최신 created_at의 실제 데이터 조회
-            query = db_session.query(cls).join(
-                subquery,
-                and_(
-                    cls.symbol == subquery.c.symbol,
-                    cls.created_at == subquery.c.max_created_at
-                )
-            )
-            
-            # 심볼 알파벳 순 정렬
-            return query.order_by(cls.symbol).limit(limit).all()
+                cls.created_at.desc(),
+                cls.id.desc()
+            ).limit(limit)
+            return db_session.execute(query).mappings().all()
             
         except Exception as e:
             logger.error(f"❌ 전체 현재가 조회 실패: {e}")
@@ -262,62 +388,25 @@ class SP500WebsocketTrades(BaseModel):
         """
         try:
             # ✅ 시간대별 고정 조회 범위
-            range_config = {
-                '1H': {'range': timedelta(hours=1), 'interval_minutes': 1},      # 1시간, 1분 간격 → ~60개
-                '1D': {'range': timedelta(days=1), 'interval_minutes': 5},       # 1일, 5분 간격 → ~78개
-                '1W': {'range': timedelta(days=5), 'interval_minutes': 30},      # 5거래일, 30분 간격 → ~65개
-                '1MO': {'range': timedelta(days=22), 'interval_minutes': 120},   # 22거래일, 2시간 간격 → ~72개
-            }
-            
-            config = range_config.get(timeframe, range_config['1D'])
+            config = CHART_RANGE_CONFIG.get(timeframe, CHART_RANGE_CONFIG['1D'])
             interval_minutes = config['interval_minutes']
             
             # ✅ ETF 방식 적용: 최신 데이터 시점 기준 (시장 마감 중에도 동작)
-            latest_record = db_session.query(cls).filter(
-                cls.symbol == symbol.upper()
-            ).order_by(cls.created_at.desc()).first()
+            latest_time = db_session.execute(
+                LATEST_TRADE_TIME_BY_SYMBOL_QUERY, {'symbol': symbol.upper()}
+            ).scalar()
             
-            if not latest_record:
+            if not latest_time:
                 logger.warning(f"⚠️ {symbol} 데이터가 없습니다")
                 return []
             
-            latest_time = latest_record.created_at
             start_time = latest_time - config['range']
             
             logger.debug(f"📊 {symbol} 차트 조회 범위: {start_time} ~ {latest_time} ({timeframe})")
             
             # ✅ 수정: SQL에서 직접 샘플링 (Python 샘플링 제거)
             # 지정된 간격으로 버킷팅하고, 각 버킷의 마지막 가격만 선택
-            sampling_query = text("""
-                WITH sampled AS (
-                    SELECT 
-                        id,
-                        symbol,
-                        price,
-                        volume,
-                        timestamp_ms,
-                        created_at,
-                        -- 지정된 분 단위로 버킷팅
-                        date_trunc('hour', created_at) + 
-                        INTERVAL '1 min' * (FLOOR(EXTRACT(MINUTE FROM created_at) / :interval) * :interval) AS time_bucket,
-                        -- 각 버킷 내에서 마지막 데이터 선택 (시간순 DESC)
-                        ROW_NUMBER() OVER (
-                            PARTITION BY date_trunc('hour', created_at) + 
-                            INTERVAL '1 min' * (FLOOR(EXTRACT(MINUTE FROM created_at) / :interval) * :interval)
-                            ORDER BY created_at DESC
-                        ) AS rn
-                    FROM sp500_websocket_trades
-                    WHERE symbol = :symbol
-                      AND created_at >= :start_time
-                )
-                SELECT id, symbol, price, volume, timestamp_ms, created_at
-                FROM sampled
-                WHERE rn = 1
-                ORDER BY time_bucket ASC
-                LIMIT :limit
-            """)
-            
-            result = db_session.execute(sampling_query, {
+            result = db_session.execute(CHART_SAMPLING_QUERY, {
                 'symbol': symbol.upper(),
                 'start_time': start_time.replace(tzinfo=None),
                 'interval': interval_minutes,
@@ -531,32 +620,9 @@ class SP500WebsocketTrades(BaseModel):
             Dict[str, Any]: 시장 요약 정보
         """
         try:
-            from sqlalchemy import func
-            
-            # 기본 통계 조회
-            stats = db_session.query(
-                func.count(func.distinct(cls.symbol)).label('total_symbols'),
-                func.count(cls.id).label('total_trades'),
-                func.avg(cls.price).label('avg_price'),
-                func.max(cls.price).label('max_price'),
-                func.min(cls.price).label('min_price'),
-                func.sum(cls.volume).label('total_volume')
-            ).first()
-            
-            # 최신 업데이트 시간
-            latest_update = db_session.query(
-                func.max(cls.created_at)
-            ).scalar()
-            
-            return {
-                'total_symbols': stats.total_symbols or 0,
-                'total_trades': stats.total_trades or 0,
-                'average_price': float(stats.avg_price) if stats.avg_price else 0,
-                'highest_price': float(stats.max_price) if stats.max_price else 0,
-                'lowest_price': float(stats.min_price) if stats.min_price else 0,
-                'total_volume': stats.total_volume or 0,
-                'last_updated': latest_update.isoformat() if latest_update else None
-            }
+            stats = db_session.execute(cls.market_summary_statement()).first()
+            total_symbols = db_session.execute(DISTINCT_SYMBOL_COUNT_QUERY).scalar()
+            return cls.format_market_summary(stats, total_symbols)
             
         except Exception as e:
             logger.error(f"❌ 시장 요약 정보 조회 실패: {e}")
@@ -571,46 +637,53 @@ class SP500WebsocketTrades(BaseModel):
                 'error': str(e)
             }
         
+    @classmethod
+    def market_summary_statement(cls):
+        """
+        시장 요약 통계 + 최신 업데이트 시각을 한 번에 조회하는 select 구문
+        
+        total_trades는 COUNT(*) 대신 pg_class.reltuples(ANALYZE/autovacuum 기준 추정치)를 사용합니다.
+        표시용 값이라 정확도보다 전체 행 수 재집계를 피하는 쪽이 중요합니다.
+        심볼 개수는 거의 바뀌지 않으므로 여기서 COUNT(DISTINCT)로 세지 않고
+        DISTINCT_SYMBOL_COUNT_QUERY로 따로 조회합니다.
+        """
+        approximate_rows = literal_column(
+            f"(SELECT GREATEST(reltuples, 0)::bigint FROM pg_class "
+            f"WHERE oid = '{cls.__tablename__}'::regclass)"
+        )
+        return select(
+            approximate_rows.label('total_trades'),
+            func.avg(cls.price).label('avg_price'),
+            func.max(cls.price).label('max_price'),
+            func.min(cls.price).label('min_price'),
+            func.sum(cls.volume).label('total_volume'),
+            func.max(cls.created_at).label('latest_update')
+        )
+    
+    @staticmethod
+    def format_market_summary(stats, total_symbols: Optional[int]) -> Dict[str, Any]:
+        """market_summary_statement 결과 행 + 심볼 개수를 응답 딕셔너리로 변환"""
+        return {
+            'total_symbols': total_symbols or 0,
+            'total_trades': stats.total_trades or 0,
+            'average_price': float(stats.avg_price) if stats.avg_price else 0,
+            'highest_price': float(stats.max_price) if stats.max_price else 0,
+            'lowest_price': float(stats.min_price) if stats.min_price else 0,
+            'total_volume': stats.total_volume or 0,
+            'last_updated': stats.latest_update.isoformat() if stats.latest_update else None
+        }
+    
     @classmethod
     def get_all_current_prices_with_company_info(cls, db_session: Session, limit: int = 500) -> List[Dict[str, Any]]:
         """
         모든 심볼의 현재가와 회사 정보를 JOIN으로 한번에 조회
         """
         try:
-            from sqlalchemy import text
-            
             # DISTINCT ON을 사용해서 각 심볼의 최신 데이터만 조회 + 회사 정보 JOIN
-            query = text("""
-                SELECT DISTINCT ON (trades.symbol) 
-                    trades.symbol,
-                    trades.price,
-                    trades.volume,
-                    trades.timestamp_ms,
-                    trades.created_at,
-                    companies.company_name,
-                    companies.gics_sector,
-                    companies.gics_sub_industry
-                FROM sp500_websocket_trades trades
-                LEFT JOIN sp500_companies companies ON trades.symbol = companies.symbol
-                ORDER BY trades.symbol, trades.created_at DESC
-                LIMIT :limit
-            """)
-            
-            results = db_session.execute(query, {"limit": limit}).fetchall()
+            results = db_session.execute(LATEST_PRICES_WITH_COMPANY_QUERY, {"limit": limit}).fetchall()
             
             # 딕셔너리 형태로 변환
-            formatted_results = []
-            for row in results:
-                formatted_results.append({
-                    'symbol': row.symbol,
-                    'price': float(row.price) if row.price else None,
-                    'volume': row.volume,
-                    'timestamp_ms': row.timestamp_ms,
-                    'created_at': row.created_at,
-                    'company_name': row.company_name or f"{row.symbol} Inc.",
-                    'gics_sector': row.gics_sector,
-                    'gics_sub_industry': row.gics_sub_industry
-                })
+            formatted_results = [cls.format_company_price_row(row) for row in results]
             
             return formatted_results
             
@@ -618,6 +691,82 @@ class SP500WebsocketTrades(BaseModel):
             logger.error(f"JOIN을 통한 현재가+회사정보 조회 실패: {e}")
             return []
     
+    @staticmethod
+    def format_company_price_row(row) -> Dict[str, Any]:
+        """LATEST_PRICES_WITH_COMPANY_QUERY 결과 행을 딕셔너리로 변환"""
+        return {
+            'symbol': row.symbol,
+            'price': float(row.price) if row.price else None,
+            'volume': row.volume,
+            'timestamp_ms': row.timestamp_ms,
+            'created_at': row.created_at,
+            'company_name': row.company_name or f"{row.symbol} Inc.",
+            'gics_sector': row.gics_sector,
+            'gics_sub_industry': row.gics_sub_industry
+        }
+    
+    @staticmethod
+    def combine_price_changes(current_rows, previous_close_prices: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
+        """
+        최신 거래 행과 전일 종가를 조합해 심볼별 가격 변동 정보 생성
+        
+        Args:
+            current_rows: LATEST_PRICES_BY_SYMBOLS_QUERY 결과 행
+            previous_close_prices: {symbol: previous_close_price}
+            
+        Returns:
+            Dict[str, Dict]: {symbol: price_change_info}
+        """
+        batch_results = {}
+        
+        for row in current_rows:
+            symbol = row.symbol
+            current_price = float(row.price)
+            volume = row.volume or 0
+            last_updated = row.created_at
+            
+            # 전일 종가 가져오기
+            previous_close = previous_close_prices.get(symbol)
+            
+            if previous_close and previous_close > 0:
+                change_amount = current_price - previous_close
+                change_percentage = (change_amount / previous_close) * 100
+            else:
+                change_amount = 0
+                change_percentage = 0
+            
+            batch_results[symbol] = {
+                'current_price': current_price,
+                'change_amount': change_amount,
+                'change_percentage': change_percentage,
+                'volume': volume,
+                'last_updated': last_updated,
+                'previous_close': previous_close
+            }
+        
+        return batch_results
+    
+    @classmethod
+    def previous_close_search_window(cls) -> Tuple[datetime, datetime]:
+        """
+        전일 종가 배치 조회 구간 계산 (마지막 거래일 20시 기준 5일)
+        
+        Returns:
+            Tuple[datetime, datetime]: (검색 시작, 검색 종료) - naive datetime
+        """
+        # 미국 동부 시간 기준 계산
+        us_eastern = pytz.timezone('US/Eastern')
+        now_us = datetime.now(us_eastern)
+        
+        # 마지막 거래일 찾기
+        last_trading_day = cls._find_last_trading_day(now_us)
+        
+        # 검색 범위 설정 (마지막 거래일 종료 시점까지)
+        search_end = last_trading_day.replace(hour=20, minute=0, second=0, microsecond=0)  # 오후 8시 (시간 외 거래 포함)
+        search_start = search_end - timedelta(days=5)  # 5일 전부터 검색
+        
+        return search_start.replace(tzinfo=None), search_end.replace(tzinfo=None)
+    
     @classmethod
     def get_batch_price_changes(cls, db_session, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
         """
@@ -637,18 +786,8 @@ class SP500WebsocketTrades(BaseModel):
             logger.info(f"🔄 SP500 배치 가격 변동 정보 조회 시작: {len(symbols)}개 심볼")
             
             # 1. 모든 심볼의 현재가 조회 (최신 데이터)
-            current_prices_query = text("""
-                SELECT DISTINCT ON (symbol) 
-                    symbol, price, volume, created_at
-                FROM sp500_websocket_trades 
-                WHERE symbol = ANY(:symbols)
-                    AND price IS NOT NULL 
-                    AND price > 0
-                ORDER BY symbol, created_at DESC
-            """)
-            
             current_results = db_session.execute(
-                current_prices_query, 
+                LATEST_PRICES_BY_SYMBOLS_QUERY, 
                 {"symbols": [s.upper() for s in symbols]}
             ).fetchall()
             
@@ -656,33 +795,7 @@ class SP500WebsocketTrades(BaseModel):
             previous_close_prices = cls.get_batch_previous_close_prices(db_session, symbols)
             
             # 3. 결과 조합
-            batch_results = {}
-            
-            for row in current_results:
-                symbol = row.symbol
-                current_price = float(row.price)
-                volume = row.volume or 0
-                last_updated = row.created_at
-                
-                # 전일 종가 가져오기
-                previous_close = previous_close_prices.get(symbol)
-                
-                if previous_close and previous_close > 0:
-                    change_amount = current_price - previous_close
-                    change_percentage = (change_amount / previous_close) * 100
-                else:
-                    change_amount = 0
-                    change_percentage = 0
-                    # logger.warning(f"❌ {symbol} SP500 전일 종가 데이터 없음 (배치 조회)")
-                
-                batch_results[symbol] = {
-                    'current_price': current_price,
-                    'change_amount': change_amount,
-                    'change_percentage': change_percentage,
-                    'volume': volume,
-                    'last_updated': last_updated,
-                    'previous_close': previous_close
-                }
+            batch_results = cls.combine_price_changes(current_results, previous_close_prices)
             
             logger.info(f"✅ SP500 배치 가격 변동 정보 조회 완료: {len(batch_results)}개 결과")
             return batch_results
@@ -707,41 +820,13 @@ class SP500WebsocketTrades(BaseModel):
             if not symbols:
                 return {}
             
-            # 미국 동부 시간 기준 계산
-            us_eastern = pytz.timezone('US/Eastern')
-            now_us = datetime.now(us_eastern)
-            
-            # 마지막 거래일 찾기
-            last_trading_day = cls._find_last_trading_day(now_us)
-            
-            # 검색 범위 설정 (마지막 거래일 종료 시점까지)
-            search_end = last_trading_day.replace(hour=20, minute=0, second=0, microsecond=0)  # 오후 8시 (시간 외 거래 포함)
-            search_start = search_end - timedelta(days=5)  # 5일 전부터 검색
+            search_start, search_end = cls.previous_close_search_window()
             
             # 배치 쿼리 실행
-            batch_query = text("""
-                WITH ranked_prices AS (
-                    SELECT 
-                        symbol,
-                        price,
-                        created_at,
-                        ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY created_at DESC) as rn
-                    FROM sp500_websocket_trades
-                    WHERE symbol = ANY(:symbols)
-                        AND price IS NOT NULL 
-                        AND price > 0
-                        AND created_at >= :search_start
-                        AND created_at <= :search_end
-                )
-                SELECT symbol, price
-                FROM ranked_prices
-                WHERE rn = 1
-            """)
-            
-            results = db_session.execute(batch_query, {
+            results = db_session.execute(PREVIOUS_CLOSE_PRICES_QUERY, {
                 "symbols": [s.upper() for s in symbols],
-                "search_start": search_start.replace(tzinfo=None),
-                "search_end": search_end.replace(tzinfo=None)
+                "search_start": search_start,
+                "search_end": search_end
             }).fetchall()
             
             # 결과 딕셔너리로 변환
@@ -755,31 +840,10 @@ class SP500WebsocketTrades(BaseModel):
                 logger.info(f"🔍 {len(missing_symbols)}개 심볼 확장 검색 시작")
                 
                 # 확장 검색 (12시간 더 뒤로)
-                extended_search_start = search_start - timedelta(hours=12)
-                
-                extended_query = text("""
-                    WITH ranked_prices AS (
-                        SELECT 
-                            symbol,
-                            price,
-                            created_at,
-                            ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY created_at DESC) as rn
-                        FROM sp500_websocket_trades
-                        WHERE symbol = ANY(:missing_symbols)
-                            AND price IS NOT NULL 
-                            AND price > 0
-                            AND created_at >= :extended_search_start
-                            AND created_at <= :search_end
-                    )
-                    SELECT symbol, price
-                    FROM ranked_prices
-                    WHERE rn = 1
-                """)
-                
-                extended_results = db_session.execute(extended_query, {
-                    "missing_symbols": [s.upper() for s in missing_symbols],
-                    "extended_search_start": extended_search_start.replace(tzinfo=None),
-                    "search_end": search_end.replace(tzinfo=None)
+                extended_results = db_session.execute(PREVIOUS_CLOSE_PRICES_QUERY, {
+                    "symbols": [s.upper() for s in missing_symbols],
+                    "search_start": search_start - timedelta(hours=12),
+                    "search_end": search_end
                 }).fetchall()
                 
                 for row in extended_results:
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Date, Numeric, Boolean, JSON, Text
+from sqlalchemy import Column, Integer, String, DateTime, Date, Numeric, Boolean, JSON, Text, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from app.models.base import BaseModel
 
@@ -55,6 +55,11 @@ class TruthSocialPost(BaseModel):
     collected_at = Column(DateTime, server_default='now()')
     updated_at = Column(DateTime, server_default='now()')
 
+    # SNS 피드 keyset 페이징 인덱스: (created_at, id) < 커서 조건을 인덱스 탐색으로 처리
+    __table_args__ = (
+        Index('idx_truth_social_posts_created_keyset', created_at.desc(), id.desc()),
+    )
+
 
 class TruthSocialTag(BaseModel):
     """Truth Social 해시태그 트렌드 모델"""
@@ -135,4 +140,9 @@ class TruthSocialTrend(BaseModel):
     
     # 타임스탬프
     collected_at = Column(DateTime, server_default='now()')
-    updated_at = Column(DateTime, server_default='now()')
\ No newline at end of file
+    updated_at = Column(DateTime, server_default='now()')
+
+    # SNS 피드 keyset 페이징 인덱스: (created_at, id) < 커서 조건을 인덱스 탐색으로 처리
+    __table_args__ = (
+        Index('idx_truth_social_trends_created_keyset', created_at.desc(), id.desc()),
+    )
@@ -1,6 +1,6 @@
 # app/models/x_posts_model.py
 
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, BigInteger
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, BigInteger, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from app.models.base import BaseModel
 
@@ -61,6 +61,11 @@ class XPost(BaseModel):
     collected_at = Column(DateTime, comment="수집 시간")
     updated_at = Column(DateTime, comment="업데이트 시간")
     
+    # SNS 피드 keyset 페이징 인덱스: (created_at, tweet_id) < 커서 조건을 인덱스 탐색으로 처리
+    __table_args__ = (
+        Index('idx_x_posts_created_keyset', created_at.desc(), tweet_id.desc()),
+    )
+    
     def __repr__(self):
         return f"<XPost(tweet_id='{self.tweet_id}', username='{self.username}', likes={self.like_count})>"
     
@@ -86,18 +86,20 @@ class FinancialNewsListResponse(BaseModel):
     페이징된 금융 뉴스 목록 응답
     
     구조:
-    - total: 전체 개수
+    - total: 전체 개수 (cursor 페이지는 추정치)
     - items: 뉴스 목록
     - category: 현재 조회 카테고리 (필터링 시)
-    - page, limit: 페이징 정보
+    - page, limit: 페이징 정보 (cursor 페이지는 page 없음)
     - has_next: 다음 페이지 존재 여부
+    - next_cursor: 다음 페이지 커서 (keyset 페이징)
     """
-    total: int = Field(..., description="전체 뉴스 개수")
+    total: int = Field(..., description="전체 뉴스 개수 (cursor 페이지는 추정치)")
     items: List[FinancialNewsListItem] = Field(..., description="뉴스 목록")
     category: Optional[str] = Field(None, description="현재 조회 카테고리")
-    page: int = Field(..., description="현재 페이지 (1부터 시작)")
+    page: Optional[int] = Field(None, description="현재 페이지 (1부터 시작, cursor 페이지는 null)")
     limit: int = Field(..., description="페이지당 항목 수")
     has_next: bool = Field(..., description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (cursor 파라미터로 전달)")
 
     class Config:
         json_schema_extra = {
@@ -118,7 +120,8 @@ class FinancialNewsListResponse(BaseModel):
                 "category": "crypto",
                 "page": 1,
                 "limit": 20,
-                "has_next": True
+                "has_next": True,
+                "next_cursor": "WyIyMDI1LTA3LTIwVDE0OjMwOjE1IiwxMjM0NTY3ODkwMSwiY3J5cHRvIl0"
             }
         }
 
@@ -129,9 +132,10 @@ class FinancialNewsSearchResponse(BaseModel):
     items: List[FinancialNewsResponse]
     search_query: str = Field(..., description="검색어")
     categories: Optional[List[str]] = Field(None, description="검색 대상 카테고리")
-    page: int
+    page: Optional[int] = Field(None, description="현재 페이지 (cursor 페이지는 null)")
     limit: int
     has_next: bool
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (cursor 파라미터로 전달)")
 
 
 class CategoryStatsResponse(BaseModel):
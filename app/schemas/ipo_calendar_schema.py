@@ -28,6 +28,23 @@ class IPOCalendarResponse(IPOCalendarBase):
         }
     }
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> "IPOCalendarResponse":
+        """
+        ORM 객체에서 검증 없이 응답 스키마 생성
+        
+        DB 제약으로 이미 타입이 보장된 ipo_calendar 행 전용입니다.
+        (외부 입력처럼 신뢰할 수 없는 데이터는 model_validate 사용)
+        """
+        values = {name: getattr(obj, name, None) for name in cls.model_fields}
+        
+        # Numeric 컬럼은 Decimal로 오므로 스키마 타입(float)에 맞춤
+        for key in ("price_range_low", "price_range_high"):
+            if values[key] is not None:
+                values[key] = float(values[key])
+        
+        return cls.model_construct(_fields_set=set(values), **values)
+
 class IPOCalendarListResponse(BaseModel):
     """IPO 캘린더 목록 응답"""
     items: List[IPOCalendarResponse] = Field(..., description="IPO 일정 목록")
@@ -73,12 +73,14 @@ class MarketNewsListResponse(BaseModel):
     - items: 뉴스 목록
     - page, limit: 페이징 정보
     - has_next: 다음 페이지 존재 여부
+    - next_cursor: 다음 페이지 커서 (keyset 페이징)
     """
     total: int = Field(..., description="전체 뉴스 개수")
     items: List[MarketNewsListItem] = Field(..., description="뉴스 목록")
     page: int = Field(..., description="현재 페이지 (1부터 시작)")
     limit: int = Field(..., description="페이지당 항목 수")
     has_next: bool = Field(..., description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (cursor 파라미터로 전달)")
 
     class Config:
         json_schema_extra = {
@@ -94,7 +96,8 @@ class MarketNewsListResponse(BaseModel):
                 ],
                 "page": 1,
                 "limit": 20,
-                "has_next": True
+                "has_next": True,
+                "next_cursor": "WyIyMDI1LTA3LTE5VDAwOjAwOjE0IiwiQkJDIE5ld3MiLCJodHRwczovL3d3dy5iYmMuY29tL25ld3MiXQ"
             }
         }
 
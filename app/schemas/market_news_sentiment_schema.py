@@ -1,8 +1,13 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Literal
 from decimal import Decimal
 
+# 쿼리 파라미터 허용값 정의 (타입 안전성)
+SentimentSortType = Literal["time_published", "sentiment_score"]
+SortOrderType = Literal["asc", "desc"]
+TrendIntervalType = Literal["hourly", "daily"]
+
 # =============================================================================
 # 기본 JSONB 스키마들 (ticker_sentiment, topics 파싱용)
 # =============================================================================
@@ -95,6 +100,7 @@ class MarketSentimentListResponse(BaseModel):
     total_count: int = Field(..., description="총 뉴스 개수")
     batch_info: BatchInfo = Field(..., description="배치 정보")
     news: List[MarketNewsSentimentResponse] = Field(..., description="뉴스 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (cursor 파라미터로 전달)")
 
 class TopicListResponse(BaseModel):
     """사용 가능한 주제 목록 응답"""
@@ -3,9 +3,25 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from enum import Enum
 
 from app.schemas.common import PaginatedResponse
 
+
+class SNSPlatform(str, Enum):
+    """개별 게시글 조회용 SNS 플랫폼"""
+    x = "x"
+    truth_social_posts = "truth_social_posts"
+    truth_social_trends = "truth_social_trends"
+
+
+class SNSFeedPlatform(str, Enum):
+    """목록 조회용 SNS 플랫폼 (all: 전체 플랫폼)"""
+    all = "all"
+    x = "x"
+    truth_social_posts = "truth_social_posts"
+    truth_social_trends = "truth_social_trends"
+
 # ==================================================================================
 # === 신규 추가/수정된 스키마: OHLCV 데이터 구조를 정의합니다. ===
 # ==================================================================================
@@ -54,6 +70,7 @@ class SNSPostsResponse(PaginatedResponse):
     """(원본 데이터용) SNS 게시글 목록 응답 스키마"""
     items: List[UnifiedSNSPostResponse] = Field(..., description="게시글 목록")
     platform_counts: Dict[str, int] = Field(default_factory=dict, description="플랫폼별 개수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (cursor 파라미터로 전달)")
 
 
 class AuthorInfo(BaseModel):
@@ -46,6 +46,16 @@ class StockInfo(BaseModel):
         """변동 수치 반올림"""
         return round(v, 2) if v is not None else None
 
+    @classmethod
+    def from_dict_fast(cls, item: Dict[str, Any]) -> "StockInfo":
+        """
+        서비스 결과 딕셔너리에서 검증 없이 응답 스키마 생성
+        
+        SP500Service가 DB 값으로 만든(변동 수치는 이미 반올림된) 항목 전용입니다.
+        """
+        values = {name: item.get(name) for name in cls.model_fields}
+        return cls.model_construct(_fields_set=set(values), **values)
+
 class StockDetail(StockInfo):
     """주식 상세 정보 (차트 데이터 포함)"""
     previous_close: Optional[float] = Field(None, description="전일 종가")
@@ -73,6 +83,19 @@ class CategoryStockResponse(BaseModel):
     market_status: MarketStatus = Field(..., description="시장 상태")
     message: Optional[str] = Field(None, description="메시지")
 
+    @classmethod
+    def from_service_fast(cls, result: Dict[str, Any]) -> "CategoryStockResponse":
+        """SP500Service 순위 결과에서 검증 없이 응답 스키마 생성"""
+        return cls.model_construct(
+            category=result['category'],
+            stocks=[StockInfo.from_dict_fast(item) for item in result['stocks']],
+            total_count=result['total_count'],
+            market_status=MarketStatus.model_construct(
+                **{name: result['market_status'].get(name) for name in MarketStatus.model_fields}
+            ),
+            message=result.get('message')
+        )
+
 class SearchResponse(BaseModel):
     """검색 결과 응답"""
     query: str = Field(..., description="검색어")
@@ -80,15 +103,25 @@ class SearchResponse(BaseModel):
     total_count: int = Field(..., description="총 결과 개수")
     message: Optional[str] = Field(None, description="메시지")
 
+    @classmethod
+    def from_service_fast(cls, result: Dict[str, Any]) -> "SearchResponse":
+        """SP500Service 검색 결과에서 검증 없이 응답 스키마 생성"""
+        return cls.model_construct(
+            query=result['query'],
+            results=[StockInfo.from_dict_fast(item) for item in result['results']],
+            total_count=result['total_count'],
+            message=result.get('message')
+        )
+
 
 class MarketSummary(BaseModel):
     """시장 요약 정보"""
     total_symbols: int = Field(..., description="총 심볼 개수")
-    total_trades: int = Field(..., description="총 거래 개수")
-    average_price: float = Field(..., description="평균 가격")
-    highest_price: float = Field(..., description="최고 가격")
-    lowest_price: float = Field(..., description="최저 가격")
-    total_volume: int = Field(..., description="총 거래량")
+    total_trades: int = Field(..., description="총 거래 개수 (추정치)")
+    average_price: float = Field(..., description="평균 가격 (심볼별 최신가 기준)")
+    highest_price: float = Field(..., description="최고 가격 (심볼별 최신가 기준)")
+    lowest_price: float = Field(..., description="최저 가격 (심볼별 최신가 기준)")
+    total_volume: int = Field(..., description="총 거래량 (최근 24시간)")
     last_updated: Optional[str] = Field(None, description="최종 업데이트 시간")
 
 class MarketHighlights(BaseModel):
@@ -290,6 +323,18 @@ def create_error_response(error_type: str, message: str, code: str = None, path:
         path=path
     )
 
+def error_detail(error_type: str, message: str, code: str = None, path: str = None) -> Dict[str, Any]:
+    """
+    HTTPException detail용 에러 딕셔너리 생성
+    
+    create_error_response(...).model_dump()와 같은 구조를 모델 생성/검증 없이 만듭니다.
+    """
+    return {
+        'error': {'type': error_type, 'message': message, 'code': code},
+        'timestamp': datetime.now(pytz.UTC).isoformat(),
+        'path': path
+    }
+
 def market_status_to_dict(market_status: MarketStatus) -> Dict[str, Any]:
     """MarketStatus를 딕셔너리로 변환"""
     return {
@@ -4,9 +4,9 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import pytz
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
-from app.database import get_db
+from app.database import get_db, AsyncSessionLocal
 from app.models.company_overview_model import CompanyOverview
 from app.schemas.company_overview_schema import (
     CompanyOverviewData, CompanyOverviewSummary, SectorStatistics,
@@ -112,10 +112,12 @@ class CompanyOverviewService:
         finally:
             db.close()
     
-    def get_company_basic_metrics(self, symbol: str) -> Dict[str, Any]:
+    async def get_company_basic_metrics(self, symbol: str) -> Dict[str, Any]:
         """
         회사의 핵심 지표만 간단히 조회 (SP500 서비스와 통합용)
         
+        AsyncSession으로 조회하므로 SP500 실시간 데이터 조회와 asyncio.gather로 동시에 실행할 수 있습니다.
+        
         Args:
             symbol: 주식 심볼
             
@@ -126,13 +128,19 @@ class CompanyOverviewService:
             self.stats["api_requests"] += 1
             logger.info(f"Company Overview 핵심 지표 조회 시작: {symbol}")
             
-            db = next(get_db())
-            company = CompanyOverview.get_latest_by_symbol(db, symbol.upper())
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(CompanyOverview)
+                    .where(CompanyOverview.symbol == symbol.upper())
+                    .order_by(CompanyOverview.batch_id.desc())
+                    .limit(1)
+                )
+                company = result.scalars().first()
+            self.stats["db_queries"] += 1
             
             if not company:
                 self.stats["data_not_found"] += 1
                 logger.warning(f"⚠️ {symbol} Company Overview 데이터 없음 - DB에서 조회 결과 없음")
-                logger.info(f"DB 쿼리 실행: CompanyOverview.get_latest_by_symbol(db, '{symbol.upper()}')")
                 return {
                     'data_available': False,
                     'message': f'{symbol} 회사 정보가 없습니다',
@@ -141,33 +149,67 @@ class CompanyOverviewService:
             
             # 핵심 지표만 반환
             logger.info(f"✅ {symbol} Company Overview 핵심 지표 생성 완료 (batch_id: {company.batch_id}, name: {company.name})")
-            return {
-                'data_available': True,
-                'company_name': company.name,
-                'sector': company.sector,
-                'industry': company.industry,
-                'market_cap': company.market_capitalization,
-                'pe_ratio': float(company.pe_ratio) if company.pe_ratio else None,
-                'dividend_yield': float(company.dividend_yield) if company.dividend_yield else None,
-                'beta': float(company.beta) if company.beta else None,
-                'roe': float(company.return_on_equity_ttm) if company.return_on_equity_ttm else None,
-                'profit_margin': float(company.profit_margin) if company.profit_margin else None,
-                'description': company.description,
-                'website': company.official_site,
-                'batch_id': company.batch_id
-            }
+            return self._format_basic_metrics(company)
             
         except Exception as e:
-            logger.error(f"❌ {symbol} 핵심 지표 조회 실패: {e}")
-            import traceback
-            logger.error(f"❌ 상세 에러 트레이스: {traceback.format_exc()}")
+            logger.error(f"❌ {symbol} 핵심 지표 조회 실패: {e}", exc_info=True)
+            self.stats["errors"] += 1
             return {
                 'data_available': False,
                 'error': f'Company Overview 조회 중 오류 발생: {str(e)}',
                 'debug_info': f'Exception: {type(e).__name__}'
             }
-        finally:
-            db.close()
+    
+    async def get_companies_basic_metrics(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 회사의 핵심 지표 일괄 조회 (관심 종목 목록용)
+        
+        심볼별 최신 배치 1건을 DISTINCT ON 한 번으로 조회합니다.
+        
+        Args:
+            symbols: 주식 심볼 리스트 (대문자)
+            
+        Returns:
+            Dict[str, Dict]: {symbol: 핵심 지표} - 데이터가 없는 심볼은 제외
+        """
+        try:
+            self.stats["api_requests"] += 1
+            
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(CompanyOverview)
+                    .where(CompanyOverview.symbol.in_(symbols))
+                    .distinct(CompanyOverview.symbol)
+                    .order_by(CompanyOverview.symbol, CompanyOverview.batch_id.desc())
+                )
+                companies = result.scalars().all()
+            self.stats["db_queries"] += 1
+            
+            return {company.symbol: self._format_basic_metrics(company) for company in companies}
+            
+        except Exception as e:
+            logger.error(f"❌ 핵심 지표 일괄 조회 실패 ({len(symbols)}개): {e}")
+            self.stats["errors"] += 1
+            return {}
+    
+    @staticmethod
+    def _format_basic_metrics(company: CompanyOverview) -> Dict[str, Any]:
+        """CompanyOverview 행을 SP500 통합 응답용 핵심 지표 딕셔너리로 변환"""
+        return {
+            'data_available': True,
+            'company_name': company.name,
+            'sector': company.sector,
+            'industry': company.industry,
+            'market_cap': company.market_capitalization,
+            'pe_ratio': float(company.pe_ratio) if company.pe_ratio else None,
+            'dividend_yield': float(company.dividend_yield) if company.dividend_yield else None,
+            'beta': float(company.beta) if company.beta else None,
+            'roe': float(company.return_on_equity_ttm) if company.return_on_equity_ttm else None,
+            'profit_margin': float(company.profit_margin) if company.profit_margin else None,
+            'description': company.description,
+            'website': company.official_site,
+            'batch_id': company.batch_id
+        }
     
     # =========================
     # 🎯 섹터별 분석
@@ -1,7 +1,7 @@
 # app/services/email_subscription_service.py
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, text
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from datetime import datetime, timedelta
 import uuid
 import logging
@@ -10,6 +10,9 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
 
+from fastapi import BackgroundTasks
+
+from app.database import SessionLocal
 from app.models.email_subscription_model import EmailSubscription
 
 logger = logging.getLogger(__name__)
@@ -34,10 +37,33 @@ class EmailSubscriptionService:
     def __init__(self, db: Session):
         self.db = db
     
+    def _dispatch_email(
+        self,
+        background_tasks: Optional[BackgroundTasks],
+        send_func: Callable[..., bool],
+        *args
+    ) -> bool:
+        """
+        메일 발송 실행 (BackgroundTasks가 주어지면 응답 이후로 미룸)
+        
+        SMTP 왕복(수백 ms)이 요청 응답 시간에 포함되지 않도록,
+        엔드포인트에서 BackgroundTasks를 넘기면 발송을 예약만 하고 바로 반환합니다.
+        
+        Returns:
+            bool: 예약 시 True, 즉시 발송 시 발송 성공 여부
+        """
+        if background_tasks is not None:
+            background_tasks.add_task(send_func, *args)
+            return True
+        return send_func(*args)
+    
     def _get_upcoming_earnings(self) -> List[Tuple]:
         """
         오늘부터 7일 후까지의 실적 발표 일정 조회
         
+        알림 메일은 응답 이후 백그라운드 태스크에서 발송될 수 있고, 그 시점에는
+        요청 스코프 세션(self.db)이 이미 닫혀 있으므로 조회용 세션을 새로 엽니다.
+        
         Returns:
             List[Tuple]: [(report_date, symbol, company_name, estimate, gics_sector), ...]
         """
@@ -58,8 +84,8 @@ class EmailSubscriptionService:
                 ORDER BY ec.report_date ASC, sp.market_cap DESC
             """)
             
-            result = self.db.execute(sql, {"start_date": today, "end_date": end_date})
-            return result.fetchall()
+            with SessionLocal() as db:
+                return db.execute(sql, {"start_date": today, "end_date": end_date}).fetchall()
             
         except Exception as e:
             logger.error(f"❌ 실적 발표 일정 조회 실패: {e}")
@@ -270,7 +296,13 @@ class EmailSubscriptionService:
             logger.error(f"❌ 인증 메일 발송 실패: {email} - {e}")
             return False
     
-    def subscribe(self, email: str, scope: str = 'SP500', agreed: bool = True) -> Dict[str, Any]:
+    def subscribe(
+        self,
+        email: str,
+        scope: str = 'SP500',
+        agreed: bool = True,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> Dict[str, Any]:
         """
         이메일 구독 추가 (Double Opt-in)
         
@@ -278,6 +310,7 @@ class EmailSubscriptionService:
             email: 구독할 이메일 주소
             scope: 구독 범위 (SP500, NASDAQ 등)
             agreed: 개인정보 수집/이용 동의 여부
+            background_tasks: 주어지면 인증 메일을 응답 이후 백그라운드로 발송
             
         Returns:
             Dict[str, Any]: 구독 결과
@@ -319,7 +352,10 @@ class EmailSubscriptionService:
                     self.db.commit()
                     
                     # 인증 메일 발송
-                    self._send_verification_email(email, str(existing.verification_token))
+                    self._dispatch_email(
+                        background_tasks, self._send_verification_email,
+                        email, str(existing.verification_token)
+                    )
                     
                     logger.info(f"📧 인증 메일 재발송: {email} ({scope})")
                     return {
@@ -338,7 +374,10 @@ class EmailSubscriptionService:
                     existing.agreed_at = datetime.now()
                     self.db.commit()
                     
-                    self._send_verification_email(email, str(existing.verification_token))
+                    self._dispatch_email(
+                        background_tasks, self._send_verification_email,
+                        email, str(existing.verification_token)
+                    )
                     
                     logger.info(f"📧 구독 재활성화 인증 메일: {email} ({scope})")
                     return {
@@ -366,7 +405,10 @@ class EmailSubscriptionService:
             self.db.refresh(new_subscription)
             
             # 인증 메일 발송
-            self._send_verification_email(email, str(verification_token))
+            self._dispatch_email(
+                background_tasks, self._send_verification_email,
+                email, str(verification_token)
+            )
             
             logger.info(f"✅ 새 구독 생성 (인증 대기): {email} ({scope})")
             
@@ -389,12 +431,17 @@ class EmailSubscriptionService:
                 'requires_verification': False
             }
     
-    def verify_email(self, token: str) -> Dict[str, Any]:
+    def verify_email(
+        self,
+        token: str,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> Dict[str, Any]:
         """
         이메일 인증 처리
         
         Args:
             token: 인증 토큰
+            background_tasks: 주어지면 실적 발표 알림 메일을 응답 이후 백그라운드로 발송
             
         Returns:
             Dict[str, Any]: 인증 결과
@@ -446,15 +493,16 @@ class EmailSubscriptionService:
             # 🆕 인증 완료 시 즉시 실적 발표 알림 이메일 발송
             email_sent = False
             if subscription.unsubscribe_token:
-                email_sent = self._send_earnings_notification_email(
-                    subscription.email, 
+                email_sent = self._dispatch_email(
+                    background_tasks, self._send_earnings_notification_email,
+                    subscription.email,
                     str(subscription.unsubscribe_token)
                 )
             
             if email_sent:
                 return {
                     'success': True,
-                    'message': '이메일 인증이 완료되었습니다! 향후 7일간 실적 발표 일정을 이메일로 보내드렸습니다.',
+                    'message': '이메일 인증이 완료되었습니다! 향후 7일간 실적 발표 일정을 이메일로 보내드립니다.',
                     'email': subscription.email
                 }
             else:
@@ -1,15 +1,16 @@
 # app/services/etf_service.py
 
+import asyncio
 import logging
 import json
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import pytz
 import redis
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, AsyncSessionLocal
 from app.models.etf_model import ETFBasicInfo, ETFProfileHoldings, ETFRealtimePrices
 from app.schemas import etf_schema
 from app.config import settings
@@ -189,37 +190,52 @@ class ETFService:
     # 개별 ETF 상세 정보 API
     # =========================
     
-    def get_etf_details_by_symbol(self, symbol: str) -> Optional[etf_schema.ETFDetailResponse]:
+    async def get_etf_details_by_symbol(self, symbol: str) -> Optional[etf_schema.ETFDetailResponse]:
         """
         특정 ETF 심볼에 대한 모든 상세 정보 조회
         
+        기본 정보 / 최신 가격 / 프로필은 서로 독립적인 쿼리이므로
+        각자 커넥션 풀에서 세션을 받아 asyncio.gather로 동시에 실행합니다.
+        전일 종가는 최신 가격의 시각에 의존하므로 그 다음에 조회합니다.
+        
         Args:
             symbol: ETF 심볼
             
         Returns:
             Optional[ETFDetailResponse]: ETF 상세 정보
         """
-        db: Session = next(get_db())
         try:
             symbol_upper = symbol.upper()
             
-            # DB에서 필요한 모든 데이터 조회
-            basic_info_model = db.query(ETFBasicInfo).filter(ETFBasicInfo.symbol == symbol_upper).first()
-            latest_price_model = db.query(ETFRealtimePrices).filter(
-                ETFRealtimePrices.symbol == symbol_upper
-            ).order_by(ETFRealtimePrices.timestamp_ms.desc()).first()
-            profile_model = db.query(ETFProfileHoldings).filter(
-                ETFProfileHoldings.symbol == symbol_upper
-            ).first()
+            # DB에서 필요한 모든 데이터 병렬 조회
+            basic_info_model, latest_price_model, profile_model = await asyncio.gather(
+                self._fetch_first(
+                    select(ETFBasicInfo).where(ETFBasicInfo.symbol == symbol_upper)
+                ),
+                self._fetch_first(
+                    select(ETFRealtimePrices)
+                    .where(ETFRealtimePrices.symbol == symbol_upper)
+                    .order_by(ETFRealtimePrices.timestamp_ms.desc())
+                    .limit(1)
+                ),
+                self._fetch_first(
+                    select(ETFProfileHoldings).where(ETFProfileHoldings.symbol == symbol_upper)
+                )
+            )
+            self.stats["db_queries"] += 3
 
             if not basic_info_model or not latest_price_model:
                 logger.warning(f"⚠️ 기본 정보 또는 실시간 가격 정보가 없음: {symbol_upper}")
                 return None
 
             # 전일 종가 안정적으로 계산
-            previous_close = self._get_robust_previous_close_price(
-                db, symbol_upper, latest_price_model.created_at
-            )
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    self._previous_close_query(symbol_upper, latest_price_model.created_at)
+                )
+                previous_close_record = result.first()
+            self.stats["db_queries"] += 1
+            previous_close = previous_close_record[0] if previous_close_record else None
 
             # 변동률 계산
             change_amount, change_percentage, is_positive = None, None, None
@@ -241,10 +257,12 @@ class ETFService:
                 last_updated=latest_price_model.created_at.isoformat() if latest_price_model.created_at else None
             )
 
-            # 프로필 정보 및 파생 데이터 스키마 생성
+            # 프로필 정보 및 파생 데이터 스키마 생성 (이름은 이미 조회한 기본 정보 재사용)
             profile_schema, sector_chart_data, holdings_chart_data, key_metrics = None, None, None, None
             if profile_model:
-                profile_schema, sector_chart_data, holdings_chart_data, key_metrics = self._parse_profile_to_schemas(profile_model)
+                profile_schema, sector_chart_data, holdings_chart_data, key_metrics = self._parse_profile_to_schemas(
+                    profile_model, etf_name=basic_info_model.name
+                )
 
             # 최종 응답 스키마 조합 후 반환
             return etf_schema.ETFDetailResponse(
@@ -258,12 +276,51 @@ class ETFService:
 
         except Exception as e:
             logger.error(f"❌ {symbol} ETF 상세 정보 조회 중 오류: {e}", exc_info=True)
+            self.stats["errors"] += 1
             return None
-        finally:
-            db.close()
 
-    def _get_robust_previous_close_price(self, db: Session, symbol: str, current_timestamp_utc: datetime) -> Optional[float]:
-        """안정적으로 전일 종가를 조회 (주말/공휴일 처리)"""
+    async def get_data_version(self, symbol: str, include_profile: bool = False) -> Optional[str]:
+        """
+        ETF 데이터 버전 조회 (ETag 생성용)
+        
+        차트/상세 응답 전체를 만들지 않고 최신 가격 시각(및 프로필 갱신 시각)만 조회합니다.
+        
+        Args:
+            symbol: ETF 심볼
+            include_profile: 프로필 갱신 시각 포함 여부 (상세 조회용)
+            
+        Returns:
+            Optional[str]: 버전 문자열 (데이터가 없으면 None)
+        """
+        symbol_upper = symbol.upper()
+        columns = [
+            select(func.max(ETFRealtimePrices.created_at))
+            .where(ETFRealtimePrices.symbol == symbol_upper)
+            .scalar_subquery()
+        ]
+        if include_profile:
+            columns.append(
+                select(ETFProfileHoldings.updated_at)
+                .where(ETFProfileHoldings.symbol == symbol_upper)
+                .limit(1)
+                .scalar_subquery()
+            )
+        
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(select(*columns))).first()
+        
+        if not row or row[0] is None:
+            return None
+        return ":".join(value.isoformat() if value else "-" for value in row)
+
+    async def _fetch_first(self, query):
+        """독립 세션으로 단일 행 조회 (gather 병렬 실행용)"""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(query)
+            return result.scalars().first()
+
+    def _get_previous_trading_day(self, current_timestamp_utc: datetime) -> date:
+        """기준 시각(ET) 직전의 유효 거래일 계산 (주말/공휴일 건너뜀)"""
         et_tz = pytz.timezone('US/Eastern')
         current_et_time = current_timestamp_utc.astimezone(et_tz)
         lookup_date = current_et_time.date() - timedelta(days=1)
@@ -272,16 +329,28 @@ class ETFService:
         while lookup_date.weekday() >= 5 or lookup_date.strftime('%Y-%m-%d') in self.market_checker.market_holidays:
             lookup_date -= timedelta(days=1)
         
-        # 해당 날짜의 마지막 거래 기록 찾음
-        previous_close_record = db.query(ETFRealtimePrices.price)\
-            .filter(ETFRealtimePrices.symbol == symbol)\
-            .filter(func.date(ETFRealtimePrices.created_at.op('AT TIME ZONE')('UTC').op('AT TIME ZONE')('US/Eastern')) == lookup_date)\
-            .order_by(ETFRealtimePrices.timestamp_ms.desc())\
-            .first()
+        return lookup_date
+
+    def _previous_close_query(self, symbol: str, current_timestamp_utc: datetime):
+        """전일 종가 조회 쿼리 생성 (해당 거래일의 마지막 거래 기록)"""
+        lookup_date = self._get_previous_trading_day(current_timestamp_utc)
+        return (
+            select(ETFRealtimePrices.price)
+            .where(ETFRealtimePrices.symbol == symbol)
+            .where(func.date(ETFRealtimePrices.created_at.op('AT TIME ZONE')('UTC').op('AT TIME ZONE')('US/Eastern')) == lookup_date)
+            .order_by(ETFRealtimePrices.timestamp_ms.desc())
+            .limit(1)
+        )
+
+    def _get_robust_previous_close_price(self, db: Session, symbol: str, current_timestamp_utc: datetime) -> Optional[float]:
+        """안정적으로 전일 종가를 조회 (주말/공휴일 처리)"""
+        previous_close_record = db.execute(
+            self._previous_close_query(symbol, current_timestamp_utc)
+        ).first()
 
         return previous_close_record[0] if previous_close_record else None
 
-    def _parse_profile_to_schemas(self, profile: ETFProfileHoldings):
+    def _parse_profile_to_schemas(self, profile: ETFProfileHoldings, etf_name: Optional[str] = None):
         """DB 모델을 받아서 여러 Pydantic 스키마로 변환"""
         try:
             # sectors 파싱
@@ -303,9 +372,10 @@ class ETFService:
             logger.warning(f"⚠️ JSON 파싱 오류: {e}, 빈 리스트로 대체")
             sectors, holdings = [], []
 
-        # ETF 이름 조회
-        etf_names = self._get_etf_names_sync([profile.symbol])
-        etf_name = etf_names.get(profile.symbol, profile.symbol)
+        # ETF 이름 조회 (호출 측에서 이미 알고 있으면 재조회하지 않음)
+        if etf_name is None:
+            etf_names = self._get_etf_names_sync([profile.symbol])
+            etf_name = etf_names.get(profile.symbol, profile.symbol)
         
         profile_schema = etf_schema.ETFProfile(
             symbol=profile.symbol, name=etf_name, net_assets=profile.net_assets,
@@ -642,7 +712,7 @@ class ETFService:
             Optional[dict]: 심볼 데이터
         """
         try:
-            result = self.get_etf_details_by_symbol(symbol)
+            result = await self.get_etf_details_by_symbol(symbol)
             if result:
                 # ETFDetailResponse를 dict로 변환
                 return {
@@ -1,10 +1,17 @@
+import asyncio
+import logging
+import time
 from datetime import datetime, timedelta
 import pytz
 from typing import List, Optional, Tuple, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import func, text, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, text, and_, or_, select, tuple_, literal, any_, String
+from sqlalchemy.dialects.postgresql import ARRAY
 
+from app.database import AsyncSessionLocal
 from app.models.financial_news_model import FinancialNews
+from app.utils.timezone_utils import to_naive_utc
+from app.utils.pagination_utils import encode_keyset_cursor, decode_keyset_cursor, estimated_count
 from app.schemas.financial_news_schema import (
     FinancialNewsResponse,
     FinancialNewsListItem,
@@ -15,6 +22,100 @@ from app.schemas.financial_news_schema import (
     CategoryType
 )
 
+logger = logging.getLogger(__name__)
+
+# =========================
+# 카테고리 통계 인프로세스 캐시
+# =========================
+# /categories/stats, /stats, /health가 같은 집계 쿼리를 쓰므로 한 번 계산한 결과를 공유하고,
+# lifespan의 백그라운드 갱신 태스크가 만료 전에 미리 다시 채웁니다.
+
+CATEGORIES_STATS_TTL = 60  # 초
+CATEGORIES_STATS_REFRESH_INTERVAL = 45  # 초 (TTL보다 짧게 두어 만료 전에 갱신)
+
+_categories_stats_cache: Dict[str, object] = {"value": None, "expires_at": 0.0, "refreshed_at": None}
+_categories_stats_lock = asyncio.Lock()
+
+
+def _get_cached_categories_statistics() -> Optional[CategoriesStatsResponse]:
+    """유효한 카테고리 통계 캐시 반환 (없거나 만료되면 None)"""
+    if time.monotonic() < _categories_stats_cache["expires_at"]:
+        return _categories_stats_cache["value"]
+    return None
+
+
+def _store_categories_statistics(value: CategoriesStatsResponse) -> None:
+    """카테고리 통계 캐시 저장"""
+    _categories_stats_cache["value"] = value
+    _categories_stats_cache["expires_at"] = time.monotonic() + CATEGORIES_STATS_TTL
+    _categories_stats_cache["refreshed_at"] = datetime.now(pytz.UTC)
+
+
+def get_categories_statistics_snapshot() -> Tuple[Optional[CategoriesStatsResponse], Optional[datetime]]:
+    """
+    마지막으로 계산된 카테고리 통계와 갱신 시각 반환 (만료 여부와 무관, DB 조회 없음)
+    
+    헬스 체크처럼 자주 호출되는 경로에서 메모리 값만 읽을 때 사용합니다.
+    """
+    return _categories_stats_cache["value"], _categories_stats_cache["refreshed_at"]
+
+
+async def refresh_categories_statistics() -> CategoriesStatsResponse:
+    """카테고리 통계를 새 세션으로 다시 계산해 캐시에 저장"""
+    async with AsyncSessionLocal() as db:
+        result = await FinancialNewsService(db)._query_categories_statistics()
+    _store_categories_statistics(result)
+    return result
+
+
+async def run_categories_statistics_refresher(interval: int = CATEGORIES_STATS_REFRESH_INTERVAL) -> None:
+    """
+    카테고리 통계 캐시 주기적 갱신 루프 (lifespan에서 태스크로 실행)
+    
+    사용자 요청이 캐시 미스로 집계 쿼리를 기다리지 않도록 미리 채워 둡니다.
+    """
+    while True:
+        try:
+            await refresh_categories_statistics()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ 카테고리 통계 캐시 갱신 실패: {e}")
+        await asyncio.sleep(interval)
+
+
+def _array_param(values) -> object:
+    """
+    리스트 필터를 단일 배열 파라미터로 바인딩
+    
+    IN (...)은 원소 개수마다 SQL 문자열이 달라져 asyncpg prepared statement를
+    재사용하지 못하므로, 항상 = ANY($1::VARCHAR[]) 형태가 되도록 합니다.
+    """
+    return any_(literal(list(values), ARRAY(String)))
+
+
+# keyset 페이징 정렬 키 (최신순, 동일 시각은 news_id/category로 순서 고정)
+_KEYSET_COLUMNS = (FinancialNews.published_at, FinancialNews.news_id, FinancialNews.category)
+
+
+def _encode_cursor(item: FinancialNews) -> str:
+    """마지막 항목의 정렬 키로 다음 페이지 커서 생성"""
+    return encode_keyset_cursor([item.published_at, item.news_id, item.category])
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int, str]:
+    """
+    커서를 (published_at, news_id, category)로 복원
+    
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    published_at, news_id, category = decode_keyset_cursor(cursor, len(_KEYSET_COLUMNS))
+    try:
+        return to_naive_utc(datetime.fromisoformat(published_at)), int(news_id), str(category)
+    except (TypeError, ValueError):
+        raise ValueError(f"잘못된 커서 형식입니다: {cursor}")
+
 
 class FinancialNewsService:
     """
@@ -29,10 +130,63 @@ class FinancialNewsService:
     6. 최신 뉴스 조회
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_financial_news_list(
+    async def _count(self, query) -> int:
+        """필터가 적용된 select 구문의 전체 행 수 조회"""
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        return (await self.db.execute(count_query)).scalar_one()
+
+    async def _total(self, query, cursor: Optional[str], name: str, filters: dict) -> int:
+        """
+        페이징 정보용 전체 개수 조회
+        
+        첫 페이지(cursor 없음)는 정확한 COUNT(*)를 사용하고, 커서로 이어지는 페이지는
+        매번 필터 결과 전체를 세지 않도록 캐시된 실행 계획 추정치를 사용합니다.
+        """
+        if cursor:
+            return await estimated_count(self.db, query, "financial_news", name, filters)
+        return await self._count(query)
+
+    async def _fetch_page(
+        self,
+        query,
+        skip: int,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[FinancialNews], bool, Optional[str]]:
+        """
+        최신순 페이지 조회 (cursor가 있으면 keyset, 없으면 OFFSET)
+        
+        정렬 키 (published_at, news_id, category)를 고정하고,
+        다음 페이지 존재 여부 확인을 위해 limit + 1개를 조회합니다.
+        
+        Returns:
+            Tuple[List[FinancialNews], bool, Optional[str]]: (항목, has_next, next_cursor)
+            
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        query = query.order_by(None).order_by(*(column.desc() for column in _KEYSET_COLUMNS))
+        
+        if cursor:
+            query = query.where(
+                tuple_(*_KEYSET_COLUMNS) < tuple_(*(
+                    literal(value, column.type) for column, value in zip(_KEYSET_COLUMNS, _decode_cursor(cursor))
+                ))
+            )
+        else:
+            query = query.offset(skip)
+        
+        items = (await self.db.execute(query.limit(limit + 1))).scalars().all()
+        
+        has_next = len(items) > limit
+        items = items[:limit]
+        next_cursor = _encode_cursor(items[-1]) if has_next and items else None
+        return items, has_next, next_cursor
+
+    async def get_financial_news_list(
         self,
         skip: int = 0,
         limit: int = 20,
@@ -40,28 +194,36 @@ class FinancialNewsService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         symbols: Optional[List[str]] = None,
-        sources: Optional[List[str]] = None
+        sources: Optional[List[str]] = None,
+        cursor: Optional[str] = None
     ) -> FinancialNewsListResponse:
         """
         금융 뉴스 목록 조회 (페이징 + 다중 필터링)
         
+        cursor가 주어지면 OFFSET 대신 keyset 페이징을 사용합니다.
+        (깊은 페이지에서도 앞쪽 행을 건너뛰며 스캔하지 않음)
+        
         Args:
-            skip: 건너뛸 항목 수
+            skip: 건너뛸 항목 수 (cursor 사용 시 무시)
             limit: 한 페이지당 항목 수
             categories: 포함할 카테고리 목록
             start_date: 시작 날짜 필터
             end_date: 종료 날짜 필터
             symbols: 관련 종목 필터 (BTCUSD, AAPL 등)
             sources: 뉴스 소스 필터
+            cursor: 이전 응답의 next_cursor 값
             
         Returns:
             FinancialNewsListResponse: 페이징된 뉴스 목록
+            
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
         """
-        # 기본 쿼리 (최신순 정렬)
-        query = self.db.query(FinancialNews).order_by(FinancialNews.published_at.desc())
+        # 기본 쿼리 (정렬은 _fetch_page에서 keyset 정렬 키로 적용)
+        query = select(FinancialNews)
         
         # 제목/내용 필터링: headline이나 summary가 없으면 제외
-        query = query.filter(
+        query = query.where(
             or_(
                 and_(FinancialNews.headline.isnot(None), FinancialNews.headline != ''),
                 and_(FinancialNews.summary.isnot(None), FinancialNews.summary != '')
@@ -70,32 +232,36 @@ class FinancialNewsService:
         
         # 카테고리 필터링
         if categories:
-            query = query.filter(FinancialNews.category.in_(categories))
+            query = query.where(FinancialNews.category == _array_param(categories))
             
         # 날짜 필터링
         if start_date:
-            query = query.filter(FinancialNews.published_at >= start_date)
+            query = query.where(FinancialNews.published_at >= to_naive_utc(start_date))
         if end_date:
-            query = query.filter(FinancialNews.published_at <= end_date)
+            query = query.where(FinancialNews.published_at <= to_naive_utc(end_date))
             
         # 관련 종목 필터링 (부분 문자열 검색)
         if symbols:
-            symbol_conditions = []
-            for symbol in symbols:
-                # related 필드에서 해당 종목이 포함된 뉴스 검색
-                symbol_conditions.append(FinancialNews.related.ilike(f'%{symbol}%'))
-            query = query.filter(or_(*symbol_conditions))
+            # related 필드에서 해당 종목 중 하나라도 포함된 뉴스 검색
+            query = query.where(
+                FinancialNews.related.ilike(_array_param(f'%{symbol}%' for symbol in symbols))
+            )
             
         # 소스 필터링
         if sources:
-            query = query.filter(FinancialNews.source.in_(sources))
+            query = query.where(FinancialNews.source == _array_param(sources))
         
-        # 전체 개수 조회 (페이징 정보용)
-        total = query.count()
+        # 전체 개수 조회 (페이징 정보용, 커서 페이지는 추정치)
+        total = await self._total(query, cursor, "list", {
+            "categories": categories,
+            "start_date": start_date,
+            "end_date": end_date,
+            "symbols": symbols,
+            "sources": sources
+        })
         
         # 페이징 적용
-        items_query = query.offset(skip).limit(limit)
-        items = items_query.all()
+        items, has_next, next_cursor = await self._fetch_page(query, skip, limit, cursor)
         
         # 응답 데이터 생성
         news_items = []
@@ -114,9 +280,8 @@ class FinancialNewsService:
             )
             news_items.append(news_item)
         
-        # 페이징 정보 계산
-        page = (skip // limit) + 1
-        has_next = (skip + limit) < total
+        # 페이징 정보 계산 (커서 페이지는 페이지 번호가 없음)
+        page = None if cursor else (skip // limit) + 1
         
         # 현재 조회 카테고리 (단일 카테고리인 경우만 표시)
         current_category = categories[0] if categories and len(categories) == 1 else None
@@ -127,10 +292,11 @@ class FinancialNewsService:
             category=current_category,
             page=page,
             limit=limit,
-            has_next=has_next
+            has_next=has_next,
+            next_cursor=next_cursor
         )
 
-    def get_news_by_id(self, category: CategoryType, news_id: int) -> Optional[FinancialNewsResponse]:
+    async def get_news_by_id(self, category: CategoryType, news_id: int) -> Optional[FinancialNewsResponse]:
         """
         특정 뉴스 상세 조회 (복합 키 사용)
         
@@ -141,12 +307,8 @@ class FinancialNewsService:
         Returns:
             FinancialNewsResponse: 뉴스 상세 정보
         """
-        news = self.db.query(FinancialNews).filter(
-            and_(
-                FinancialNews.category == category,
-                FinancialNews.news_id == news_id
-            )
-        ).first()
+        # 복합 기본키 (category, news_id)로 직접 조회 - PK 인덱스 단건 조회
+        news = await self.db.get(FinancialNews, (category, news_id))
         
         if not news:
             return None
@@ -169,14 +331,15 @@ class FinancialNewsService:
             category_display_name=news.category_display_name
         )
 
-    def search_financial_news(
+    async def search_financial_news(
         self,
         query_text: str,
         skip: int = 0,
         limit: int = 20,
         categories: Optional[List[CategoryType]] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None
     ) -> FinancialNewsSearchResponse:
         """
         금융 뉴스 전문 검색
@@ -187,46 +350,56 @@ class FinancialNewsService:
         
         Args:
             query_text: 검색어
-            skip: 페이징 offset
+            skip: 페이징 offset (cursor 사용 시 무시)
             limit: 페이징 limit
             categories: 검색 대상 카테고리
             start_date: 날짜 필터 시작
             end_date: 날짜 필터 종료
+            cursor: 이전 응답의 next_cursor 값 (keyset 페이징)
             
         Returns:
             FinancialNewsSearchResponse: 검색 결과
+            
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
         """
-        # 기본 검색 쿼리
-        search_query = self.db.query(FinancialNews).filter(
+        # 기본 검색 쿼리 (3자 이상이면 pg_trgm GIN 인덱스 사용)
+        pattern = f'%{query_text}%'
+        search_query = select(FinancialNews).where(
             or_(
                 # 헤드라인에서 검색 (대소문자 무시)
-                FinancialNews.headline.ilike(f'%{query_text}%'),
+                FinancialNews.headline.ilike(pattern),
                 # 요약에서 검색
-                FinancialNews.summary.ilike(f'%{query_text}%'),
+                FinancialNews.summary.ilike(pattern),
                 # 소스에서 검색
-                FinancialNews.source.ilike(f'%{query_text}%')
+                FinancialNews.source.ilike(pattern)
             )
-        ).filter(
+        ).where(
             # 제목/내용 필터링: headline이나 summary가 없으면 제외
             or_(
                 and_(FinancialNews.headline.isnot(None), FinancialNews.headline != ''),
                 and_(FinancialNews.summary.isnot(None), FinancialNews.summary != '')
             )
-        ).order_by(FinancialNews.published_at.desc())
+        )
         
         # 카테고리 필터링
         if categories:
-            search_query = search_query.filter(FinancialNews.category.in_(categories))
+            search_query = search_query.where(FinancialNews.category == _array_param(categories))
             
         # 날짜 필터링
         if start_date:
-            search_query = search_query.filter(FinancialNews.published_at >= start_date)
+            search_query = search_query.where(FinancialNews.published_at >= to_naive_utc(start_date))
         if end_date:
-            search_query = search_query.filter(FinancialNews.published_at <= end_date)
+            search_query = search_query.where(FinancialNews.published_at <= to_naive_utc(end_date))
         
-        # 전체 개수 및 페이징
-        total = search_query.count()
-        items = search_query.offset(skip).limit(limit).all()
+        # 전체 개수 (커서 페이지는 추정치) 및 페이징
+        total = await self._total(search_query, cursor, "search", {
+            "query": query_text,
+            "categories": categories,
+            "start_date": start_date,
+            "end_date": end_date
+        })
+        items, has_next, next_cursor = await self._fetch_page(search_query, skip, limit, cursor)
         
         # 응답 생성
         news_items = []
@@ -249,8 +422,7 @@ class FinancialNewsService:
                 category_display_name=item.category_display_name
             ))
         
-        page = (skip // limit) + 1
-        has_next = (skip + limit) < total
+        page = None if cursor else (skip // limit) + 1
         
         return FinancialNewsSearchResponse(
             total=total,
@@ -259,39 +431,43 @@ class FinancialNewsService:
             categories=categories,
             page=page,
             limit=limit,
-            has_next=has_next
+            has_next=has_next,
+            next_cursor=next_cursor
         )
 
-    def get_category_news(
+    async def get_category_news(
         self,
         category: CategoryType,
         skip: int = 0,
         limit: int = 20,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None
     ) -> FinancialNewsListResponse:
         """
         특정 카테고리 뉴스 조회
         
         Args:
             category: 조회할 카테고리
-            skip: 페이징 offset
+            skip: 페이징 offset (cursor 사용 시 무시)
             limit: 페이징 limit
             start_date: 날짜 필터 시작
             end_date: 날짜 필터 종료
+            cursor: 이전 응답의 next_cursor 값 (keyset 페이징)
             
         Returns:
             FinancialNewsListResponse: 해당 카테고리 뉴스 목록
         """
-        return self.get_financial_news_list(
+        return await self.get_financial_news_list(
             skip=skip,
             limit=limit,
             categories=[category],
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cursor=cursor
         )
 
-    def get_recent_financial_news(
+    async def get_recent_financial_news(
         self, 
         hours: int = 24, 
         limit: int = 10,
@@ -308,11 +484,11 @@ class FinancialNewsService:
         Returns:
             List[FinancialNewsResponse]: 최근 뉴스 목록
         """
-        cutoff_time = datetime.now(pytz.UTC) - timedelta(hours=hours)
+        cutoff_time = to_naive_utc(datetime.now(pytz.UTC) - timedelta(hours=hours))
         
-        query = self.db.query(FinancialNews).filter(
+        query = select(FinancialNews).where(
             FinancialNews.published_at >= cutoff_time
-        ).filter(
+        ).where(
             # 제목/내용 필터링: headline이나 summary가 없으면 제외
             or_(
                 and_(FinancialNews.headline.isnot(None), FinancialNews.headline != ''),
@@ -321,11 +497,11 @@ class FinancialNewsService:
         )
         
         if categories:
-            query = query.filter(FinancialNews.category.in_(categories))
+            query = query.where(FinancialNews.category == _array_param(categories))
             
-        items = query.order_by(
-            FinancialNews.published_at.desc()
-        ).limit(limit).all()
+        items = (await self.db.execute(
+            query.order_by(FinancialNews.published_at.desc()).limit(limit)
+        )).scalars().all()
         
         return [
             FinancialNewsResponse(
@@ -348,19 +524,45 @@ class FinancialNewsService:
             for item in items
         ]
 
-    def get_categories_statistics(self) -> CategoriesStatsResponse:
+    async def get_categories_statistics(self, use_cache: bool = True) -> CategoriesStatsResponse:
         """
         카테고리별 통계 조회
         
+        인프로세스 캐시(TTL CATEGORIES_STATS_TTL초)를 먼저 확인하고,
+        만료된 경우에만 집계 쿼리를 한 번 실행합니다. (동시 미스는 락으로 합침)
+        
+        Args:
+            use_cache: False면 캐시를 무시하고 DB에서 바로 집계
+            
         Returns:
             CategoriesStatsResponse: 전체 카테고리 통계
         """
+        if not use_cache:
+            return await self._query_categories_statistics()
+        
+        cached = _get_cached_categories_statistics()
+        if cached is not None:
+            return cached
+        
+        async with _categories_stats_lock:
+            cached = _get_cached_categories_statistics()
+            if cached is not None:
+                return cached
+            
+            result = await self._query_categories_statistics()
+            _store_categories_statistics(result)
+            return result
+
+    async def _query_categories_statistics(self) -> CategoriesStatsResponse:
+        """카테고리별 개수/최신 뉴스 일시 집계 쿼리 실행"""
         # 카테고리별 뉴스 개수 및 최신 뉴스 날짜 조회
-        stats_query = self.db.query(
-            FinancialNews.category,
-            func.count(FinancialNews.news_id).label('count'),
-            func.max(FinancialNews.published_at).label('latest_date')
-        ).group_by(FinancialNews.category).all()
+        stats_query = (await self.db.execute(
+            select(
+                FinancialNews.category,
+                func.count(FinancialNews.news_id).label('count'),
+                func.max(FinancialNews.published_at).label('latest_date')
+            ).group_by(FinancialNews.category)
+        )).all()
         
         # 카테고리 표시명 매핑
         category_display_names = {
@@ -393,33 +595,36 @@ class FinancialNewsService:
             available_categories=FinancialNews.get_valid_categories()
         )
 
-    def get_news_by_symbol(
+    async def get_news_by_symbol(
         self,
         symbol: str,
         skip: int = 0,
         limit: int = 20,
-        categories: Optional[List[CategoryType]] = None
+        categories: Optional[List[CategoryType]] = None,
+        cursor: Optional[str] = None
     ) -> FinancialNewsListResponse:
         """
         특정 종목 관련 뉴스 조회
         
         Args:
             symbol: 검색할 종목 코드 (예: BTCUSD, AAPL)
-            skip: 페이징 offset
+            skip: 페이징 offset (cursor 사용 시 무시)
             limit: 페이징 limit
             categories: 검색 대상 카테고리
+            cursor: 이전 응답의 next_cursor 값 (keyset 페이징)
             
         Returns:
             FinancialNewsListResponse: 해당 종목 관련 뉴스 목록
         """
-        return self.get_financial_news_list(
+        return await self.get_financial_news_list(
             skip=skip,
             limit=limit,
             categories=categories,
-            symbols=[symbol]
+            symbols=[symbol],
+            cursor=cursor
         )
 
-    def get_trending_symbols(self, days: int = 7, limit: int = 10) -> List[Tuple[str, int]]:
+    async def get_trending_symbols(self, days: int = 7, limit: int = 10) -> List[Tuple[str, int]]:
         """
         최근 N일간 가장 많이 언급된 종목 조회
         
@@ -430,32 +635,33 @@ class FinancialNewsService:
         Returns:
             List[Tuple[str, int]]: (종목코드, 언급횟수) 튜플 리스트
         """
-        cutoff_date = datetime.now(pytz.UTC) - timedelta(days=days)
+        cutoff_date = to_naive_utc(datetime.now(pytz.UTC) - timedelta(days=days))
         
-        # related 필드에서 종목 추출 (복잡한 로직이므로 Python에서 처리)
-        news_items = self.db.query(FinancialNews.related).filter(
+        # related 필드(쉼표 구분)를 행 단위로 펼친 뒤 DB에서 바로 집계
+        symbol_expr = func.upper(
+            func.trim(func.unnest(func.string_to_array(FinancialNews.related, ',')))
+        ).label('symbol')
+        
+        related_symbols = select(symbol_expr).where(
             and_(
                 FinancialNews.published_at >= cutoff_date,
                 FinancialNews.related.isnot(None),
                 FinancialNews.related != ''
             )
-        ).all()
-        
-        # 종목별 언급 횟수 집계
-        symbol_counts = {}
-        for item in news_items:
-            if item.related:
-                symbols = [s.strip().upper() for s in item.related.split(',') if s.strip()]
-                for symbol in symbols:
-                    if len(symbol) >= 2:  # 유효한 종목 코드만
-                        symbol_counts[symbol] = symbol_counts.get(symbol, 0) + 1
-        
-        # 언급 횟수 기준 내림차순 정렬
-        sorted_symbols = sorted(symbol_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        return sorted_symbols[:limit]
+        ).subquery()
+        
+        mentions = func.count().label('mentions')
+        results = (await self.db.execute(
+            select(related_symbols.c.symbol, mentions)
+            .where(func.length(related_symbols.c.symbol) >= 2)  # 유효한 종목 코드만
+            .group_by(related_symbols.c.symbol)
+            .order_by(mentions.desc(), related_symbols.c.symbol)
+            .limit(limit)
+        )).all()
+        
+        return [(row.symbol, row.mentions) for row in results]
 
-    def get_sources_statistics(self, categories: Optional[List[CategoryType]] = None) -> List[Tuple[str, int]]:
+    async def get_sources_statistics(self, categories: Optional[List[CategoryType]] = None) -> List[Tuple[str, int]]:
         """
         뉴스 소스별 통계 조회
         
@@ -465,25 +671,27 @@ class FinancialNewsService:
         Returns:
             List[Tuple[str, int]]: (소스명, 뉴스 개수) 튜플 리스트
         """
-        query = self.db.query(
+        query = select(
             FinancialNews.source,
             func.count(FinancialNews.news_id).label('count')
-        ).filter(
+        ).where(
             FinancialNews.source.isnot(None)
         )
         
         if categories:
-            query = query.filter(FinancialNews.category.in_(categories))
+            query = query.where(FinancialNews.category == _array_param(categories))
             
-        results = query.group_by(
-            FinancialNews.source
-        ).order_by(
-            func.count(FinancialNews.news_id).desc()
-        ).all()
+        results = (await self.db.execute(
+            query.group_by(
+                FinancialNews.source
+            ).order_by(
+                func.count(FinancialNews.news_id).desc()
+            )
+        )).all()
         
         return [(result.source, result.count) for result in results]
 
-    def get_daily_news_count_by_category(
+    async def get_daily_news_count_by_category(
         self, 
         days: int = 30,
         category: Optional[CategoryType] = None
@@ -498,25 +706,27 @@ class FinancialNewsService:
         Returns:
             List[Tuple[str, str, int]]: (날짜, 카테고리, 뉴스개수) 튜플 리스트
         """
-        cutoff_date = datetime.now(pytz.UTC) - timedelta(days=days)
+        cutoff_date = to_naive_utc(datetime.now(pytz.UTC) - timedelta(days=days))
         
-        query = self.db.query(
+        query = select(
             func.date(FinancialNews.published_at).label('news_date'),
             FinancialNews.category,
             func.count(FinancialNews.news_id).label('count')
-        ).filter(
+        ).where(
             FinancialNews.published_at >= cutoff_date
         )
         
         if category:
-            query = query.filter(FinancialNews.category == category)
+            query = query.where(FinancialNews.category == category)
             
-        results = query.group_by(
-            func.date(FinancialNews.published_at),
-            FinancialNews.category
-        ).order_by(
-            func.date(FinancialNews.published_at).desc(),
-            FinancialNews.category
-        ).all()
+        results = (await self.db.execute(
+            query.group_by(
+                func.date(FinancialNews.published_at),
+                FinancialNews.category
+            ).order_by(
+                func.date(FinancialNews.published_at).desc(),
+                FinancialNews.category
+            )
+        )).all()
         
         return [(str(result.news_date), result.category, result.count) for result in results]
\ No newline at end of file
@@ -1,6 +1,7 @@
 # app/services/ipo_calendar_service.py
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, extract
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, extract, select
+from sqlalchemy.dialects.postgresql import JSON
 from typing import List, Optional, Tuple
 from datetime import date, datetime, timedelta
 from collections import defaultdict
@@ -10,10 +11,10 @@ from app.models.ipo_calendar_model import IPOCalendar
 class IPOCalendarService:
     """IPO 캘린더 비즈니스 로직 서비스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def get_all_ipos(
+    async def get_all_ipos(
         self, 
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
@@ -23,27 +24,31 @@ class IPOCalendarService:
         """
         전체 IPO 일정 조회 (캘린더용)
         """
-        query = self.db.query(IPOCalendar)
+        query = select(IPOCalendar)
         
         # 날짜 범위 필터링
         if start_date:
-            query = query.filter(IPOCalendar.ipo_date >= start_date)
+            query = query.where(IPOCalendar.ipo_date >= start_date)
         if end_date:
-            query = query.filter(IPOCalendar.ipo_date <= end_date)
+            query = query.where(IPOCalendar.ipo_date <= end_date)
         
         # 거래소 필터링
         if exchange:
-            query = query.filter(IPOCalendar.exchange.ilike(f"%{exchange}%"))
+            query = query.where(IPOCalendar.exchange.ilike(f"%{exchange}%"))
         
         # 전체 개수
-        total_count = query.count()
+        total_count = (await self.db.execute(
+            select(func.count()).select_from(query.subquery())
+        )).scalar_one()
         
         # 정렬 및 제한
-        items = query.order_by(IPOCalendar.ipo_date.asc()).limit(limit).all()
+        items = (await self.db.execute(
+            query.order_by(IPOCalendar.ipo_date.asc()).limit(limit)
+        )).scalars().all()
         
         return items, total_count
     
-    def get_monthly_ipos(self, year: int = None, month: int = None) -> List[IPOCalendar]:
+    async def get_monthly_ipos(self, year: int = None, month: int = None) -> List[IPOCalendar]:
         """
         이번 달 IPO 일정 조회
         """
@@ -52,81 +57,89 @@ class IPOCalendarService:
             year = today.year
             month = today.month
         
-        return self.db.query(IPOCalendar).filter(
-            and_(
-                extract('year', IPOCalendar.ipo_date) == year,
-                extract('month', IPOCalendar.ipo_date) == month
-            )
-        ).order_by(IPOCalendar.ipo_date.asc()).all()
+        result = await self.db.execute(
+            select(IPOCalendar).where(
+                and_(
+                    extract('year', IPOCalendar.ipo_date) == year,
+                    extract('month', IPOCalendar.ipo_date) == month
+                )
+            ).order_by(IPOCalendar.ipo_date.asc())
+        )
+        return result.scalars().all()
     
-    def get_statistics(self) -> dict:
+    async def get_statistics(self) -> dict:
         """
         IPO 통계 정보 조회
+        
+        모든 지표를 FILTER 집계로 한 번의 쿼리에서 계산합니다.
+        (테이블 1회 스캔, DB 왕복 1회)
         """
         today = date.today()
         
-        # 전체 IPO 개수 (과거 포함 전체)
-        total_ipos = self.db.query(func.count(IPOCalendar.id)).scalar()
+        # 이번 달 / 다음 달 / 다다음 달 1일 (월 범위 비교용)
+        this_month_start = today.replace(day=1)
+        next_month_start = (this_month_start + timedelta(days=32)).replace(day=1)
+        month_after_next_start = (next_month_start + timedelta(days=32)).replace(day=1)
         
-        # 이번 달 IPO (과거 포함 이번 달 전체)
-        this_month_count = self.db.query(func.count(IPOCalendar.id)).filter(
-            and_(
-                extract('year', IPOCalendar.ipo_date) == today.year,
-                extract('month', IPOCalendar.ipo_date) == today.month
-            )
-        ).scalar()
+        # 향후 7일
+        future_7days = today + timedelta(days=7)
         
-        # 다음 달 IPO
-        next_month = today.replace(day=1) + timedelta(days=32)
-        next_month = next_month.replace(day=1)
-        next_month_count = self.db.query(func.count(IPOCalendar.id)).filter(
-            and_(
-                extract('year', IPOCalendar.ipo_date) == next_month.year,
-                extract('month', IPOCalendar.ipo_date) == next_month.month
-            )
-        ).scalar()
+        upcoming = IPOCalendar.ipo_date >= today
+        has_price_range = and_(
+            IPOCalendar.price_range_low.isnot(None),
+            IPOCalendar.price_range_high.isnot(None),
+            upcoming
+        )
         
-        # 향후 7일 내 IPO
-        future_7days = today + timedelta(days=7)
-        upcoming_7days_count = self.db.query(func.count(IPOCalendar.id)).filter(
+        # 거래소별 개수 (예정 IPO 기준) → {exchange: count} JSON
+        exchange_counts = select(
+            IPOCalendar.exchange.label('exchange'),
+            func.count(IPOCalendar.symbol).label('count')
+        ).where(
             and_(
-                IPOCalendar.ipo_date >= today,
-                IPOCalendar.ipo_date <= future_7days
+                upcoming,
+                IPOCalendar.exchange.isnot(None),
+                IPOCalendar.exchange != ''
             )
-        ).scalar()
+        ).group_by(IPOCalendar.exchange).subquery()
         
-        # 거래소별 개수
-        exchange_stats = self.db.query(
-            IPOCalendar.exchange,
-            func.count(IPOCalendar.symbol)
-        ).filter(
-            IPOCalendar.ipo_date >= today
-        ).group_by(IPOCalendar.exchange).all()
+        by_exchange_json = select(
+            func.json_object_agg(exchange_counts.c.exchange, exchange_counts.c.count, type_=JSON)
+        ).scalar_subquery()
         
-        by_exchange = {exchange: count for exchange, count in exchange_stats if exchange}
-        
-        # 평균 공모가 범위
-        avg_price = self.db.query(
-            func.avg(IPOCalendar.price_range_low).label('avg_low'),
-            func.avg(IPOCalendar.price_range_high).label('avg_high')
-        ).filter(
-            and_(
-                IPOCalendar.price_range_low.isnot(None),
-                IPOCalendar.price_range_high.isnot(None),
-                IPOCalendar.ipo_date >= today
+        stats = (await self.db.execute(
+            select(
+                # 전체 IPO 개수 (과거 포함 전체)
+                func.count(IPOCalendar.id).label('total_ipos'),
+                # 이번 달 IPO (과거 포함 이번 달 전체)
+                func.count(IPOCalendar.id).filter(
+                    and_(IPOCalendar.ipo_date >= this_month_start, IPOCalendar.ipo_date < next_month_start)
+                ).label('this_month'),
+                # 다음 달 IPO
+                func.count(IPOCalendar.id).filter(
+                    and_(IPOCalendar.ipo_date >= next_month_start, IPOCalendar.ipo_date < month_after_next_start)
+                ).label('next_month'),
+                # 향후 7일 내 IPO
+                func.count(IPOCalendar.id).filter(
+                    and_(upcoming, IPOCalendar.ipo_date <= future_7days)
+                ).label('upcoming_7days'),
+                # 평균 공모가 범위
+                func.avg(IPOCalendar.price_range_low).filter(has_price_range).label('avg_low'),
+                func.avg(IPOCalendar.price_range_high).filter(has_price_range).label('avg_high'),
+                by_exchange_json.label('by_exchange')
             )
-        ).first()
+        )).one()
         
         avg_price_range = {
-            "low": round(float(avg_price.avg_low), 2) if avg_price.avg_low else 0.0,
-            "high": round(float(avg_price.avg_high), 2) if avg_price.avg_high else 0.0
+            "low": round(float(stats.avg_low), 2) if stats.avg_low else 0.0,
+            "high": round(float(stats.avg_high), 2) if stats.avg_high else 0.0
         }
         
         return {
-            "total_ipos": total_ipos or 0,
-            "this_month": this_month_count or 0,
-            "next_month": next_month_count or 0,
-            "by_exchange": by_exchange,
+            "total_ipos": stats.total_ipos or 0,
+            "this_month": stats.this_month or 0,
+            "next_month": stats.next_month or 0,
+            "by_exchange": stats.by_exchange or {},
             "avg_price_range": avg_price_range,
-            "upcoming_7days": upcoming_7days_count or 0
-        }
\ No newline at end of file
+            "upcoming_7days": stats.upcoming_7days or 0
+        }
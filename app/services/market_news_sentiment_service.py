@@ -1,10 +1,175 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, desc, asc, text
-from typing import List, Dict, Optional, Tuple, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, desc, asc, text, select, tuple_, literal, bindparam, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from typing import List, Dict, Optional, Sequence, Tuple, Any, AsyncIterator, Awaitable, Callable, TypeVar
 from datetime import datetime, timedelta
+import asyncio
+import copy
+import functools
 import json
+import logging
+import time
 
+from app.database import AsyncSessionLocal
 from app.models.market_news_sentiment_model import MarketNewsSentiment
+from app.utils.pagination_utils import encode_keyset_cursor, decode_keyset_cursor, estimated_count
+from app.utils.materialized_view_utils import MaterializedViewRefresher
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# keyset 페이징 정렬 키 (발행 시각순, 동일 시각은 기본키 batch_id/url로 순서 고정)
+_KEYSET_COLUMNS = (MarketNewsSentiment.time_published, MarketNewsSentiment.batch_id, MarketNewsSentiment.url)
+
+
+def _encode_cursor(item: MarketNewsSentiment) -> str:
+    """마지막 항목의 정렬 키로 다음 페이지 커서 생성"""
+    return encode_keyset_cursor([item.time_published, item.batch_id, item.url])
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int, str]:
+    """
+    커서를 (time_published, batch_id, url)로 복원
+    
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    time_published, batch_id, url = decode_keyset_cursor(cursor, len(_KEYSET_COLUMNS))
+    try:
+        return datetime.fromisoformat(time_published), int(batch_id), str(url)
+    except (TypeError, ValueError):
+        raise ValueError(f"잘못된 커서 형식입니다: {cursor}")
+
+
+# =========================
+# 메타데이터 L1 인프로세스 캐시
+# =========================
+# 티커/주제 목록과 배치 정보는 새 배치가 적재될 때만 바뀌므로 프로세스 메모리에 잠시 보관합니다.
+# 조회 순서: L1(프로세스, 60초) → L2(Redis 응답 캐시) → PostgreSQL
+
+SENTIMENT_METADATA_TTL = 60  # 초
+
+_sentiment_metadata_cache: Dict[str, Tuple[float, Any]] = {}
+_sentiment_metadata_batch: Dict[str, Optional[int]] = {"latest_batch_id": None}
+
+
+def clear_sentiment_metadata_cache() -> None:
+    """메타데이터 L1 캐시 비우기 (새 배치 적재 시)"""
+    _sentiment_metadata_cache.clear()
+
+
+def _note_latest_batch_id(batch_id: Optional[int]) -> None:
+    """관측한 최신 배치 ID가 바뀌었으면 L1 캐시를 비움 (TTL 만료 전 새 배치 반영)"""
+    if batch_id != _sentiment_metadata_batch["latest_batch_id"]:
+        _sentiment_metadata_batch["latest_batch_id"] = batch_id
+        clear_sentiment_metadata_cache()
+
+
+def _metadata_cached(func: Callable) -> Callable:
+    """인자 없는 조회 메서드의 결과를 SENTIMENT_METADATA_TTL 동안 재사용하는 데코레이터"""
+    @functools.wraps(func)
+    async def wrapper(self):
+        entry = _sentiment_metadata_cache.get(func.__name__)
+        if entry is not None and time.monotonic() < entry[0]:
+            return copy.copy(entry[1])
+        
+        value = await func(self)
+        _sentiment_metadata_cache[func.__name__] = (time.monotonic() + SENTIMENT_METADATA_TTL, value)
+        return copy.copy(value)
+    
+    return wrapper
+
+
+# =========================
+# 감성 추이 사전 집계 (materialized view)
+# =========================
+# /sentiment-trends가 매 요청마다 원본 테이블을 집계하지 않도록 시간 단위로 미리 집계해 둡니다.
+# 평균 대신 합계/개수를 저장하므로 일별 추이는 시간별 행을 다시 합쳐 계산합니다.
+# 뷰가 준비되지 않은 경우(권한 부족 등)에는 원본 테이블 집계로 대체합니다.
+
+SENTIMENT_TREND_VIEWS_REFRESH_INTERVAL = 600  # 초
+
+# 여러 워커가 동시에 갱신하지 않도록 사용하는 advisory lock 키
+_SENTIMENT_TREND_VIEWS_LOCK_KEY = 7_310_042
+
+_SENTIMENT_TREND_VIEWS_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS market_news_sentiment_trend_hourly AS
+    SELECT
+        DATE_TRUNC('hour', time_published) AS bucket,
+        SUM(overall_sentiment_score)::float AS sentiment_sum,
+        COUNT(*) AS news_count,
+        COUNT(*) FILTER (WHERE overall_sentiment_score > 0.1) AS bullish_count,
+        COUNT(*) FILTER (WHERE overall_sentiment_score < -0.1) AS bearish_count,
+        COUNT(*) FILTER (WHERE overall_sentiment_score BETWEEN -0.1 AND 0.1) AS neutral_count
+    FROM market_news_sentiment
+    WHERE overall_sentiment_score IS NOT NULL
+    GROUP BY 1
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_market_news_sentiment_trend_hourly_bucket
+    ON market_news_sentiment_trend_hourly (bucket)
+    """,
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS market_news_sentiment_ticker_trend_hourly AS
+    SELECT
+        DATE_TRUNC('hour', time_published) AS bucket,
+        t->>'ticker' AS ticker,
+        SUM(score) AS sentiment_sum,
+        COUNT(*) AS news_count,
+        COUNT(*) FILTER (WHERE score > 0.1) AS bullish_count,
+        COUNT(*) FILTER (WHERE score < -0.1) AS bearish_count,
+        COUNT(*) FILTER (WHERE score BETWEEN -0.1 AND 0.1) AS neutral_count
+    FROM market_news_sentiment
+    CROSS JOIN LATERAL jsonb_array_elements(ticker_sentiment) AS t
+    CROSS JOIN LATERAL (SELECT (t->>'ticker_sentiment_score')::float AS score) AS s
+    WHERE ticker_sentiment IS NOT NULL
+    AND t->>'ticker' IS NOT NULL
+    AND score IS NOT NULL
+    GROUP BY 1, 2
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_market_news_sentiment_ticker_trend_hourly_key
+    ON market_news_sentiment_ticker_trend_hourly (ticker, bucket)
+    """,
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS market_news_sentiment_topic_trend_hourly AS
+    SELECT
+        DATE_TRUNC('hour', time_published) AS bucket,
+        t->>'topic' AS topic,
+        SUM(overall_sentiment_score)::float AS sentiment_sum,
+        COUNT(*) AS news_count,
+        COUNT(*) FILTER (WHERE overall_sentiment_score > 0.1) AS bullish_count,
+        COUNT(*) FILTER (WHERE overall_sentiment_score < -0.1) AS bearish_count,
+        COUNT(*) FILTER (WHERE overall_sentiment_score BETWEEN -0.1 AND 0.1) AS neutral_count
+    FROM market_news_sentiment
+    CROSS JOIN LATERAL jsonb_array_elements(topics) AS t
+    WHERE topics IS NOT NULL
+    AND overall_sentiment_score IS NOT NULL
+    AND t->>'topic' IS NOT NULL
+    GROUP BY 1, 2
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_market_news_sentiment_topic_trend_hourly_key
+    ON market_news_sentiment_topic_trend_hourly (topic, bucket)
+    """,
+)
+
+_SENTIMENT_TREND_VIEWS = (
+    "market_news_sentiment_trend_hourly",
+    "market_news_sentiment_ticker_trend_hourly",
+    "market_news_sentiment_topic_trend_hourly",
+)
+
+sentiment_trend_views = MaterializedViewRefresher(
+    label="감성 추이",
+    views=_SENTIMENT_TREND_VIEWS,
+    ddl=_SENTIMENT_TREND_VIEWS_DDL,
+    lock_key=_SENTIMENT_TREND_VIEWS_LOCK_KEY,
+    interval=SENTIMENT_TREND_VIEWS_REFRESH_INTERVAL
+)
+
 
 class MarketNewsSentimentService:
     """
@@ -17,9 +182,36 @@ class MarketNewsSentimentService:
     4. 크로스 분석 (주제↔티커 관계)
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
+    async def run_in_new_session(self, call: Callable[["MarketNewsSentimentService"], Awaitable[T]]) -> T:
+        """
+        별도 세션(커넥션)에서 서비스 메서드를 실행합니다.
+        
+        AsyncSession 하나로는 쿼리를 동시에 실행할 수 없으므로,
+        asyncio.gather로 현재 세션의 조회와 병렬 실행할 쪽은 새 세션에서 돌립니다.
+        
+        사용 예시:
+            news, batch_info = await asyncio.gather(
+                service.get_news_by_batch(batch_id),
+                service.run_in_new_session(lambda s: s.get_batch_info())
+            )
+        """
+        async with AsyncSessionLocal() as db:
+            return await call(MarketNewsSentimentService(db))
+    
+    async def iter_in_new_session(self, call: Callable[["MarketNewsSentimentService"], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """
+        별도 세션에서 서비스의 비동기 이터레이터를 끝까지 소비합니다.
+        
+        StreamingResponse는 핸들러가 반환된 뒤에 본문을 읽으므로,
+        요청 의존성 세션 수명에 의존하지 않도록 스트림 전용 세션을 엽니다.
+        """
+        async with AsyncSessionLocal() as db:
+            async for item in call(MarketNewsSentimentService(db)):
+                yield item
+    
     # =========================================================================
     # JSONB 데이터 파싱 유틸리티 메서드
     # =========================================================================
@@ -127,26 +319,49 @@ class MarketNewsSentimentService:
     # 기본 뉴스 조회 메서드
     # =========================================================================
     
-    def get_latest_batch_id(self) -> Optional[int]:
+    async def get_latest_batch_id(self) -> Optional[int]:
         """최신 배치 ID를 조회합니다."""
-        result = self.db.query(func.max(MarketNewsSentiment.batch_id)).scalar()
+        result = (await self.db.execute(select(func.max(MarketNewsSentiment.batch_id)))).scalar()
         return result if result else None
     
-    def get_batch_info(self) -> Dict[str, Any]:
+    async def get_data_version(self) -> Optional[str]:
+        """
+        감성 데이터 버전 조회 (ETag 생성용)
+        
+        최신 배치 ID와 최신 발행 시각만 조회합니다. 새 배치가 적재되면 값이 바뀝니다.
+        
+        Returns:
+            Optional[str]: 버전 문자열 (데이터가 없으면 None)
+        """
+        row = (await self.db.execute(
+            select(func.max(MarketNewsSentiment.batch_id), func.max(MarketNewsSentiment.time_published))
+        )).first()
+        if not row or row[0] is None:
+            return None
+        latest_batch_id, latest_published = row
+        _note_latest_batch_id(latest_batch_id)
+        return f"{latest_batch_id}:{latest_published.isoformat() if latest_published else '-'}"
+    
+    @_metadata_cached
+    async def get_batch_info(self) -> Dict[str, Any]:
         """배치 정보를 조회합니다."""
-        latest_batch_id = self.get_latest_batch_id()
+        latest_batch_id = await self.get_latest_batch_id()
         
         # 총 배치 수 조회
-        total_batches = self.db.query(func.count(func.distinct(MarketNewsSentiment.batch_id))).scalar()
+        total_batches = (await self.db.execute(
+            select(func.count(func.distinct(MarketNewsSentiment.batch_id)))
+        )).scalar()
         
         # 최신 배치의 수집 날짜 조회
         collection_date = "알 수 없음"
         if latest_batch_id:
-            latest_news = (self.db.query(MarketNewsSentiment)
-                          .filter(MarketNewsSentiment.batch_id == latest_batch_id)
-                          .first())
-            if latest_news and latest_news.created_at:
-                collection_date = latest_news.created_at.strftime("%Y-%m-%d")
+            latest_created_at = (await self.db.execute(
+                select(MarketNewsSentiment.created_at)
+                .where(MarketNewsSentiment.batch_id == latest_batch_id)
+                .limit(1)
+            )).scalar()
+            if latest_created_at:
+                collection_date = latest_created_at.strftime("%Y-%m-%d")
         
         return {
             "latest_batch_id": latest_batch_id or 0,
@@ -154,31 +369,38 @@ class MarketNewsSentimentService:
             "total_batches": total_batches or 0
         }
     
-    def get_news_list(self, days: int = 7, limit: int = 20, offset: int = 0,
+    async def get_news_list(self, days: int = 7, limit: int = 20, offset: int = 0,
                      min_sentiment: Optional[float] = None, max_sentiment: Optional[float] = None,
-                     sentiment_labels: Optional[List[str]] = None,
-                     sort_by: str = "time_published", order: str = "desc") -> Tuple[List[Dict], int]:
+                     sentiment_labels: Optional[Sequence[str]] = None,
+                     sort_by: str = "time_published", order: str = "desc",
+                     cursor: Optional[str] = None,
+                     exact_count: bool = False) -> Tuple[List[Dict], int, Optional[str]]:
         """
         뉴스 목록을 조회합니다.
         
         Args:
             days: 최근 N일 데이터
             limit: 결과 개수 제한
-            offset: 페이징 오프셋
+            offset: 페이징 오프셋 (cursor 사용 시 무시)
             min_sentiment: 최소 감성 점수
             max_sentiment: 최대 감성 점수
             sentiment_labels: 감성 라벨 필터
             sort_by: 정렬 기준
             order: 정렬 순서
+            cursor: 이전 응답의 next_cursor 값 (time_published 정렬에서만 사용)
+            exact_count: True면 COUNT(*)로 정확한 총 개수 계산 (기본은 추정치)
             
         Returns:
-            Tuple[news_list, total_count]: 뉴스 목록과 총 개수
+            Tuple[news_list, total_count, next_cursor]: 뉴스 목록, 총 개수, 다음 페이지 커서
+            
+        Raises:
+            ValueError: 커서 형식이 올바르지 않거나 sentiment_score 정렬에 커서를 지정한 경우
         """
         # 기본 쿼리
-        query = self.db.query(MarketNewsSentiment)
+        query = select(MarketNewsSentiment)
         
         # 제목/내용 필터링: title이 있고, summary도 있어야 함
-        query = query.filter(
+        query = query.where(
             and_(
                 MarketNewsSentiment.title.isnot(None),
                 MarketNewsSentiment.title != '',
@@ -189,67 +411,74 @@ class MarketNewsSentimentService:
         
         # 날짜 필터
         cutoff_date = datetime.now() - timedelta(days=days)
-        query = query.filter(MarketNewsSentiment.time_published >= cutoff_date)
+        query = query.where(MarketNewsSentiment.time_published >= cutoff_date)
         
         # 감성 점수 필터
         if min_sentiment is not None:
-            query = query.filter(MarketNewsSentiment.overall_sentiment_score >= min_sentiment)
+            query = query.where(MarketNewsSentiment.overall_sentiment_score >= min_sentiment)
         if max_sentiment is not None:
-            query = query.filter(MarketNewsSentiment.overall_sentiment_score <= max_sentiment)
+            query = query.where(MarketNewsSentiment.overall_sentiment_score <= max_sentiment)
         
         # 감성 라벨 필터
         if sentiment_labels:
-            query = query.filter(MarketNewsSentiment.overall_sentiment_label.in_(sentiment_labels))
+            query = query.where(MarketNewsSentiment.overall_sentiment_label.in_(sentiment_labels))
         
-        # 총 개수 계산
-        total_count = query.count()
-        
-        # 정렬
+        # 총 개수 계산 (기본은 실행 계획 기반 추정치)
+        if exact_count:
+            total_count = (await self.db.execute(
+                select(func.count()).select_from(query.subquery())
+            )).scalar_one()
+        else:
+            total_count = await estimated_count(self.db, query, "market_sentiment", "list", {
+                "days": days,
+                "min_sentiment": min_sentiment,
+                "max_sentiment": max_sentiment,
+                "sentiment_labels": sentiment_labels
+            })
+        
+        # 정렬 + 페이징
         if sort_by == "sentiment_score":
+            # 감성 점수는 NULL이 섞여 있어 keyset 비교가 불가능하므로 OFFSET 페이징만 지원
+            if cursor:
+                raise ValueError("cursor는 sort_by=time_published 정렬에서만 사용할 수 있습니다")
             sort_column = MarketNewsSentiment.overall_sentiment_score
-        elif sort_by == "time_published":
-            sort_column = MarketNewsSentiment.time_published
+            query = query.order_by(desc(sort_column) if order == "desc" else asc(sort_column))
+            news_items = (await self.db.execute(query.limit(limit).offset(offset))).scalars().all()
+            next_cursor = None
         else:
-            sort_column = MarketNewsSentiment.time_published
-        
-        if order == "desc":
-            query = query.order_by(desc(sort_column))
-        else:
-            query = query.order_by(asc(sort_column))
-        
-        # 페이징
-        news_items = query.limit(limit).offset(offset).all()
+            news_items, next_cursor = await self._fetch_page(
+                query, limit, offset, cursor, descending=(order == "desc")
+            )
         
         # JSONB 데이터 파싱하여 반환
         enriched_news = self.enrich_news_with_jsonb_data(news_items)
         
-        return enriched_news, total_count
-    
-    def get_news_by_batch(self, batch_id: int, limit: int = 20, offset: int = 0) -> List[Dict]:
-        """특정 배치의 뉴스를 조회합니다."""
-        news_items = (self.db.query(MarketNewsSentiment)
-                     .filter(MarketNewsSentiment.batch_id == batch_id)
-                     .filter(
-                         # 제목/내용 필터링: title이 있고, summary도 있어야 함
-                         and_(
-                             MarketNewsSentiment.title.isnot(None),
-                             MarketNewsSentiment.title != '',
-                             MarketNewsSentiment.summary.isnot(None),
-                             MarketNewsSentiment.summary != ''
-                         )
+        return enriched_news, total_count, next_cursor
+    
+    async def get_news_by_batch(self, batch_id: int, limit: int = 20, offset: int = 0,
+                                cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """특정 배치의 뉴스와 다음 페이지 커서를 조회합니다."""
+        query = (select(MarketNewsSentiment)
+                 .where(MarketNewsSentiment.batch_id == batch_id)
+                 .where(
+                     # 제목/내용 필터링: title이 있고, summary도 있어야 함
+                     and_(
+                         MarketNewsSentiment.title.isnot(None),
+                         MarketNewsSentiment.title != '',
+                         MarketNewsSentiment.summary.isnot(None),
+                         MarketNewsSentiment.summary != ''
                      )
-                     .order_by(desc(MarketNewsSentiment.time_published))
-                     .limit(limit)
-                     .offset(offset)
-                     .all())
+                 ))
+        news_items, next_cursor = await self._fetch_page(query, limit, offset, cursor)
         
-        return self.enrich_news_with_jsonb_data(news_items)
+        return self.enrich_news_with_jsonb_data(news_items), next_cursor
     
     # =========================================================================
     # Topic & Ticker 관련 메서드
     # =========================================================================
     
-    def get_all_topics(self) -> List[str]:
+    @_metadata_cached
+    async def get_all_topics(self) -> List[str]:
         """모든 주제 목록을 조회합니다."""
         # PostgreSQL JSONB 쿼리로 모든 topic 추출
         query = text("""
@@ -259,10 +488,11 @@ class MarketNewsSentimentService:
             ORDER BY topic
         """)
         
-        result = self.db.execute(query).fetchall()
+        result = (await self.db.execute(query)).fetchall()
         return [row[0] for row in result if row[0]]
     
-    def get_all_tickers(self) -> List[str]:
+    @_metadata_cached
+    async def get_all_tickers(self) -> List[str]:
         """모든 티커 목록을 조회합니다."""
         # PostgreSQL JSONB 쿼리로 모든 ticker 추출
         query = text("""
@@ -272,33 +502,38 @@ class MarketNewsSentimentService:
             ORDER BY ticker
         """)
         
-        result = self.db.execute(query).fetchall()
+        result = (await self.db.execute(query)).fetchall()
         return [row[0] for row in result if row[0]]
     
-    def get_news_by_topic(self, topic: str, days: int = 7, limit: int = 20, offset: int = 0) -> Tuple[List[Dict], Dict]:
+    async def get_news_by_topic(self, topic: str, days: int = 7, limit: int = 20, offset: int = 0) -> Tuple[List[Dict], Dict]:
         """특정 주제의 뉴스를 조회합니다."""
         # PostgreSQL JSONB 연산자 사용하여 특정 주제 필터링
         cutoff_date = datetime.now() - timedelta(days=days)
         
         query = text("""
             SELECT * FROM market_news_sentiment 
-            WHERE topics @> :topic_filter
+            WHERE topics @> CAST(:topic_filter AS jsonb)
             AND time_published >= :cutoff_date
             ORDER BY time_published DESC
             LIMIT :limit OFFSET :offset
         """)
         
         topic_filter = json.dumps([{"topic": topic}])
-        result = self.db.execute(query, {
-            "topic_filter": topic_filter,
-            "cutoff_date": cutoff_date,
-            "limit": limit,
-            "offset": offset
-        }).fetchall()
+        
+        # 뉴스 조회와 주제별 감성 요약 계산은 서로 독립적이므로 별도 커넥션에서 동시에 실행
+        result, topic_summary = await asyncio.gather(
+            self.db.execute(query, {
+                "topic_filter": topic_filter,
+                "cutoff_date": cutoff_date,
+                "limit": limit,
+                "offset": offset
+            }),
+            self.run_in_new_session(lambda service: service.calculate_topic_sentiment_summary(topic, days))
+        )
         
         # 결과를 MarketNewsSentiment 객체로 변환
         news_items = []
-        for row in result:
+        for row in result.fetchall():
             news_item = MarketNewsSentiment()
             for i, column in enumerate(MarketNewsSentiment.__table__.columns):
                 setattr(news_item, column.name, row[i])
@@ -306,34 +541,36 @@ class MarketNewsSentimentService:
         
         enriched_news = self.enrich_news_with_jsonb_data(news_items)
         
-        # 주제별 감성 요약 계산
-        topic_summary = self.calculate_topic_sentiment_summary(topic, days)
-        
         return enriched_news, topic_summary
     
-    def get_news_by_ticker(self, ticker: str, days: int = 7, limit: int = 20, offset: int = 0) -> Tuple[List[Dict], Dict]:
+    async def get_news_by_ticker(self, ticker: str, days: int = 7, limit: int = 20, offset: int = 0) -> Tuple[List[Dict], Dict]:
         """특정 티커의 뉴스를 조회합니다."""
         cutoff_date = datetime.now() - timedelta(days=days)
         
         query = text("""
             SELECT * FROM market_news_sentiment 
-            WHERE ticker_sentiment @> :ticker_filter
+            WHERE ticker_sentiment @> CAST(:ticker_filter AS jsonb)
             AND time_published >= :cutoff_date
             ORDER BY time_published DESC
             LIMIT :limit OFFSET :offset
         """)
         
         ticker_filter = json.dumps([{"ticker": ticker}])
-        result = self.db.execute(query, {
-            "ticker_filter": ticker_filter,
-            "cutoff_date": cutoff_date,
-            "limit": limit,
-            "offset": offset
-        }).fetchall()
+        
+        # 뉴스 조회와 티커별 감성 요약 계산은 서로 독립적이므로 별도 커넥션에서 동시에 실행
+        result, ticker_summary = await asyncio.gather(
+            self.db.execute(query, {
+                "ticker_filter": ticker_filter,
+                "cutoff_date": cutoff_date,
+                "limit": limit,
+                "offset": offset
+            }),
+            self.run_in_new_session(lambda service: service.calculate_ticker_sentiment_summary(ticker, days))
+        )
         
         # 결과를 MarketNewsSentiment 객체로 변환
         news_items = []
-        for row in result:
+        for row in result.fetchall():
             news_item = MarketNewsSentiment()
             for i, column in enumerate(MarketNewsSentiment.__table__.columns):
                 setattr(news_item, column.name, row[i])
@@ -341,23 +578,60 @@ class MarketNewsSentimentService:
         
         enriched_news = self.enrich_news_with_jsonb_data(news_items)
         
-        # 티커별 감성 요약 계산
-        ticker_summary = self.calculate_ticker_sentiment_summary(ticker, days)
-        
         return enriched_news, ticker_summary
     
     # =========================================================================
     # 감성 분석 및 랭킹 메서드
     # =========================================================================
     
-    def get_sentiment_filtered_news(self, sentiment_type: str, days: int = 7, 
-                                   limit: int = 20, offset: int = 0) -> List[Dict]:
-        """감성별로 필터링된 뉴스를 조회합니다."""
+    async def get_sentiment_summary(self, days: int = 7) -> Dict[str, Any]:
+        """
+        최근 N일 감성 분포와 평균 점수를 한 번의 집계 쿼리로 계산합니다.
+        
+        bullish/bearish/neutral 구분은 get_sentiment_filtered_news와 같은 점수 기준(±0.1)을 사용합니다.
+        
+        Returns:
+            Dict: total, bullish, bearish, neutral, avg_sentiment
+        """
+        cutoff_date = datetime.now() - timedelta(days=days)
+        score = MarketNewsSentiment.overall_sentiment_score
+        
+        query = select(
+            func.count().label("total"),
+            func.count().filter(score > 0.1).label("bullish"),
+            func.count().filter(score < -0.1).label("bearish"),
+            func.count().filter(and_(score >= -0.1, score <= 0.1)).label("neutral"),
+            func.avg(score).label("avg_sentiment")
+        ).where(
+            MarketNewsSentiment.time_published >= cutoff_date
+        ).where(
+            # 제목/내용 필터링: title이 있고, summary도 있어야 함
+            and_(
+                MarketNewsSentiment.title.isnot(None),
+                MarketNewsSentiment.title != '',
+                MarketNewsSentiment.summary.isnot(None),
+                MarketNewsSentiment.summary != ''
+            )
+        )
+        row = (await self.db.execute(query)).one()
+        
+        return {
+            "total": row.total,
+            "bullish": row.bullish,
+            "bearish": row.bearish,
+            "neutral": row.neutral,
+            "avg_sentiment": float(row.avg_sentiment) if row.avg_sentiment is not None else 0.0
+        }
+    
+    async def get_sentiment_filtered_news(self, sentiment_type: str, days: int = 7, 
+                                   limit: int = 20, offset: int = 0,
+                                   cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """감성별로 필터링된 뉴스와 다음 페이지 커서를 조회합니다."""
         cutoff_date = datetime.now() - timedelta(days=days)
         
-        query = self.db.query(MarketNewsSentiment).filter(
+        query = select(MarketNewsSentiment).where(
             MarketNewsSentiment.time_published >= cutoff_date
-        ).filter(
+        ).where(
             # 제목/내용 필터링: title이 있고, summary도 있어야 함
             and_(
                 MarketNewsSentiment.title.isnot(None),
@@ -369,156 +643,176 @@ class MarketNewsSentimentService:
         
         # 감성 타입별 필터링
         if sentiment_type == "bullish":
-            query = query.filter(MarketNewsSentiment.overall_sentiment_score > 0.1)
+            query = query.where(MarketNewsSentiment.overall_sentiment_score > 0.1)
         elif sentiment_type == "bearish":
-            query = query.filter(MarketNewsSentiment.overall_sentiment_score < -0.1)
+            query = query.where(MarketNewsSentiment.overall_sentiment_score < -0.1)
         elif sentiment_type == "neutral":
-            query = query.filter(
+            query = query.where(
                 and_(
                     MarketNewsSentiment.overall_sentiment_score >= -0.1,
                     MarketNewsSentiment.overall_sentiment_score <= 0.1
                 )
             )
         
-        news_items = (query.order_by(desc(MarketNewsSentiment.time_published))
-                     .limit(limit)
-                     .offset(offset)
-                     .all())
+        news_items, next_cursor = await self._fetch_page(query, limit, offset, cursor)
         
-        return self.enrich_news_with_jsonb_data(news_items)
+        return self.enrich_news_with_jsonb_data(news_items), next_cursor
     
-    def calculate_topic_sentiment_ranking(self, days: int = 7, top_count: int = 10,
+    async def _fetch_hot_cold_rows(self, stats_sql: str, params: Dict[str, Any],
+                                   top_count: int, bottom_count: int) -> Tuple[List[Any], List[Any]]:
+        """
+        집계 CTE 한 번으로 상위(hot)/하위(cold) 행을 함께 조회합니다.
+        
+        stats_sql은 avg_sentiment, key 컬럼과 group_total(COUNT(*) OVER ())을 가진
+        ranking_stats CTE 정의여야 합니다. 하위 목록은 전체 그룹 수가 bottom_count 이하이면
+        상위 목록과 겹치므로 기존처럼 비워 둡니다.
+        """
+        query = text(f"""
+            WITH {stats_sql}
+            (SELECT 'hot' AS kind, * FROM ranking_stats ORDER BY avg_sentiment DESC, key LIMIT :top_count)
+            UNION ALL
+            (SELECT 'cold' AS kind, * FROM ranking_stats ORDER BY avg_sentiment ASC, key LIMIT :bottom_count)
+        """)
+        
+        rows = (await self.db.execute(query, {
+            **params,
+            "top_count": top_count,
+            "bottom_count": bottom_count
+        })).fetchall()
+        
+        hot_rows = [row for row in rows if row.kind == "hot"]
+        cold_rows = [row for row in rows if row.kind == "cold"]
+        if not rows or rows[0].group_total <= bottom_count:
+            cold_rows = []
+        
+        return hot_rows, cold_rows
+    
+    async def calculate_topic_sentiment_ranking(self, days: int = 7, top_count: int = 10,
                                         bottom_count: int = 10, min_mentions: int = 2) -> Tuple[List[Dict], List[Dict]]:
-        """주제별 감성 랭킹을 계산합니다."""
+        """주제별 감성 랭킹을 계산합니다. (상위/하위를 한 번의 집계로 조회)"""
         cutoff_date = datetime.now() - timedelta(days=days)
         
-        # PostgreSQL JSONB 집계 쿼리 (수정됨)
-        query = text("""
-            WITH topic_expanded AS (
+        stats_sql = """
+            topic_expanded AS (
                 SELECT 
-                    overall_sentiment_score,
-                    (jsonb_array_elements(topics)->>'topic') as topic,
-                    (jsonb_array_elements(topics)->>'relevance_score')::float as relevance_score
-                FROM market_news_sentiment 
-                WHERE time_published >= :cutoff_date
-                AND topics IS NOT NULL
-                AND overall_sentiment_score IS NOT NULL
+                    m.overall_sentiment_score,
+                    elem->>'topic' as topic,
+                    (elem->>'relevance_score')::float as relevance_score
+                FROM market_news_sentiment m
+                CROSS JOIN LATERAL jsonb_array_elements(m.topics) AS elem
+                WHERE m.time_published >= :cutoff_date
+                AND m.topics IS NOT NULL
+                AND m.overall_sentiment_score IS NOT NULL
             ),
-            topic_stats AS (
+            ranking_stats AS (
                 SELECT 
-                    topic,
+                    topic as key,
                     AVG(overall_sentiment_score) as avg_sentiment,
                     COUNT(*) as news_count,
-                    AVG(relevance_score) as avg_relevance
+                    AVG(relevance_score) as avg_relevance,
+                    COUNT(*) OVER () as group_total
                 FROM topic_expanded
                 GROUP BY topic
                 HAVING COUNT(*) >= :min_mentions
             )
-            SELECT topic, avg_sentiment, news_count, avg_relevance
-            FROM topic_stats
-            ORDER BY avg_sentiment DESC
-        """)
+        """
         
-        result = self.db.execute(query, {
+        hot_rows, cold_rows = await self._fetch_hot_cold_rows(stats_sql, {
             "cutoff_date": cutoff_date,
             "min_mentions": min_mentions
-        }).fetchall()
+        }, top_count, bottom_count)
+        
+        # 관련 티커는 실제로 응답에 담기는 주제만 조회
+        related_cache: Dict[str, List[str]] = {}
         
-        # 결과 처리
-        all_topics = []
-        for row in result:
-            topic, avg_sentiment, news_count, avg_relevance = row
+        async def build(row) -> Dict:
+            topic, avg_sentiment = row.key, row.avg_sentiment
             
             # 감성 라벨 결정
             sentiment_label, sentiment_emoji = self._get_sentiment_label_and_emoji(avg_sentiment)
             
             # 관련 티커 조회
-            related_tickers = self._get_tickers_by_topic(topic, days)
+            if topic not in related_cache:
+                related_cache[topic] = await self._get_tickers_by_topic(topic, days)
             
-            topic_data = {
+            return {
                 "topic": topic,
                 "avg_sentiment_score": float(avg_sentiment),
-                "news_count": news_count,
+                "news_count": row.news_count,
                 "sentiment_label": sentiment_label,
                 "sentiment_emoji": sentiment_emoji,
                 "trend": "상승" if avg_sentiment > 0.05 else "하락" if avg_sentiment < -0.05 else "안정",
-                "related_tickers": related_tickers[:5]  # 상위 5개만
+                "related_tickers": related_cache[topic][:5]  # 상위 5개만
             }
-            all_topics.append(topic_data)
         
-        # Hot & Cold 분리
-        hot_topics = all_topics[:top_count]
-        cold_topics = all_topics[-bottom_count:] if len(all_topics) > bottom_count else []
-        cold_topics.reverse()  # 가장 부정적인 것부터
+        hot_topics = [await build(row) for row in hot_rows]
+        cold_topics = [await build(row) for row in cold_rows]  # 가장 부정적인 것부터
         
         return hot_topics, cold_topics
     
-    def calculate_ticker_sentiment_ranking(self, days: int = 7, top_count: int = 10,
+    async def calculate_ticker_sentiment_ranking(self, days: int = 7, top_count: int = 10,
                                          bottom_count: int = 10, min_mentions: int = 2) -> Tuple[List[Dict], List[Dict]]:
-        """티커별 감성 랭킹을 계산합니다."""
+        """티커별 감성 랭킹을 계산합니다. (상위/하위를 한 번의 집계로 조회)"""
         cutoff_date = datetime.now() - timedelta(days=days)
         
-        # PostgreSQL JSONB 집계 쿼리 (수정됨)
-        query = text("""
-            WITH ticker_expanded AS (
+        stats_sql = """
+            ticker_expanded AS (
                 SELECT 
-                    (jsonb_array_elements(ticker_sentiment)->>'ticker') as ticker,
-                    (jsonb_array_elements(ticker_sentiment)->>'ticker_sentiment_score')::float as ticker_sentiment_score,
-                    (jsonb_array_elements(ticker_sentiment)->>'relevance_score')::float as relevance_score
-                FROM market_news_sentiment 
-                WHERE time_published >= :cutoff_date
-                AND ticker_sentiment IS NOT NULL
+                    elem->>'ticker' as ticker,
+                    (elem->>'ticker_sentiment_score')::float as ticker_sentiment_score,
+                    (elem->>'relevance_score')::float as relevance_score
+                FROM market_news_sentiment m
+                CROSS JOIN LATERAL jsonb_array_elements(m.ticker_sentiment) AS elem
+                WHERE m.time_published >= :cutoff_date
+                AND m.ticker_sentiment IS NOT NULL
             ),
-            ticker_stats AS (
+            ranking_stats AS (
                 SELECT 
-                    ticker,
+                    ticker as key,
                     AVG(ticker_sentiment_score) as avg_sentiment,
                     COUNT(*) as mention_count,
-                    AVG(relevance_score) as avg_relevance
+                    AVG(relevance_score) as avg_relevance,
+                    COUNT(*) OVER () as group_total
                 FROM ticker_expanded
                 GROUP BY ticker
                 HAVING COUNT(*) >= :min_mentions
             )
-            SELECT ticker, avg_sentiment, mention_count, avg_relevance
-            FROM ticker_stats
-            ORDER BY avg_sentiment DESC
-        """)
+        """
         
-        result = self.db.execute(query, {
+        hot_rows, cold_rows = await self._fetch_hot_cold_rows(stats_sql, {
             "cutoff_date": cutoff_date,
             "min_mentions": min_mentions
-        }).fetchall()
+        }, top_count, bottom_count)
         
-        # 결과 처리
-        all_tickers = []
-        for row in result:
-            ticker, avg_sentiment, mention_count, avg_relevance = row
+        # 관련 주제는 실제로 응답에 담기는 티커만 조회
+        related_cache: Dict[str, List[str]] = {}
+        
+        async def build(row) -> Dict:
+            ticker, avg_sentiment = row.key, row.avg_sentiment
             
             # 감성 라벨 결정
             sentiment_label, sentiment_emoji = self._get_sentiment_label_and_emoji(avg_sentiment)
             
             # 관련 주제 조회
-            related_topics = self._get_topics_by_ticker(ticker, days)
+            if ticker not in related_cache:
+                related_cache[ticker] = await self._get_topics_by_ticker(ticker, days)
             
-            ticker_data = {
+            return {
                 "ticker": ticker,
                 "avg_sentiment_score": float(avg_sentiment),
                 "sentiment_label": sentiment_label,
                 "sentiment_emoji": sentiment_emoji,
-                "mention_count": mention_count,
-                "avg_relevance_score": float(avg_relevance),
-                "related_topics": related_topics[:3]  # 상위 3개만
+                "mention_count": row.mention_count,
+                "avg_relevance_score": float(row.avg_relevance),
+                "related_topics": related_cache[ticker][:3]  # 상위 3개만
             }
-            all_tickers.append(ticker_data)
         
-        # Hot & Cold 분리
-        hot_tickers = all_tickers[:top_count]
-        cold_tickers = all_tickers[-bottom_count:] if len(all_tickers) > bottom_count else []
-        cold_tickers.reverse()  # 가장 부정적인 것부터
+        hot_tickers = [await build(row) for row in hot_rows]
+        cold_tickers = [await build(row) for row in cold_rows]  # 가장 부정적인 것부터
         
         return hot_tickers, cold_tickers
     
-    def calculate_topic_sentiment_summary(self, topic: str, days: int = 7) -> Dict[str, Any]:
+    async def calculate_topic_sentiment_summary(self, topic: str, days: int = 7) -> Dict[str, Any]:
         """특정 주제의 감성 요약을 계산합니다."""
         cutoff_date = datetime.now() - timedelta(days=days)
         
@@ -530,16 +824,16 @@ class MarketNewsSentimentService:
                 COUNT(CASE WHEN overall_sentiment_score < -0.1 THEN 1 END) as bearish_count,
                 COUNT(CASE WHEN overall_sentiment_score BETWEEN -0.1 AND 0.1 THEN 1 END) as neutral_count
             FROM market_news_sentiment 
-            WHERE topics @> :topic_filter
+            WHERE topics @> CAST(:topic_filter AS jsonb)
             AND time_published >= :cutoff_date
             AND overall_sentiment_score IS NOT NULL
         """)
         
         topic_filter = json.dumps([{"topic": topic}])
-        result = self.db.execute(query, {
+        result = (await self.db.execute(query, {
             "topic_filter": topic_filter,
             "cutoff_date": cutoff_date
-        }).fetchone()
+        })).fetchone()
         
         if not result or result[0] is None:
             return {
@@ -565,7 +859,7 @@ class MarketNewsSentimentService:
             }
         }
     
-    def calculate_ticker_sentiment_summary(self, ticker: str, days: int = 7) -> Dict[str, Any]:
+    async def calculate_ticker_sentiment_summary(self, ticker: str, days: int = 7) -> Dict[str, Any]:
         """특정 티커의 감성 요약을 계산합니다."""
         cutoff_date = datetime.now() - timedelta(days=days)
         
@@ -575,15 +869,15 @@ class MarketNewsSentimentService:
                 COUNT(*) as mention_count,
                 AVG((jsonb_array_elements(ticker_sentiment)->>'relevance_score')::float) as avg_relevance
             FROM market_news_sentiment 
-            WHERE ticker_sentiment @> :ticker_filter
+            WHERE ticker_sentiment @> CAST(:ticker_filter AS jsonb)
             AND time_published >= :cutoff_date
         """)
         
         ticker_filter = json.dumps([{"ticker": ticker}])
-        result = self.db.execute(query, {
+        result = (await self.db.execute(query, {
             "ticker_filter": ticker_filter,
             "cutoff_date": cutoff_date
-        }).fetchone()
+        })).fetchone()
         
         if not result or result[0] is None:
             return {
@@ -605,11 +899,89 @@ class MarketNewsSentimentService:
             "avg_relevance_score": float(avg_relevance)
         }
     
+    async def get_tickers_with_summary(self, limit: int = 10, days: int = 7) -> List[Dict[str, Any]]:
+        """
+        최근 언급이 많은 티커의 감성 요약을 한 번의 쿼리로 조회합니다.
+        
+        ticker_sentiment 배열을 LATERAL로 펼쳐 티커별로 GROUP BY 하므로
+        티커마다 요약 쿼리를 반복하지 않습니다.
+        """
+        cutoff_date = datetime.now() - timedelta(days=days)
+        
+        query = text("""
+            SELECT 
+                t->>'ticker' as ticker,
+                COUNT(*) as mention_count,
+                AVG((t->>'ticker_sentiment_score')::float) as avg_sentiment
+            FROM market_news_sentiment
+            CROSS JOIN LATERAL jsonb_array_elements(ticker_sentiment) AS t
+            WHERE ticker_sentiment IS NOT NULL
+            AND time_published >= :cutoff_date
+            AND t->>'ticker' IS NOT NULL
+            GROUP BY t->>'ticker'
+            ORDER BY mention_count DESC, ticker
+            LIMIT :limit
+        """)
+        
+        result = (await self.db.execute(query, {
+            "cutoff_date": cutoff_date,
+            "limit": limit
+        })).fetchall()
+        
+        return [
+            {
+                "ticker": row.ticker,
+                "mention_count": row.mention_count,
+                "avg_sentiment": float(row.avg_sentiment) if row.avg_sentiment is not None else 0.0,
+                "sentiment_label": self._get_sentiment_label_and_emoji(row.avg_sentiment)[0]
+            }
+            for row in result
+        ]
+    
+    async def get_topics_with_summary(self, limit: int = 10, days: int = 7) -> List[Dict[str, Any]]:
+        """
+        최근 뉴스가 많은 주제의 감성 요약을 한 번의 쿼리로 조회합니다.
+        
+        topics 배열을 LATERAL로 펼쳐 주제별로 GROUP BY 합니다.
+        """
+        cutoff_date = datetime.now() - timedelta(days=days)
+        
+        query = text("""
+            SELECT 
+                t->>'topic' as topic,
+                COUNT(*) as news_count,
+                AVG(overall_sentiment_score) as avg_sentiment
+            FROM market_news_sentiment
+            CROSS JOIN LATERAL jsonb_array_elements(topics) AS t
+            WHERE topics IS NOT NULL
+            AND time_published >= :cutoff_date
+            AND overall_sentiment_score IS NOT NULL
+            AND t->>'topic' IS NOT NULL
+            GROUP BY t->>'topic'
+            ORDER BY news_count DESC, topic
+            LIMIT :limit
+        """)
+        
+        result = (await self.db.execute(query, {
+            "cutoff_date": cutoff_date,
+            "limit": limit
+        })).fetchall()
+        
+        return [
+            {
+                "topic": row.topic,
+                "news_count": row.news_count,
+                "avg_sentiment": float(row.avg_sentiment) if row.avg_sentiment is not None else 0.0,
+                "sentiment_label": self._get_sentiment_label_and_emoji(row.avg_sentiment)[0]
+            }
+            for row in result
+        ]
+    
     # =========================================================================
     # 크로스 분석 메서드
     # =========================================================================
     
-    def get_tickers_by_topic(self, topic: str, days: int = 7, limit: int = 10) -> List[Dict]:
+    async def get_tickers_by_topic(self, topic: str, days: int = 7, limit: int = 10) -> List[Dict]:
         """특정 주제와 관련된 티커들을 조회합니다."""
         cutoff_date = datetime.now() - timedelta(days=days)
         
@@ -619,7 +991,7 @@ class MarketNewsSentimentService:
                     (jsonb_array_elements(ticker_sentiment)->>'ticker') as ticker,
                     (jsonb_array_elements(ticker_sentiment)->>'ticker_sentiment_score')::float as sentiment_score
                 FROM market_news_sentiment 
-                WHERE topics @> :topic_filter
+                WHERE topics @> CAST(:topic_filter AS jsonb)
                 AND time_published >= :cutoff_date
                 AND ticker_sentiment IS NOT NULL
             ),
@@ -638,11 +1010,11 @@ class MarketNewsSentimentService:
         """)
         
         topic_filter = json.dumps([{"topic": topic}])
-        result = self.db.execute(query, {
+        result = (await self.db.execute(query, {
             "topic_filter": topic_filter,
             "cutoff_date": cutoff_date,
             "limit": limit
-        }).fetchall()
+        })).fetchall()
         
         return [
             {
@@ -654,7 +1026,7 @@ class MarketNewsSentimentService:
             for row in result
         ]
     
-    def get_topics_by_ticker(self, ticker: str, days: int = 7, limit: int = 10) -> List[Dict]:
+    async def get_topics_by_ticker(self, ticker: str, days: int = 7, limit: int = 10) -> List[Dict]:
         """특정 티커와 관련된 주제들을 조회합니다."""
         cutoff_date = datetime.now() - timedelta(days=days)
         
@@ -664,7 +1036,7 @@ class MarketNewsSentimentService:
                     (jsonb_array_elements(topics)->>'topic') as topic,
                     (jsonb_array_elements(topics)->>'relevance_score')::float as relevance_score
                 FROM market_news_sentiment 
-                WHERE ticker_sentiment @> :ticker_filter
+                WHERE ticker_sentiment @> CAST(:ticker_filter AS jsonb)
                 AND time_published >= :cutoff_date
                 AND topics IS NOT NULL
             ),
@@ -683,11 +1055,11 @@ class MarketNewsSentimentService:
         """)
         
         ticker_filter = json.dumps([{"ticker": ticker}])
-        result = self.db.execute(query, {
+        result = (await self.db.execute(query, {
             "ticker_filter": ticker_filter,
             "cutoff_date": cutoff_date,
             "limit": limit
-        }).fetchall()
+        })).fetchall()
         
         return [
             {
@@ -702,6 +1074,35 @@ class MarketNewsSentimentService:
     # 내부 유틸리티 메서드
     # =========================================================================
     
+    async def _fetch_page(self, query, limit: int, offset: int, cursor: Optional[str] = None,
+                          descending: bool = True) -> Tuple[List[MarketNewsSentiment], Optional[str]]:
+        """
+        발행 시각순 페이지 조회 (cursor가 있으면 keyset, 없으면 OFFSET)
+        
+        다음 페이지 존재 여부 확인을 위해 limit + 1개를 조회합니다.
+        
+        Returns:
+            Tuple[items, next_cursor]: 현재 페이지 항목과 다음 페이지 커서 (없으면 None)
+            
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        query = query.order_by(*(column.desc() if descending else column.asc() for column in _KEYSET_COLUMNS))
+        
+        if cursor:
+            keyset = tuple_(*_KEYSET_COLUMNS)
+            bound = tuple_(*(
+                literal(value, column.type) for column, value in zip(_KEYSET_COLUMNS, _decode_cursor(cursor))
+            ))
+            query = query.where(keyset < bound if descending else keyset > bound)
+        else:
+            query = query.offset(offset)
+        
+        items = (await self.db.execute(query.limit(limit + 1))).scalars().all()
+        
+        next_cursor = _encode_cursor(items[limit - 1]) if len(items) > limit else None
+        return items[:limit], next_cursor
+    
     def _get_sentiment_label_and_emoji(self, score: Optional[float]) -> Tuple[str, str]:
         """감성 점수를 라벨과 이모지로 변환합니다."""
         if score is None:
@@ -719,23 +1120,23 @@ class MarketNewsSentimentService:
         else:
             return "매우부정적", "🔻"
     
-    def _get_tickers_by_topic(self, topic: str, days: int = 7) -> List[str]:
+    async def _get_tickers_by_topic(self, topic: str, days: int = 7) -> List[str]:
         """특정 주제의 관련 티커 목록을 조회합니다."""
-        tickers_data = self.get_tickers_by_topic(topic, days, 10)
+        tickers_data = await self.get_tickers_by_topic(topic, days, 10)
         return [item["ticker"] for item in tickers_data]
     
-    def _get_topics_by_ticker(self, ticker: str, days: int = 7) -> List[str]:
+    async def _get_topics_by_ticker(self, ticker: str, days: int = 7) -> List[str]:
         """특정 티커의 관련 주제 목록을 조회합니다."""
-        topics_data = self.get_topics_by_ticker(ticker, days, 10)
+        topics_data = await self.get_topics_by_ticker(ticker, days, 10)
         return [item["topic"] for item in topics_data]
     
     # =========================================================================
     # 감정 점수 추이 메서드 (프론트엔드 차트용)
     # =========================================================================
     
-    def get_sentiment_trends(self, interval: str = "daily", days: int = 7, 
-                           tickers: Optional[List[str]] = None, 
-                           topics: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def get_sentiment_trends(self, interval: str = "daily", days: int = 7, 
+                           tickers: Optional[Sequence[str]] = None, 
+                           topics: Optional[Sequence[str]] = None) -> Dict[str, Any]:
         """
         시간대별 감정 점수 추이를 계산합니다.
         
@@ -758,14 +1159,27 @@ class MarketNewsSentimentService:
             date_trunc = "day"
             interval_text = "일별"
         
+        # 사전 집계 뷰가 준비되어 있으면 시간별 집계 행에서 계산
+        if sentiment_trend_views.ready:
+            overall_trend, ticker_trends, topic_trends = await self._get_sentiment_trends_from_views(
+                cutoff_date, date_trunc, tickers, topics
+            )
+            return {
+                "period": f"최근 {days}일",
+                "interval": interval_text,
+                "overall_trend": overall_trend,
+                "ticker_trends": ticker_trends,
+                "topic_trends": topic_trends
+            }
+        
         # 전체 감정 점수 추이
-        overall_trend = self._calculate_overall_sentiment_trend(cutoff_date, date_trunc)
+        overall_trend = await self._calculate_overall_sentiment_trend(cutoff_date, date_trunc)
         
         # 티커별 추이 (요청된 경우)
         ticker_trends = []
         if tickers:
             for ticker in tickers:
-                trend_data = self._calculate_ticker_sentiment_trend(ticker, cutoff_date, date_trunc)
+                trend_data = await self._calculate_ticker_sentiment_trend(ticker, cutoff_date, date_trunc)
                 if trend_data:
                     ticker_trends.append({
                         "ticker": ticker,
@@ -776,7 +1190,7 @@ class MarketNewsSentimentService:
         topic_trends = []
         if topics:
             for topic in topics:
-                trend_data = self._calculate_topic_sentiment_trend(topic, cutoff_date, date_trunc)
+                trend_data = await self._calculate_topic_sentiment_trend(topic, cutoff_date, date_trunc)
                 if trend_data:
                     topic_trends.append({
                         "topic": topic,
@@ -791,7 +1205,146 @@ class MarketNewsSentimentService:
             "topic_trends": topic_trends
         }
     
-    def _calculate_overall_sentiment_trend(self, cutoff_date: datetime, date_trunc: str) -> List[Dict]:
+    async def _get_sentiment_trends_from_views(self, cutoff_date: datetime, date_trunc: str,
+                                               tickers: Optional[Sequence[str]] = None,
+                                               topics: Optional[Sequence[str]] = None
+                                               ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        시간별 사전 집계 뷰에서 전체/티커별/주제별 추이를 계산합니다.
+        
+        일별 추이는 시간별 합계/개수를 다시 합산하므로 가중 평균이 유지되고,
+        여러 티커/주제도 각각 한 번의 쿼리로 조회합니다.
+        """
+        params = {"cutoff_date": cutoff_date}
+        
+        overall_query = self._overall_trend_view_query(date_trunc)
+        overall_rows = (await self.db.execute(overall_query, params)).fetchall()
+        overall_trend = [self._trend_point(row) for row in overall_rows]
+        
+        ticker_trends = []
+        if tickers:
+            ticker_trends = await self._fetch_keyed_trends_from_view(
+                "market_news_sentiment_ticker_trend_hourly", "ticker", tickers, cutoff_date, date_trunc
+            )
+        
+        topic_trends = []
+        if topics:
+            topic_trends = await self._fetch_keyed_trends_from_view(
+                "market_news_sentiment_topic_trend_hourly", "topic", topics, cutoff_date, date_trunc
+            )
+        
+        return overall_trend, ticker_trends, topic_trends
+    
+    async def _fetch_keyed_trends_from_view(self, view: str, key_column: str, keys: Sequence[str],
+                                            cutoff_date: datetime, date_trunc: str) -> List[Dict]:
+        """티커/주제별 사전 집계 뷰에서 요청한 키들의 추이를 한 번에 조회합니다 (요청 순서 유지)."""
+        query = self._keyed_trend_view_query(view, key_column, date_trunc)
+        rows = (await self.db.execute(query, {"keys": list(keys), "cutoff_date": cutoff_date})).fetchall()
+        
+        points_by_key: Dict[str, List[Dict]] = {}
+        for row in rows:
+            points_by_key.setdefault(row[0], []).append(self._trend_point(row[1:]))
+        
+        return [
+            {key_column: key, "trend_data": points_by_key[key]}
+            for key in dict.fromkeys(keys)
+            if key in points_by_key
+        ]
+    
+    @staticmethod
+    def _overall_trend_view_query(date_trunc: str):
+        """전체 추이 사전 집계 뷰 조회 쿼리 (시간별 행을 date_trunc 단위로 재집계)"""
+        return text(f"""
+            SELECT 
+                DATE_TRUNC('{date_trunc}', bucket) as time_period,
+                SUM(sentiment_sum) / NULLIF(SUM(news_count), 0) as avg_sentiment,
+                CAST(SUM(news_count) AS BIGINT) as news_count,
+                CAST(SUM(bullish_count) AS BIGINT) as bullish_count,
+                CAST(SUM(bearish_count) AS BIGINT) as bearish_count,
+                CAST(SUM(neutral_count) AS BIGINT) as neutral_count
+            FROM market_news_sentiment_trend_hourly
+            WHERE bucket >= DATE_TRUNC('hour', CAST(:cutoff_date AS timestamp))
+            GROUP BY 1
+            ORDER BY time_period
+        """)
+    
+    @staticmethod
+    def _keyed_trend_view_query(view: str, key_column: str, date_trunc: str):
+        """티커/주제별 추이 사전 집계 뷰 조회 쿼리 (키 목록은 :keys 배열 파라미터)"""
+        return text(f"""
+            SELECT 
+                {key_column} as key,
+                DATE_TRUNC('{date_trunc}', bucket) as time_period,
+                SUM(sentiment_sum) / NULLIF(SUM(news_count), 0) as avg_sentiment,
+                CAST(SUM(news_count) AS BIGINT) as news_count,
+                CAST(SUM(bullish_count) AS BIGINT) as bullish_count,
+                CAST(SUM(bearish_count) AS BIGINT) as bearish_count,
+                CAST(SUM(neutral_count) AS BIGINT) as neutral_count
+            FROM {view}
+            WHERE {key_column} = ANY(:keys)
+            AND bucket >= DATE_TRUNC('hour', CAST(:cutoff_date AS timestamp))
+            GROUP BY 1, 2
+            ORDER BY 1, time_period
+        """).bindparams(bindparam("keys", type_=ARRAY(Text)))
+    
+    async def iter_sentiment_trends(self, interval: str = "daily", days: int = 7,
+                                    tickers: Optional[Sequence[str]] = None,
+                                    topics: Optional[Sequence[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        감정 점수 추이를 데이터 포인트 단위로 순차 반환합니다 (NDJSON 스트리밍용).
+        
+        첫 항목은 기간/간격 메타 정보이고, 이후 항목은 type(overall/ticker/topic)이 붙은 포인트입니다.
+        사전 집계 뷰가 준비되어 있으면 db.stream(서버 측 커서)으로 읽어 전체 결과를 메모리에 올리지 않습니다.
+        """
+        cutoff_date = datetime.now() - timedelta(days=days)
+        date_trunc = "hour" if interval == "hourly" else "day"
+        
+        yield {
+            "type": "meta",
+            "period": f"최근 {days}일",
+            "interval": "시간별" if interval == "hourly" else "일별"
+        }
+        
+        if not sentiment_trend_views.ready:
+            # 뷰가 없으면 기존 원본 집계 결과를 포인트 단위로 풀어서 반환
+            trends = await self.get_sentiment_trends(interval, days, tickers, topics)
+            for point in trends["overall_trend"]:
+                yield {"type": "overall", **point}
+            for key_column, series in (("ticker", trends["ticker_trends"]), ("topic", trends["topic_trends"])):
+                for trend in series:
+                    for point in trend["trend_data"]:
+                        yield {"type": key_column, key_column: trend[key_column], **point}
+            return
+        
+        result = await self.db.stream(self._overall_trend_view_query(date_trunc), {"cutoff_date": cutoff_date})
+        async for row in result:
+            yield {"type": "overall", **self._trend_point(row)}
+        
+        for view, key_column, keys in (
+            ("market_news_sentiment_ticker_trend_hourly", "ticker", tickers),
+            ("market_news_sentiment_topic_trend_hourly", "topic", topics),
+        ):
+            if not keys:
+                continue
+            result = await self.db.stream(
+                self._keyed_trend_view_query(view, key_column, date_trunc),
+                {"keys": list(keys), "cutoff_date": cutoff_date}
+            )
+            async for row in result:
+                yield {"type": key_column, key_column: row[0], **self._trend_point(row[1:])}
+    
+    def _trend_point(self, row) -> Dict:
+        """(시간, 평균, 개수, 긍정, 부정, 중립) 행을 추이 데이터 포인트로 변환합니다."""
+        return {
+            "timestamp": row[0],
+            "avg_sentiment_score": float(row[1]) if row[1] else 0.0,
+            "news_count": row[2],
+            "bullish_count": row[3],
+            "bearish_count": row[4],
+            "neutral_count": row[5]
+        }
+    
+    async def _calculate_overall_sentiment_trend(self, cutoff_date: datetime, date_trunc: str) -> List[Dict]:
         """전체 감정 점수 추이를 계산합니다."""
         query = text(f"""
             SELECT 
@@ -808,7 +1361,7 @@ class MarketNewsSentimentService:
             ORDER BY time_period
         """)
         
-        result = self.db.execute(query, {"cutoff_date": cutoff_date}).fetchall()
+        result = (await self.db.execute(query, {"cutoff_date": cutoff_date})).fetchall()
         
         return [
             {
@@ -822,7 +1375,7 @@ class MarketNewsSentimentService:
             for row in result
         ]
     
-    def _calculate_ticker_sentiment_trend(self, ticker: str, cutoff_date: datetime, date_trunc: str) -> List[Dict]:
+    async def _calculate_ticker_sentiment_trend(self, ticker: str, cutoff_date: datetime, date_trunc: str) -> List[Dict]:
         """특정 티커의 감정 점수 추이를 계산합니다."""
         query = text(f"""
             WITH ticker_expanded AS (
@@ -830,7 +1383,7 @@ class MarketNewsSentimentService:
                     time_published,
                     (jsonb_array_elements(ticker_sentiment)->>'ticker_sentiment_score')::float as sentiment_score
                 FROM market_news_sentiment 
-                WHERE ticker_sentiment @> :ticker_filter
+                WHERE ticker_sentiment @> CAST(:ticker_filter AS jsonb)
                 AND time_published >= :cutoff_date
             )
             SELECT 
@@ -846,10 +1399,10 @@ class MarketNewsSentimentService:
         """)
         
         ticker_filter = json.dumps([{"ticker": ticker}])
-        result = self.db.execute(query, {
+        result = (await self.db.execute(query, {
             "ticker_filter": ticker_filter,
             "cutoff_date": cutoff_date
-        }).fetchall()
+        })).fetchall()
         
         return [
             {
@@ -863,7 +1416,7 @@ class MarketNewsSentimentService:
             for row in result
         ]
     
-    def _calculate_topic_sentiment_trend(self, topic: str, cutoff_date: datetime, date_trunc: str) -> List[Dict]:
+    async def _calculate_topic_sentiment_trend(self, topic: str, cutoff_date: datetime, date_trunc: str) -> List[Dict]:
         """특정 주제의 감정 점수 추이를 계산합니다."""
         query = text(f"""
             SELECT 
@@ -874,7 +1427,7 @@ class MarketNewsSentimentService:
                 COUNT(CASE WHEN overall_sentiment_score < -0.1 THEN 1 END) as bearish_count,
                 COUNT(CASE WHEN overall_sentiment_score BETWEEN -0.1 AND 0.1 THEN 1 END) as neutral_count
             FROM market_news_sentiment 
-            WHERE topics @> :topic_filter
+            WHERE topics @> CAST(:topic_filter AS jsonb)
             AND time_published >= :cutoff_date
             AND overall_sentiment_score IS NOT NULL
             GROUP BY DATE_TRUNC('{date_trunc}', time_published)
@@ -882,10 +1435,10 @@ class MarketNewsSentimentService:
         """)
         
         topic_filter = json.dumps([{"topic": topic}])
-        result = self.db.execute(query, {
+        result = (await self.db.execute(query, {
             "topic_filter": topic_filter,
             "cutoff_date": cutoff_date
-        }).fetchall()
+        })).fetchall()
         
         return [
             {
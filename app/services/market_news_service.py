@@ -1,11 +1,16 @@
+import logging
+import time
 from datetime import datetime, timedelta
 import pytz
-from typing import List, Optional, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import func, text, and_, or_
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, or_, select, tuple_, literal
 from sqlalchemy.dialects.postgresql import TSVECTOR
 
-from app.models.market_news_model import MarketNews
+from app.models.market_news_model import MarketNews, MARKET_NEWS_TSV_EXPRESSION
+from app.utils.timezone_utils import to_naive_utc
+from app.utils.pagination_utils import encode_keyset_cursor, decode_keyset_cursor, estimated_count
+from app.utils.db_schema_utils import OptionalColumn
 from app.schemas.market_news_schema import (
     MarketNewsResponse, 
     MarketNewsListItem, 
@@ -13,6 +18,48 @@ from app.schemas.market_news_schema import (
     MarketNewsSearchResponse
 )
 
+logger = logging.getLogger(__name__)
+
+# =========================
+# 개요 통계 인프로세스 캐시
+# =========================
+# /health는 프로브가 자주 호출하므로 COUNT(*) + MAX(published_at) 결과를 잠시 재사용합니다.
+
+NEWS_OVERVIEW_TTL = 30  # 초
+
+_news_overview_cache: Dict[str, object] = {"value": None, "expires_at": 0.0}
+
+# keyset 페이징 정렬 키 (최신순, 동일 시각은 기본키 source/url로 순서 고정)
+_KEYSET_COLUMNS = (MarketNews.published_at, MarketNews.source, MarketNews.url)
+
+
+def _encode_cursor(item: MarketNews) -> str:
+    """마지막 항목의 정렬 키로 다음 페이지 커서 생성"""
+    return encode_keyset_cursor([item.published_at, item.source, item.url])
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str, str]:
+    """
+    커서를 (published_at, source, url)로 복원
+    
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    published_at, source, url = decode_keyset_cursor(cursor, len(_KEYSET_COLUMNS))
+    try:
+        return to_naive_utc(datetime.fromisoformat(published_at)), str(source), str(url)
+    except (TypeError, ValueError):
+        raise ValueError(f"잘못된 커서 형식입니다: {cursor}")
+
+
+# =========================
+# 전문 검색 생성 컬럼 (tsv)
+# =========================
+# 컬럼과 GIN 인덱스는 scripts/sql/market_news_tsv.sql로 추가하고,
+# 앱은 시작 시 존재 여부만 확인합니다 (없으면 검색 시 같은 식을 직접 계산).
+
+market_news_tsv_column = OptionalColumn("market_news", "tsv", MARKET_NEWS_TSV_EXPRESSION, TSVECTOR)
+
 
 class MarketNewsService:
     """
@@ -26,37 +73,52 @@ class MarketNewsService:
     5. 통계 및 분석
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_news_list(
+    async def _count(self, query) -> int:
+        """필터가 적용된 select 구문의 전체 행 수 조회"""
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        return (await self.db.execute(count_query)).scalar_one()
+
+    async def get_news_list(
         self,
         skip: int = 0,
         limit: int = 20,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         sources: Optional[List[str]] = None,
-        exclude_sources: Optional[List[str]] = None
+        exclude_sources: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        exact_count: bool = False
     ) -> MarketNewsListResponse:
         """
         뉴스 목록 조회 (페이징 + 필터링)
         
+        cursor가 주어지면 (published_at, source, url) keyset 조건으로 이어서 조회하고,
+        없으면 기존 OFFSET(skip) 방식으로 조회합니다.
+        
         Args:
-            skip: 건너뛸 항목 수 (페이징용)
+            skip: 건너뛸 항목 수 (페이징용, cursor 사용 시 무시)
             limit: 한 페이지당 항목 수
             start_date: 시작 날짜 필터
             end_date: 종료 날짜 필터
             sources: 포함할 소스 목록
             exclude_sources: 제외할 소스 목록
+            cursor: 이전 응답의 next_cursor 값 (keyset 페이징)
+            exact_count: True면 COUNT(*)로 정확한 전체 개수 계산 (기본은 추정치)
             
         Returns:
             MarketNewsListResponse: 페이징된 뉴스 목록
+            
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
         """
-        # 기본 쿼리 (최신순 정렬)
-        query = self.db.query(MarketNews).order_by(MarketNews.published_at.desc())
+        # 기본 쿼리 (최신순 정렬, 동일 시각은 source/url로 순서 고정)
+        query = select(MarketNews).order_by(*(column.desc() for column in _KEYSET_COLUMNS))
         
         # 제목/내용 필터링: title이 있고, (description 또는 content 중 하나라도 있어야 함)
-        query = query.filter(
+        query = query.where(
             and_(
                 MarketNews.title.isnot(None),
                 MarketNews.title != '',
@@ -69,22 +131,41 @@ class MarketNewsService:
         
         # 날짜 필터링
         if start_date:
-            query = query.filter(MarketNews.published_at >= start_date)
+            query = query.where(MarketNews.published_at >= to_naive_utc(start_date))
         if end_date:
-            query = query.filter(MarketNews.published_at <= end_date)
+            query = query.where(MarketNews.published_at <= to_naive_utc(end_date))
             
         # 소스 필터링
         if sources:
-            query = query.filter(MarketNews.source.in_(sources))
+            query = query.where(MarketNews.source.in_(sources))
         if exclude_sources:
-            query = query.filter(~MarketNews.source.in_(exclude_sources))
+            query = query.where(~MarketNews.source.in_(exclude_sources))
         
-        # 전체 개수 조회 (페이징 정보용)
-        total = query.count()
+        # 전체 개수 조회 (페이징 정보용, 기본은 실행 계획 기반 추정치)
+        if exact_count:
+            total = await self._count(query)
+        else:
+            total = await estimated_count(self.db, query, "market_news", "list", {
+                "start_date": start_date,
+                "end_date": end_date,
+                "sources": sources,
+                "exclude_sources": exclude_sources
+            })
         
-        # 페이징 적용
-        items_query = query.offset(skip).limit(limit)
-        items = items_query.all()
+        # 페이징 적용 (다음 페이지 존재 여부 확인을 위해 1개 더 조회)
+        if cursor:
+            items_query = query.where(
+                tuple_(*_KEYSET_COLUMNS) < tuple_(*(
+                    literal(value, column.type) for column, value in zip(_KEYSET_COLUMNS, _decode_cursor(cursor))
+                ))
+            )
+        else:
+            items_query = query.offset(skip)
+        items = (await self.db.execute(items_query.limit(limit + 1))).scalars().all()
+        
+        has_next = len(items) > limit
+        items = items[:limit]
+        next_cursor = _encode_cursor(items[-1]) if has_next and items else None
         
         # 응답 데이터 생성
         news_items = []
@@ -104,17 +185,17 @@ class MarketNewsService:
         
         # 페이징 정보 계산
         page = (skip // limit) + 1
-        has_next = (skip + limit) < total
         
         return MarketNewsListResponse(
             total=total,
             items=news_items,
             page=page,
             limit=limit,
-            has_next=has_next
+            has_next=has_next,
+            next_cursor=next_cursor
         )
 
-    def get_news_by_url(self, source: str, url: str) -> Optional[MarketNewsResponse]:
+    async def get_news_by_url(self, source: str, url: str) -> Optional[MarketNewsResponse]:
         """
         특정 뉴스 상세 조회 (복합 키 사용)
         
@@ -125,12 +206,7 @@ class MarketNewsService:
         Returns:
             MarketNewsResponse: 뉴스 상세 정보 (content 포함)
         """
-        news = self.db.query(MarketNews).filter(
-            and_(
-                MarketNews.source == source,
-                MarketNews.url == url
-            )
-        ).first()
+        news = await self.db.get(MarketNews, (source, url))
         
         if not news:
             return None
@@ -148,17 +224,20 @@ class MarketNewsService:
             content_preview=news.content_preview
         )
 
-    def search_news(
+    async def search_news(
         self,
         query_text: str,
         skip: int = 0,
         limit: int = 20,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        exact_count: bool = False
     ) -> MarketNewsSearchResponse:
         """
         뉴스 전문 검색 (PostgreSQL Full-Text Search 활용)
         
+        tsv 생성 컬럼의 GIN 인덱스로 검색하고 ts_rank_cd 관련도 순으로 정렬합니다.
+        
         검색 대상:
         - title (제목)
         - description (설명)
@@ -170,29 +249,20 @@ class MarketNewsService:
             limit: 페이징 limit
             start_date: 날짜 필터 시작
             end_date: 날짜 필터 종료
+            exact_count: True면 COUNT(*)로 정확한 전체 개수 계산 (기본은 추정치)
             
         Returns:
             MarketNewsSearchResponse: 검색 결과
         """
         # PostgreSQL Full-Text Search 쿼리
-        # to_tsvector: 텍스트를 검색 가능한 형태로 변환
-        # plainto_tsquery: 일반 텍스트를 검색 쿼리로 변환
-        search_query = self.db.query(MarketNews).filter(
-            or_(
-                # 제목에서 검색 (인덱스 활용)
-                func.to_tsvector('english', MarketNews.title).match(
-                    func.plainto_tsquery('english', query_text)
-                ),
-                # 설명에서 검색
-                func.to_tsvector('english', MarketNews.description).match(
-                    func.plainto_tsquery('english', query_text)
-                ),
-                # 본문에서 검색
-                func.to_tsvector('english', MarketNews.content).match(
-                    func.plainto_tsquery('english', query_text)
-                )
-            )
-        ).filter(
+        # tsv: title/description/content를 합친 생성 컬럼 (GIN 인덱스 idx_market_news_tsv_gin)
+        # plainto_tsquery: 일반 텍스트를 검색 쿼리로 변환 (tsv와 같은 'english' 설정)
+        ts_query = func.plainto_tsquery('english', query_text)
+        # tsv 컬럼이 아직 없는 DB에서는 같은 식을 직접 계산
+        tsv = market_news_tsv_column.resolve(MarketNews.tsv)
+        search_query = select(MarketNews).where(
+            tsv.bool_op('@@')(ts_query)
+        ).where(
             # 제목/내용 필터링: title이 있고, (description 또는 content 중 하나라도 있어야 함)
             and_(
                 MarketNews.title.isnot(None),
@@ -202,17 +272,32 @@ class MarketNewsService:
                     and_(MarketNews.content.isnot(None), MarketNews.content != '')
                 )
             )
-        ).order_by(MarketNews.published_at.desc())
+        ).order_by(
+            # 관련도 우선, 같은 점수는 최신순
+            func.ts_rank_cd(tsv, ts_query).desc(),
+            MarketNews.published_at.desc()
+        )
         
         # 날짜 필터링
         if start_date:
-            search_query = search_query.filter(MarketNews.published_at >= start_date)
+            search_query = search_query.where(MarketNews.published_at >= to_naive_utc(start_date))
         if end_date:
-            search_query = search_query.filter(MarketNews.published_at <= end_date)
+            search_query = search_query.where(MarketNews.published_at <= to_naive_utc(end_date))
+        
+        # 전체 개수 (기본은 실행 계획 기반 추정치)
+        if exact_count:
+            total = await self._count(search_query)
+        else:
+            total = await estimated_count(self.db, search_query, "market_news", "search", {
+                "q": query_text,
+                "start_date": start_date,
+                "end_date": end_date
+            })
         
-        # 전체 개수 및 페이징
-        total = search_query.count()
-        items = search_query.offset(skip).limit(limit).all()
+        # 페이징 (total이 추정치일 수 있으므로 1개 더 조회해 다음 페이지 여부 판단)
+        items = (await self.db.execute(search_query.offset(skip).limit(limit + 1))).scalars().all()
+        has_next = len(items) > limit
+        items = items[:limit]
         
         # 응답 생성
         news_items = []
@@ -231,7 +316,6 @@ class MarketNewsService:
             ))
         
         page = (skip // limit) + 1
-        has_next = (skip + limit) < total
         
         return MarketNewsSearchResponse(
             total=total,
@@ -242,7 +326,7 @@ class MarketNewsService:
             has_next=has_next
         )
 
-    def get_recent_news(self, hours: int = 24, limit: int = 10) -> List[MarketNewsResponse]:
+    async def get_recent_news(self, hours: int = 24, limit: int = 10) -> List[MarketNewsResponse]:
         """
         최근 뉴스 조회
         
@@ -253,11 +337,11 @@ class MarketNewsService:
         Returns:
             List[MarketNewsResponse]: 최근 뉴스 목록
         """
-        cutoff_time = datetime.now(pytz.UTC) - timedelta(hours=hours)
+        cutoff_time = to_naive_utc(datetime.now(pytz.UTC) - timedelta(hours=hours))
         
-        items = self.db.query(MarketNews).filter(
+        query = select(MarketNews).where(
             MarketNews.published_at >= cutoff_time
-        ).filter(
+        ).where(
             # 제목/내용 필터링: title이 있고, (description 또는 content 중 하나라도 있어야 함)
             and_(
                 MarketNews.title.isnot(None),
@@ -269,7 +353,9 @@ class MarketNewsService:
             )
         ).order_by(
             MarketNews.published_at.desc()
-        ).limit(limit).all()
+        ).limit(limit)
+        
+        items = (await self.db.execute(query)).scalars().all()
         
         return [
             MarketNewsResponse(
@@ -287,45 +373,89 @@ class MarketNewsService:
             for item in items
         ]
 
-    def get_news_sources(self) -> List[Tuple[str, int]]:
+    async def get_news_sources(self) -> List[Tuple[str, int]]:
         """
         뉴스 소스별 통계 조회
         
         Returns:
             List[Tuple[str, int]]: (소스명, 뉴스 개수) 튜플 리스트
         """
-        results = self.db.query(
+        query = select(
             MarketNews.source,
             func.count(MarketNews.source).label('count')
         ).group_by(
             MarketNews.source
         ).order_by(
             func.count(MarketNews.source).desc()
-        ).all()
+        )
+        results = (await self.db.execute(query)).all()
         
         return [(result.source, result.count) for result in results]
 
-    def get_daily_news_count(self, days: int = 30) -> List[Tuple[str, int]]:
+    async def get_daily_news_count(self, days: int = 30) -> Tuple[List[Tuple[str, int]], int]:
         """
         일별 뉴스 발행 통계
         
+        전체 합계도 같은 쿼리에서 윈도우 함수(SUM(COUNT(*)) OVER ())로 함께 계산합니다.
+        
         Args:
             days: 조회할 일수
             
         Returns:
-            List[Tuple[str, int]]: (날짜, 뉴스 개수) 튜플 리스트
+            Tuple[List[Tuple[str, int]], int]: ((날짜, 뉴스 개수) 튜플 리스트, 기간 내 전체 개수)
         """
-        cutoff_date = datetime.now(pytz.UTC) - timedelta(days=days)
+        cutoff_date = to_naive_utc(datetime.now(pytz.UTC) - timedelta(days=days))
         
-        results = self.db.query(
+        query = select(
             func.date(MarketNews.published_at).label('news_date'),
-            func.count(MarketNews.source).label('count')
-        ).filter(
+            func.count(MarketNews.source).label('count'),
+            func.sum(func.count(MarketNews.source)).over().label('total')
+        ).where(
             MarketNews.published_at >= cutoff_date
         ).group_by(
             func.date(MarketNews.published_at)
         ).order_by(
             func.date(MarketNews.published_at).desc()
-        ).all()
+        )
+        results = (await self.db.execute(query)).all()
+        
+        total = int(results[0].total) if results else 0
+        return [(str(result.news_date), result.count) for result in results], total
+
+    async def get_data_version(self) -> Optional[str]:
+        """
+        뉴스 데이터 버전 조회 (ETag 생성용)
+        
+        통계 응답 전체를 만들지 않고 최신 발행 시간만 조회합니다.
+        
+        Returns:
+            Optional[str]: 버전 문자열 (데이터가 없으면 None)
+        """
+        latest_date = (await self.db.execute(select(func.max(MarketNews.published_at)))).scalar()
+        return latest_date.isoformat() if latest_date else None
+    
+    async def get_news_overview(self) -> Tuple[int, Optional[datetime]]:
+        """
+        전체 뉴스 개수와 최신 뉴스 발행 시간 조회 (통계/헬스체크용)
+        
+        Returns:
+            Tuple[int, Optional[datetime]]: (전체 개수, 최신 발행 시간)
+        """
+        query = select(func.count(), func.max(MarketNews.published_at)).select_from(MarketNews)
+        total_count, latest_date = (await self.db.execute(query)).one()
+        return total_count, latest_date
+    
+    async def get_cached_news_overview(self) -> Tuple[int, Optional[datetime]]:
+        """
+        get_news_overview 결과를 NEWS_OVERVIEW_TTL 동안 메모리에서 재사용 (헬스체크용)
+        
+        Returns:
+            Tuple[int, Optional[datetime]]: (전체 개수, 최신 발행 시간)
+        """
+        if time.monotonic() < _news_overview_cache["expires_at"]:
+            return _news_overview_cache["value"]
         
-        return [(str(result.news_date), result.count) for result in results]
\ No newline at end of file
+        overview = await self.get_news_overview()
+        _news_overview_cache["value"] = overview
+        _news_overview_cache["expires_at"] = time.monotonic() + NEWS_OVERVIEW_TTL
+        return overview
@@ -1,8 +1,9 @@
 # app/services/sns_service.py
 
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from typing import List, Optional, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text, tuple_, literal, select
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
 import math
 import json
 from pydantic import ValidationError
@@ -11,18 +12,48 @@ from app.models.x_posts_model import XPost
 from app.models.truth_social_model import TruthSocialPost, TruthSocialTrend
 from app.models.post_analysis_cache_model import PostAnalysisCache
 from app.schemas import sns_schema
+from app.utils.pagination_utils import encode_keyset_cursor, decode_keyset_cursor
+from app.utils.cache_utils import cached_response
 from fastapi import HTTPException
 
 
+def _decode_feed_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    피드 커서를 복원하고 첫 값(작성 시각)을 datetime으로 변환
+    
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    values = decode_keyset_cursor(cursor, size)
+    try:
+        values[0] = datetime.fromisoformat(values[0])
+    except (TypeError, ValueError):
+        raise ValueError(f"잘못된 커서 형식입니다: {cursor}")
+    return values
+
+
+# 피드 플랫폼별 게시글 수 캐시 TTL (초) - 커서로 스크롤할 때마다 전체 개수를 다시 세지 않음
+SNS_PLATFORM_COUNTS_TTL = 60
+
+
+# 플랫폼별 게시글 상세 조회 구문 (플랫폼이 정해져 있으므로 해당 테이블의 기본키 조회 하나만 실행)
+# text() 구문을 모듈 수준에서 한 번만 만들어 요청마다 재생성하지 않습니다.
+_POST_DETAIL_QUERIES = {
+    "x": text("SELECT tweet_id as id, 'x' as platform, text as content, source_account as author, display_name, created_at, like_count, retweet_count, reply_count, false as has_media, null as media_attachments FROM x_posts WHERE tweet_id = :post_id"),
+    "truth_social_posts": text("SELECT id, 'truth_social_posts' as platform, clean_content as content, username as author, display_name, created_at, favourites_count as like_count, reblogs_count as retweet_count, replies_count as reply_count, has_media, media_attachments FROM truth_social_posts WHERE id = :post_id"),
+    "truth_social_trends": text("SELECT id, 'truth_social_trends' as platform, clean_content as content, username as author, display_name, created_at, favourites_count as like_count, reblogs_count as retweet_count, replies_count as reply_count, false as has_media, null as media_attachments FROM truth_social_trends WHERE id = :post_id"),
+}
+
+
 class SNSService:
     """통합 SNS 서비스: 원본 데이터 조회 및 분석 데이터 조회를 모두 처리"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     # --- 1. 원본 데이터 조회용 서비스 (기존 코드 유지 및 보안 강화) ---
     
-    def get_available_authors(self) -> Dict[str, List[Dict[str, Any]]]:
+    async def get_available_authors(self) -> Dict[str, List[Dict[str, Any]]]:
         """DB에서 사용 가능한 작성자 목록 조회"""
         x_query = """
         SELECT 
@@ -33,7 +64,7 @@ class SNSService:
             MAX(user_verified) as verified
         FROM x_posts 
         WHERE created_at >= NOW() - INTERVAL '30 days'
-            AND text NOT LIKE '@%%'
+            AND text NOT LIKE '@%'
             AND text IS NOT NULL
             AND LENGTH(TRIM(text)) > 0
         GROUP BY source_account, display_name
@@ -69,7 +100,7 @@ class SNSService:
         """
         
         try:
-            x_result = self.db.execute(text(x_query)).fetchall()
+            x_result = (await self.db.execute(text(x_query))).fetchall()
             x_authors = [
                 {
                     "username": row.username,
@@ -80,7 +111,7 @@ class SNSService:
                 } for row in x_result
             ]
             
-            truth_posts_result = self.db.execute(text(truth_posts_query)).fetchall()
+            truth_posts_result = (await self.db.execute(text(truth_posts_query))).fetchall()
             truth_posts_authors = [
                 {
                     "username": row.username,
@@ -91,7 +122,7 @@ class SNSService:
                 } for row in truth_posts_result
             ]
             
-            truth_trends_result = self.db.execute(text(truth_trends_query)).fetchall()
+            truth_trends_result = (await self.db.execute(text(truth_trends_query))).fetchall()
             truth_trends_authors = [
                 {
                     "username": row.username,
@@ -111,36 +142,60 @@ class SNSService:
             print(f"작성자 목록 조회 실패: {e}")
             return {"x": [], "truth_social_posts": [], "truth_social_trends": []}
     
-    def get_posts(self, platform: str, author: Optional[str], limit: int, offset: int) -> sns_schema.SNSPostsResponse:
-        """(원본 데이터용) SNS 게시글 조회 - SQL 인젝션 방지 적용"""
-        params = {'limit': limit, 'offset': offset}
+    async def get_posts(self, platform: str, author: Optional[str], limit: int, offset: int = 0,
+                  cursor: Optional[str] = None) -> sns_schema.SNSPostsResponse:
+        """
+        (원본 데이터용) SNS 게시글 조회 - SQL 인젝션 방지 적용
+        
+        cursor가 주어지면 (created_at, platform, id) keyset 조건으로 이어서 조회합니다.
+        각 플랫폼 쿼리에 커서 조건과 LIMIT을 함께 걸어 페이지가 깊어져도
+        테이블별 (created_at DESC, id DESC) 인덱스에서 필요한 만큼만 읽습니다.
+        
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        params = {'limit': limit + 1, 'offset': offset, 'branch_limit': offset + limit + 1}
+        if cursor:
+            params['offset'] = 0
+            params['branch_limit'] = limit + 1
+            params['cursor_ts'], params['cursor_platform'], params['cursor_id'] = _decode_feed_cursor(cursor, 3)
         queries, count_queries = [], []
+        
+        def branch(select_base: str, where_clauses: List[str], platform_name: str, id_column: str) -> str:
+            """플랫폼별 쿼리에 커서 조건과 정렬/LIMIT을 붙입니다."""
+            if cursor:
+                where_clauses = where_clauses + [
+                    "created_at <= :cursor_ts",
+                    f"(created_at, '{platform_name}'::text, {id_column}::text) < "
+                    "(:cursor_ts, CAST(:cursor_platform AS text), CAST(:cursor_id AS text))"
+                ]
+            return f"({select_base} WHERE {' AND '.join(where_clauses)} ORDER BY created_at DESC, {id_column} DESC LIMIT :branch_limit)"
 
         if platform in ["all", "x"]:
             x_select_base = "SELECT tweet_id as id, 'x' as platform, text as content, source_account as author, display_name, created_at, like_count, retweet_count, reply_count, false as has_media, null as media_attachments, created_at as sort_date FROM x_posts"
-            x_count_base = "SELECT COUNT(*) as count FROM x_posts"
-            where_clauses = ["text NOT LIKE '@%%'", "text IS NOT NULL", "LENGTH(TRIM(text)) > 0"]
+            x_count_base = "SELECT 'x' as platform, COUNT(*) as count FROM x_posts"
+            where_clauses = ["text NOT LIKE '@%'", "text IS NOT NULL", "LENGTH(TRIM(text)) > 0"]
             if author:
                 where_clauses.append("source_account = :author")
                 params['author'] = author
             final_where = " WHERE " + " AND ".join(where_clauses)
-            queries.append(x_select_base + final_where)
+            queries.append(branch(x_select_base, where_clauses, "x", "tweet_id"))
             count_queries.append(x_count_base + final_where)
 
         if platform in ["all", "truth_social_posts"]:
             truth_posts_select_base = "SELECT id, 'truth_social_posts' as platform, clean_content as content, username as author, display_name, created_at, favourites_count as like_count, reblogs_count as retweet_count, replies_count as reply_count, has_media, media_attachments, created_at as sort_date FROM truth_social_posts"
-            truth_posts_count_base = "SELECT COUNT(*) as count FROM truth_social_posts"
+            truth_posts_count_base = "SELECT 'truth_social_posts' as platform, COUNT(*) as count FROM truth_social_posts"
             where_clauses = ["((clean_content IS NOT NULL AND LENGTH(TRIM(clean_content)) > 0) OR (media_attachments IS NOT NULL AND media_attachments != 'null'::jsonb) OR username IN ('realDonaldTrump', 'WhiteHouse', 'DonaldJTrumpJr'))"]
             if author:
                 where_clauses.append("username = :author")
                 params['author'] = author
             final_where = " WHERE " + " AND ".join(where_clauses)
-            queries.append(truth_posts_select_base + final_where)
+            queries.append(branch(truth_posts_select_base, where_clauses, "truth_social_posts", "id"))
             count_queries.append(truth_posts_count_base + final_where)
 
         if platform in ["all", "truth_social_trends"]:
             truth_trends_select_base = "SELECT id, 'truth_social_trends' as platform, clean_content as content, username as author, display_name, created_at, favourites_count as like_count, reblogs_count as retweet_count, replies_count as reply_count, false as has_media, null as media_attachments, created_at as sort_date FROM truth_social_trends"
-            truth_trends_count_base = "SELECT COUNT(*) as count FROM truth_social_trends"
+            truth_trends_count_base = "SELECT 'truth_social_trends' as platform, COUNT(*) as count FROM truth_social_trends"
             where_clauses = ["clean_content IS NOT NULL", "LENGTH(TRIM(clean_content)) > 0", "username NOT IN ('realDonaldTrump', 'WhiteHouse', 'DonaldJTrumpJr')"]
             if author and author not in ['realDonaldTrump', 'WhiteHouse', 'DonaldJTrumpJr']:
                 where_clauses.append("username = :author")
@@ -148,22 +203,30 @@ class SNSService:
             elif author in ['realDonaldTrump', 'WhiteHouse', 'DonaldJTrumpJr']:
                 where_clauses.append("1=0") # Author is a VIP, so no results from trends
             final_where = " WHERE " + " AND ".join(where_clauses)
-            queries.append(truth_trends_select_base + final_where)
+            queries.append(branch(truth_trends_select_base, where_clauses, "truth_social_trends", "id"))
             count_queries.append(truth_trends_count_base + final_where)
 
         if not queries:
-            return sns_schema.SNSPostsResponse(items=[], total=0, page=1, size=limit, pages=0, platform_counts={})
+            return sns_schema.SNSPostsResponse(items=[], total_count=0, page=1, page_size=limit, total_pages=0, has_next=False, platform_counts={})
         
         union_query = " UNION ALL ".join(queries)
-        final_query = f"WITH unified_posts AS ({union_query}) SELECT * FROM unified_posts ORDER BY sort_date DESC LIMIT :limit OFFSET :offset"
+        final_query = f"WITH unified_posts AS ({union_query}) SELECT * FROM unified_posts ORDER BY sort_date DESC, platform DESC, id DESC LIMIT :limit OFFSET :offset"
         
-        union_count_query = " UNION ALL ".join(count_queries)
-        total_count_query = f"WITH counts AS ({union_count_query}) SELECT SUM(count) as total FROM counts"
-
         try:
-            posts_result = self.db.execute(text(final_query), params).fetchall()
-            count_result = self.db.execute(text(total_count_query), params).fetchone()
-            total_count = count_result[0] or 0
+            posts_result = (await self.db.execute(text(final_query), params)).fetchall()
+            # 플랫폼별 개수는 필터(platform, author)별로 캐시해 커서 페이지마다 다시 세지 않음
+            platform_counts = await self._load_platform_counts(
+                platform=platform, author=author, count_query=" UNION ALL ".join(count_queries)
+            )
+            total_count = sum(platform_counts.values())
+            
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회한 결과 정리
+            has_next = len(posts_result) > limit
+            posts_result = posts_result[:limit]
+            next_cursor = None
+            if has_next and posts_result:
+                last = posts_result[-1]
+                next_cursor = encode_keyset_cursor([last.sort_date, last.platform, str(last.id)])
             
             items = []
             for post in posts_result:
@@ -181,27 +244,29 @@ class SNSService:
                 ))
 
             return sns_schema.SNSPostsResponse(
-                items=items, total=total_count, page=(offset // limit) + 1,
-                size=limit, pages=math.ceil(total_count / limit) if total_count > 0 else 0,
-                platform_counts={}
+                items=items, total_count=total_count,
+                page=None if cursor else (offset // limit) + 1,
+                page_size=limit, total_pages=math.ceil(total_count / limit) if total_count > 0 else 0,
+                has_next=has_next, has_previous=bool(cursor) or offset > 0,
+                next_cursor=next_cursor, platform_counts=platform_counts
             )
         except Exception as e:
             raise Exception(f"SNS 게시글 조회 중 오류 발생: {str(e)}")
 
-    def get_post_detail(self, post_id: str, platform: str) -> Optional[sns_schema.UnifiedSNSPostResponse]:
+    @cached_response("sns", expire=SNS_PLATFORM_COUNTS_TTL)
+    async def _load_platform_counts(self, platform: str, author: Optional[str], count_query: str) -> Dict[str, int]:
+        """(원본 데이터용) 플랫폼별 게시글 수 조회 (Redis 캐시)"""
+        rows = (await self.db.execute(text(count_query), {'author': author})).fetchall()
+        return {row.platform: int(row.count or 0) for row in rows}
+
+    async def get_post_detail(self, post_id: str, platform: str) -> Optional[sns_schema.UnifiedSNSPostResponse]:
         """(원본 데이터용) 개별 게시글 상세 조회 - 보안 수정 적용"""
-        query_map = {
-            "x": "SELECT tweet_id as id, 'x' as platform, text as content, source_account as author, display_name, created_at, like_count, retweet_count, reply_count, false as has_media, null as media_attachments FROM x_posts WHERE tweet_id = :post_id",
-            "truth_social_posts": "SELECT id, 'truth_social_posts' as platform, clean_content as content, username as author, display_name, created_at, favourites_count as like_count, reblogs_count as retweet_count, replies_count as reply_count, has_media, media_attachments FROM truth_social_posts WHERE id = :post_id",
-            "truth_social_trends": "SELECT id, 'truth_social_trends' as platform, clean_content as content, username as author, display_name, created_at, favourites_count as like_count, reblogs_count as retweet_count, replies_count as reply_count, false as has_media, null as media_attachments FROM truth_social_trends WHERE id = :post_id"
-        }
-        
-        query = query_map.get(platform)
-        if not query:
+        query = _POST_DETAIL_QUERIES.get(platform)
+        if query is None:
             return None
 
         try:
-            result = self.db.execute(text(query), {"post_id": post_id}).fetchone()
+            result = (await self.db.execute(query, {"post_id": post_id})).fetchone()
             if not result:
                 return None
             
@@ -221,9 +286,53 @@ class SNSService:
             print(f"게시글 상세 조회 실패: {e}")
             return None
 
-    def get_basic_stats(self) -> Dict[str, Any]:
-        """(원본 데이터용) 기본 통계 조회"""
-        # (기존 코드와 동일, 생략 없음)
+    async def get_basic_stats(self) -> Dict[str, Any]:
+        """
+        (원본 데이터용) 기본 통계 조회
+        
+        플랫폼별 게시글 수/최근 24시간 게시글 수/작성자 수를 하나의 CTE 쿼리로 집계합니다.
+        """
+        query = """
+        WITH platform_stats AS (
+            SELECT 'x' as platform, COUNT(*) as total_posts,
+                   COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours') as posts_last_24h,
+                   COUNT(DISTINCT source_account) as unique_authors,
+                   MAX(created_at) as latest_post_at
+            FROM x_posts
+            UNION ALL
+            SELECT 'truth_social_posts', COUNT(*),
+                   COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours'),
+                   COUNT(DISTINCT username),
+                   MAX(created_at)
+            FROM truth_social_posts
+            UNION ALL
+            SELECT 'truth_social_trends', COUNT(*),
+                   COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours'),
+                   COUNT(DISTINCT username),
+                   MAX(created_at)
+            FROM truth_social_trends
+        )
+        SELECT platform, total_posts, posts_last_24h, unique_authors, latest_post_at
+        FROM platform_stats
+        """
+        rows = (await self.db.execute(text(query))).fetchall()
+        
+        platforms = [
+            {
+                "platform": row.platform,
+                "total_posts": row.total_posts,
+                "posts_last_24h": row.posts_last_24h,
+                "unique_authors": row.unique_authors,
+                "latest_post_at": row.latest_post_at
+            }
+            for row in rows
+        ]
+        
+        return {
+            "total_posts": sum(p["total_posts"] for p in platforms),
+            "posts_last_24h": sum(p["posts_last_24h"] for p in platforms),
+            "platforms": platforms
+        }
     
     def _extract_media_info(self, media_attachments: Any, has_media: bool) -> (Optional[str], Optional[str]):
         """미디어 첨부파일에서 썸네일 정보 추출"""
@@ -252,28 +361,52 @@ class SNSService:
 
     # --- 2. 프론트엔드 분석 페이지용 서비스 (신규 추가) ---
     
-    def get_analysis_posts(self, db: Session, skip: int, limit: int, post_source: str) -> List[sns_schema.SNSPostAnalysisListResponse]:
-        """[분석 목록 페이지용] 분석된 SNS 게시글 목록을 조회합니다."""
+    async def get_analysis_posts(self, db: AsyncSession, skip: int, limit: int, post_source: str,
+                           cursor: Optional[str] = None) -> Tuple[List[sns_schema.SNSPostAnalysisListResponse], Optional[str]]:
+        """
+        [분석 목록 페이지용] 분석된 SNS 게시글 목록과 다음 페이지 커서를 조회합니다.
         
-        query = db.query(PostAnalysisCache)
+        cursor가 주어지면 (post_timestamp, id) keyset 조건으로 이어서 조회합니다. (skip 무시)
+        
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        
+        query = select(PostAnalysisCache)
 
         # post_source가 'all'이 아닐 경우에만 필터링 조건 추가
         if post_source != "all":
             valid_sources = ["x", "truth_social_posts", "truth_social_trends"]
             if post_source in valid_sources:
-                query = query.filter(PostAnalysisCache.post_source == post_source)
+                query = query.where(PostAnalysisCache.post_source == post_source)
             else:
                 # 유효하지 않은 source 값이 들어오면 빈 리스트 반환
-                return []
+                return [], None
+
+        query = query.order_by(PostAnalysisCache.post_timestamp.desc(), PostAnalysisCache.id.desc())
+        if cursor:
+            cursor_ts, cursor_id = _decode_feed_cursor(cursor, 2)
+            query = query.where(
+                tuple_(PostAnalysisCache.post_timestamp, PostAnalysisCache.id) <
+                tuple_(literal(cursor_ts, PostAnalysisCache.post_timestamp.type), literal(int(cursor_id)))
+            )
+        else:
+            query = query.offset(skip)
 
-        analysis_results = query.order_by(PostAnalysisCache.post_timestamp.desc()).offset(skip).limit(limit).all()
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        analysis_results = (await db.execute(query.limit(limit + 1))).scalars().all()
+        next_cursor = None
+        if len(analysis_results) > limit:
+            analysis_results = analysis_results[:limit]
+            last = analysis_results[-1]
+            next_cursor = encode_keyset_cursor([last.post_timestamp, last.id])
         
         post_ids_by_source = {'x': [], 'truth_social_posts': [], 'truth_social_trends': []}
         for result in analysis_results:
             if result.post_source in post_ids_by_source:
                 post_ids_by_source[result.post_source].append(result.post_id)
 
-        original_posts_map = self._get_original_posts_for_analysis_map(db, post_ids_by_source)
+        original_posts_map = await self._get_original_posts_for_analysis_map(db, post_ids_by_source)
 
         combined_posts = []
         for result in analysis_results:
@@ -304,17 +437,41 @@ class SNSService:
                 engagement=engagement_schema,
                 media=media_schema
             ))
-        return combined_posts
+        return combined_posts, next_cursor
 
-    def get_analysis_post_detail(self, db: Session, post_id: str, post_source: str) -> sns_schema.SNSPostAnalysisDetailResponse:
-        """[분석 상세 페이지용] 특정 게시물의 모든 상세 분석 데이터를 조회합니다."""
-        analysis_result = db.query(PostAnalysisCache).filter(
-            PostAnalysisCache.post_id == post_id,
-            PostAnalysisCache.post_source == post_source
-        ).first()
+    async def get_analysis_post_detail(self, db: AsyncSession, post_id: str, post_source: str) -> sns_schema.SNSPostAnalysisDetailResponse:
+        """
+        [분석 상세 페이지용] 특정 게시물의 모든 상세 분석 데이터를 조회합니다.
+        
+        원본 게시물은 post_source에 해당하는 테이블을 LEFT JOIN해 분석 데이터와 한 번에 조회합니다.
+        """
+        query = select(PostAnalysisCache)
+        if post_source == 'x':
+            query = query.add_columns(
+                XPost.tweet_id.label("original_id"),
+                XPost.text.label("content"),
+                XPost.retweet_count, XPost.reply_count, XPost.like_count,
+                XPost.quote_count, XPost.impression_count, XPost.account_category
+            ).outerjoin(XPost, XPost.tweet_id == PostAnalysisCache.post_id)
+        elif post_source in ['truth_social_posts', 'truth_social_trends']:
+            original_model = TruthSocialPost if post_source == 'truth_social_posts' else TruthSocialTrend
+            query = query.add_columns(
+                original_model.id.label("original_id"),
+                original_model.clean_content.label("content"),
+                original_model.has_media,
+                original_model.media_attachments
+            ).outerjoin(original_model, original_model.id == PostAnalysisCache.post_id)
+        
+        row = (await db.execute(
+            query.where(
+                PostAnalysisCache.post_id == post_id,
+                PostAnalysisCache.post_source == post_source
+            ).limit(1)
+        )).first()
 
-        if not analysis_result:
+        if not row:
             raise HTTPException(status_code=404, detail="Analysis data not found for the given post.")
+        analysis_result = row[0]
         
         # market_data 처리 (기존/신규 형식 모두 지원)
         try:
@@ -340,9 +497,25 @@ class SNSService:
             traceback.print_exc()
             analysis_result.market_data = {}
 
-        # 원본 게시물 데이터 조회
-        original_posts_map = self._get_original_posts_for_analysis_map(db, {post_source: [post_id]})
-        original_post_data = original_posts_map.get((post_source, post_id))
+        # 원본 게시물 데이터 (JOIN 결과에서 추출)
+        original_post_data = None
+        if getattr(row, "original_id", None) is not None:
+            if post_source == 'x':
+                original_post_data = {
+                    "content": row.content,
+                    "engagement": {
+                        "retweet_count": row.retweet_count, "reply_count": row.reply_count,
+                        "like_count": row.like_count, "quote_count": row.quote_count,
+                        "impression_count": row.impression_count, "account_category": row.account_category,
+                    }
+                }
+            else:
+                original_post_data = {
+                    "content": row.content,
+                    "engagement": None,
+                    "has_media": row.has_media or False,
+                    "media_attachments": row.media_attachments
+                }
 
         content_schema = sns_schema.OriginalPostForAnalysisSchema(content="원본 게시물을 찾을 수 없습니다.")
         engagement_schema = None
@@ -371,13 +544,13 @@ class SNSService:
             media=media_schema
         )
     
-    def _get_original_posts_for_analysis_map_optimized(self, db: Session, post_ids_by_source: dict) -> dict:
+    async def _get_original_posts_for_analysis_map_optimized(self, db: AsyncSession, post_ids_by_source: dict) -> dict:
         """(분석용) Helper to fetch original posts efficiently - 최적화 버전."""
         original_posts_map = {}
         
         # X 포스트 조회 - 필요한 컬럼만 선택
         if post_ids_by_source.get('x'):
-            x_posts = db.query(
+            x_posts = (await db.execute(select(
                 XPost.tweet_id,
                 XPost.text,
                 XPost.retweet_count,
@@ -386,7 +559,7 @@ class SNSService:
                 XPost.quote_count,
                 XPost.impression_count,
                 XPost.account_category
-            ).filter(XPost.tweet_id.in_(post_ids_by_source['x'])).all()
+            ).where(XPost.tweet_id.in_(post_ids_by_source['x'])))).all()
             
             for post in x_posts:
                 original_posts_map[('x', post.tweet_id)] = {
@@ -404,11 +577,11 @@ class SNSService:
         # Truth Social 포스트 조회 - 미디어 정보 간소화
         truth_post_ids = post_ids_by_source.get('truth_social_posts', [])
         if truth_post_ids:
-            truth_posts = db.query(
+            truth_posts = (await db.execute(select(
                 TruthSocialPost.id, 
                 TruthSocialPost.clean_content, 
                 TruthSocialPost.has_media
-            ).filter(TruthSocialPost.id.in_(truth_post_ids)).all()
+            ).where(TruthSocialPost.id.in_(truth_post_ids)))).all()
             
             for post in truth_posts:
                 original_posts_map[('truth_social_posts', str(post.id))] = {
@@ -420,11 +593,11 @@ class SNSService:
         
         return original_posts_map
 
-    def _get_original_posts_for_analysis_map(self, db: Session, post_ids_by_source: dict) -> dict:
+    async def _get_original_posts_for_analysis_map(self, db: AsyncSession, post_ids_by_source: dict) -> dict:
         """(분석용) Helper to fetch original posts efficiently."""
         original_posts_map = {}
         if post_ids_by_source.get('x'):
-            x_posts = db.query(XPost).filter(XPost.tweet_id.in_(post_ids_by_source['x'])).all()
+            x_posts = (await db.execute(select(XPost).where(XPost.tweet_id.in_(post_ids_by_source['x'])))).scalars().all()
             for post in x_posts:
                 original_posts_map[('x', post.tweet_id)] = {
                     "content": post.text,
@@ -438,12 +611,12 @@ class SNSService:
         truth_post_ids = post_ids_by_source.get('truth_social_posts', [])
         if truth_post_ids:
             # --- 👇 [수정] media_attachments, has_media 컬럼 추가 조회 ---
-            truth_posts = db.query(
+            truth_posts = (await db.execute(select(
                 TruthSocialPost.id, 
                 TruthSocialPost.clean_content, 
                 TruthSocialPost.has_media, 
                 TruthSocialPost.media_attachments
-            ).filter(TruthSocialPost.id.in_(truth_post_ids)).all()
+            ).where(TruthSocialPost.id.in_(truth_post_ids)))).all()
             for post in truth_posts:
                 original_posts_map[('truth_social_posts', str(post.id))] = {
                     "content": post.clean_content, 
@@ -455,12 +628,12 @@ class SNSService:
         truth_trend_ids = post_ids_by_source.get('truth_social_trends', [])
         if truth_trend_ids:
             # TruthSocialTrend 모델에 미디어 컬럼이 추가되어 Posts와 동일하게 처리합니다.
-            truth_trends = db.query(
+            truth_trends = (await db.execute(select(
                 TruthSocialTrend.id, 
                 TruthSocialTrend.clean_content, 
                 TruthSocialTrend.has_media, 
                 TruthSocialTrend.media_attachments
-            ).filter(TruthSocialTrend.id.in_(truth_trend_ids)).all()
+            ).where(TruthSocialTrend.id.in_(truth_trend_ids)))).all()
             for trend in truth_trends:
                 original_posts_map[('truth_social_trends', str(trend.id))] = {
                     "content": trend.clean_content, 
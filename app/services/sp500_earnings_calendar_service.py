@@ -1,56 +1,231 @@
 # app/services/sp500_earnings_calendar_service.py
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, asc, desc, func
-from typing import List, Optional, Tuple, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, asc, desc, func, select, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import aliased
+from typing import List, Optional, Tuple, Dict, Any, AsyncIterator, Callable, TypeVar
 from datetime import date, datetime, timedelta
+import functools
+import logging
+import time
 
-from app.models.sp500_earnings_calendar_model import SP500EarningsCalendar
+from app.database import AsyncSessionLocal
+from app.models.sp500_earnings_calendar_model import SP500EarningsCalendar, SP500_EARNINGS_SEARCH_TSV_EXPRESSION
 from app.schemas.sp500_earnings_calendar_schema import SP500EarningsCalendarQueryParams
+from app.utils.pagination_utils import estimated_count
+from app.utils.materialized_view_utils import MaterializedViewRefresher
+from app.utils.db_schema_utils import OptionalColumn
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ETag 버전 메모리 캐시 TTL (초) - 조건부 요청마다 집계 쿼리가 나가지 않도록 재사용
+DATA_VERSION_TTL = 30
+
+_data_version_cache: Dict[str, Any] = {"value": None, "expires_at": 0.0}
+_upcoming_data_version_cache: Dict[str, Any] = {"value": None, "expires_at": 0.0}
+
+
+# =========================
+# 이번 주/향후 실적 일정 사전 계산 (materialized view)
+# =========================
+# /weekly, /upcoming은 모든 사용자에게 같은 결과이므로 이번 주 월요일부터 1년 뒤까지의
+# 일정만 담은 작은 뷰를 주기적으로 갱신해 두고 조회합니다.
+# 뷰가 준비되지 않은 경우(권한 부족 등)에는 원본 테이블을 조회합니다.
+
+UPCOMING_EARNINGS_VIEW_REFRESH_INTERVAL = 900  # 초
+
+# 여러 워커가 동시에 갱신하지 않도록 사용하는 advisory lock 키
+_UPCOMING_EARNINGS_VIEW_LOCK_KEY = 7_310_043
+
+_UPCOMING_EARNINGS_VIEW = "sp500_earnings_upcoming"
+
+_UPCOMING_EARNINGS_VIEW_DDL = (
+    f"""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS {_UPCOMING_EARNINGS_VIEW} AS
+    SELECT *
+    FROM sp500_earnings_calendar
+    WHERE report_date >= DATE_TRUNC('week', CURRENT_DATE)::date
+    AND report_date <= CURRENT_DATE + 365
+    """,
+    f"""
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_{_UPCOMING_EARNINGS_VIEW}_id
+    ON {_UPCOMING_EARNINGS_VIEW} (id)
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS idx_{_UPCOMING_EARNINGS_VIEW}_report_date
+    ON {_UPCOMING_EARNINGS_VIEW} (report_date, symbol)
+    """,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _upcoming_earnings_entity():
+    """
+    뷰 행을 SP500EarningsCalendar 객체로 받기 위한 매핑 (컬럼 구성은 원본 테이블과 동일)
+    
+    aliased()는 매퍼 구성을 요구하므로 모든 모델이 로드된 뒤 첫 조회 시점에 생성합니다.
+    """
+    return aliased(
+        SP500EarningsCalendar,
+        table(_UPCOMING_EARNINGS_VIEW, *(column._copy() for column in SP500EarningsCalendar.__table__.columns)),
+        adapt_on_names=True
+    )
+
+
+def _expire_upcoming_data_version() -> None:
+    """갱신된 뷰 기준으로 ETag 버전을 다시 계산하도록 메모리 캐시 만료"""
+    _upcoming_data_version_cache["expires_at"] = 0.0
+
+
+upcoming_earnings_view = MaterializedViewRefresher(
+    label="실적 일정",
+    views=(_UPCOMING_EARNINGS_VIEW,),
+    ddl=_UPCOMING_EARNINGS_VIEW_DDL,
+    lock_key=_UPCOMING_EARNINGS_VIEW_LOCK_KEY,
+    interval=UPCOMING_EARNINGS_VIEW_REFRESH_INTERVAL,
+    on_refresh=_expire_upcoming_data_version
+)
+
+
+# =========================
+# 전문 검색 생성 컬럼 (search_tsv)
+# =========================
+# 컬럼과 GIN 인덱스는 scripts/sql/sp500_earnings_calendar_search_tsv.sql로 추가하고,
+# 앱은 시작 시 존재 여부만 확인합니다 (없으면 검색 시 같은 식을 직접 계산).
+
+earnings_search_tsv_column = OptionalColumn(
+    "sp500_earnings_calendar", "search_tsv", SP500_EARNINGS_SEARCH_TSV_EXPRESSION, TSVECTOR
+)
+
 
 class SP500EarningsCalendarService:
     """S&P 500 실적 발표 캘린더 관련 비즈니스 로직 서비스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def get_all_calendar_events(self, params: SP500EarningsCalendarQueryParams = None) -> Tuple[List[SP500EarningsCalendar], int]:
+    async def iter_in_new_session(self, call: Callable[["SP500EarningsCalendarService"], AsyncIterator[T]]) -> AsyncIterator[T]:
         """
-        모든 실적 발표 일정을 조회 (프론트엔드 캘린더용)
-        날짜 제한 없이 전체 데이터를 반환하되, 필터링 옵션 제공
+        별도 세션에서 서비스의 비동기 이터레이터를 끝까지 소비합니다.
+        
+        StreamingResponse는 핸들러가 반환된 뒤에 본문을 읽으므로,
+        요청 의존성 세션 수명에 의존하지 않도록 스트림 전용 세션을 엽니다.
+        """
+        async with AsyncSessionLocal() as db:
+            async for item in call(SP500EarningsCalendarService(db)):
+                yield item
+    
+    async def get_data_version(self) -> Optional[str]:
+        """
+        실적 캘린더 데이터 버전 조회 (ETag 생성용)
+        
+        응답 전체를 만들지 않고 최신 수정 시간과 행 수만 조회하며,
+        결과는 DATA_VERSION_TTL 동안 메모리에서 재사용합니다.
+        
+        Returns:
+            Optional[str]: 버전 문자열 (데이터가 없으면 None)
+        """
+        if time.monotonic() < _data_version_cache["expires_at"]:
+            return _data_version_cache["value"]
+        
+        last_updated, total = (await self.db.execute(
+            select(func.max(SP500EarningsCalendar.updated_at), func.count())
+        )).one()
+        version = f"{last_updated.isoformat() if last_updated else ''}:{total}" if total else None
+        
+        _data_version_cache["value"] = version
+        _data_version_cache["expires_at"] = time.monotonic() + DATA_VERSION_TTL
+        return version
+    
+    async def get_upcoming_data_version(self) -> Optional[str]:
+        """
+        이번 주/향후 일정 데이터 버전 조회 (ETag 생성용)
+        
+        /weekly, /upcoming은 materialized view를 읽으므로 원본 테이블이 아닌
+        뷰의 최신 수정 시간과 행 수로 버전을 만듭니다. 뷰가 갱신되기 전에는
+        버전도 바뀌지 않아 ETag가 실제로 제공되는 데이터와 일치합니다.
+        뷰가 준비되지 않았으면 원본 테이블 버전(get_data_version)을 사용합니다.
+        
+        Returns:
+            Optional[str]: 버전 문자열 (데이터가 없으면 None)
         """
-        query = self.db.query(SP500EarningsCalendar)
+        if not upcoming_earnings_view.ready:
+            return await self.get_data_version()
+        
+        if time.monotonic() < _upcoming_data_version_cache["expires_at"]:
+            return _upcoming_data_version_cache["value"]
+        
+        source = _upcoming_earnings_entity()
+        last_updated, total = (await self.db.execute(
+            select(func.max(source.updated_at), func.count()).select_from(source)
+        )).one()
+        version = f"view:{last_updated.isoformat() if last_updated else ''}:{total}" if total else None
+        
+        _upcoming_data_version_cache["value"] = version
+        _upcoming_data_version_cache["expires_at"] = time.monotonic() + DATA_VERSION_TTL
+        return version
+    
+    def _calendar_events_query(self, params: Optional[SP500EarningsCalendarQueryParams]):
+        """전체 캘린더 조회의 필터 조건을 적용한 select 구문 (정렬/페이징 제외)"""
+        query = select(SP500EarningsCalendar)
         
         if params:
             # 날짜 범위 필터링 (옵션)
             if params.start_date and params.end_date:
-                query = query.filter(
+                query = query.where(
                     and_(
                         SP500EarningsCalendar.report_date >= params.start_date,
                         SP500EarningsCalendar.report_date <= params.end_date
                     )
                 )
             elif params.start_date:
-                query = query.filter(SP500EarningsCalendar.report_date >= params.start_date)
+                query = query.where(SP500EarningsCalendar.report_date >= params.start_date)
             elif params.end_date:
-                query = query.filter(SP500EarningsCalendar.report_date <= params.end_date)
+                query = query.where(SP500EarningsCalendar.report_date <= params.end_date)
             
             # 심볼 필터링
             if params.symbol:
-                query = query.filter(SP500EarningsCalendar.symbol.ilike(f"%{params.symbol.upper()}%"))
+                query = query.where(SP500EarningsCalendar.symbol.ilike(f"%{params.symbol.upper()}%"))
             
             # 섹터 필터링
             if params.sector:
-                query = query.filter(SP500EarningsCalendar.gics_sector.ilike(f"%{params.sector}%"))
+                query = query.where(SP500EarningsCalendar.gics_sector.ilike(f"%{params.sector}%"))
             
             # 예상 수익 존재 여부 필터링
             if params.has_estimate is not None:
                 if params.has_estimate:
-                    query = query.filter(SP500EarningsCalendar.estimate.isnot(None))
+                    query = query.where(SP500EarningsCalendar.estimate.isnot(None))
                 else:
-                    query = query.filter(SP500EarningsCalendar.estimate.is_(None))
+                    query = query.where(SP500EarningsCalendar.estimate.is_(None))
         
-        # 전체 개수 계산
-        total_count = query.count()
+        return query
+    
+    async def get_all_calendar_events(self, params: SP500EarningsCalendarQueryParams = None,
+                                      exact_count: bool = False) -> Tuple[List[SP500EarningsCalendar], int]:
+        """
+        모든 실적 발표 일정을 조회 (프론트엔드 캘린더용)
+        날짜 제한 없이 전체 데이터를 반환하되, 필터링 옵션 제공
+        
+        Args:
+            params: 필터/페이징 파라미터
+            exact_count: True면 COUNT(*)로 정확한 전체 개수 계산 (기본은 추정치)
+        """
+        query = self._calendar_events_query(params)
+        
+        # 전체 개수 계산 (기본은 실행 계획 기반 추정치)
+        if exact_count:
+            count_query = select(func.count()).select_from(query.subquery())
+            total_count = (await self.db.execute(count_query)).scalar_one()
+        else:
+            total_count = await estimated_count(self.db, query, "sp500_earnings", "list", {
+                "start_date": params.start_date if params else None,
+                "end_date": params.end_date if params else None,
+                "symbol": params.symbol if params else None,
+                "sector": params.sector if params else None,
+                "has_estimate": params.has_estimate if params else None
+            })
         
         # 정렬 및 페이징
         query = query.order_by(asc(SP500EarningsCalendar.report_date), asc(SP500EarningsCalendar.symbol))
@@ -58,13 +233,30 @@ class SP500EarningsCalendarService:
         if params and params.limit and params.offset is not None:
             query = query.offset(params.offset).limit(params.limit)
         
-        results = query.all()
+        results = (await self.db.execute(query)).scalars().all()
         
         # 계산된 속성들은 @property로 자동 제공됨 (별도 할당 불필요)
         
         return results, total_count
     
-    def get_weekly_events(self) -> Tuple[List[SP500EarningsCalendar], date, date]:
+    async def iter_calendar_events(self, params: SP500EarningsCalendarQueryParams = None,
+                                   batch_size: int = 500) -> AsyncIterator[SP500EarningsCalendar]:
+        """
+        전체 캘린더 조회와 같은 조건의 실적 일정을 한 건씩 순차 반환합니다 (NDJSON 스트리밍용).
+        
+        서버 측 커서에서 batch_size개씩 가져오므로 limit이 커도 전체 결과를 메모리에 올리지 않습니다.
+        """
+        query = self._calendar_events_query(params).order_by(
+            asc(SP500EarningsCalendar.report_date), asc(SP500EarningsCalendar.symbol)
+        )
+        if params and params.limit and params.offset is not None:
+            query = query.offset(params.offset).limit(params.limit)
+        
+        result = await self.db.stream_scalars(query.execution_options(yield_per=batch_size))
+        async for event in result:
+            yield event
+    
+    async def get_weekly_events(self) -> Tuple[List[SP500EarningsCalendar], date, date]:
         """
         이번 주 실적 발표 일정 조회 (캘린더 하단 위젯용)
         """
@@ -74,97 +266,107 @@ class SP500EarningsCalendarService:
         # 이번 주 끝 (일요일)
         week_end = week_start + timedelta(days=6)
         
-        query = self.db.query(SP500EarningsCalendar).filter(
+        # 뷰가 준비되어 있으면 사전 계산된 뷰를 조회
+        source = _upcoming_earnings_entity() if upcoming_earnings_view.ready else SP500EarningsCalendar
+        
+        query = select(source).where(
             and_(
-                SP500EarningsCalendar.report_date >= week_start,
-                SP500EarningsCalendar.report_date <= week_end
+                source.report_date >= week_start,
+                source.report_date <= week_end
             )
-        ).order_by(asc(SP500EarningsCalendar.report_date), asc(SP500EarningsCalendar.symbol))
+        ).order_by(asc(source.report_date), asc(source.symbol))
         
-        results = query.all()
+        results = (await self.db.execute(query)).scalars().all()
         
         # 계산된 속성들은 @property로 자동 제공됨 (별도 할당 불필요)
         
         return results, week_start, week_end
     
-    def get_earnings_by_symbol(self, symbol: str, limit: int = 10) -> List[SP500EarningsCalendar]:
+    async def get_earnings_by_symbol(self, symbol: str, limit: int = 10) -> Tuple[List[SP500EarningsCalendar], int]:
         """
-        특정 심볼의 실적 발표 일정을 조회 (옵션 기능)
+        특정 심볼의 실적 발표 일정과 전체 개수를 조회 (옵션 기능)
+        
+        전체 개수는 count(*) OVER ()로 같은 쿼리에서 함께 계산하므로
+        개수를 세기 위해 전체 이력을 다시 조회하지 않습니다.
         """
-        query = self.db.query(SP500EarningsCalendar).filter(
+        query = select(
+            SP500EarningsCalendar,
+            func.count().over().label("total_count")
+        ).where(
             SP500EarningsCalendar.symbol == symbol.upper()
         ).order_by(desc(SP500EarningsCalendar.report_date))
         
         if limit:
             query = query.limit(limit)
         
-        results = query.all()
+        rows = (await self.db.execute(query)).all()
         
         # 계산된 속성들은 @property로 자동 제공됨 (별도 할당 불필요)
+        results = [row[0] for row in rows]
+        total_count = rows[0].total_count if rows else 0
         
-        return results
+        return results, total_count
     
-    def get_calendar_event_by_id(self, calendar_id: int) -> Optional[SP500EarningsCalendar]:
+    async def get_calendar_event_by_id(self, calendar_id: int) -> Optional[SP500EarningsCalendar]:
         """
         특정 ID의 실적 캘린더 이벤트 조회
         """
-        result = self.db.query(SP500EarningsCalendar).filter(
-            SP500EarningsCalendar.id == calendar_id
-        ).first()
+        result = await self.db.get(SP500EarningsCalendar, calendar_id)
         
         # 계산된 속성들은 @property로 자동 제공됨 (별도 할당 불필요)
         
         return result
     
-    def get_upcoming_events(self, days: int = 30) -> List[SP500EarningsCalendar]:
+    async def get_upcoming_events(self, days: int = 30) -> List[SP500EarningsCalendar]:
         """
         향후 N일 내의 실적 발표 일정 조회
         """
         today = date.today()
         future_date = today + timedelta(days=days)
         
-        query = self.db.query(SP500EarningsCalendar).filter(
+        # 뷰가 준비되어 있으면 사전 계산된 뷰를 조회 (뷰는 1년 뒤까지 포함)
+        source = _upcoming_earnings_entity() if upcoming_earnings_view.ready else SP500EarningsCalendar
+        
+        query = select(source).where(
             and_(
-                SP500EarningsCalendar.report_date >= today,
-                SP500EarningsCalendar.report_date <= future_date
+                source.report_date >= today,
+                source.report_date <= future_date
             )
-        ).order_by(asc(SP500EarningsCalendar.report_date), asc(SP500EarningsCalendar.symbol))
+        ).order_by(asc(source.report_date), asc(source.symbol))
         
-        results = query.all()
+        results = (await self.db.execute(query)).scalars().all()
         
         return results
     
-    def get_calendar_statistics(self) -> Dict[str, Any]:
+    async def get_calendar_statistics(self) -> Dict[str, Any]:
         """
         실적 캘린더 통계 정보 조회
         """
-        # 기본 통계
-        total_events = self.db.query(SP500EarningsCalendar).count()
-        total_companies = self.db.query(func.count(func.distinct(SP500EarningsCalendar.symbol))).scalar()
-        
-        # 예상 수익이 있는 이벤트
-        events_with_estimates = self.db.query(SP500EarningsCalendar).filter(
-            SP500EarningsCalendar.estimate.isnot(None)
-        ).count()
-        
-        # 뉴스가 있는 이벤트
-        events_with_news = self.db.query(SP500EarningsCalendar).filter(
-            SP500EarningsCalendar.total_news_count > 0
-        ).count()
-        
-        # 향후 예정된 이벤트
-        upcoming_events = self.db.query(SP500EarningsCalendar).filter(
-            SP500EarningsCalendar.report_date >= date.today()
-        ).count()
-        
-        # 포함된 섹터 목록
-        sectors = self.db.query(func.distinct(SP500EarningsCalendar.gics_sector)).filter(
-            SP500EarningsCalendar.gics_sector.isnot(None)
-        ).all()
-        sectors_list = [sector[0] for sector in sectors if sector[0]]
-        
-        # 마지막 업데이트 시간
-        last_updated = self.db.query(func.max(SP500EarningsCalendar.updated_at)).scalar()
+        # 개수 집계와 섹터 목록을 FILTER/array_agg로 한 번에 계산
+        stats_query = select(
+            func.count().label("total_events"),
+            func.count(func.distinct(SP500EarningsCalendar.symbol)).label("total_companies"),
+            # 예상 수익이 있는 이벤트
+            func.count().filter(SP500EarningsCalendar.estimate.isnot(None)).label("events_with_estimates"),
+            # 뉴스가 있는 이벤트
+            func.count().filter(SP500EarningsCalendar.total_news_count > 0).label("events_with_news"),
+            # 향후 예정된 이벤트
+            func.count().filter(SP500EarningsCalendar.report_date >= date.today()).label("upcoming_events"),
+            # 포함된 섹터 목록
+            func.array_agg(func.distinct(SP500EarningsCalendar.gics_sector)).filter(
+                SP500EarningsCalendar.gics_sector.isnot(None)
+            ).label("sectors"),
+            # 마지막 업데이트 시간
+            func.max(SP500EarningsCalendar.updated_at).label("last_updated")
+        )
+        stats = (await self.db.execute(stats_query)).one()
+        total_events = stats.total_events
+        total_companies = stats.total_companies
+        events_with_estimates = stats.events_with_estimates
+        events_with_news = stats.events_with_news
+        upcoming_events = stats.upcoming_events
+        last_updated = stats.last_updated
+        sectors_list = [sector for sector in (stats.sectors or []) if sector]
         
         return {
             "total_companies": total_companies,
@@ -176,37 +378,43 @@ class SP500EarningsCalendarService:
             "last_updated": last_updated
         }
     
-    def search_events(self, keyword: str, limit: int = 50) -> List[SP500EarningsCalendar]:
+    async def search_events(self, keyword: str, limit: int = 50) -> List[SP500EarningsCalendar]:
         """
         키워드로 실적 이벤트 검색 (심볼, 회사명, 이벤트 제목 대상)
+        
+        search_tsv 생성 컬럼의 GIN 인덱스로 단어 검색을 하고,
+        심볼은 입력 중인 접두어(예: "AA")도 찾을 수 있도록 접두어 인덱스로 함께 검색합니다.
         """
-        search_term = f"%{keyword}%"
+        # plainto_tsquery: 일반 텍스트를 검색 쿼리로 변환 (search_tsv와 같은 'english' 설정)
+        ts_query = func.plainto_tsquery('english', keyword)
+        # search_tsv 컬럼이 아직 없는 DB에서는 같은 식을 직접 계산
+        search_tsv = earnings_search_tsv_column.resolve(SP500EarningsCalendar.search_tsv)
         
-        query = self.db.query(SP500EarningsCalendar).filter(
+        query = select(SP500EarningsCalendar).where(
             or_(
-                SP500EarningsCalendar.symbol.ilike(search_term),
-                SP500EarningsCalendar.company_name.ilike(search_term),
-                SP500EarningsCalendar.event_title.ilike(search_term)
+                search_tsv.bool_op('@@')(ts_query),
+                # LIKE 특수문자(%, _)는 autoescape로 이스케이프해 접두어 검색으로만 사용
+                SP500EarningsCalendar.symbol.startswith(keyword.upper(), autoescape=True)
             )
         ).order_by(desc(SP500EarningsCalendar.report_date))
         
         if limit:
             query = query.limit(limit)
         
-        results = query.all()
+        results = (await self.db.execute(query)).scalars().all()
         
         # 계산된 속성은 @property로 자동 제공됨 (별도 할당 불필요)
         return results
     
-    def get_events_by_date(self, target_date: date) -> List[SP500EarningsCalendar]:
+    async def get_events_by_date(self, target_date: date) -> List[SP500EarningsCalendar]:
         """
         특정 날짜의 실적 발표 일정 조회
         """
-        query = self.db.query(SP500EarningsCalendar).filter(
+        query = select(SP500EarningsCalendar).where(
             SP500EarningsCalendar.report_date == target_date
         ).order_by(asc(SP500EarningsCalendar.symbol))
         
-        results = query.all()
+        results = (await self.db.execute(query)).scalars().all()
         
         # 계산된 속성은 @property로 자동 제공됨 (별도 할당 불필요)
         return results
\ No newline at end of file
@@ -1,6 +1,6 @@
 # app/services/sp500_earnings_news_service.py
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, asc, desc, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, asc, desc, func, select
 from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime
 
@@ -11,16 +11,19 @@ from app.schemas.sp500_earnings_news_schema import SP500EarningsNewsQueryParams
 class SP500EarningsNewsService:
     """S&P 500 실적 관련 뉴스 비즈니스 로직 서비스"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def get_news_by_calendar_id(self, calendar_id: int, params: SP500EarningsNewsQueryParams = None) -> Tuple[List[SP500EarningsNews], int]:
+    async def get_news_by_calendar_id(self, calendar_id: int, params: SP500EarningsNewsQueryParams = None) -> Tuple[List[SP500EarningsNews], int, Dict[str, int]]:
         """
         특정 캘린더 ID의 뉴스 목록 조회 (메인 기능)
+        
+        Returns:
+            Tuple: (현재 페이지 뉴스, 전체 개수, 섹션별 전체 개수 {"forecast": n, "reaction": m})
         """
-        query = self.db.query(SP500EarningsNews).filter(
+        query = select(SP500EarningsNews).where(
             SP500EarningsNews.calendar_id == calendar_id
-        ).filter(
+        ).where(
             # 제목/내용 필터링: title이 있고, (summary 또는 content 중 하나라도 있어야 함)
             and_(
                 SP500EarningsNews.title.isnot(None),
@@ -35,40 +38,45 @@ class SP500EarningsNewsService:
         if params:
             # 뉴스 섹션 필터링 (forecast, reaction)
             if params.news_section:
-                query = query.filter(SP500EarningsNews.news_section == params.news_section)
+                query = query.where(SP500EarningsNews.news_section == params.news_section)
             
             # 뉴스 소스 필터링
             if params.source:
-                query = query.filter(SP500EarningsNews.source.ilike(f"%{params.source}%"))
+                query = query.where(SP500EarningsNews.source.ilike(f"%{params.source}%"))
             
             # 게시일 범위 필터링
             if params.start_date and params.end_date:
-                query = query.filter(
+                query = query.where(
                     and_(
                         SP500EarningsNews.published_at >= params.start_date,
                         SP500EarningsNews.published_at <= params.end_date
                     )
                 )
             elif params.start_date:
-                query = query.filter(SP500EarningsNews.published_at >= params.start_date)
+                query = query.where(SP500EarningsNews.published_at >= params.start_date)
             elif params.end_date:
-                query = query.filter(SP500EarningsNews.published_at <= params.end_date)
+                query = query.where(SP500EarningsNews.published_at <= params.end_date)
             
             # 본문 내용 존재 여부 필터링
             if params.has_content is not None:
                 if params.has_content:
-                    query = query.filter(SP500EarningsNews.content.isnot(None))
-                    query = query.filter(SP500EarningsNews.content != '')
+                    # 부분 인덱스(idx_sp500_earnings_news_has_content)와 같은 조건식 사용
+                    query = query.where(SP500EarningsNews.content_present())
                 else:
-                    query = query.filter(
+                    query = query.where(
                         or_(
                             SP500EarningsNews.content.is_(None),
                             SP500EarningsNews.content == ''
                         )
                     )
         
-        # 전체 개수 계산
-        total_count = query.count()
+        # 섹션별 개수를 한 번의 GROUP BY로 계산 (전체 개수는 합계)
+        section_rows = (await self.db.execute(
+            query.with_only_columns(SP500EarningsNews.news_section, func.count())
+            .group_by(SP500EarningsNews.news_section)
+        )).all()
+        section_counts = {section: count for section, count in section_rows}
+        total_count = sum(section_counts.values())
         
         # 정렬 (최신순)
         query = query.order_by(desc(SP500EarningsNews.published_at))
@@ -77,44 +85,33 @@ class SP500EarningsNewsService:
         if params and params.limit and params.offset is not None:
             query = query.offset(params.offset).limit(params.limit)
         
-        results = query.all()
+        results = (await self.db.execute(query)).scalars().all()
         
         # 계산된 속성들은 @property로 정의되어 있어서 별도 설정 불필요
         
-        return results, total_count
+        return results, total_count, {
+            "forecast": section_counts.get("forecast", 0),
+            "reaction": section_counts.get("reaction", 0)
+        }
     
-    def get_news_with_calendar_info(self, calendar_id: int) -> Dict[str, Any]:
-        """
-        캘린더 정보와 함께 뉴스 목록을 반환 (UI 표시용)
+    async def _get_sectioned_news(self, calendar_ids: List[int]) -> Dict[int, Dict[str, List[SP500EarningsNews]]]:
         """
-        # 캘린더 정보 조회
-        calendar_info = self.db.query(SP500EarningsCalendar).filter(
-            SP500EarningsCalendar.id == calendar_id
-        ).first()
+        여러 캘린더 이벤트의 예측/반응 뉴스를 한 번의 쿼리로 조회
         
-        if not calendar_info:
-            return None
+        이벤트마다 섹션별 쿼리를 반복하지 않도록 calendar_id IN (...)으로 묶어 조회한 뒤
+        calendar_id, news_section 별로 나눕니다. (각 목록은 최신순 유지)
         
-        # 예측 뉴스 조회
-        forecast_news = self.db.query(SP500EarningsNews).filter(
-            and_(
-                SP500EarningsNews.calendar_id == calendar_id,
-                SP500EarningsNews.news_section == "forecast",
-                # 제목/내용 필터링: title이 있고, (summary 또는 content 중 하나라도 있어야 함)
-                SP500EarningsNews.title.isnot(None),
-                SP500EarningsNews.title != '',
-                or_(
-                    and_(SP500EarningsNews.summary.isnot(None), SP500EarningsNews.summary != ''),
-                    and_(SP500EarningsNews.content.isnot(None), SP500EarningsNews.content != '')
-                )
-            )
-        ).order_by(desc(SP500EarningsNews.published_at)).all()
+        Returns:
+            Dict[int, Dict[str, List]]: {calendar_id: {"forecast": [...], "reaction": [...]}}
+        """
+        sectioned = {calendar_id: {"forecast": [], "reaction": []} for calendar_id in calendar_ids}
+        if not calendar_ids:
+            return sectioned
         
-        # 반응 뉴스 조회
-        reaction_news = self.db.query(SP500EarningsNews).filter(
+        query = select(SP500EarningsNews).where(
             and_(
-                SP500EarningsNews.calendar_id == calendar_id,
-                SP500EarningsNews.news_section == "reaction",
+                SP500EarningsNews.calendar_id.in_(calendar_ids),
+                SP500EarningsNews.news_section.in_(["forecast", "reaction"]),
                 # 제목/내용 필터링: title이 있고, (summary 또는 content 중 하나라도 있어야 함)
                 SP500EarningsNews.title.isnot(None),
                 SP500EarningsNews.title != '',
@@ -123,7 +120,28 @@ class SP500EarningsNewsService:
                     and_(SP500EarningsNews.content.isnot(None), SP500EarningsNews.content != '')
                 )
             )
-        ).order_by(desc(SP500EarningsNews.published_at)).all()
+        ).order_by(desc(SP500EarningsNews.published_at))
+        news_items = (await self.db.execute(query)).scalars().all()
+        
+        for news in news_items:
+            sectioned[news.calendar_id][news.news_section].append(news)
+        
+        return sectioned
+    
+    async def get_news_with_calendar_info(self, calendar_id: int) -> Dict[str, Any]:
+        """
+        캘린더 정보와 함께 뉴스 목록을 반환 (UI 표시용)
+        """
+        # 캘린더 정보 조회
+        calendar_info = await self.db.get(SP500EarningsCalendar, calendar_id)
+        
+        if not calendar_info:
+            return None
+        
+        # 예측/반응 뉴스 일괄 조회
+        sectioned = (await self._get_sectioned_news([calendar_id]))[calendar_id]
+        forecast_news = sectioned["forecast"]
+        reaction_news = sectioned["reaction"]
         
         # 계산된 속성들은 @property로 정의되어 있어서 별도 설정 불필요
         all_news = forecast_news + reaction_news
@@ -145,11 +163,11 @@ class SP500EarningsNewsService:
             "reaction_news_count": len(reaction_news)
         }
     
-    def get_forecast_news(self, calendar_id: int, limit: int = 20) -> List[SP500EarningsNews]:
+    async def get_forecast_news(self, calendar_id: int, limit: int = 20) -> List[SP500EarningsNews]:
         """
         특정 캘린더 ID의 예측 뉴스만 조회
         """
-        query = self.db.query(SP500EarningsNews).filter(
+        query = select(SP500EarningsNews).where(
             and_(
                 SP500EarningsNews.calendar_id == calendar_id,
                 SP500EarningsNews.news_section == "forecast",
@@ -166,17 +184,17 @@ class SP500EarningsNewsService:
         if limit:
             query = query.limit(limit)
         
-        results = query.all()
+        results = (await self.db.execute(query)).scalars().all()
         
         # 계산된 속성들은 @property로 정의되어 있어서 별도 설정 불필요
         
         return results
     
-    def get_reaction_news(self, calendar_id: int, limit: int = 20) -> List[SP500EarningsNews]:
+    async def get_reaction_news(self, calendar_id: int, limit: int = 20) -> List[SP500EarningsNews]:
         """
         특정 캘린더 ID의 반응 뉴스만 조회
         """
-        query = self.db.query(SP500EarningsNews).filter(
+        query = select(SP500EarningsNews).where(
             and_(
                 SP500EarningsNews.calendar_id == calendar_id,
                 SP500EarningsNews.news_section == "reaction",
@@ -193,13 +211,13 @@ class SP500EarningsNewsService:
         if limit:
             query = query.limit(limit)
         
-        results = query.all()
+        results = (await self.db.execute(query)).scalars().all()
         
         # 계산된 속성들은 @property로 정의되어 있어서 별도 설정 불필요
         
         return results
     
-    def get_weekly_news(self) -> Dict[str, Any]:
+    async def get_weekly_news(self) -> Dict[str, Any]:
         """
         이번 주 실적 이벤트별 뉴스 목록 조회
         earnings_calendar의 weekly 데이터와 연계하여 뉴스까지 함께 제공
@@ -212,47 +230,26 @@ class SP500EarningsNewsService:
         week_end = week_start + timedelta(days=6)  # 일요일
         
         # 이번 주 실적 캘린더 조회
-        weekly_calendar_events = self.db.query(SP500EarningsCalendar).filter(
-            and_(
-                SP500EarningsCalendar.report_date >= week_start,
-                SP500EarningsCalendar.report_date <= week_end
-            )
-        ).order_by(SP500EarningsCalendar.report_date).all()
+        weekly_calendar_events = (await self.db.execute(
+            select(SP500EarningsCalendar).where(
+                and_(
+                    SP500EarningsCalendar.report_date >= week_start,
+                    SP500EarningsCalendar.report_date <= week_end
+                )
+            ).order_by(SP500EarningsCalendar.report_date)
+        )).scalars().all()
         
         earnings_with_news = []
         total_news_count = 0
         total_forecast_count = 0
         total_reaction_count = 0
         
+        # 이번 주 이벤트 전체의 뉴스를 한 번에 조회 (이벤트별 반복 쿼리 방지)
+        news_by_calendar = await self._get_sectioned_news([event.id for event in weekly_calendar_events])
+        
         for calendar_event in weekly_calendar_events:
-            # 각 실적 이벤트의 뉴스 조회
-            forecast_news = self.db.query(SP500EarningsNews).filter(
-                and_(
-                    SP500EarningsNews.calendar_id == calendar_event.id,
-                    SP500EarningsNews.news_section == "forecast",
-                    # 제목/내용 필터링: title이 있고, (summary 또는 content 중 하나라도 있어야 함)
-                    SP500EarningsNews.title.isnot(None),
-                    SP500EarningsNews.title != '',
-                    or_(
-                        and_(SP500EarningsNews.summary.isnot(None), SP500EarningsNews.summary != ''),
-                        and_(SP500EarningsNews.content.isnot(None), SP500EarningsNews.content != '')
-                    )
-                )
-            ).order_by(desc(SP500EarningsNews.published_at)).all()
-            
-            reaction_news = self.db.query(SP500EarningsNews).filter(
-                and_(
-                    SP500EarningsNews.calendar_id == calendar_event.id,
-                    SP500EarningsNews.news_section == "reaction",
-                    # 제목/내용 필터링: title이 있고, (summary 또는 content 중 하나라도 있어야 함)
-                    SP500EarningsNews.title.isnot(None),
-                    SP500EarningsNews.title != '',
-                    or_(
-                        and_(SP500EarningsNews.summary.isnot(None), SP500EarningsNews.summary != ''),
-                        and_(SP500EarningsNews.content.isnot(None), SP500EarningsNews.content != '')
-                    )
-                )
-            ).order_by(desc(SP500EarningsNews.published_at)).all()
+            forecast_news = news_by_calendar[calendar_event.id]["forecast"]
+            reaction_news = news_by_calendar[calendar_event.id]["reaction"]
             
             # 뉴스가 있는 이벤트만 포함하거나, 모든 이벤트를 포함할지 결정
             all_news = forecast_news + reaction_news
@@ -1,4 +1,5 @@
 # app/services/sp500_service.py
+import asyncio
 import logging
 import json
 from typing import List, Dict, Any, Optional
@@ -6,11 +7,188 @@ from datetime import datetime, timedelta
 import pytz
 import redis
 from app.config import settings
-from app.database import get_db
-from app.models.sp500_model import SP500WebsocketTrades
+from sqlalchemy import text
+from app.database import get_db, AsyncSessionLocal
+from app.models.sp500_model import (
+    SP500WebsocketTrades,
+    LATEST_PRICES_WITH_COMPANY_QUERY,
+    LATEST_PRICES_BY_SYMBOLS_QUERY,
+    PREVIOUS_CLOSE_PRICES_QUERY,
+    VOLUME_SINCE_BY_SYMBOLS_QUERY,
+    COMPANY_NAMES_BY_SYMBOLS_QUERY,
+    DISTINCT_SYMBOL_COUNT_QUERY,
+    CHART_RANGE_CONFIG,
+    CHART_SAMPLING_QUERY,
+    LATEST_TRADE_TIME_QUERY,
+    LATEST_TRADE_TIME_BY_SYMBOL_QUERY
+)
+from app.utils.cache_utils import cached_response, single_flight
+from app.utils.materialized_view_utils import MaterializedViewRefresher
 
 logger = logging.getLogger(__name__)
 
+# 시장 요약 통계 캐시 TTL (초) - 전체 거래 테이블 집계라 요청마다 다시 계산하지 않음
+MARKET_SUMMARY_CACHE_TTL = 60
+
+# 심볼 개수 캐시 TTL (초) - S&P 500 종목 구성은 거의 바뀌지 않음
+SYMBOL_COUNT_CACHE_TTL = 3600
+
+# =========================
+# 심볼별 최신 스냅샷 materialized view (상승/하락/거래량 순위용)
+# =========================
+
+LATEST_SNAPSHOT_VIEW_REFRESH_INTERVAL = 15  # 초
+
+# 여러 워커가 동시에 갱신하지 않도록 사용하는 advisory lock 키
+_LATEST_SNAPSHOT_VIEW_LOCK_KEY = 7_310_044
+
+_LATEST_SNAPSHOT_VIEW = "sp500_latest_snapshot"
+
+# 전일 종가 / 24시간 거래량 구간은 SP500WebsocketTrades.previous_close_search_window,
+# get_trading_volume_24h와 같은 규칙 (마지막 거래일 = 주말을 건너뛴 전일, 미국 동부 시간 20시 기준)
+# 확장 구간(12시간 추가)의 최신 행은 기본 구간에 행이 있으면 그 행과 같으므로 확장 구간 하나로 조회
+# 심볼별 최신 거래는 테이블 전체 DISTINCT ON 대신 DISTINCT_SYMBOL_COUNT_QUERY와 같은
+# loose index scan으로 심볼을 건너뛰며 찾고, 심볼마다 (symbol, created_at DESC) 인덱스에서 1행만 읽음
+_LATEST_SNAPSHOT_SELECT = """
+    WITH RECURSIVE bounds AS (
+        SELECT
+            (et_today - CASE EXTRACT(ISODOW FROM et_today) WHEN 1 THEN 3 WHEN 7 THEN 2 ELSE 1 END)
+                + TIME '20:00' AS previous_close_end,
+            (NOW() AT TIME ZONE 'Asia/Seoul') - INTERVAL '24 hours' AS volume_since
+        FROM (SELECT (NOW() AT TIME ZONE 'US/Eastern')::date AS et_today) AS today
+    ),
+    symbols AS (
+        (SELECT symbol FROM sp500_websocket_trades ORDER BY symbol LIMIT 1)
+        UNION ALL
+        SELECT (
+            SELECT trades.symbol FROM sp500_websocket_trades trades
+            WHERE trades.symbol > symbols.symbol
+            ORDER BY trades.symbol LIMIT 1
+        )
+        FROM symbols
+        WHERE symbols.symbol IS NOT NULL
+    ),
+    latest AS (
+        SELECT symbols.symbol, trade.price, trade.volume, trade.created_at
+        FROM symbols
+        CROSS JOIN LATERAL (
+            SELECT trades.price, trades.volume, trades.created_at
+            FROM sp500_websocket_trades trades
+            WHERE trades.symbol = symbols.symbol
+            AND trades.price IS NOT NULL AND trades.price > 0
+            ORDER BY trades.created_at DESC
+            LIMIT 1
+        ) AS trade
+    ),
+    previous_close AS (
+        SELECT DISTINCT ON (trades.symbol) trades.symbol, trades.price
+        FROM sp500_websocket_trades trades, bounds
+        WHERE trades.price IS NOT NULL AND trades.price > 0
+        AND trades.created_at >= bounds.previous_close_end - INTERVAL '5 days 12 hours'
+        AND trades.created_at <= bounds.previous_close_end
+        ORDER BY trades.symbol, trades.created_at DESC
+    ),
+    volume_24h AS (
+        SELECT trades.symbol, SUM(trades.volume) AS total_volume
+        FROM sp500_websocket_trades trades, bounds
+        WHERE trades.created_at >= bounds.volume_since AND trades.volume IS NOT NULL
+        GROUP BY trades.symbol
+    )
+    SELECT
+        latest.symbol,
+        COALESCE(companies.company_name, latest.symbol || ' Inc.') AS company_name,
+        latest.price::float8 AS current_price,
+        (latest.price - previous_close.price)::float8 AS change_amount,
+        ((latest.price - previous_close.price) / previous_close.price * 100)::float8 AS change_percentage,
+        COALESCE(volume_24h.total_volume, 0)::bigint AS volume,
+        latest.created_at AS last_updated
+    FROM latest
+    LEFT JOIN previous_close ON previous_close.symbol = latest.symbol
+    LEFT JOIN volume_24h ON volume_24h.symbol = latest.symbol
+    LEFT JOIN sp500_companies companies ON companies.symbol = latest.symbol
+"""
+
+_LATEST_SNAPSHOT_VIEW_DDL = (
+    f"CREATE MATERIALIZED VIEW IF NOT EXISTS {_LATEST_SNAPSHOT_VIEW} AS {_LATEST_SNAPSHOT_SELECT}",
+    f"""
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_{_LATEST_SNAPSHOT_VIEW}_symbol
+    ON {_LATEST_SNAPSHOT_VIEW} (symbol)
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS idx_{_LATEST_SNAPSHOT_VIEW}_change
+    ON {_LATEST_SNAPSHOT_VIEW} (change_percentage DESC)
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS idx_{_LATEST_SNAPSHOT_VIEW}_volume
+    ON {_LATEST_SNAPSHOT_VIEW} (volume DESC)
+    """,
+    # 검색: symbol/company_name ILIKE '%검색어%'가 pg_trgm GIN 인덱스를 사용 (확장은 etf_model에서 활성화)
+    f"""
+    CREATE INDEX IF NOT EXISTS idx_{_LATEST_SNAPSHOT_VIEW}_symbol_trgm
+    ON {_LATEST_SNAPSHOT_VIEW} USING gin (symbol gin_trgm_ops)
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS idx_{_LATEST_SNAPSHOT_VIEW}_company_name_trgm
+    ON {_LATEST_SNAPSHOT_VIEW} USING gin (company_name gin_trgm_ops)
+    """,
+)
+
+# 카테고리별 순위 조건 (필터, 정렬) - 정렬 + LIMIT은 모두 SQL에서 수행
+_SNAPSHOT_COLUMNS = "symbol, company_name, current_price, change_amount, change_percentage, volume"
+_SNAPSHOT_RANKINGS = {
+    'top_gainers': ("change_percentage > 0", "change_percentage DESC"),
+    'top_losers': ("change_percentage < 0", "change_percentage ASC"),
+    'most_active': ("volume > 0", "volume DESC"),
+}
+
+
+def _snapshot_queries(source: str) -> Dict[str, Any]:
+    """스냅샷 소스(뷰 또는 같은 정의의 서브쿼리)에 대한 순위/검색/시장 요약 구문 생성"""
+    queries = {
+        category: text(f"""
+            SELECT {_SNAPSHOT_COLUMNS} FROM {source}
+            WHERE {condition}
+            ORDER BY {order}
+            LIMIT :limit
+        """)
+        for category, (condition, order) in _SNAPSHOT_RANKINGS.items()
+    }
+    # 심볼 또는 회사명 부분 일치 검색 (LIKE 특수문자는 '/'로 이스케이프한 패턴 사용)
+    queries['search'] = text(f"""
+        SELECT {_SNAPSHOT_COLUMNS} FROM {source}
+        WHERE symbol ILIKE :pattern ESCAPE '/' OR company_name ILIKE :pattern ESCAPE '/'
+        ORDER BY symbol
+        LIMIT :limit
+    """)
+    # 시장 요약: 거래 테이블 전체 집계 대신 심볼별 최신가(약 500행)와 24시간 거래량으로 계산
+    # total_trades는 COUNT(*) 대신 pg_class.reltuples 추정치 (market_summary_statement와 같은 규칙)
+    queries['summary'] = text(f"""
+        SELECT
+            (SELECT GREATEST(reltuples, 0)::bigint FROM pg_class
+             WHERE oid = 'sp500_websocket_trades'::regclass) AS total_trades,
+            AVG(current_price) AS avg_price,
+            MAX(current_price) AS max_price,
+            MIN(current_price) AS min_price,
+            SUM(volume)::bigint AS total_volume,
+            MAX(last_updated) AS latest_update
+        FROM {source}
+    """)
+    return queries
+
+
+# 뷰가 준비되면 뷰에서, 준비 전(최초 생성 전/실패 시)에는 같은 정의를 서브쿼리로 직접 실행
+_SNAPSHOT_VIEW_QUERIES = _snapshot_queries(_LATEST_SNAPSHOT_VIEW)
+_SNAPSHOT_LIVE_QUERIES = _snapshot_queries(f"({_LATEST_SNAPSHOT_SELECT}) AS snapshot")
+
+latest_snapshot_view = MaterializedViewRefresher(
+    label="SP500 최신 스냅샷",
+    views=(_LATEST_SNAPSHOT_VIEW,),
+    ddl=_LATEST_SNAPSHOT_VIEW_DDL,
+    lock_key=_LATEST_SNAPSHOT_VIEW_LOCK_KEY,
+    interval=LATEST_SNAPSHOT_VIEW_REFRESH_INTERVAL
+)
+
+
 # =========================
 # 시장 시간 체크 클래스
 # =========================
@@ -117,7 +295,7 @@ class SP500Service:
     # 주식 리스트 API
     # =========================
     
-    def get_stock_list(self, limit: int = 500) -> Dict[str, Any]:
+    async def get_stock_list(self, limit: int = 500) -> Dict[str, Any]:
         """
         주식 리스트 페이지용 전체 주식 현재가 조회
         
@@ -131,10 +309,13 @@ class SP500Service:
             self.stats["api_requests"] += 1
             self.stats["last_request"] = datetime.now(pytz.UTC)
             
-            db = next(get_db())
-            
-            # JOIN을 통해 현재가 + 회사정보 조회
-            stock_data_with_company = SP500WebsocketTrades.get_all_current_prices_with_company_info(db, limit)
+            async with AsyncSessionLocal() as db:
+                # JOIN을 통해 현재가 + 회사정보 조회
+                stock_data_with_company = await self._fetch_latest_prices_with_company(db, limit)
+                
+                # 배치 쿼리로 성능 최적화
+                symbols = [stock_data['symbol'] for stock_data in stock_data_with_company]
+                batch_change_info = await self._fetch_price_changes(db, symbols)
             
             if not stock_data_with_company:
                 logger.warning("주식 현재가 데이터 없음")
@@ -145,12 +326,6 @@ class SP500Service:
                     'message': 'No stock data available'
                 }
             
-            # 심볼 리스트 추출
-            symbols = [stock_data['symbol'] for stock_data in stock_data_with_company]
-            
-            # 배치 쿼리로 성능 최적화
-            batch_change_info = SP500WebsocketTrades.get_batch_price_changes(db, symbols)
-            
             logger.info(f"🔄 SP500 배치 처리 완료: {len(batch_change_info)}/{len(symbols)}개")
             
             # 각 주식의 변동 정보 조합
@@ -207,14 +382,12 @@ class SP500Service:
                 'market_status': self.market_checker.get_market_status(),
                 'error': str(e)
             }
-        finally:
-            db.close()
     
     # =========================
     # 개별 주식 정보 API
     # =========================
     
-    def get_stock_basic_info(self, symbol: str) -> Dict[str, Any]:
+    async def get_stock_basic_info(self, symbol: str) -> Dict[str, Any]:
         """
         개별 주식 기본 정보 조회 (차트 데이터 제외)
         
@@ -229,34 +402,17 @@ class SP500Service:
             self.stats["last_request"] = datetime.now(pytz.UTC)
             
             symbol = symbol.upper()
-            db = next(get_db())
             
-            # 현재가 및 변동 정보 조회
-            change_info = SP500WebsocketTrades.get_price_change_info(db, symbol)
+            async with AsyncSessionLocal() as db:
+                basic_info = await self._fetch_basic_info(db, [symbol])
             
-            if not change_info['current_price']:
+            if symbol not in basic_info:
                 return {
                     'symbol': symbol,
                     'error': f'No data found for symbol {symbol}'
                 }
             
-            # 회사 기본 정보 조회
-            company_name = self._get_company_name(symbol)
-            
-            self.stats["db_queries"] += 1
-            
-            return {
-                'symbol': symbol,
-                'company_name': company_name,
-                'current_price': change_info['current_price'],
-                'change_amount': change_info['change_amount'],
-                'change_percentage': change_info['change_percentage'],
-                'volume': change_info['volume'],
-                'previous_close': change_info['previous_close'],
-                'is_positive': change_info['change_amount'] > 0 if change_info['change_amount'] else None,
-                'market_status': self.market_checker.get_market_status(),
-                'last_updated': change_info['last_updated']
-            }
+            return basic_info[symbol]
             
         except Exception as e:
             logger.error(f"❌ {symbol} 주식 기본 정보 조회 실패: {e}")
@@ -265,13 +421,13 @@ class SP500Service:
                 'symbol': symbol,
                 'error': str(e)
             }
-        finally:
-            db.close()
     
-    def get_chart_data_only(self, symbol: str, timeframe: str = '1D') -> Dict[str, Any]:
+    async def get_chart_data_only(self, symbol: str, timeframe: str = '1D') -> Dict[str, Any]:
         """
         주식 차트 데이터만 조회
         
+        최신 거래 시각 기준 범위를 SQL에서 샘플링합니다 (SP500WebsocketTrades.get_chart_data_by_timeframe과 같은 규칙).
+        
         Args:
             symbol: 주식 심볼
             timeframe: 차트 시간대 ('1M', '5M', '1H', '1D', '1W', '1MO')
@@ -284,14 +440,25 @@ class SP500Service:
             self.stats["last_request"] = datetime.now(pytz.UTC)
             
             symbol = symbol.upper()
-            db = next(get_db())
+            config = CHART_RANGE_CONFIG.get(timeframe, CHART_RANGE_CONFIG['1D'])
             
-            # 차트 데이터 조회
-            chart_data = SP500WebsocketTrades.get_chart_data_by_timeframe(
-                db, symbol, timeframe, limit=200
-            )
+            async with AsyncSessionLocal() as db:
+                latest_time = (await db.execute(LATEST_TRADE_TIME_BY_SYMBOL_QUERY, {"symbol": symbol})).scalar()
+                
+                rows = []
+                if latest_time:
+                    start_time = latest_time - config['range']
+                    result = await db.execute(CHART_SAMPLING_QUERY, {
+                        'symbol': symbol,
+                        'start_time': start_time.replace(tzinfo=None),
+                        'interval': config['interval_minutes'],
+                        'limit': 200
+                    })
+                    rows = result.all()
             
-            if not chart_data:
+            self.stats["db_queries"] += 1
+            
+            if not rows:
                 # 데이터가 없어도 정상 응답 (시장 마감 중일 수 있음)
                 return {
                     'symbol': symbol,
@@ -304,19 +471,16 @@ class SP500Service:
                 }
             
             # 차트 데이터 포맷 변환
-            formatted_chart_data = []
-            for trade in chart_data:
-                formatted_timestamp = self._format_timestamp_by_timeframe(trade.created_at, timeframe)
-                
-                formatted_chart_data.append({
-                    'timestamp': formatted_timestamp,
-                    'price': float(trade.price),
-                    'volume': trade.volume,
-                    'datetime': trade.created_at.isoformat(),
-                    'raw_timestamp': trade.timestamp_ms
-                })
-            
-            self.stats["db_queries"] += 1
+            formatted_chart_data = [
+                {
+                    'timestamp': self._format_timestamp_by_timeframe(row.created_at, timeframe),
+                    'price': float(row.price),
+                    'volume': row.volume,
+                    'datetime': row.created_at.isoformat(),
+                    'raw_timestamp': row.timestamp_ms
+                }
+                for row in rows
+            ]
             
             return {
                 'symbol': symbol,
@@ -336,10 +500,63 @@ class SP500Service:
                 'chart_data': [],
                 'error': str(e)
             }
-        finally:
-            db.close()
     
-    def get_stock_detail(self, symbol: str, timeframe: str = '1D') -> Dict[str, Any]:
+    async def get_data_version(self, symbol: Optional[str] = None) -> Optional[str]:
+        """
+        주식 데이터 버전 조회 (ETag 생성용)
+        
+        차트 범위는 최신 거래 시각 기준으로 정해지므로, 차트를 만들지 않고 그 시각만 조회합니다.
+        symbol이 없으면 전체 최신 거래 시각 + 전일 종가 기준 시점을 버전으로 사용합니다
+        (순위/개요 응답은 최신 거래와 전일 종가로만 결정되며, 거래가 없어도 날짜가 바뀌면 기준 시점이 바뀜).
+        
+        Args:
+            symbol: 주식 심볼 (None이면 전체 목록용 버전)
+            
+        Returns:
+            Optional[str]: 버전 문자열 (데이터가 없으면 None)
+        """
+        async with AsyncSessionLocal() as db:
+            if symbol:
+                result = await db.execute(LATEST_TRADE_TIME_BY_SYMBOL_QUERY, {"symbol": symbol.upper()})
+            else:
+                result = await db.execute(LATEST_TRADE_TIME_QUERY)
+            latest = result.scalar()
+        
+        if not latest:
+            return None
+        if symbol:
+            return latest.isoformat()
+        
+        _, previous_close_end = SP500WebsocketTrades.previous_close_search_window()
+        return f"{latest.isoformat()}:{previous_close_end.isoformat()}"
+    
+    async def get_stocks_basic_info(self, symbols: List[str]) -> Dict[str, Any]:
+        """
+        여러 주식의 기본 정보 일괄 조회 (관심 종목 목록용)
+        
+        심볼 수와 관계없이 고정 개수의 배치 쿼리로 처리합니다.
+        
+        Args:
+            symbols: 주식 심볼 리스트 (대문자)
+            
+        Returns:
+            Dict[str, Any]: {'stocks': {symbol: 기본 정보}} - 데이터가 없는 심볼은 제외
+        """
+        try:
+            self.stats["api_requests"] += 1
+            self.stats["last_request"] = datetime.now(pytz.UTC)
+            
+            async with AsyncSessionLocal() as db:
+                basic_info = await self._fetch_basic_info(db, symbols)
+            
+            return {'stocks': basic_info}
+            
+        except Exception as e:
+            logger.error(f"❌ 주식 기본 정보 일괄 조회 실패 ({len(symbols)}개): {e}")
+            self.stats["errors"] += 1
+            return {'stocks': {}, 'error': str(e)}
+    
+    async def get_stock_detail(self, symbol: str, timeframe: str = '1D') -> Dict[str, Any]:
         """
         개별 주식 상세 정보 조회 (기본 정보 + 차트)
         
@@ -352,12 +569,12 @@ class SP500Service:
         """
         try:
             # 기본 정보 조회
-            basic_info = self.get_stock_basic_info(symbol)
+            basic_info = await self.get_stock_basic_info(symbol)
             if basic_info.get('error'):
                 return basic_info
             
             # 차트 데이터 조회
-            chart_info = self.get_chart_data_only(symbol, timeframe)
+            chart_info = await self.get_chart_data_only(symbol, timeframe)
             
             # 두 정보 합치기
             combined_result = {
@@ -389,35 +606,12 @@ class SP500Service:
     # 카테고리별 주식 조회 API
     # =========================
     
-    def get_top_gainers(self, limit: int = 20) -> Dict[str, Any]:
+    async def get_top_gainers(self, limit: int = 20) -> Dict[str, Any]:
         """상위 상승 종목 조회"""
         try:
             self.stats["api_requests"] += 1
             
-            db = next(get_db())
-            
-            # 회사 정보 포함해서 조회
-            all_stocks_with_company = SP500WebsocketTrades.get_all_current_prices_with_company_info(db, limit * 3)
-            
-            gainers = []
-            for stock_data in all_stocks_with_company:
-                change_info = SP500WebsocketTrades.get_price_change_info(db, stock_data['symbol'])
-                
-                # 상승 종목만 필터링
-                if change_info['change_percentage'] and change_info['change_percentage'] > 0:
-                    stock_item = {
-                        'symbol': stock_data['symbol'],
-                        'company_name': stock_data['company_name'],
-                        'current_price': change_info['current_price'],
-                        'change_amount': change_info['change_amount'],
-                        'change_percentage': change_info['change_percentage'],
-                        'volume': change_info['volume']
-                    }
-                    gainers.append(stock_item)
-            
-            # 상승률 기준 정렬
-            gainers.sort(key=lambda x: x['change_percentage'], reverse=True)
-            gainers = gainers[:limit]
+            gainers = await self._fetch_snapshot_ranking('top_gainers', limit)
             
             return {
                 'category': 'top_gainers',
@@ -430,37 +624,13 @@ class SP500Service:
             logger.error(f"❌ 상위 상승 종목 조회 실패: {e}")
             self.stats["errors"] += 1
             return {'category': 'top_gainers', 'stocks': [], 'error': str(e)}
-        finally:
-            db.close()
     
-    def get_top_losers(self, limit: int = 20) -> Dict[str, Any]:
+    async def get_top_losers(self, limit: int = 20) -> Dict[str, Any]:
         """상위 하락 종목 조회"""
         try:
             self.stats["api_requests"] += 1
             
-            db = next(get_db())
-            
-            all_stocks_with_company = SP500WebsocketTrades.get_all_current_prices_with_company_info(db, limit * 3)
-            
-            losers = []
-            for stock_data in all_stocks_with_company:
-                change_info = SP500WebsocketTrades.get_price_change_info(db, stock_data['symbol'])
-                
-                # 하락 종목만 필터링
-                if change_info['change_percentage'] and change_info['change_percentage'] < 0:
-                    stock_item = {
-                        'symbol': stock_data['symbol'],
-                        'company_name': stock_data['company_name'],
-                        'current_price': change_info['current_price'],
-                        'change_amount': change_info['change_amount'],
-                        'change_percentage': change_info['change_percentage'],
-                        'volume': change_info['volume']
-                    }
-                    losers.append(stock_item)
-            
-            # 하락률 기준 정렬
-            losers.sort(key=lambda x: x['change_percentage'])
-            losers = losers[:limit]
+            losers = await self._fetch_snapshot_ranking('top_losers', limit)
             
             return {
                 'category': 'top_losers',
@@ -473,36 +643,13 @@ class SP500Service:
             logger.error(f"❌ 상위 하락 종목 조회 실패: {e}")
             self.stats["errors"] += 1
             return {'category': 'top_losers', 'stocks': [], 'error': str(e)}
-        finally:
-            db.close()
     
-    def get_most_active(self, limit: int = 20) -> Dict[str, Any]:
+    async def get_most_active(self, limit: int = 20) -> Dict[str, Any]:
         """가장 활발한 거래 종목 조회"""
         try:
             self.stats["api_requests"] += 1
             
-            db = next(get_db())
-            
-            all_stocks_with_company = SP500WebsocketTrades.get_all_current_prices_with_company_info(db, limit * 2)
-            
-            active_stocks = []
-            for stock_data in all_stocks_with_company:
-                change_info = SP500WebsocketTrades.get_price_change_info(db, stock_data['symbol'])
-                
-                if change_info['volume'] and change_info['volume'] > 0:
-                    stock_item = {
-                        'symbol': stock_data['symbol'],
-                        'company_name': stock_data['company_name'],
-                        'current_price': change_info['current_price'],
-                        'change_amount': change_info['change_amount'],
-                        'change_percentage': change_info['change_percentage'],
-                        'volume': change_info['volume']
-                    }
-                    active_stocks.append(stock_item)
-            
-            # 거래량 기준 정렬
-            active_stocks.sort(key=lambda x: x['volume'], reverse=True)
-            active_stocks = active_stocks[:limit]
+            active_stocks = await self._fetch_snapshot_ranking('most_active', limit)
             
             return {
                 'category': 'most_active',
@@ -515,35 +662,35 @@ class SP500Service:
             logger.error(f"❌ 활발한 거래 종목 조회 실패: {e}")
             self.stats["errors"] += 1
             return {'category': 'most_active', 'stocks': [], 'error': str(e)}
-        finally:
-            db.close()
     
     # =========================
     # 시장 요약 정보 API
     # =========================
     
-    def get_market_overview(self) -> Dict[str, Any]:
-        """전체 시장 개요 조회"""
+    async def get_market_overview(self) -> Dict[str, Any]:
+        """
+        전체 시장 개요 조회
+        
+        시장 요약과 상위 종목 요약은 서로 독립적인 조회이므로
+        각자 커넥션 풀에서 세션을 받아 asyncio.gather로 동시에 실행합니다.
+        """
         try:
             self.stats["api_requests"] += 1
             
-            db = next(get_db())
-            
-            # 기본 시장 요약 정보
-            market_summary = SP500WebsocketTrades.get_market_summary(db)
-            
-            # 상위 종목들 요약 조회
-            top_gainers = self.get_top_gainers(5)['stocks']
-            top_losers = self.get_top_losers(5)['stocks']
-            most_active = self.get_most_active(5)['stocks']
+            market_summary, top_gainers, top_losers, most_active = await asyncio.gather(
+                self._fetch_market_summary(),
+                self.get_top_gainers(5),
+                self.get_top_losers(5),
+                self.get_most_active(5)
+            )
             
             return {
                 'market_summary': market_summary,
                 'market_status': self.market_checker.get_market_status(),
                 'highlights': {
-                    'top_gainers': top_gainers,
-                    'top_losers': top_losers,
-                    'most_active': most_active
+                    'top_gainers': top_gainers['stocks'],
+                    'top_losers': top_losers['stocks'],
+                    'most_active': most_active['stocks']
                 },
                 'last_updated': datetime.now(pytz.UTC).isoformat()
             }
@@ -556,49 +703,17 @@ class SP500Service:
                 'market_status': self.market_checker.get_market_status(),
                 'error': str(e)
             }
-        finally:
-            db.close()
     
     # =========================
     # 검색 API
     # =========================
     
-    def search_stocks(self, query: str, limit: int = 20) -> Dict[str, Any]:
+    async def search_stocks(self, query: str, limit: int = 20) -> Dict[str, Any]:
         """주식 검색 (심볼 또는 회사명)"""
         try:
             self.stats["api_requests"] += 1
             
-            db = next(get_db())
-            
-            # 전체 주식 데이터 조회
-            all_stocks = SP500WebsocketTrades.get_all_current_prices(db, 500)
-            
-            # 검색어 매칭
-            search_results = []
-            query_upper = query.upper()
-            
-            for trade in all_stocks:
-                company_name = self._get_company_name(trade.symbol)
-                
-                # 심볼 또는 회사명 매칭
-                if (query_upper in trade.symbol.upper() or 
-                    query_upper in company_name.upper()):
-                    
-                    change_info = SP500WebsocketTrades.get_price_change_info(db, trade.symbol)
-                    
-                    stock_data = {
-                        'symbol': trade.symbol,
-                        'company_name': company_name,
-                        'current_price': change_info['current_price'],
-                        'change_amount': change_info['change_amount'],
-                        'change_percentage': change_info['change_percentage'],
-                        'volume': change_info['volume']
-                    }
-                    search_results.append(stock_data)
-            
-            # 심볼 알파벳 순 정렬
-            search_results.sort(key=lambda x: x['symbol'])
-            search_results = search_results[:limit]
+            search_results = await self._search_snapshot(query, limit)
             
             return {
                 'query': query,
@@ -616,8 +731,206 @@ class SP500Service:
                 'total_count': 0,
                 'error': str(e)
             }
-        finally:
-            db.close()
+    
+    # =========================
+    # 비동기 조회 헬퍼 (AsyncSession)
+    # =========================
+    
+    async def _fetch_latest_prices_with_company(self, db, limit: int) -> List[Dict[str, Any]]:
+        """
+        심볼별 최신 거래 + 회사 정보 조회
+        
+        서버 측 커서(db.stream)로 200행씩 가져오며 바로 딕셔너리로 변환하므로
+        limit=500 목록에서도 전체 결과 버퍼와 변환 결과를 동시에 들고 있지 않습니다.
+        """
+        result = await db.stream(
+            LATEST_PRICES_WITH_COMPANY_QUERY.execution_options(yield_per=200), {"limit": limit}
+        )
+        self.stats["db_queries"] += 1
+        return [SP500WebsocketTrades.format_company_price_row(row) async for row in result]
+    
+    async def _fetch_previous_close_prices(self, db, symbols: List[str]) -> Dict[str, float]:
+        """
+        여러 심볼의 전일 종가 배치 조회
+        
+        SP500WebsocketTrades.get_batch_previous_close_prices와 같은 구간 규칙을 사용하고,
+        구간 내 데이터가 없는 심볼만 12시간 확장 구간으로 한 번 더 조회합니다.
+        """
+        search_start, search_end = SP500WebsocketTrades.previous_close_search_window()
+        
+        result = await db.execute(PREVIOUS_CLOSE_PRICES_QUERY, {
+            "symbols": symbols,
+            "search_start": search_start,
+            "search_end": search_end
+        })
+        previous_prices = {row.symbol: float(row.price) for row in result}
+        
+        missing_symbols = [symbol for symbol in symbols if symbol not in previous_prices]
+        if missing_symbols:
+            result = await db.execute(PREVIOUS_CLOSE_PRICES_QUERY, {
+                "symbols": missing_symbols,
+                "search_start": search_start - timedelta(hours=12),
+                "search_end": search_end
+            })
+            previous_prices.update({row.symbol: float(row.price) for row in result})
+        
+        return previous_prices
+    
+    async def _fetch_price_changes(self, db, symbols: List[str],
+                                   include_volume_24h: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 심볼의 가격 변동 정보 배치 조회 (심볼당 쿼리 없이 고정 개수의 쿼리로 처리)
+        
+        Args:
+            db: AsyncSession
+            symbols: 조회할 심볼 리스트
+            include_volume_24h: volume을 최신 거래량 대신 24시간 누적 거래량으로 채울지 여부
+            
+        Returns:
+            Dict[str, Dict]: {symbol: price_change_info}
+        """
+        if not symbols:
+            return {}
+        
+        symbols = [symbol.upper() for symbol in symbols]
+        
+        current_rows = (await db.execute(LATEST_PRICES_BY_SYMBOLS_QUERY, {"symbols": symbols})).all()
+        previous_close_prices = await self._fetch_previous_close_prices(db, symbols)
+        change_info = SP500WebsocketTrades.combine_price_changes(current_rows, previous_close_prices)
+        
+        if include_volume_24h:
+            # get_trading_volume_24h와 동일하게 한국 시간 기준 24시간
+            since_24h = datetime.now(pytz.timezone('Asia/Seoul')) - timedelta(hours=24)
+            result = await db.execute(VOLUME_SINCE_BY_SYMBOLS_QUERY, {
+                "symbols": symbols,
+                "since": since_24h.replace(tzinfo=None)
+            })
+            volumes = {row.symbol: int(row.total_volume) for row in result}
+            for symbol, info in change_info.items():
+                info['volume'] = volumes.get(symbol, 0)
+        
+        self.stats["db_queries"] += 1
+        return change_info
+    
+    async def _fetch_basic_info(self, db, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """심볼별 기본 정보 (현재가, 변동 정보, 회사명) 조회 - 데이터가 없는 심볼은 제외"""
+        change_info = await self._fetch_price_changes(db, symbols, include_volume_24h=True)
+        if not change_info:
+            return {}
+        
+        result = await db.execute(COMPANY_NAMES_BY_SYMBOLS_QUERY, {"symbols": list(change_info)})
+        company_names = {row.symbol: row.company_name for row in result}
+        market_status = self.market_checker.get_market_status()
+        
+        basic_info = {}
+        for symbol, info in change_info.items():
+            change_amount = round(info['change_amount'], 2) if info['change_amount'] else None
+            change_percentage = round(info['change_percentage'], 2) if info['change_percentage'] else None
+            basic_info[symbol] = {
+                'symbol': symbol,
+                'company_name': company_names.get(symbol) or symbol,
+                'current_price': info['current_price'],
+                'change_amount': change_amount,
+                'change_percentage': change_percentage,
+                'volume': info['volume'],
+                'previous_close': info['previous_close'],
+                'is_positive': change_amount > 0 if change_amount else None,
+                'market_status': market_status,
+                'last_updated': info['last_updated'].isoformat()
+            }
+        
+        return basic_info
+    
+    async def _query_snapshot(self, name: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        최신 스냅샷 순위/검색 조회 (필터 + 정렬 + LIMIT을 모두 SQL에서 수행)
+        
+        뷰가 준비되어 있으면 뷰에서, 아니면 같은 정의를 서브쿼리로 직접 실행합니다.
+        """
+        queries = _SNAPSHOT_VIEW_QUERIES if latest_snapshot_view.ready else _SNAPSHOT_LIVE_QUERIES
+        
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(queries[name], params)
+            rows = result.mappings().all()
+        self.stats["db_queries"] += 1
+        
+        # 스냅샷 행에 회사명과 변동 정보가 모두 들어 있음
+        return [self._build_stock_item(row, row) for row in rows]
+    
+    async def _fetch_snapshot_ranking(self, category: str, limit: int) -> List[Dict[str, Any]]:
+        """카테고리별 순위 조회"""
+        return await self._query_snapshot(category, {"limit": limit})
+    
+    async def _search_snapshot(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """심볼/회사명 부분 일치 검색 (뷰에서는 trigram 인덱스 사용)"""
+        escaped = query.replace('/', '//').replace('%', '/%').replace('_', '/_')
+        return await self._query_snapshot('search', {"pattern": f"%{escaped}%", "limit": limit})
+    
+    @cached_response("sp500", expire=MARKET_SUMMARY_CACHE_TTL)
+    @single_flight("sp500")
+    async def _load_market_summary(self) -> Dict[str, Any]:
+        """
+        시장 요약 통계 단일 쿼리 조회 (Redis 캐시, 실패 시 예외 전파로 캐시되지 않음)
+        
+        가격 통계는 심볼별 최신가, 거래량은 최근 24시간 합계 기준이며
+        순위 조회와 같은 최신 스냅샷(뷰 또는 같은 정의의 서브쿼리)에서 계산합니다.
+        """
+        queries = _SNAPSHOT_VIEW_QUERIES if latest_snapshot_view.ready else _SNAPSHOT_LIVE_QUERIES
+        async with AsyncSessionLocal() as db:
+            stats = (await db.execute(queries['summary'])).first()
+        self.stats["db_queries"] += 1
+        total_symbols = await self._load_symbol_count()
+        return SP500WebsocketTrades.format_market_summary(stats, total_symbols)
+    
+    @cached_response("sp500", expire=SYMBOL_COUNT_CACHE_TTL)
+    @single_flight("sp500")
+    async def _load_symbol_count(self) -> int:
+        """거래 테이블의 심볼 개수 조회 (Redis 캐시)"""
+        async with AsyncSessionLocal() as db:
+            total_symbols = (await db.execute(DISTINCT_SYMBOL_COUNT_QUERY)).scalar()
+        self.stats["db_queries"] += 1
+        return total_symbols or 0
+    
+    async def _fetch_market_summary(self) -> Dict[str, Any]:
+        """시장 요약 통계 조회 (독립 세션, gather 병렬 실행용)"""
+        try:
+            return await self._load_market_summary()
+        except Exception as e:
+            logger.error(f"❌ 시장 요약 정보 조회 실패: {e}")
+            return {
+                'total_symbols': 0,
+                'total_trades': 0,
+                'average_price': 0,
+                'highest_price': 0,
+                'lowest_price': 0,
+                'total_volume': 0,
+                'last_updated': None,
+                'error': str(e)
+            }
+    
+    @staticmethod
+    def _build_stock_item(stock: Dict[str, Any], change_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """순위/검색 응답용 종목 항목 생성 (변동 값은 소수점 2자리)"""
+        if not change_info:
+            return {
+                'symbol': stock['symbol'],
+                'company_name': stock['company_name'],
+                'current_price': None,
+                'change_amount': None,
+                'change_percentage': None,
+                'volume': None
+            }
+        
+        change_amount = change_info['change_amount']
+        change_percentage = change_info['change_percentage']
+        return {
+            'symbol': stock['symbol'],
+            'company_name': stock['company_name'],
+            'current_price': change_info['current_price'],
+            'change_amount': round(change_amount, 2) if change_amount else None,
+            'change_percentage': round(change_percentage, 2) if change_percentage else None,
+            'volume': change_info['volume']
+        }
     
     # =========================
     # 🆕 WebSocket용 헬퍼 함수들 (동기 방식)
@@ -635,7 +948,7 @@ class SP500Service:
         """
         try:
             # get_stock_list를 사용하여 데이터 조회
-            result = self.get_stock_list(limit)
+            result = await self.get_stock_list(limit)
             return result.get('stocks', [])
         except Exception as e:
             logger.error(f"❌ WebSocket 실시간 데이터 조회 실패: {e}")
@@ -652,7 +965,7 @@ class SP500Service:
             Optional[dict]: 심볼 데이터
         """
         try:
-            return self.get_stock_basic_info(symbol)
+            return await self.get_stock_basic_info(symbol)
         except Exception as e:
             logger.error(f"❌ WebSocket 심볼 {symbol} 조회 실패: {e}")
             return None
@@ -686,27 +999,6 @@ class SP500Service:
             if 'db' in locals():
                 db.close()
     
-    def _get_company_name(self, symbol: str) -> str:
-        """
-        주식 심볼의 회사명 조회
-        
-        Args:
-            symbol: 주식 심볼
-            
-        Returns:
-            str: 회사명 (없으면 심볼 반환)
-        """
-        try:
-            db = next(get_db())
-            company_info = SP500WebsocketTrades.get_company_name(db, symbol)
-            return company_info if company_info else symbol
-        except Exception as e:
-            logger.error(f"❌ 회사명 조회 실패 ({symbol}): {e}")
-            return symbol
-        finally:
-            if 'db' in locals():
-                db.close()
-    
     # =========================
     # 🆕 WebSocket용 헬퍼 함수들 (비동기 방식)
     # =========================
@@ -723,7 +1015,7 @@ class SP500Service:
         """
         try:
             # get_stock_list를 사용하여 데이터 조회
-            result = self.get_stock_list(limit)
+            result = await self.get_stock_list(limit)
             return result.get('stocks', [])
         except Exception as e:
             logger.error(f"❌ WebSocket 실시간 데이터 조회 실패: {e}")
@@ -740,7 +1032,7 @@ class SP500Service:
             Optional[dict]: 심볼 데이터
         """
         try:
-            return self.get_stock_basic_info(symbol)
+            return await self.get_stock_basic_info(symbol)
         except Exception as e:
             logger.error(f"❌ WebSocket 심볼 {symbol} 조회 실패: {e}")
             return None
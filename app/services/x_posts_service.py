@@ -89,6 +89,31 @@ class XPostsService:
         else:
             return query.order_by(asc(column))
     
+    def _paginate_with_total(self, query, offset: int, limit: int) -> Tuple[List[XPost], int]:
+        """
+        페이지 조회와 전체 개수 집계를 한 번의 쿼리로 처리
+        
+        별도 query.count()로 같은 필터를 한 번 더 스캔하는 대신
+        COUNT(*) OVER () 윈도 함수로 페이지 행마다 필터 결과 전체 개수를 함께 받습니다.
+        오프셋이 결과 범위를 벗어나 행이 없을 때만 개수를 따로 조회합니다.
+        
+        Args:
+            query: 필터/정렬이 적용된 XPost 쿼리
+            offset: 건너뛸 포스트 수
+            limit: 조회할 포스트 수
+            
+        Returns:
+            Tuple[List[XPost], int]: (포스트 목록, 전체 개수)
+        """
+        rows = query.add_columns(func.count().over().label('total_count'))\
+            .offset(offset).limit(limit).all()
+        
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+        
+        total_count = query.order_by(None).count() if offset > 0 else 0
+        return [], total_count
+    
     def get_posts_list(self, request: XPostListRequest) -> Tuple[List[XPost], int]:
         """
         포스트 목록 조회 (페이징, 필터링, 정렬)
@@ -109,16 +134,11 @@ class XPostsService:
         if request.verified_only:
             query = query.filter(XPost.user_verified == True)
         
-        # 전체 개수 조회 (필터 적용 후)
-        total_count = query.count()
-        
         # 정렬 적용
         query = self._apply_sorting(query, request.sort_by, request.order)
         
-        # 페이징 적용
-        posts = query.offset(request.offset).limit(request.limit).all()
-        
-        return posts, total_count
+        # 페이징 + 전체 개수 (필터 적용 후)
+        return self._paginate_with_total(query, request.offset, request.limit)
     
     def get_recent_posts(self, limit: int = 10, category: Optional[AccountCategory] = None) -> List[XPost]:
         """
@@ -152,10 +172,7 @@ class XPostsService:
         """
         query = self.db.query(XPost).filter(XPost.account_category == category.value)
         
-        total_count = query.count()
-        posts = query.order_by(desc(XPost.created_at)).offset(offset).limit(limit).all()
-        
-        return posts, total_count
+        return self._paginate_with_total(query.order_by(desc(XPost.created_at)), offset, limit)
     
     def get_user_posts(self, username: str, request: UserPostsRequest) -> Tuple[List[XPost], int]:
         """
@@ -170,14 +187,10 @@ class XPostsService:
         """
         query = self.db.query(XPost).filter(XPost.username == username)
         
-        total_count = query.count()
-        
         # 정렬 적용
         query = self._apply_sorting(query, request.sort_by, request.order)
         
-        posts = query.offset(request.offset).limit(request.limit).all()
-        
-        return posts, total_count
+        return self._paginate_with_total(query, request.offset, request.limit)
     
     def get_user_recent_posts(self, username: str, limit: int = 10) -> List[XPost]:
         """
@@ -337,14 +350,10 @@ class XPostsService:
         if request.category:
             search_query = search_query.filter(XPost.account_category == request.category.value)
         
-        total_count = search_query.count()
-        
         # 정렬 적용
         search_query = self._apply_sorting(search_query, request.sort_by, request.order)
         
-        posts = search_query.limit(request.limit).all()
-        
-        return posts, total_count
+        return self._paginate_with_total(search_query, 0, request.limit)
     
     def search_mentions(self, username: str, limit: int = 20) -> List[XPost]:
         """
@@ -0,0 +1,91 @@
+"""
+응답 캐시 데코레이터(cached_response / conditional_etag) 테스트
+
+Redis 대신 메모리 딕셔너리 클라이언트를 사용합니다.
+"""
+
+import asyncio
+
+from starlette.requests import Request
+from fastapi import Response
+
+from app.utils import cache_utils
+
+
+class FakeRedis:
+    """get/set만 지원하는 메모리 Redis"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+def _request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+def test_etag_version_rebuilds_cached_body(monkeypatch):
+    """데이터 버전이 바뀌면 이전 버전 캐시 본문 대신 새 본문을 새 ETag로 반환"""
+    monkeypatch.setattr(cache_utils, "_redis_client", FakeRedis())
+    state = {"version": "1", "value": 1}
+
+    async def version(**_):
+        return state["version"]
+
+    @cache_utils.conditional_etag(version)
+    @cache_utils.cached_response("test", expire=60)
+    @cache_utils.single_flight("test")
+    async def handler(request, response):
+        return {"value": state["value"]}
+
+    async def scenario():
+        first = Response()
+        assert await handler(request=_request(), response=first) == {"value": 1}
+
+        # 같은 버전: 캐시된 본문 유지
+        state["value"] = 2
+        assert await handler(request=_request(), response=Response()) == {"value": 1}
+
+        # 새 버전: 본문과 ETag 모두 갱신
+        state["version"] = "2"
+        second = Response()
+        assert await handler(request=_request(), response=second) == {"value": 2}
+        assert second.headers["ETag"] != first.headers["ETag"]
+
+        not_modified = await handler(request=_request(second.headers["ETag"]), response=Response())
+        assert not_modified.status_code == 304
+
+    asyncio.run(scenario())
+
+
+def test_etag_version_does_not_leak_into_nested_caches(monkeypatch):
+    """핸들러 안에서 호출한 cached_response는 ETag 버전과 무관한 키를 사용"""
+    monkeypatch.setattr(cache_utils, "_redis_client", FakeRedis())
+    state = {"version": "1", "calls": 0}
+
+    async def version(**_):
+        return state["version"]
+
+    @cache_utils.cached_response("test", expire=3600)
+    @cache_utils.single_flight("test")
+    async def load_count():
+        state["calls"] += 1
+        return 500
+
+    @cache_utils.conditional_etag(version)
+    async def handler(request, response):
+        return {"count": await load_count()}
+
+    async def scenario():
+        for current in ("1", "2", "3"):
+            state["version"] = current
+            assert await handler(request=_request(), response=Response()) == {"count": 500}
+
+    asyncio.run(scenario())
+    assert state["calls"] == 1
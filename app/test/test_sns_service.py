@@ -0,0 +1,55 @@
+"""
+SNSService 피드 조회 테스트
+
+커서로 이어지는 페이지에서 플랫폼별 게시글 수를 다시 세지 않는지 확인합니다.
+DB 세션과 Redis는 메모리 대체 객체를 사용합니다.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.services.sns_service import SNSService
+from app.utils import cache_utils
+from app.utils.pagination_utils import encode_keyset_cursor
+from app.test.test_cache_utils import FakeRedis
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeSession:
+    """게시글 조회와 개수 조회 구문을 구분해 기록하는 AsyncSession 대체 객체"""
+
+    def __init__(self):
+        self.count_queries = 0
+
+    async def execute(self, statement, params=None):
+        if "COUNT(*)" in str(statement):
+            self.count_queries += 1
+            return FakeResult([SimpleNamespace(platform="x", count=120)])
+        return FakeResult([])
+
+
+def test_platform_counts_cached_across_cursor_pages(monkeypatch):
+    """첫 페이지에서 센 플랫폼별 개수를 커서 페이지에서 재사용"""
+    monkeypatch.setattr(cache_utils, "_redis_client", FakeRedis())
+    db = FakeSession()
+    service = SNSService(db)
+    cursor = encode_keyset_cursor(["2025-07-20T14:30:15", "x", "1"])
+
+    async def scenario():
+        first = await service.get_posts(platform="x", author=None, limit=50)
+        second = await service.get_posts(platform="x", author=None, limit=50, cursor=cursor)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.platform_counts == second.platform_counts == {"x": 120}
+    assert first.total_count == second.total_count == 120
+    assert second.page is None
+    assert db.count_queries == 1
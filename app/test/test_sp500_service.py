@@ -0,0 +1,94 @@
+"""
+SP500Service 서비스 캐시 테스트
+
+엔드포인트의 ETag 버전(최신 거래 시각)이 바뀌어도 서비스 내부 캐시는
+자체 TTL대로 재사용되는지 확인합니다. DB 세션과 Redis는 메모리 대체 객체를 사용합니다.
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from starlette.requests import Request
+from fastapi import Response
+
+from app.services import sp500_service
+from app.services.sp500_service import SP500Service
+from app.utils import cache_utils
+from app.test.test_cache_utils import FakeRedis
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+    def first(self):
+        return SimpleNamespace(
+            total_trades=1_000_000, avg_price=150.0, max_price=900.0, min_price=10.0,
+            total_volume=123_456, latest_update=datetime(2025, 7, 20, 14, 30, 15)
+        )
+
+
+class FakeSession:
+    """execute 호출 횟수를 세는 AsyncSession 대체 객체"""
+
+    executed = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        FakeSession.executed.append(statement)
+        return FakeResult(503)
+
+
+def _call_under_versions(monkeypatch, load):
+    """load를 서로 다른 ETag 버전의 엔드포인트 안에서 호출"""
+    monkeypatch.setattr(cache_utils, "_redis_client", FakeRedis())
+    monkeypatch.setattr(sp500_service, "AsyncSessionLocal", FakeSession)
+    FakeSession.executed = []
+    versions = iter(["2025-07-20T14:30:15", "2025-07-20T14:30:16"])
+
+    async def version(**_):
+        return next(versions)
+
+    @cache_utils.conditional_etag(version)
+    async def handler(request, response):
+        return await load()
+
+    async def scenario():
+        results = []
+        for _ in range(2):
+            request = Request({"type": "http", "headers": []})
+            results.append(await handler(request=request, response=Response()))
+        return results
+
+    return asyncio.run(scenario())
+
+
+def test_symbol_count_cache_ignores_etag_version(monkeypatch):
+    """심볼 개수 캐시는 ETag 버전이 바뀌어도 DB를 한 번만 조회"""
+    service = SP500Service()
+
+    results = _call_under_versions(monkeypatch, service._load_symbol_count)
+
+    assert results == [503, 503]
+    assert FakeSession.executed == [sp500_service.DISTINCT_SYMBOL_COUNT_QUERY]
+
+
+def test_market_summary_cache_ignores_etag_version(monkeypatch):
+    """시장 요약 캐시는 ETag 버전이 바뀌어도 요약/심볼 개수 쿼리를 한 번씩만 실행"""
+    service = SP500Service()
+
+    results = _call_under_versions(monkeypatch, service._load_market_summary)
+
+    assert results[0] == results[1]
+    assert results[0]['total_symbols'] == 503
+    assert results[0]['total_volume'] == 123_456
+    assert len(FakeSession.executed) == 2
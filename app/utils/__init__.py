@@ -1,7 +1,18 @@
 # app/utils/__init__.py
-from .timezone_utils import TimezoneHelper, now_utc, previous_market_day_utc, is_market_open
+from .timezone_utils import TimezoneHelper, now_utc, previous_market_day_utc, is_market_open, to_naive_utc
+from .cache_utils import cached_response, conditional_etag, single_flight, init_response_cache, close_response_cache
+from .pagination_utils import encode_keyset_cursor, decode_keyset_cursor, estimated_count
+from .url_utils import canonicalize_url
+from .materialized_view_utils import MaterializedViewRefresher
+from .db_schema_utils import OptionalColumn
 
-__all__ = ['TimezoneHelper', 'now_utc', 'previous_market_day_utc', 'is_market_open']
+__all__ = [
+    'TimezoneHelper', 'now_utc', 'previous_market_day_utc', 'is_market_open', 'to_naive_utc',
+    'cached_response', 'conditional_etag', 'single_flight', 'init_response_cache', 'close_response_cache',
+    'encode_keyset_cursor', 'decode_keyset_cursor', 'estimated_count',
+    'canonicalize_url',
+    'MaterializedViewRefresher', 'OptionalColumn'
+]
 
 
 
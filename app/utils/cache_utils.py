@@ -0,0 +1,325 @@
+# app/utils/cache_utils.py
+import asyncio
+import contextvars
+import functools
+import hashlib
+import json
+import logging
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Optional, Tuple, Union
+
+import orjson
+from fastapi import HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
+from app.dependencies import get_cache_key
+
+logger = logging.getLogger(__name__)
+
+# 응답 캐시 전용 비동기 Redis 클라이언트 (lifespan에서 초기화)
+_redis_client = None
+
+# 캐시 키에 포함할 수 있는 파라미터 타입 (db 세션, 서비스 객체 등은 제외)
+_KEYABLE_TYPES = (str, int, float, bool, date, datetime, Enum)
+
+# 404 결과를 캐시할 때 사용하는 마커 키
+_NOT_FOUND_MARKER = "__not_found__"
+
+# single_flight: 캐시 키별 진행 중인 조회 태스크
+_inflight: dict = {}
+
+# conditional_etag가 조회한 현재 데이터 버전과, 그 버전을 키에 포함할 데코레이터 체인
+# (conditional_etag 바로 아래의 cached_response/single_flight만 대상, 핸들러 안의 서비스 캐시는 제외)
+_etag_version: contextvars.ContextVar[Optional[Tuple[str, frozenset]]] = contextvars.ContextVar(
+    "etag_version", default=None
+)
+
+
+async def init_response_cache(redis_url: Optional[str] = None) -> bool:
+    """
+    응답 캐시용 Redis 클라이언트 초기화
+
+    연결에 실패해도 예외를 올리지 않고, 캐시 없이 DB를 직접 조회하도록 둡니다.
+
+    Returns:
+        bool: 초기화 성공 여부
+    """
+    global _redis_client
+    try:
+        import redis.asyncio as redis
+
+        client = redis.Redis.from_url(
+            redis_url or settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+            health_check_interval=30
+        )
+        await client.ping()
+        _redis_client = client
+        logger.info("✅ 응답 캐시 Redis 연결 성공")
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ 응답 캐시 Redis 연결 실패 (캐시 비활성화): {e}")
+        _redis_client = None
+        return False
+
+
+async def close_response_cache() -> None:
+    """응답 캐시용 Redis 클라이언트 종료"""
+    global _redis_client
+    if _redis_client is not None:
+        try:
+            await _redis_client.aclose()
+        except Exception:
+            pass
+        _redis_client = None
+
+
+def get_response_cache_client():
+    """현재 응답 캐시 Redis 클라이언트 반환 (미초기화 시 None)"""
+    return _redis_client
+
+
+def _normalize_param(value: Any) -> Any:
+    """캐시 키 생성을 위해 파라미터 값을 문자열로 정규화"""
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_normalize_param(v) for v in value]
+    return value
+
+
+def build_cache_key(namespace: str, func_name: str, params: dict) -> str:
+    """
+    엔드포인트 파라미터 조합으로 캐시 키 생성
+
+    페이지/필터 조합마다 별도 캐시 슬롯이 생기도록
+    단순 타입 파라미터만 골라 정렬 후 해시합니다.
+    """
+    keyable = {}
+    for name, value in params.items():
+        if value is None or isinstance(value, _KEYABLE_TYPES):
+            keyable[name] = _normalize_param(value)
+        elif isinstance(value, (list, tuple)) and all(isinstance(v, _KEYABLE_TYPES) for v in value):
+            keyable[name] = _normalize_param(value)
+
+    raw = json.dumps(keyable, sort_keys=True, ensure_ascii=False)
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+    return get_cache_key("response", namespace, func_name, digest)
+
+
+def _versioned_key(cache_key: str, func: Callable) -> str:
+    """
+    conditional_etag가 감싼 데코레이터 체인이면 캐시 키에 현재 데이터 버전을 덧붙임
+
+    버전이 바뀌면 이전 버전으로 저장된 본문 대신 새 키로 다시 조회하므로,
+    응답 본문과 ETag가 항상 같은 버전을 가리킵니다.
+    func가 체인에 속하지 않으면(핸들러 안에서 호출한 서비스 캐시 등) 키를 그대로 둡니다.
+    """
+    current = _etag_version.get()
+    if current is None:
+        return cache_key
+    version, chain = current
+    if id(func) not in chain:
+        return cache_key
+    digest = hashlib.blake2b(version.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{cache_key}:v:{digest}"
+
+
+def _wrapped_chain(func: Callable) -> frozenset:
+    """functools.wraps의 __wrapped__를 따라 데코레이터 체인에 속한 함수 id 목록 생성"""
+    ids = set()
+    while func is not None and id(func) not in ids:
+        ids.add(id(func))
+        func = getattr(func, "__wrapped__", None)
+    return frozenset(ids)
+
+
+def cached_response(
+    namespace: str,
+    expire: Union[int, Callable[[], int], None] = None,
+    not_found_expire: int = 0
+) -> Callable:
+    """
+    GET 엔드포인트 응답을 Redis에 캐싱하는 데코레이터
+
+    변동이 적은 통계/목록 엔드포인트에서 반복 요청이 DB까지 가지 않도록 합니다.
+    Redis가 없거나 오류가 나면 캐시를 건너뛰고 원래 핸들러를 그대로 실행합니다.
+
+    Args:
+        namespace: 캐시 키 네임스페이스 (예: "etf", "financial_news")
+        expire: 캐시 TTL (초, 기본값 settings.cache_ttl).
+            장중/장외처럼 시점에 따라 TTL이 달라지면 TTL을 반환하는 함수를 전달 (저장 시점에 호출)
+        not_found_expire: 404 결과를 캐시할 TTL (초, 0이면 캐시하지 않음)
+
+    사용 예시:
+        @router.get("/stats")
+        @cached_response("etf", expire=300)
+        async def get_stats(...):
+            ...
+    """
+    def resolve_ttl() -> int:
+        if callable(expire):
+            return expire()
+        return expire if expire is not None else settings.cache_ttl
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            client = _redis_client
+            if client is None:
+                return await func(*args, **kwargs)
+
+            cache_key = _versioned_key(build_cache_key(namespace, func.__name__, kwargs), func)
+
+            try:
+                cached = await client.get(cache_key)
+            except Exception as e:
+                logger.debug(f"응답 캐시 조회 실패 ({cache_key}): {e}")
+                cached = None
+
+            if cached is not None:
+                payload = orjson.loads(cached)
+                if isinstance(payload, dict) and _NOT_FOUND_MARKER in payload:
+                    raise HTTPException(status_code=404, detail=payload[_NOT_FOUND_MARKER])
+                return payload
+
+            try:
+                result = await func(*args, **kwargs)
+            except HTTPException as e:
+                if e.status_code == 404 and not_found_expire > 0:
+                    await _store(client, cache_key, {_NOT_FOUND_MARKER: e.detail}, not_found_expire)
+                raise
+
+            await _store(client, cache_key, jsonable_encoder(result), resolve_ttl())
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def single_flight(namespace: str) -> Callable:
+    """
+    동일 파라미터의 동시 요청을 한 번의 실행으로 합치는 데코레이터
+
+    캐시 미스 순간 같은 심볼 요청이 몰려도 DB 조회는 한 번만 실행하고,
+    나머지 요청은 진행 중인 결과(또는 예외)를 그대로 공유합니다.
+    cached_response 아래에 두어 캐시 미스 경로만 합치도록 사용합니다.
+
+    실제 조회는 별도 태스크로 실행하므로, 먼저 들어온 요청의 연결이 끊겨도
+    기다리던 다른 요청은 영향을 받지 않습니다.
+
+    사용 예시:
+        @router.get("/symbol/{symbol}")
+        @cached_response("etf", expire=60)
+        @single_flight("etf")
+        async def get_detail(symbol: str):
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _versioned_key(build_cache_key(namespace, func.__name__, kwargs), func)
+
+            task = _inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                _inflight[key] = task
+                task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
+
+
+async def _store(client, cache_key: str, payload: Any, ttl: int) -> None:
+    """캐시 저장 (실패해도 응답에는 영향 없음)"""
+    try:
+        await client.set(cache_key, orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), ex=ttl)
+    except Exception as e:
+        logger.debug(f"응답 캐시 저장 실패 ({cache_key}): {e}")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 현재 ETag가 포함되어 있는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def conditional_etag(version_func: Callable, max_age: int = 15, cache_control: Optional[str] = None) -> Callable:
+    """
+    ETag / If-None-Match 기반 조건부 응답 데코레이터
+
+    version_func로 데이터 버전(최신 갱신 시각 등)만 가볍게 조회해 ETag를 만들고,
+    클라이언트가 같은 ETag를 보내면 본문 조회/직렬화 없이 304를 반환합니다.
+    cached_response 위에 두어 Redis 캐시 적중 시에도 ETag가 붙도록 합니다.
+    이때 조회한 버전은 바로 아래(같은 핸들러를 감싼) cached_response/single_flight의
+    캐시 키에만 포함되므로, 데이터가 바뀐 뒤 이전 버전의 캐시 본문이 새 ETag로 나가지 않습니다.
+    핸들러 안에서 호출하는 서비스 메서드의 cached_response는 버전과 무관한 키를 그대로 사용해
+    자체 TTL대로 캐시됩니다.
+
+    대상 핸들러는 `request: Request`, `response: Response` 파라미터를 받아야 합니다.
+
+    Args:
+        version_func: 핸들러 kwargs를 받아 버전 문자열을 반환하는 async 함수 (None이면 ETag 생략)
+        max_age: Cache-Control max-age (초)
+        cache_control: Cache-Control 헤더 직접 지정 (None이면 max_age 기반 기본값,
+            CDN 공유 캐시를 허용할 공개 통계 엔드포인트 등에서 사용)
+
+    사용 예시:
+        @router.get("/symbol/{symbol}/chart")
+        @conditional_etag(get_chart_version, max_age=15)
+        @cached_response("etf", expire=30)
+        async def get_chart(symbol: str, request: Request, response: Response, ...):
+            ...
+    """
+    cache_control = cache_control or f"max-age={max_age}, must-revalidate"
+
+    def decorator(func: Callable) -> Callable:
+        chain = _wrapped_chain(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Optional[Request] = kwargs.get("request")
+            response: Optional[Response] = kwargs.get("response")
+
+            try:
+                version = await version_func(**kwargs)
+            except Exception as e:
+                logger.debug(f"ETag 버전 조회 실패 ({func.__name__}): {e}")
+                version = None
+
+            if version is None or request is None:
+                return await func(*args, **kwargs)
+
+            key = build_cache_key("etag", func.__name__, kwargs)
+            etag = '"' + hashlib.blake2b(f"{key}:{version}".encode("utf-8"), digest_size=8).hexdigest() + '"'
+
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+            token = _etag_version.set((str(version), chain))
+            try:
+                result = await func(*args, **kwargs)
+            finally:
+                _etag_version.reset(token)
+            if response is not None:
+                response.headers["ETag"] = etag
+                response.headers["Cache-Control"] = cache_control
+            return result
+
+        return wrapper
+
+    return decorator
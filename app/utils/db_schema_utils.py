@@ -0,0 +1,75 @@
+# app/utils/db_schema_utils.py
+import logging
+from typing import Any, Optional
+
+from sqlalchemy import literal_column, text
+
+from app.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class OptionalColumn:
+    """
+    마이그레이션 스크립트로 추가하는 컬럼의 존재 여부 확인
+
+    테이블을 다시 쓰는 스키마 변경(생성 컬럼 추가, 인덱스 생성)은 앱 시작 시 실행하지 않고
+    scripts/sql의 일회성 마이그레이션으로 적용합니다. 앱은 lifespan에서 probe()로 컬럼 존재만
+    확인하고, 컬럼이 없으면(ready=False) 생성 컬럼과 같은 식을 조회 시점에 직접 계산합니다.
+
+    사용 예시:
+        search_tsv_column = OptionalColumn("sp500_earnings_calendar", "search_tsv", TSV_EXPRESSION, TSVECTOR)
+        asyncio.create_task(search_tsv_column.probe())
+        tsv = search_tsv_column.resolve(Model.search_tsv)
+    """
+
+    def __init__(self, table: str, column: str, fallback_sql: str, type_: Optional[Any] = None):
+        """
+        Args:
+            table: 테이블 이름
+            column: 컬럼 이름
+            fallback_sql: 컬럼이 없을 때 대신 사용할 SQL 식 (생성 컬럼 정의와 같은 식)
+            type_: fallback 식의 SQLAlchemy 타입 (연산자 사용을 위해 지정)
+        """
+        self.table = table
+        self.column = column
+        self.fallback = literal_column(fallback_sql, type_=type_)
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        """컬럼 사용 가능 여부 (probe 전이거나 확인 실패 시 False)"""
+        return self._ready
+
+    def resolve(self, column: Any) -> Any:
+        """컬럼이 있으면 매핑된 컬럼을, 없으면 fallback 식을 반환 (fallback은 인덱스를 타지 않음)"""
+        return column if self._ready else self.fallback
+
+    async def probe(self) -> bool:
+        """
+        information_schema에서 컬럼 존재 여부 확인 (실패해도 예외를 올리지 않음)
+
+        Returns:
+            bool: 컬럼 존재 여부
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                exists = (await db.execute(
+                    text(
+                        "SELECT 1 FROM information_schema.columns "
+                        "WHERE table_schema = current_schema() "
+                        "AND table_name = :table AND column_name = :column"
+                    ),
+                    {"table": self.table, "column": self.column}
+                )).scalar()
+        except Exception as e:
+            logger.warning("⚠️ %s.%s 컬럼 확인 실패 (fallback 식 사용): %s", self.table, self.column, e)
+            self._ready = False
+            return False
+
+        self._ready = bool(exists)
+        if not self._ready:
+            logger.warning(
+                "⚠️ %s.%s 컬럼 없음 (fallback 식 사용, scripts/sql 마이그레이션 필요)", self.table, self.column
+            )
+        return self._ready
@@ -0,0 +1,120 @@
+# app/utils/materialized_view_utils.py
+import asyncio
+import logging
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy import text
+
+from app.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class MaterializedViewRefresher:
+    """
+    materialized view 생성 및 주기적 CONCURRENTLY 갱신 관리
+
+    lifespan에서 run()을 태스크로 실행하면 뷰와 인덱스를 만든 뒤 interval마다 갱신하고,
+    조회 코드는 ready로 뷰 사용 여부를 판단합니다 (준비 전/실패 시 원본 조회).
+    여러 워커가 동시에 생성/갱신하지 않도록 advisory lock을 사용합니다.
+
+    사용 예시:
+        snapshot_view = MaterializedViewRefresher(
+            label="SP500 최신 스냅샷",
+            views=("sp500_latest_snapshot",),
+            ddl=(CREATE_VIEW_SQL, CREATE_INDEX_SQL),
+            lock_key=7_310_044,
+            interval=15
+        )
+        asyncio.create_task(snapshot_view.run())
+        source = "sp500_latest_snapshot" if snapshot_view.ready else "(...) AS snapshot"
+    """
+
+    def __init__(
+        self,
+        label: str,
+        views: Sequence[str],
+        ddl: Sequence[str],
+        lock_key: int,
+        interval: int,
+        on_refresh: Optional[Callable[[], None]] = None
+    ):
+        """
+        Args:
+            label: 로그에 표시할 뷰 이름
+            views: 갱신할 materialized view 목록 (CONCURRENTLY 갱신을 위해 각각 UNIQUE 인덱스 필요)
+            ddl: 뷰/인덱스 생성 구문 (IF NOT EXISTS)
+            lock_key: 워커 간 생성/갱신 직렬화용 advisory lock 키
+            interval: 갱신 주기 (초)
+            on_refresh: 갱신 성공 후 호출할 함수 (뷰 기반 메모리 캐시 만료 등)
+        """
+        self.label = label
+        self.views = tuple(views)
+        self.ddl = tuple(ddl)
+        self.lock_key = lock_key
+        self.interval = interval
+        self.on_refresh = on_refresh
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        """materialized view 사용 가능 여부"""
+        return self._ready
+
+    async def ensure(self) -> None:
+        """materialized view와 인덱스가 없으면 생성"""
+        async with AsyncSessionLocal() as db:
+            # 여러 워커가 동시에 CREATE ... IF NOT EXISTS를 실행하면 충돌할 수 있으므로 순서대로 실행
+            await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": self.lock_key})
+            for statement in self.ddl:
+                await db.execute(text(statement))
+            await db.commit()
+        self._ready = True
+
+    async def refresh(self) -> bool:
+        """
+        materialized view를 새 세션으로 갱신
+
+        CONCURRENTLY로 갱신해 조회를 막지 않으며, 다른 워커가 갱신 중이면 건너뜁니다.
+
+        Returns:
+            bool: 이번 호출에서 갱신했는지 여부
+        """
+        async with AsyncSessionLocal() as db:
+            acquired = (await db.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": self.lock_key}
+            )).scalar()
+            if not acquired:
+                return False
+
+            for view in self.views:
+                await db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+            await db.commit()
+
+        if self.on_refresh is not None:
+            self.on_refresh()
+        return True
+
+    async def run(self) -> None:
+        """
+        생성 및 주기적 갱신 루프 (lifespan에서 태스크로 실행)
+
+        생성에 실패하면 뷰를 사용하지 않고(ready=False) 종료합니다.
+        """
+        try:
+            await self.ensure()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("⚠️ %s materialized view 준비 실패 (원본 조회 사용): %s", self.label, e)
+            return
+
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("⚠️ %s materialized view 갱신 실패: %s", self.label, e)
@@ -0,0 +1,115 @@
+# app/utils/pagination_utils.py
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import Any, List, Sequence
+
+from app.utils.cache_utils import build_cache_key, get_response_cache_client
+
+logger = logging.getLogger(__name__)
+
+# 추정 개수 Redis 캐시 TTL (초)
+ESTIMATED_COUNT_TTL = 60
+
+
+def encode_keyset_cursor(values: Sequence[Any]) -> str:
+    """
+    keyset 페이징용 불투명 커서 생성
+
+    마지막 행의 정렬 키 값들을 JSON 배열로 묶어 URL-safe base64로 인코딩합니다.
+    URL처럼 구분자를 포함할 수 있는 키도 그대로 담을 수 있습니다.
+
+    Args:
+        values: 정렬 키 값 목록 (datetime은 ISO 문자열로 변환)
+
+    Returns:
+        str: 쿼리 파라미터로 전달 가능한 커서 문자열
+    """
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    encode_keyset_cursor로 만든 커서 복원
+
+    Args:
+        cursor: 커서 문자열
+        size: 기대하는 정렬 키 개수
+
+    Returns:
+        List[Any]: 정렬 키 값 목록 (datetime은 ISO 문자열 상태)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (UnicodeEncodeError, ValueError):
+        raise ValueError(f"잘못된 커서 형식입니다: {cursor}")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"잘못된 커서 형식입니다: {cursor}")
+    return values
+
+
+async def estimated_count(
+    db,
+    query,
+    namespace: str,
+    name: str,
+    filters: dict,
+    expire: int = ESTIMATED_COUNT_TTL
+) -> int:
+    """
+    COUNT(*) 없이 select 구문의 결과 행 수를 추정
+
+    목록 응답의 total은 화면 표시용이므로, 매 요청마다 필터 결과 전체를 세는 대신
+    EXPLAIN (FORMAT JSON)의 "Plan Rows" 추정치를 사용합니다.
+    추정치는 필터 조합별로 Redis에 캐시해 같은 필터 요청에서는 DB를 거치지 않습니다.
+
+    Args:
+        db: AsyncSession
+        query: 개수를 셀 select 구문 (정렬/페이징은 무시)
+        namespace: 캐시 키 네임스페이스 (예: "market_news")
+        name: 목록 종류 (예: "list", "search")
+        filters: 캐시 키를 만들 필터 파라미터
+        expire: 캐시 TTL (초)
+
+    Returns:
+        int: 추정 행 수
+    """
+    client = get_response_cache_client()
+    cache_key = build_cache_key(namespace, f"{name}:count", filters)
+
+    if client is not None:
+        try:
+            cached = await client.get(cache_key)
+            if cached is not None:
+                return int(cached)
+        except Exception as e:
+            logger.debug(f"추정 개수 캐시 조회 실패 ({cache_key}): {e}")
+
+    connection = await db.connection()
+    compiled = query.order_by(None).limit(None).offset(None).compile(
+        dialect=connection.dialect,
+        compile_kwargs={"render_postcompile": True}
+    )
+    params = tuple(compiled.params[key] for key in compiled.positiontup or ())
+
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", params)
+    plan = result.scalar()
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+    count = int(plan[0]["Plan"]["Plan Rows"])
+
+    if client is not None:
+        try:
+            await client.set(cache_key, count, ex=expire)
+        except Exception as e:
+            logger.debug(f"추정 개수 캐시 저장 실패 ({cache_key}): {e}")
+
+    return count
@@ -141,3 +141,14 @@ def is_market_open() -> bool:
 
 
 
+
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    timezone 없는 DateTime 컬럼 비교용 UTC naive datetime 변환
+
+    asyncpg는 timezone 없는 컬럼에 aware datetime을 바인딩하면 오류를 내므로
+    쿼리 파라미터로 넘기기 전에 정규화합니다.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
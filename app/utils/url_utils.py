@@ -0,0 +1,28 @@
+# app/utils/url_utils.py
+from urllib.parse import urlsplit, urlunsplit
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    뉴스 URL 정규화
+
+    같은 기사를 가리키는 URL 표기 차이로 캐시 키가 갈라지지 않도록
+    앞뒤 공백 제거, scheme/host 소문자화, fragment(#...) 제거만 수행합니다.
+    경로와 쿼리 문자열은 기사 식별에 쓰일 수 있으므로 그대로 둡니다.
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        str: 정규화된 URL (파싱할 수 없는 형식이면 공백만 제거한 값)
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    if not parts.scheme or not parts.netloc:
+        return url
+
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
@@ -0,0 +1,16 @@
+-- sp500_earnings_calendar 전문 검색 컬럼(search_tsv)과 GIN 인덱스 추가 (일회성 마이그레이션)
+--
+-- 생성 컬럼 추가는 테이블을 다시 쓰므로 트래픽이 적은 시간에 실행하고,
+-- CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 psql 자동 커밋 모드로 실행합니다.
+--   psql "$DATABASE_URL" -f scripts/sql/sp500_earnings_calendar_search_tsv.sql
+-- 적용 후 앱을 재시작하면 search_events가 컬럼/인덱스를 사용합니다 (그 전까지는 같은 식을 직접 계산).
+
+ALTER TABLE sp500_earnings_calendar
+    ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(symbol, '') || ' ' ||
+            coalesce(company_name, '') || ' ' || coalesce(event_title, ''))
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sp500_earnings_calendar_tsv_gin
+    ON sp500_earnings_calendar USING gin (search_tsv);